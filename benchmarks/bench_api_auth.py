@@ -0,0 +1,80 @@
+"""Benchmark JWT authentication modes on GET /api/tickets/{id}
+
+Fills a temporary SQLite database with one user and one ticket and
+requests the ticket repeatedly with the same bearer token, once per
+API_AUTH_MODE (each in a fresh interpreter, since the router picks its
+authentication at import). Reports the time per request and the queries
+per request: "database" pays the user query on every request, "cached"
+and "stateless" skip it.
+
+Usage:
+    python benchmarks/bench_api_auth.py [--requests 500]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+from common import best_of, print_row, setup_django
+
+MODES = ("database", "cached", "stateless")
+
+
+def run_mode(requests: int) -> dict:
+    """Benchmark the API_AUTH_MODE of this process."""
+    setup_django()
+    from django.contrib.auth import get_user_model
+    from django.core.management import call_command
+    from django.db import connection
+    from django.test import Client
+    from ninja_jwt.tokens import AccessToken
+
+    from pyticket.infrastructure.models.models import TicketModel
+
+    call_command("migrate", verbosity=0)
+    user = get_user_model().objects.create_user(username="bench", password="benchpass123")
+    ticket = TicketModel.objects.create(id=uuid4(), title="Login fails", description="Cannot log in since the update")
+    client = Client(HTTP_HOST="localhost", HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    path = f"/api/tickets/{ticket.id}"
+
+    assert client.get(path).status_code == 200
+    queries = []
+    with connection.execute_wrapper(lambda execute, sql, *args: queries.append(sql) or execute(sql, *args)):
+        client.get(path)  # The test client's request_started resets connection.queries, so count at execution
+    seconds = best_of(lambda: client.get(path), repeat=3, number=requests)
+    return {"seconds": seconds, "queries": len(queries)}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.requests)))
+        return
+
+    print_row("mode", "us/request", "queries/request")
+    for mode in MODES:
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {
+                **os.environ,
+                "API_AUTH_MODE": mode,
+                "DATABASE_NAME": str(Path(tmp) / "auth.sqlite3"),
+                "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "benchmark",
+            }
+            command = [sys.executable, __file__, "--mode", mode, "--requests", str(args.requests)]
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print_row(mode, f"{result['seconds'] * 1e6:.0f}", result["queries"])
+
+
+if __name__ == "__main__":
+    main()
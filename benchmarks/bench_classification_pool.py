@@ -0,0 +1,97 @@
+"""Benchmark thread vs process execution of CPU-bound classification
+
+Classifies 2000 tickets with a pure-Python local classifier (normalization,
+hashed bag-of-words scoring against per-category weights, JSON response
+parsing) through TicketClassificationService.classify_many, using the
+thread pool and the ProcessClassificationPool at 1, 2, 4 ... workers up to
+the CPU count. Threads stay at one core because of the GIL; processes
+should scale with the cores available.
+
+Usage:
+    python benchmarks/bench_classification_pool.py
+"""
+
+import json
+import os
+import random
+import re
+import time
+from typing import Dict, List
+
+from common import print_row, setup_django
+
+setup_django()
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket  # noqa: E402
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult  # noqa: E402
+from pyticket.service.tickets.classification_pool import ProcessClassificationPool  # noqa: E402
+from pyticket.service.tickets.classification_service import TicketClassificationService  # noqa: E402
+
+TICKET_COUNT = 2000
+FEATURES = 1 << 14
+VOCABULARY = (
+    "login password error invoice refund charge payment crash upload slow feature dark mode export api timeout "
+    "dashboard account subscription broken request please help urgent production outage question settings"
+).split()
+
+
+class LocalClassifier(AIClassificationService):
+    """CPU-bound stand-in for a local model; the weights are 'loaded' once per instance"""
+
+    def __init__(self):
+        rng = random.Random(42)
+        self.weights: Dict[Category, List[float]] = {category: [rng.random() for _ in range(FEATURES)] for category in Category}
+
+    def classify_ticket(self, ticket: Ticket) -> ClassificationResult:
+        text = re.sub(r"[^a-z0-9 ]+", " ", f"{ticket.title} {ticket.description}".lower())
+        tokens = text.split()
+        features = [hash(token) % FEATURES for token in tokens] + [hash(pair) % FEATURES for pair in zip(tokens, tokens[1:])]
+        scores = {category: sum(weights[feature] for feature in features) for category, weights in self.weights.items()}
+        category = max(scores, key=scores.__getitem__)
+        response = json.dumps({"category": category.value, "priority": "MEDIUM", "confidence_score": 0.8, "reasoning": "local"})
+        parsed = json.loads(response)
+        return ClassificationResult(
+            Category(parsed["category"]), Priority(parsed["priority"]), parsed["confidence_score"], parsed["reasoning"]
+        )
+
+
+def make_tickets() -> List[Ticket]:
+    """Build tickets with 200-word descriptions."""
+    rng = random.Random(7)
+    return [
+        Ticket(title=" ".join(rng.choices(VOCABULARY, k=6)), description=" ".join(rng.choices(VOCABULARY, k=200)))
+        for _ in range(TICKET_COUNT)
+    ]
+
+
+def timed(service: TicketClassificationService, tickets: List[Ticket], workers: int) -> float:
+    """Classify all tickets once and return the elapsed seconds."""
+    start = time.perf_counter()
+    service.classify_many(tickets, max_workers=workers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Run the benchmark."""
+    tickets = make_tickets()
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({1, *(count for count in (2, 4, 8, 16) if count <= cpus), cpus})
+    classifier = LocalClassifier()
+    thread_service = TicketClassificationService(classifier)
+    baseline = timed(thread_service, tickets, 1)
+
+    print_row("workers", "mode", "tickets/s", "speedup")
+    for workers in worker_counts:
+        elapsed = timed(thread_service, tickets, workers)
+        print_row(workers, "threads", f"{TICKET_COUNT / elapsed:.0f}", f"{baseline / elapsed:.2f}x")
+
+        pool = ProcessClassificationPool(LocalClassifier, workers=workers, chunk_size=32)
+        process_service = TicketClassificationService(classifier, process_pool=pool)
+        timed(process_service, tickets[: workers * 32], workers)  # start the workers and load their models
+        elapsed = timed(process_service, tickets, workers)
+        pool.shutdown()
+        print_row(workers, "processes", f"{TICKET_COUNT / elapsed:.0f}", f"{baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
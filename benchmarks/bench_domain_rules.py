@@ -0,0 +1,112 @@
+"""Benchmark domain rule lookups on bulk paths
+
+Compares the previous per-call rule tables (dicts of lists rebuilt inside
+each method) with the precomputed frozen tables in domain.tickets.rules,
+for status transitions, team routing and default priorities over 10 000
+tickets - the per-ticket work done by bulk status updates and bulk
+reclassification.
+
+Usage:
+    python benchmarks/bench_domain_rules.py
+"""
+
+from datetime import datetime
+from typing import List
+
+from common import best_of, print_row, setup_django
+
+setup_django()
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus  # noqa: E402
+from pyticket.domain.tickets.services import TicketClassificationService, TicketRoutingService  # noqa: E402
+
+TICKET_COUNT = 10_000
+CATEGORIES = list(Category)
+
+
+def legacy_update_status(ticket: Ticket, new_status: TicketStatus) -> None:
+    """Previous Ticket.update_status."""
+    valid_transitions = {
+        TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CLOSED],
+        TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.OPEN],
+        TicketStatus.RESOLVED: [TicketStatus.CLOSED, TicketStatus.IN_PROGRESS],
+        TicketStatus.CLOSED: [],
+    }
+    if new_status not in valid_transitions.get(ticket.status, []):
+        raise ValueError(f"Cannot transition from {ticket.status.value} to {new_status.value}")
+    ticket.status = new_status
+    ticket.updated_at = datetime.utcnow()
+
+
+def legacy_team_for_category(category: Category) -> str:
+    """Previous TicketRoutingService.get_team_for_category."""
+    routing_map = {
+        Category.TECHNICAL: "technical-support",
+        Category.BILLING: "billing-team",
+        Category.FEATURE_REQUEST: "product-team",
+        Category.BUG_REPORT: "engineering-team",
+        Category.GENERAL: "customer-support",
+    }
+    return routing_map.get(category, "customer-support")
+
+
+def legacy_default_priority(category: Category) -> Priority:
+    """Previous TicketClassificationService.get_default_priority_for_category."""
+    defaults = {
+        Category.TECHNICAL: Priority.MEDIUM,
+        Category.BILLING: Priority.HIGH,
+        Category.FEATURE_REQUEST: Priority.LOW,
+        Category.BUG_REPORT: Priority.HIGH,
+        Category.GENERAL: Priority.LOW,
+    }
+    return defaults.get(category, Priority.MEDIUM)
+
+
+def make_tickets() -> List[Ticket]:
+    """Build open tickets."""
+    return [Ticket(title=f"Ticket {index}", description="Bulk workload") for index in range(TICKET_COUNT)]
+
+
+def cycle_status(tickets: List[Ticket], update_status) -> None:
+    """Move every ticket OPEN -> IN_PROGRESS -> OPEN."""
+    for ticket in tickets:
+        update_status(ticket, TicketStatus.IN_PROGRESS)
+        update_status(ticket, TicketStatus.OPEN)
+
+
+def route_all(categories: List[Category], team_for, default_priority) -> None:
+    """Look up team and default priority for every ticket."""
+    for category in categories:
+        team_for(category)
+        default_priority(category)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    tickets = make_tickets()
+    categories = [CATEGORIES[index % len(CATEGORIES)] for index in range(TICKET_COUNT)]
+    workloads = {
+        "status transitions": (
+            lambda: cycle_status(tickets, legacy_update_status),
+            lambda: cycle_status(tickets, Ticket.update_status),
+        ),
+        "team + priority": (
+            lambda: route_all(categories, legacy_team_for_category, legacy_default_priority),
+            lambda: route_all(
+                categories,
+                TicketRoutingService.get_team_for_category,
+                TicketClassificationService.get_default_priority_for_category,
+            ),
+        ),
+    }
+
+    print_row("workload", "path", "ms/10k tickets", "speedup")
+    for name, (legacy, precomputed) in workloads.items():
+        baseline = best_of(legacy, number=3)
+        elapsed = best_of(precomputed, number=3)
+        print_row(name, "per-call tables", f"{baseline * 1000:.2f}", "1.00x")
+        print_row(name, "precomputed", f"{elapsed * 1000:.2f}", f"{baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
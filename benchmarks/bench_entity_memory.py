@@ -0,0 +1,138 @@
+"""Benchmark memory footprint of ticket entities and DTOs
+
+Measures per-object allocations (tracemalloc) for the slotted domain
+entities/DTOs against equivalent ``__dict__``-backed dataclasses, for a
+list workload (Ticket -> TicketResponseDTO with classification) and a
+bulk-import workload (Ticket only).
+
+Usage:
+    python benchmarks/bench_entity_memory.py
+"""
+
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, List, Optional
+from uuid import UUID, uuid4
+
+from common import print_row, setup_django
+
+setup_django()
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus  # noqa: E402
+from pyticket.service.tickets.dtos import ClassificationResultDTO, TicketResponseDTO  # noqa: E402
+
+OBJECT_COUNT = 10_000
+
+
+@dataclass
+class DictTicket:
+    """Ticket without slots (previous layout)"""
+
+    id: UUID = field(default_factory=uuid4)
+    title: str = ""
+    description: str = ""
+    status: TicketStatus = TicketStatus.OPEN
+    category: Optional[Category] = None
+    priority: Optional[Priority] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=datetime.utcnow)
+
+    def __post_init__(self):
+        if not self.title:
+            raise ValueError("Ticket title cannot be empty")
+        if not self.description:
+            raise ValueError("Ticket description cannot be empty")
+
+
+@dataclass
+class DictClassificationResultDTO:
+    """Classification DTO without slots (previous layout)"""
+
+    category: Category
+    priority: Priority
+    confidence_score: float
+    reasoning: str
+
+
+@dataclass
+class DictTicketResponseDTO:
+    """Ticket response DTO without slots (previous layout)"""
+
+    id: UUID
+    title: str
+    description: str
+    status: TicketStatus
+    category: Optional[Category]
+    priority: Optional[Priority]
+    created_at: datetime
+    updated_at: datetime
+    classification: Optional[DictClassificationResultDTO] = None
+
+
+def bulk_import(ticket_cls) -> Callable[[], List[object]]:
+    """Build tickets as a bulk import would."""
+
+    def run() -> List[object]:
+        return [
+            ticket_cls(title="Imported", description="Imported description", category=Category.BILLING, priority=Priority.HIGH)
+            for _ in range(OBJECT_COUNT)
+        ]
+
+    return run
+
+
+def list_page(ticket_cls, response_cls, classification_cls) -> Callable[[], List[object]]:
+    """Build tickets and their response DTOs as the list path does."""
+
+    def run() -> List[object]:
+        results = []
+        for _ in range(OBJECT_COUNT):
+            ticket = ticket_cls(title="Listed", description="Listed description", category=Category.BILLING, priority=Priority.HIGH)
+            results.append(
+                response_cls(
+                    id=ticket.id,
+                    title=ticket.title,
+                    description=ticket.description,
+                    status=ticket.status,
+                    category=ticket.category,
+                    priority=ticket.priority,
+                    created_at=ticket.created_at,
+                    updated_at=ticket.updated_at,
+                    classification=classification_cls(ticket.category, ticket.priority, 0.0, ""),
+                )
+            )
+        return results
+
+    return run
+
+
+def measure(build: Callable[[], List[object]]) -> int:
+    """Return allocated bytes retained by the built objects."""
+    tracemalloc.start()
+    objects = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current
+
+
+def main() -> None:
+    """Run the benchmark."""
+    workloads = [
+        ("bulk-import", bulk_import(DictTicket), bulk_import(Ticket)),
+        (
+            "list",
+            list_page(DictTicket, DictTicketResponseDTO, DictClassificationResultDTO),
+            list_page(Ticket, TicketResponseDTO, ClassificationResultDTO),
+        ),
+    ]
+    print_row("workload", "dict bytes/row", "slotted bytes/row", "saving")
+    for name, legacy, slotted in workloads:
+        legacy_bytes = measure(legacy) / OBJECT_COUNT
+        slotted_bytes = measure(slotted) / OBJECT_COUNT
+        print_row(name, f"{legacy_bytes:.0f}", f"{slotted_bytes:.0f}", f"{1 - slotted_bytes / legacy_bytes:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark the cost of one password hash per hasher and cost setting
+
+Use it to pick PASSWORD_HASHER and its cost: a login costs one hash (two
+when the stored hash is upgraded), and at most PASSWORD_HASHING_WORKERS
+run at once per process. argon2 rows need argon2-cffi.
+
+Usage:
+    python benchmarks/bench_password_hashers.py
+"""
+
+from common import best_of, print_row, setup_django
+
+PROFILES = [
+    ("pbkdf2", "PASSWORD_PBKDF2_ITERATIONS", 0),
+    ("pbkdf2", "PASSWORD_PBKDF2_ITERATIONS", 600_000),
+    ("pbkdf2", "PASSWORD_PBKDF2_ITERATIONS", 260_000),
+    ("scrypt", "PASSWORD_SCRYPT_WORK_FACTOR", 0),
+    ("scrypt", "PASSWORD_SCRYPT_WORK_FACTOR", 2**13),
+    ("argon2", "PASSWORD_ARGON2_MEMORY_COST", 0),
+    ("argon2", "PASSWORD_ARGON2_MEMORY_COST", 19_456),
+]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    setup_django()
+    from django.conf import settings
+    from django.contrib.auth.hashers import get_hasher
+
+    print_row("hasher", "cost", "ms/hash")
+    for name, setting, value in PROFILES:
+        cost = f"{setting.split('_', 2)[-1].lower()}={value or 'default'}"
+        setattr(settings, setting, value)
+        hasher = get_hasher(name.replace("pbkdf2", "pbkdf2_sha256"))
+        try:
+            elapsed = best_of(lambda: hasher.encode("correct horse battery staple", hasher.salt()), repeat=3, number=3)
+            print_row(name, cost, f"{elapsed * 1000:.1f}")
+        except ValueError:  # Algorithm library not installed
+            print_row(name, cost, "not installed")
+        finally:
+            setattr(settings, setting, 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark concurrent write throughput of DjangoTicketRepository.save
+
+Runs the same workload (N threads, each saving M tickets through its own
+connection) against a fresh SQLite file for each database profile:
+
+- sqlite-default: SQLite/Django defaults (rollback journal, synchronous=FULL,
+  deferred transactions)
+- sqlite-tuned: the project profile (WAL, synchronous=NORMAL, busy timeout,
+  mmap, immediate transactions)
+
+Each profile runs in a subprocess because database settings are read once
+at startup.
+
+Usage:
+    python benchmarks/bench_repository_writes.py [--workers 8] [--tickets 200]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+PROFILES = {
+    "sqlite-default": {"SQLITE_TUNING": "False", "SQLITE_TRANSACTION_MODE": "DEFERRED"},
+    "sqlite-tuned": {"SQLITE_TUNING": "True", "SQLITE_TRANSACTION_MODE": "IMMEDIATE"},
+}
+
+
+def worker(count: int) -> int:
+    """Save tickets through the repository, returning the number of failures."""
+    from django.db import connection, OperationalError
+
+    from pyticket.domain.tickets.entities import Category, Priority, Ticket
+    from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+
+    repository = DjangoTicketRepository()
+    failures = 0
+    try:
+        for index in range(count):
+            ticket = Ticket(title=f"Ticket {index}", description="Benchmark ticket")
+            ticket.classify(Category.TECHNICAL, Priority.MEDIUM)
+            try:
+                repository.save(ticket)
+            except OperationalError:
+                failures += 1
+    finally:
+        connection.close()
+    return failures
+
+
+def run_profile(workers: int, tickets: int) -> None:
+    """Run the workload in the current process and print a result line."""
+    from common import setup_django
+
+    setup_django()
+    from django.core.management import call_command
+
+    call_command("migrate", verbosity=0)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        failures = sum(executor.map(worker, [tickets] * workers))
+    elapsed = time.perf_counter() - start
+    saved = workers * tickets - failures
+    print(f"{saved / elapsed:.0f}\t{failures}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--tickets", type=int, default=200)
+    parser.add_argument("--run-profile", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_profile:
+        run_profile(args.workers, args.tickets)
+        return
+
+    print(f"{args.workers} workers x {args.tickets} tickets")
+    print(f"{'profile':<22}{'saves/s':<12}{'failed saves':<12}")
+    for name, profile_env in PROFILES.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {**os.environ, **profile_env, "DATABASE_NAME": str(Path(tmp) / "bench.sqlite3"), "PYTHONWARNINGS": "ignore"}
+            command = [sys.executable, __file__, "--run-profile", f"--workers={args.workers}", f"--tickets={args.tickets}"]
+            output = subprocess.run(command, env=env, capture_output=True, text=True, check=True).stdout  # nosec B603
+            rate, failures = output.strip().splitlines()[-1].split("\t")
+            print(f"{name:<22}{rate:<12}{failures:<12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark routing rule evaluation
+
+Compares evaluating each routing rule in turn (RoutingRule.matches, one
+regex search per keyword) with CompiledRoutingRules (decision table for
+category/priority plus a single prefix-factored keyword scan), for rule
+sets of 10 to 1000 rules with three keywords each, over 1000 tickets.
+
+Usage:
+    python benchmarks/bench_routing_rules.py
+"""
+
+import random
+from typing import List
+
+from common import best_of, print_row, setup_django
+
+setup_django()
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket  # noqa: E402
+from pyticket.domain.tickets.services import compile_routing_rules, RoutingRule  # noqa: E402
+
+RULE_COUNTS = (10, 100, 1000)
+TICKET_COUNT = 1000
+CATEGORIES = list(Category)
+PRIORITIES = list(Priority)
+FILLER = "the app crashes when i open the settings page after updating to the latest version".split()
+
+
+def make_rule_configs(count: int, rng: random.Random) -> List[dict]:
+    """Build rules conditioned on a category and three keywords each."""
+    return [
+        {
+            "team": f"team-{index}",
+            "categories": [rng.choice(CATEGORIES).value],
+            "keywords": [f"kw{index}a", f"kw{index}b", f"kw{index} phrase"],
+        }
+        for index in range(count)
+    ]
+
+
+def make_tickets(rule_count: int, rng: random.Random) -> List[Ticket]:
+    """Build classified tickets; about half mention a rule keyword."""
+    tickets = []
+    for _ in range(TICKET_COUNT):
+        words = rng.choices(FILLER, k=40)
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(len(words)), f"kw{rng.randrange(rule_count)}b")
+        ticket = Ticket(title="Support request", description=" ".join(words))
+        ticket.classify(rng.choice(CATEGORIES), rng.choice(PRIORITIES))
+        tickets.append(ticket)
+    return tickets
+
+
+def route_naive(rules: List[RoutingRule], tickets: List[Ticket]) -> None:
+    """Evaluate rules one by one until one matches."""
+    for ticket in tickets:
+        next((rule for rule in rules if rule.matches(ticket)), None)
+
+
+def route_compiled(compiled, tickets: List[Ticket]) -> None:
+    """Evaluate the compiled rules."""
+    for ticket in tickets:
+        compiled.match(ticket)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    rng = random.Random(7)
+    print_row("rules", "path", "us/ticket", "speedup")
+    for count in RULE_COUNTS:
+        configs = make_rule_configs(count, rng)
+        compiled = compile_routing_rules(configs)
+        tickets = make_tickets(count, rng)
+        baseline = best_of(lambda rules=list(compiled.rules), tickets=tickets: route_naive(rules, tickets), repeat=3, number=1)
+        elapsed = best_of(lambda compiled=compiled, tickets=tickets: route_compiled(compiled, tickets), repeat=3, number=1)
+        print_row(count, "rule by rule", f"{baseline / TICKET_COUNT * 1e6:.1f}", "1.00x")
+        print_row(count, "compiled", f"{elapsed / TICKET_COUNT * 1e6:.1f}", f"{baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark process startup cost of the AI provider imports
+
+Each scenario runs in a fresh interpreter (best of 5) and reports the wall
+time after interpreter start plus the number of modules loaded:
+
+- django.setup() alone (what every manage.py command and worker pays)
+- importing the factory the previous way, with both provider modules
+- importing the factory with the lazy provider registry
+- creating the configured OpenAI service (imports only that provider)
+
+Usage:
+    python benchmarks/bench_startup.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+from common import print_row, SRC_DIR
+
+REPEAT = 5
+
+PRELUDE = """
+import json, os, sys, time
+sys.path.insert(0, {src!r})
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyticket.configurator.settings")
+started = time.perf_counter()
+import django
+django.setup()
+"""
+
+SCENARIOS: Dict[str, str] = {
+    "django.setup()": "",
+    "eager providers": """
+import pyticket.infrastructure.ai.providers.anthropic_provider
+import pyticket.infrastructure.ai.providers.openai_provider
+import pyticket.infrastructure.ai.factory
+""",
+    "lazy registry": """
+import pyticket.infrastructure.ai.factory
+""",
+    "create OPENAI": """
+from pyticket.infrastructure.ai.factory import AIClassificationServiceFactory
+AIClassificationServiceFactory.create()
+""",
+}
+
+EPILOGUE = """
+print(json.dumps({"seconds": time.perf_counter() - started, "modules": len(sys.modules)}))
+"""
+
+
+def run_scenario(code: str) -> Tuple[float, int]:
+    """Run a scenario in fresh interpreters; return the best time and the module count."""
+    env = {**os.environ, "AI_PROVIDER": "OPENAI", "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY") or "benchmark"}
+    script = PRELUDE.format(src=str(SRC_DIR)) + code + EPILOGUE
+    best, modules = float("inf"), 0
+    for _ in range(REPEAT):
+        output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        best, modules = min(best, result["seconds"]), result["modules"]
+    return best, modules
+
+
+def main() -> None:
+    """Run the benchmark."""
+    results = {name: run_scenario(code) for name, code in SCENARIOS.items()}
+    baseline, _ = results["django.setup()"]
+    print_row("scenario", "ms", "modules", "vs setup")
+    for name, (elapsed, modules) in results.items():
+        print_row(name, f"{elapsed * 1000:.0f}", modules, f"{(elapsed - baseline) * 1000:+.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
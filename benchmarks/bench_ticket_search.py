@@ -0,0 +1,67 @@
+"""Benchmark indexed ticket search against a table scan
+
+Fills a temporary SQLite database with N tickets and compares the FTS5
+backend with the unindexed LIKE fallback for a rare keyword, a rare
+two-word query and a common word, on the first page and a deep page.
+
+Usage:
+    python benchmarks/bench_ticket_search.py [--tickets 100000]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+from pathlib import Path
+from uuid import uuid4
+
+from common import best_of, print_row, setup_django
+
+KEYWORDS = "refund chargeback outage timeout darkmode".split()
+KEYWORD_RATE = 0.002  # Share of tickets mentioning each keyword
+
+
+def populate(count: int) -> None:
+    """Insert count tickets drawn from a large vocabulary, with rare keywords."""
+    from pyticket.infrastructure.models.models import TicketModel
+
+    rng = random.Random(42)
+    vocabulary = [f"word{index}" for index in range(20_000)]
+    batch = []
+    for index in range(count):
+        words = rng.choices(vocabulary, k=30) + [keyword for keyword in KEYWORDS if rng.random() < KEYWORD_RATE]
+        rng.shuffle(words)
+        batch.append(TicketModel(id=uuid4(), title=" ".join(words[:5]), description=" ".join(words)))
+        if len(batch) == 5000 or index == count - 1:
+            TicketModel.objects.bulk_create(batch)
+            batch = []
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tickets", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_NAME"] = str(Path(tmp) / "search.sqlite3")
+        setup_django()
+        from django.core.management import call_command
+
+        from pyticket.infrastructure.repositories.search import ScanTicketSearch, SQLiteTicketSearch
+
+        call_command("migrate", verbosity=0)
+        populate(args.tickets)
+
+        print(f"{args.tickets} tickets")
+        print_row("backend", "query", "ms/first page", "ms/page 5")
+        for name, backend in (("fts5", SQLiteTicketSearch()), ("scan", ScanTicketSearch())):
+            for query in ("refund", "outage timeout", "word7"):
+                first = best_of(lambda backend=backend, query=query: backend.search(query, 20, None), repeat=3, number=3)
+                deep_cursor = (backend.search(query, 100, None) or [None])[-1]
+                deep = best_of(lambda backend=backend, query=query: backend.search(query, 20, deep_cursor), repeat=3, number=3)
+                print_row(name, query, f"{first * 1000:.1f}", f"{deep * 1000:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark ticket list response serialization
+
+Compares the schema-validated response path (DTO -> dict -> pydantic
+validation -> NinjaJSONEncoder) with the lean renderer used by the
+tickets router, for list responses of 100 to 1000 rows.
+
+Usage:
+    python benchmarks/bench_ticket_serialization.py
+"""
+
+import json
+from datetime import datetime, timezone
+from typing import List
+from uuid import uuid4
+
+from common import best_of, print_row, setup_django
+
+setup_django()
+
+from ninja.responses import NinjaJSONEncoder  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus  # noqa: E402
+from pyticket.entrypoints.web.api.tickets import renderers  # noqa: E402
+from pyticket.entrypoints.web.api.tickets.schemas import TicketResponseSchema  # noqa: E402
+from pyticket.service.tickets.dtos import ClassificationResultDTO, TicketResponseDTO  # noqa: E402
+
+ROW_COUNTS = (100, 500, 1000)
+LIST_ADAPTER = TypeAdapter(List[TicketResponseSchema])
+
+
+def make_dtos(count: int) -> List[TicketResponseDTO]:
+    """Build classified ticket DTOs."""
+    now = datetime.now(timezone.utc)
+    return [
+        TicketResponseDTO(
+            id=uuid4(),
+            title=f"Ticket {index}",
+            description="Cannot log into my account after the latest update " * 4,
+            status=TicketStatus.OPEN,
+            category=Category.TECHNICAL,
+            priority=Priority.HIGH,
+            created_at=now,
+            updated_at=now,
+            classification=ClassificationResultDTO(Category.TECHNICAL, Priority.HIGH, 0.0, ""),
+        )
+        for index in range(count)
+    ]
+
+
+def legacy_to_dict(ticket_dto: TicketResponseDTO) -> dict:
+    """Previous router conversion (DTO -> intermediate dict)."""
+    classification = ticket_dto.classification
+    return {
+        "id": ticket_dto.id,
+        "title": ticket_dto.title,
+        "description": ticket_dto.description,
+        "status": ticket_dto.status.value,
+        "category": ticket_dto.category.value if ticket_dto.category else None,
+        "priority": ticket_dto.priority.value if ticket_dto.priority else None,
+        "created_at": ticket_dto.created_at,
+        "updated_at": ticket_dto.updated_at,
+        "classification": (
+            {
+                "category": classification.category.value,
+                "priority": classification.priority.value,
+                "confidence_score": classification.confidence_score,
+                "reasoning": classification.reasoning,
+            }
+            if classification
+            else None
+        ),
+    }
+
+
+def legacy_render(dtos: List[TicketResponseDTO]) -> bytes:
+    """Schema-validated rendering as performed by django-ninja."""
+    validated = LIST_ADAPTER.validate_python([legacy_to_dict(dto) for dto in dtos])
+    data = LIST_ADAPTER.dump_python(validated)
+    return json.dumps(data, cls=NinjaJSONEncoder).encode("utf-8")
+
+
+def lean_render(dtos: List[TicketResponseDTO], encoder) -> bytes:
+    """Lean rendering with the given encoder."""
+    return encoder([renderers.ticket_to_dict(dto) for dto in dtos])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    encoders = {"stdlib": renderers.stdlib_json_encoder}
+    if renderers.orjson is not None:
+        encoders["orjson"] = renderers.orjson.dumps
+
+    print_row("rows", "path", "ms/response", "speedup")
+    for count in ROW_COUNTS:
+        dtos = make_dtos(count)
+        baseline = best_of(lambda dtos=dtos: legacy_render(dtos))
+        print_row(count, "schema-validated", f"{baseline * 1000:.2f}", "1.00x")
+        for name, encoder in encoders.items():
+            elapsed = best_of(lambda dtos=dtos, encoder=encoder: lean_render(dtos, encoder))
+            print_row(count, f"lean/{name}", f"{elapsed * 1000:.2f}", f"{baseline / elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
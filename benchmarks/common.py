@@ -0,0 +1,36 @@
+"""Shared helpers for benchmark scripts"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+
+def setup_django() -> None:
+    """Configure Django so benchmarks can import the application."""
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyticket.configurator.settings")
+
+    import django
+
+    django.setup()
+
+
+def best_of(func: Callable[[], object], repeat: int = 5, number: int = 10) -> float:
+    """Return the best average wall time per call in seconds."""
+    timings: List[float] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def print_row(*columns: object) -> None:
+    """Print a fixed-width result row."""
+    print("".join(f"{str(column):<22}" for column in columns))
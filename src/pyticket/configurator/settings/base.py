@@ -28,6 +28,7 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "ninja",
+    "ninja_extra",
     "ninja_jwt",
     "django_ai_assistant",
     "pyticket.infrastructure.models",
@@ -41,6 +42,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "pyticket.entrypoints.web.api.ratelimit.RateLimitHeadersMiddleware",
 ]
 
 ROOT_URLCONF = "pyticket.entrypoints.web.urls"
@@ -64,12 +66,58 @@ TEMPLATES = [
 WSGI_APPLICATION = "pyticket.entrypoints.web.wsgi.application"
 
 # Database
-DATABASES = {
-    "default": {
-        "ENGINE": "django.db.backends.sqlite3",
-        "NAME": BASE_DIR / "db.sqlite3",
+# DATABASE_ENGINE selects the profile: tuned SQLite (default) or PostgreSQL.
+DATABASE_ENGINE = os.getenv("DATABASE_ENGINE", "django.db.backends.sqlite3")
+
+if DATABASE_ENGINE == "django.db.backends.postgresql":
+    DATABASES = {
+        "default": {
+            "ENGINE": DATABASE_ENGINE,
+            "NAME": os.getenv("DATABASE_NAME", "pyticket"),
+            "USER": os.getenv("DATABASE_USER", ""),
+            "PASSWORD": os.getenv("DATABASE_PASSWORD", ""),
+            "HOST": os.getenv("DATABASE_HOST", "localhost"),
+            "PORT": os.getenv("DATABASE_PORT", "5432"),
+            # Persistent connections instead of one connection per request
+            "CONN_MAX_AGE": int(os.getenv("DATABASE_CONN_MAX_AGE", "60")),
+            "CONN_HEALTH_CHECKS": True,
+            "OPTIONS": {},
+        }
     }
-}
+    if os.getenv("DATABASE_POOL", "False").lower() == "true":
+        # Django connection pool (requires psycopg[pool]); replaces persistent connections
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["OPTIONS"]["pool"] = {
+            "min_size": int(os.getenv("DATABASE_POOL_MIN_SIZE", "2")),
+            "max_size": int(os.getenv("DATABASE_POOL_MAX_SIZE", "10")),
+            "timeout": int(os.getenv("DATABASE_POOL_TIMEOUT", "10")),
+        }
+else:
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": os.getenv("DATABASE_NAME", str(BASE_DIR / "db.sqlite3")),
+            "OPTIONS": {
+                # Take the write lock when a transaction starts to avoid lock-upgrade failures
+                "transaction_mode": os.getenv("SQLITE_TRANSACTION_MODE", "IMMEDIATE"),
+                "timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")) / 1000,
+            },
+        }
+    }
+
+# PRAGMAs applied to every new SQLite connection (see infrastructure.models.connection).
+# Set SQLITE_TUNING=False to use SQLite defaults.
+SQLITE_PRAGMAS = (
+    {
+        "journal_mode": os.getenv("SQLITE_JOURNAL_MODE", "WAL"),
+        "synchronous": os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        "busy_timeout": int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+        "mmap_size": int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+        "temp_store": "MEMORY",
+    }
+    if os.getenv("SQLITE_TUNING", "True").lower() == "true"
+    else {}
+)
 
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
@@ -87,6 +135,48 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing: PASSWORD_HASHER picks the algorithm of new hashes (pbkdf2,
+# scrypt, or argon2 with the argon2 extra); hashes made by the others still
+# verify and are re-hashed on the next login. Cost settings of 0 keep Django's
+# defaults (1,000,000 PBKDF2 iterations, scrypt N=2**14, argon2 2 passes over 100 MiB).
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "pbkdf2").lower()
+_PASSWORD_HASHER_PATHS = {
+    "pbkdf2": "pyticket.infrastructure.auth.hashers.PBKDF2PasswordHasher",
+    "scrypt": "pyticket.infrastructure.auth.hashers.ScryptPasswordHasher",
+    "argon2": "pyticket.infrastructure.auth.hashers.Argon2PasswordHasher",
+}
+PASSWORD_HASHERS = [_PASSWORD_HASHER_PATHS[PASSWORD_HASHER]] + [
+    path for name, path in _PASSWORD_HASHER_PATHS.items() if name != PASSWORD_HASHER
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "0"))
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv("PASSWORD_SCRYPT_WORK_FACTOR", "0"))
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", "0"))
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", "0"))  # KiB
+
+# Hash passwords of the auth endpoints on a bounded thread pool (0 = on the
+# request thread). Beyond WORKERS + MAX_PENDING concurrent hashes they answer 429.
+PASSWORD_HASHING_WORKERS = int(os.getenv("PASSWORD_HASHING_WORKERS", "2"))
+PASSWORD_HASHING_MAX_PENDING = int(os.getenv("PASSWORD_HASHING_MAX_PENDING", "16"))
+
+# Rate limits, counted by API_RATE_LIMIT_BACKEND (an IRateLimiter). The default
+# counts in process memory; CacheRateLimiter counts in the API_RATE_LIMIT_CACHE
+# Django cache, which holds across workers when the cache is shared.
+API_RATE_LIMIT_BACKEND = os.getenv("API_RATE_LIMIT_BACKEND", "pyticket.infrastructure.ratelimit.in_memory.InMemoryRateLimiter")
+API_RATE_LIMIT_CACHE = os.getenv("API_RATE_LIMIT_CACHE", "default")
+# Per authenticated user: "classify" covers the endpoints calling the AI provider
+# (create, reclassify), "default" every other ticket endpoint. Empty = unlimited.
+API_RATE_LIMITS = {
+    "classify": os.getenv("API_RATE_LIMIT_CLASSIFY", "30/minute"),
+    "default": os.getenv("API_RATE_LIMIT_DEFAULT", "600/minute"),
+}
+# Login attempts allowed per username and per client IP in each window (0 = unlimited)
+LOGIN_RATE_LIMIT_ATTEMPTS = int(os.getenv("LOGIN_RATE_LIMIT_ATTEMPTS", "10"))
+LOGIN_RATE_LIMIT_WINDOW_SECONDS = float(os.getenv("LOGIN_RATE_LIMIT_WINDOW_SECONDS", "60"))
+# Idempotency-Key of POST /tickets/: how long a key's response is replayed, and
+# after how long a key whose request never finished (worker died) can run again
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "300"))
+
 # Internationalization
 LANGUAGE_CODE = "en-us"
 TIME_ZONE = "UTC"
@@ -100,10 +190,38 @@ STATIC_URL = "static/"
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 # AI Provider Settings
-AI_PROVIDER = os.getenv("AI_PROVIDER", "OPENAI")  # OPENAI or ANTHROPIC
+AI_PROVIDER = os.getenv("AI_PROVIDER", "OPENAI")  # OPENAI, ANTHROPIC, REPLAY or a name from AI_PROVIDERS
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
 AI_MODEL = os.getenv("AI_MODEL", "gpt-4o-mini")  # Default model
+# Extra providers by name -> dotted path of the service class, e.g.
+# {"MISTRAL": "myproject.ai.MistralClassificationService"}. Providers are
+# imported on first use; packages can also register "pyticket.ai_providers" entry points.
+AI_PROVIDERS: dict = {}
+
+# Record/replay provider (AI_PROVIDER=REPLAY) for offline load testing.
+# RECORD calls AI_REPLAY_SOURCE and stores prompt -> response pairs with their
+# latency; REPLAY answers from the store, sleeping latency * LATENCY_SCALE.
+AI_REPLAY_MODE = os.getenv("AI_REPLAY_MODE", "REPLAY")
+AI_REPLAY_SOURCE = os.getenv("AI_REPLAY_SOURCE", "OPENAI")
+AI_REPLAY_FILE = os.getenv("AI_REPLAY_FILE", str(BASE_DIR / "ai_recordings.sqlite3"))
+AI_REPLAY_LATENCY_SCALE = float(os.getenv("AI_REPLAY_LATENCY_SCALE", "1.0"))
+
+# Persistent classification cache shared by all worker processes (empty = off).
+# Keyed by model, AI_PROMPT_VERSION and prompt; bump the version on prompt changes.
+AI_CACHE_FILE = os.getenv("AI_CACHE_FILE", "")
+AI_CACHE_MAX_ENTRIES = int(os.getenv("AI_CACHE_MAX_ENTRIES", "100000"))
+AI_CACHE_MEMORY_ENTRIES = int(os.getenv("AI_CACHE_MEMORY_ENTRIES", "1024"))
+AI_CACHE_WARM_START = os.getenv("AI_CACHE_WARM_START", "False").lower() == "true"
+AI_PROMPT_VERSION = os.getenv("AI_PROMPT_VERSION", "1")
+
+# Token prices per million tokens, used for the cost estimates of
+# GET /api/tickets/usage; models without a price report no cost.
+AI_TOKEN_PRICES: dict = {
+    "gpt-4o-mini": {"prompt": 0.15, "completion": 0.60},
+    "gpt-4o": {"prompt": 2.50, "completion": 10.00},
+    "claude-3-haiku-20240307": {"prompt": 0.25, "completion": 1.25},
+}
 
 # Django AI Assistant Settings
 DJANGO_AI_ASSISTANT_SETTINGS = {
@@ -111,6 +229,78 @@ DJANGO_AI_ASSISTANT_SETTINGS = {
     "default_temperature": 0.7,
 }
 
+# Ticket API JSON encoder (dotted path to a callable returning bytes).
+# Empty means orjson when installed, otherwise the standard library.
+TICKETS_JSON_ENCODER = os.getenv("TICKETS_JSON_ENCODER", "")
+
+# Ticket event stream (server-sent events)
+# Dotted path to an ITicketEventBus implementation; the default is in-process only.
+TICKET_EVENT_BUS = os.getenv("TICKET_EVENT_BUS", "pyticket.infrastructure.events.in_memory_bus.InMemoryTicketEventBus")
+TICKET_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("TICKET_EVENTS_HEARTBEAT_SECONDS", "15"))
+
+# Routing dispatch (see the dispatch_routing_events management command)
+# Dotted path to an IRoutingSink implementation receiving per-team batches.
+ROUTING_SINK = os.getenv("ROUTING_SINK", "pyticket.infrastructure.routing.sinks.LoggingRoutingSink")
+ROUTING_EVENTS_FILE = os.getenv("ROUTING_EVENTS_FILE", str(BASE_DIR / "routing_events.jsonl"))
+ROUTING_DISPATCH_BATCH_SIZE = int(os.getenv("ROUTING_DISPATCH_BATCH_SIZE", "100"))
+ROUTING_DISPATCH_MAX_ATTEMPTS = int(os.getenv("ROUTING_DISPATCH_MAX_ATTEMPTS", "5"))
+# Longest wait between retries while batches keep failing (the wait doubles per failure)
+ROUTING_DISPATCH_MAX_BACKOFF = float(os.getenv("ROUTING_DISPATCH_MAX_BACKOFF", "60"))
+
+# Ticket rules: status transitions, default priorities and routing teams.
+# Overrides are keyed by enum value and merged into the built-in tables, e.g.
+# TICKET_RULES = {"teams": {"BILLING": "finance"}, "transitions": {"CLOSED": ["OPEN"]}}
+TICKET_RULES_FILE = os.getenv("TICKET_RULES_FILE", "")
+TICKET_RULES: dict = {}
+
+# Ticket routing rules, evaluated in order before the category teams above, e.g.
+# [{"team": "vip-billing", "categories": ["BILLING"], "priorities": ["HIGH", "URGENT"]},
+#  {"team": "security", "keywords": ["breach", "phishing", "2fa"]}]
+# The rules file (a JSON list) is reloaded on change every RELOAD_SECONDS (0 disables).
+TICKET_ROUTING_RULES_FILE = os.getenv("TICKET_ROUTING_RULES_FILE", "")
+TICKET_ROUTING_RULES_RELOAD_SECONDS = float(os.getenv("TICKET_ROUTING_RULES_RELOAD_SECONDS", "5"))
+TICKET_ROUTING_RULES: list = []
+
+# Ticket ingestion admission control: classification is deferred to background
+# workers once DEFER_DEPTH tickets are being classified or queued, and new
+# tickets get 429 + Retry-After once MAX_DEPTH tickets are queued.
+TICKET_INGESTION_MAX_DEPTH = int(os.getenv("TICKET_INGESTION_MAX_DEPTH", "1000"))
+TICKET_INGESTION_DEFER_DEPTH = int(os.getenv("TICKET_INGESTION_DEFER_DEPTH", "8"))
+TICKET_INGESTION_WORKERS = int(os.getenv("TICKET_INGESTION_WORKERS", "2"))
+# The queue is in memory: when a process starts ingesting, tickets left
+# unclassified for RECOVER_AGE_SECONDS are queued again (negative disables;
+# the classify_pending_tickets command does the same on demand).
+TICKET_INGESTION_RECOVER_AGE_SECONDS = float(os.getenv("TICKET_INGESTION_RECOVER_AGE_SECONDS", "300"))
+# Deferred tickets are classified most urgent first by a keyword estimate of
+# their priority; each AGING_SECONDS of waiting counts as one priority level.
+# TICKET_URGENCY_KEYWORDS replaces the built-in keywords, e.g. {"URGENT": ["outage"]}
+TICKET_CLASSIFICATION_AGING_SECONDS = float(os.getenv("TICKET_CLASSIFICATION_AGING_SECONDS", "60"))
+TICKET_URGENCY_KEYWORDS: dict = {}
+# A new ticket whose content matches one created in the last DUPLICATE_WINDOW_SECONDS
+# returns that ticket instead of being created and classified again (0 = disabled).
+# DUPLICATE_THRESHOLD is the minimum estimated similarity; 1.0 only matches the same
+# text up to case, punctuation and spacing. Tickets have no reporter, so matching is
+# global: a fuzzy threshold (< 1.0) can merge similar reports from different customers
+# and is opt-in.
+TICKET_DUPLICATE_WINDOW_SECONDS = float(os.getenv("TICKET_DUPLICATE_WINDOW_SECONDS", "0"))
+TICKET_DUPLICATE_THRESHOLD = float(os.getenv("TICKET_DUPLICATE_THRESHOLD", "1.0"))
+
+# Ticket archival (see the archive_tickets management command): CLOSED and
+# soft-deleted tickets untouched for ARCHIVE_AFTER_DAYS move to tickets_archive,
+# BATCH_SIZE per transaction. Reads use the tickets table unless asked for archives.
+TICKET_ARCHIVE_AFTER_DAYS = int(os.getenv("TICKET_ARCHIVE_AFTER_DAYS", "90"))
+TICKET_ARCHIVE_BATCH_SIZE = int(os.getenv("TICKET_ARCHIVE_BATCH_SIZE", "500"))
+
+# Bulk reclassification (see the reclassify_tickets management command)
+# Size the worker pool to what the AI provider's rate limit allows.
+RECLASSIFY_BATCH_SIZE = int(os.getenv("RECLASSIFY_BATCH_SIZE", "100"))
+RECLASSIFY_WORKERS = int(os.getenv("RECLASSIFY_WORKERS", "4"))
+# Bulk classification runs in threads (I/O-bound provider calls) or, with
+# "process", in worker processes for CPU-bound local classification
+# (0 workers = one per CPU).
+CLASSIFICATION_EXECUTION = os.getenv("CLASSIFICATION_EXECUTION", "thread")
+CLASSIFICATION_PROCESS_WORKERS = int(os.getenv("CLASSIFICATION_PROCESS_WORKERS", "0"))
+JOB_CHECKPOINT_DIR = os.getenv("JOB_CHECKPOINT_DIR", str(BASE_DIR / ".checkpoints"))
 
 NINJA_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=60),
@@ -118,3 +308,12 @@ NINJA_JWT = {
     "ALGORITHM": "HS256",
     "SECRET_KEY": SECRET_KEY,
 }
+
+# Authentication of the ticket endpoints: "database" loads the user on every
+# request, "cached" reuses verified tokens and users (API_AUTH_CACHE, a Django
+# cache alias; use a shared cache to invalidate users in all workers at once),
+# "stateless" trusts the token claims without loading the user.
+API_AUTH_MODE = os.getenv("API_AUTH_MODE", "cached")
+API_AUTH_USER_CACHE_SECONDS = float(os.getenv("API_AUTH_USER_CACHE_SECONDS", "30"))
+API_AUTH_TOKEN_CACHE_SIZE = int(os.getenv("API_AUTH_TOKEN_CACHE_SIZE", "1024"))
+API_AUTH_CACHE = os.getenv("API_AUTH_CACHE", "default")
@@ -3,7 +3,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional
 from uuid import UUID, uuid4
 
 
@@ -35,7 +36,29 @@ class TicketStatus(Enum):
     CLOSED = "CLOSED"
 
 
-@dataclass
+StatusTransitions = Mapping[TicketStatus, FrozenSet[TicketStatus]]
+
+DEFAULT_STATUS_TRANSITIONS: StatusTransitions = MappingProxyType(
+    {
+        TicketStatus.OPEN: frozenset({TicketStatus.IN_PROGRESS, TicketStatus.CLOSED}),
+        TicketStatus.IN_PROGRESS: frozenset({TicketStatus.RESOLVED, TicketStatus.OPEN}),
+        TicketStatus.RESOLVED: frozenset({TicketStatus.CLOSED, TicketStatus.IN_PROGRESS}),
+        TicketStatus.CLOSED: frozenset(),
+    }
+)
+
+# Active transition table; replaced through domain.tickets.rules.set_rules
+_status_transitions: StatusTransitions = DEFAULT_STATUS_TRANSITIONS
+_NO_TRANSITIONS: FrozenSet[TicketStatus] = frozenset()
+
+
+def set_status_transitions(transitions: StatusTransitions) -> None:
+    """Replace the allowed status transitions."""
+    global _status_transitions
+    _status_transitions = transitions
+
+
+@dataclass(slots=True)
 class Ticket:
     """Ticket domain entity"""
 
@@ -57,14 +80,7 @@ class Ticket:
 
     def update_status(self, new_status: TicketStatus) -> None:
         """Update ticket status with validation."""
-        valid_transitions = {
-            TicketStatus.OPEN: [TicketStatus.IN_PROGRESS, TicketStatus.CLOSED],
-            TicketStatus.IN_PROGRESS: [TicketStatus.RESOLVED, TicketStatus.OPEN],
-            TicketStatus.RESOLVED: [TicketStatus.CLOSED, TicketStatus.IN_PROGRESS],
-            TicketStatus.CLOSED: [],
-        }
-
-        if new_status not in valid_transitions.get(self.status, []):
+        if new_status not in _status_transitions.get(self.status, _NO_TRANSITIONS):
             raise ValueError(f"Cannot transition from {self.status.value} to {new_status.value}")
 
         self.status = new_status
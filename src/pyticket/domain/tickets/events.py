@@ -0,0 +1,57 @@
+"""Domain events for tickets"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+
+
+class TicketEventType(Enum):
+    """Ticket event type enumeration"""
+
+    CREATED = "ticket.created"
+    CLASSIFIED = "ticket.classified"
+    STATUS_CHANGED = "ticket.status_changed"
+
+
+@dataclass(frozen=True, slots=True)
+class TicketEvent:
+    """Event describing a change to a ticket"""
+
+    event_type: TicketEventType
+    ticket_id: UUID
+    status: TicketStatus
+    category: Optional[Category] = None
+    priority: Optional[Priority] = None
+    occurred_at: datetime = field(default_factory=datetime.utcnow)
+
+    @classmethod
+    def for_ticket(cls, event_type: TicketEventType, ticket: Ticket) -> "TicketEvent":
+        """Create an event from the current state of a ticket."""
+        return cls(
+            event_type=event_type,
+            ticket_id=ticket.id,
+            status=ticket.status,
+            category=ticket.category,
+            priority=ticket.priority,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingEvent:
+    """Event asking a team to pick up a ticket"""
+
+    ticket_id: UUID
+    team: str
+    category: Category
+    priority: Optional[Priority] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    id: Optional[int] = None  # Assigned by the outbox when persisted
+
+    @classmethod
+    def for_ticket(cls, ticket: Ticket, team: str) -> "RoutingEvent":
+        """Create a routing event for a classified ticket."""
+        return cls(ticket_id=ticket.id, team=team, category=ticket.category, priority=ticket.priority)
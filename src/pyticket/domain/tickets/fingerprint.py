@@ -0,0 +1,82 @@
+"""Content fingerprints for detecting duplicate tickets"""
+
+import hashlib
+import re
+import zlib
+from dataclasses import dataclass
+from typing import List, Set, Tuple
+
+SHINGLE_SIZE = 3  # Words per shingle
+MINHASH_PERMUTATIONS = 32
+SIGNATURE_HEX_LENGTH = MINHASH_PERMUTATIONS * 8
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+
+def _coefficient(name: str) -> int:
+    """Fixed hash coefficient; signatures must not change between processes or releases."""
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "big") % _PRIME or 1
+
+
+_PERMUTATIONS: Tuple[Tuple[int, int], ...] = tuple((_coefficient(f"a{i}"), _coefficient(f"b{i}")) for i in range(MINHASH_PERMUTATIONS))
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased words of a text; punctuation, case and spacing are ignored."""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def shingles(tokens: List[str]) -> Set[str]:
+    """Word n-grams of a token list; a text shorter than SHINGLE_SIZE is a single shingle."""
+    if len(tokens) <= SHINGLE_SIZE:
+        return {" ".join(tokens)}
+    return {" ".join(tokens[i : i + SHINGLE_SIZE]) for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+
+
+def minhash(items: Set[str]) -> Tuple[int, ...]:
+    """MinHash signature of a set; equal positions estimate the Jaccard similarity of two sets."""
+    hashes = [zlib.crc32(item.encode()) for item in items]
+    return tuple(min((a * value + b) % _PRIME & _MAX_HASH for value in hashes) for a, b in _PERMUTATIONS)
+
+
+@dataclass(frozen=True, slots=True)
+class TicketFingerprint:
+    """Fingerprint of a ticket's title and description"""
+
+    digest: str  # SHA-256 of the normalized text; equal for exact duplicates
+    signature: Tuple[int, ...]  # MinHash of the word shingles; close for near duplicates
+
+    @classmethod
+    def of(cls, title: str, description: str) -> "TicketFingerprint":
+        """Fingerprint a ticket's content."""
+        title_tokens, description_tokens = tokenize(title), tokenize(description)
+        normalized = " ".join(title_tokens) + "\n" + " ".join(description_tokens)
+        return cls(
+            digest=hashlib.sha256(normalized.encode()).hexdigest(),
+            signature=minhash(shingles(title_tokens + description_tokens)),
+        )
+
+    @classmethod
+    def from_stored(cls, digest: str, signature_hex: str) -> "TicketFingerprint":
+        """
+        Rebuild a fingerprint from its stored form.
+
+        Raises:
+            ValueError: If the signature is malformed
+        """
+        if len(signature_hex) != SIGNATURE_HEX_LENGTH:
+            raise ValueError("Invalid MinHash signature")
+        return cls(digest=digest, signature=tuple(int(signature_hex[i : i + 8], 16) for i in range(0, SIGNATURE_HEX_LENGTH, 8)))
+
+    @property
+    def signature_hex(self) -> str:
+        """Signature as fixed-width hex, for storage."""
+        return "".join(f"{value:08x}" for value in self.signature)
+
+    def similarity(self, other: "TicketFingerprint") -> float:
+        """Estimated Jaccard similarity of the two tickets' shingles (1.0 for exact duplicates)."""
+        if self.digest == other.digest:
+            return 1.0
+        return sum(a == b for a, b in zip(self.signature, other.signature, strict=True)) / MINHASH_PERMUTATIONS
@@ -0,0 +1,107 @@
+"""Precomputed ticket rule tables"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+from pyticket.domain.tickets.entities import (
+    Category,
+    DEFAULT_STATUS_TRANSITIONS,
+    Priority,
+    set_status_transitions,
+    StatusTransitions,
+    TicketStatus,
+)
+
+DEFAULT_TEAM = "customer-support"
+
+
+@dataclass(frozen=True, slots=True)
+class TicketRules:
+    """Immutable lookup tables for status transitions, default priorities and team routing"""
+
+    transitions: StatusTransitions
+    default_priorities: Mapping[Category, Priority]
+    teams: Mapping[Category, str]
+    default_team: str = DEFAULT_TEAM
+    fallback_priority: Priority = Priority.MEDIUM
+
+    def team_for(self, category: Optional[Category]) -> str:
+        """Get the team handling a category."""
+        return self.teams.get(category, self.default_team)
+
+    def default_priority_for(self, category: Category) -> Priority:
+        """Get the default priority of a category."""
+        return self.default_priorities.get(category, self.fallback_priority)
+
+    def with_config(self, config: Mapping[str, Any]) -> "TicketRules":
+        """
+        Get a copy of these rules with the configured entries replaced.
+
+        Entries are keyed by enum value, e.g.::
+
+            {
+                "transitions": {"CLOSED": ["OPEN"]},
+                "default_priorities": {"BILLING": "URGENT"},
+                "teams": {"BILLING": "finance"},
+                "default_team": "helpdesk",
+            }
+
+        Sections and keys that are not configured keep their current value.
+
+        Raises:
+            ValueError: If a section, status, category or priority is unknown
+        """
+        unknown = set(config) - {"transitions", "default_priorities", "teams", "default_team"}
+        if unknown:
+            raise ValueError(f"Unknown ticket rule sections: {', '.join(sorted(unknown))}")
+
+        transitions = {
+            TicketStatus(status): frozenset(map(TicketStatus, targets)) for status, targets in config.get("transitions", {}).items()
+        }
+        priorities = {Category(category): Priority(priority) for category, priority in config.get("default_priorities", {}).items()}
+        teams = {Category(category): str(team) for category, team in config.get("teams", {}).items()}
+        return TicketRules(
+            transitions=MappingProxyType({**self.transitions, **transitions}),
+            default_priorities=MappingProxyType({**self.default_priorities, **priorities}),
+            teams=MappingProxyType({**self.teams, **teams}),
+            default_team=config.get("default_team", self.default_team),
+            fallback_priority=self.fallback_priority,
+        )
+
+
+DEFAULT_RULES = TicketRules(
+    transitions=DEFAULT_STATUS_TRANSITIONS,
+    default_priorities=MappingProxyType(
+        {
+            Category.TECHNICAL: Priority.MEDIUM,
+            Category.BILLING: Priority.HIGH,
+            Category.FEATURE_REQUEST: Priority.LOW,
+            Category.BUG_REPORT: Priority.HIGH,
+            Category.GENERAL: Priority.LOW,
+        }
+    ),
+    teams=MappingProxyType(
+        {
+            Category.TECHNICAL: "technical-support",
+            Category.BILLING: "billing-team",
+            Category.FEATURE_REQUEST: "product-team",
+            Category.BUG_REPORT: "engineering-team",
+            Category.GENERAL: "customer-support",
+        }
+    ),
+)
+
+_active_rules: TicketRules = DEFAULT_RULES
+
+
+def get_rules() -> TicketRules:
+    """Get the active ticket rules."""
+    return _active_rules
+
+
+def set_rules(rules: TicketRules) -> None:
+    """Activate ticket rules, including the status transitions enforced by Ticket."""
+    global _active_rules
+    _active_rules = rules
+    set_status_transitions(rules.transitions)
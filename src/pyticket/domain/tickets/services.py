@@ -1,6 +1,13 @@
 """Domain services for tickets"""
 
-from pyticket.domain.tickets.entities import Category, Priority
+import re
+from dataclasses import dataclass
+from itertools import product
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Pattern, Sequence, Set, Tuple
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.domain.tickets.rules import get_rules
 
 
 class TicketClassificationService:
@@ -17,14 +24,214 @@ class TicketClassificationService:
     @staticmethod
     def get_default_priority_for_category(category: Category) -> Priority:
         """Get default priority based on category."""
-        defaults = {
-            Category.TECHNICAL: Priority.MEDIUM,
-            Category.BILLING: Priority.HIGH,
-            Category.FEATURE_REQUEST: Priority.LOW,
-            Category.BUG_REPORT: Priority.HIGH,
-            Category.GENERAL: Priority.LOW,
+        return get_rules().default_priority_for(category)
+
+
+def normalize_keyword(keyword: str) -> str:
+    """Lower-case a keyword and collapse its whitespace."""
+    return " ".join(keyword.lower().split())
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingRule:
+    """Declarative routing rule; an empty condition matches any value"""
+
+    team: str
+    categories: FrozenSet[Category] = frozenset()
+    priorities: FrozenSet[Priority] = frozenset()
+    customer_tiers: FrozenSet[str] = frozenset()
+    keywords: FrozenSet[str] = frozenset()  # Any of them, as whole words in title or description
+
+    _FIELDS = frozenset({"team", "categories", "priorities", "customer_tiers", "keywords"})
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "RoutingRule":
+        """
+        Build a rule from its configuration, e.g.::
+
+            {"team": "vip-billing", "categories": ["BILLING"], "customer_tiers": ["enterprise"]}
+
+        Raises:
+            ValueError: If a field, category or priority is unknown, or the team is missing
+        """
+        unknown = set(config) - cls._FIELDS
+        if unknown:
+            raise ValueError(f"Unknown routing rule fields: {', '.join(sorted(unknown))}")
+        if not config.get("team"):
+            raise ValueError("Routing rule needs a team")
+        return cls(
+            team=str(config["team"]),
+            categories=frozenset(map(Category, config.get("categories", ()))),
+            priorities=frozenset(map(Priority, config.get("priorities", ()))),
+            customer_tiers=frozenset(config.get("customer_tiers", ())),
+            keywords=frozenset(filter(None, map(normalize_keyword, config.get("keywords", ())))),
+        )
+
+    def accepts_classification(self, category: Optional[Category], priority: Optional[Priority]) -> bool:
+        """Check the category and priority conditions."""
+        return (not self.categories or category in self.categories) and (not self.priorities or priority in self.priorities)
+
+    def accepts_tier(self, customer_tier: Optional[str]) -> bool:
+        """Check the customer tier condition."""
+        return not self.customer_tiers or customer_tier in self.customer_tiers
+
+    def matches(self, ticket: Ticket, customer_tier: Optional[str] = None) -> bool:
+        """Evaluate the rule directly (reference for CompiledRoutingRules)."""
+        if not self.accepts_classification(ticket.category, ticket.priority) or not self.accepts_tier(customer_tier):
+            return False
+        text = f"{ticket.title}\n{ticket.description}"
+        return not self.keywords or any(re.search(rf"\b{re.escape(keyword)}\b", text, re.IGNORECASE) for keyword in self.keywords)
+
+
+def _trie_regex(words: Iterable[str]) -> str:
+    """Build a regex matching any of the words, factored by common prefixes."""
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_regex(trie)
+
+
+def _trie_node_regex(node: Dict[str, dict]) -> str:
+    """Regex for the words below a trie node; longer continuations are tried first."""
+    alternatives = [re.escape(char) + _trie_node_regex(child) for char, child in sorted(node.items()) if char]
+    if not alternatives:
+        return ""
+    body = alternatives[0] if len(alternatives) == 1 else "(?:" + "|".join(alternatives) + ")"
+    if "" in node:
+        return f"(?:{body})?"
+    return body
+
+
+def _contained_keywords(keyword: str, keywords: Set[str]) -> Set[str]:
+    """Get the keywords occurring as whole words inside a (multi-word) keyword."""
+    bounds = sorted({0, len(keyword), *(match.start() for match in re.finditer(r"\b", keyword))})
+    return {keyword[start:end] for start, end in product(bounds, bounds) if start < end and keyword[start:end] in keywords}
+
+
+class KeywordScanner:
+    """
+    Finds which of many keywords occur in a text with a single regex scan.
+
+    Keywords are compiled into one prefix-factored regex. The scan reports
+    the longest keyword at each position, so each keyword also carries the
+    labels of shorter keywords it contains ("refund" in "refund request").
+    """
+
+    def __init__(self, labels: Mapping[str, Iterable[Any]]):
+        """
+        Initialize scanner.
+
+        Args:
+            labels: Normalized keyword -> labels reported when it occurs
+        """
+        direct = {keyword: frozenset(keyword_labels) for keyword, keyword_labels in labels.items() if keyword}
+        known = set(direct)
+        self._labels: Dict[str, FrozenSet[Any]] = {
+            keyword: frozenset().union(*(direct[contained] for contained in _contained_keywords(keyword, known))) for keyword in direct
         }
-        return defaults.get(category, Priority.MEDIUM)
+        self._pattern: Optional[Pattern] = re.compile(rf"(?=\b({_trie_regex(direct)})\b)", re.IGNORECASE) if direct else None
+
+    def __bool__(self) -> bool:
+        return self._pattern is not None
+
+    def scan(self, text: str) -> Set[Any]:
+        """Get the labels of all keywords occurring as whole words in the text."""
+        found: Set[Any] = set()
+        if self._pattern is None:
+            return found
+        for keyword in self._pattern.findall(text):
+            found.update(self._labels.get(normalize_keyword(keyword), ()))
+        return found
+
+
+class CompiledRoutingRules:
+    """
+    Routing rules compiled for evaluation on every ticket.
+
+    Category and priority conditions are resolved up front into a decision
+    table holding the candidate rules for each (category, priority) pair.
+    All keywords are compiled into one prefix-factored regex, so a ticket's
+    text is scanned once no matter how many rules there are. Rules keep
+    their configured order: the first matching rule wins.
+    """
+
+    def __init__(self, rules: Sequence[RoutingRule] = ()):
+        self.rules: Tuple[RoutingRule, ...] = tuple(rules)
+        self._table, self._table_needs_keywords = self._build_decision_table(self.rules)
+        self._keywords = self._compile_keywords(self.rules)
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    @staticmethod
+    def _build_decision_table(rules: Sequence[RoutingRule]) -> Tuple[Dict[tuple, Tuple[int, ...]], Dict[tuple, bool]]:
+        """Map every (category, priority) pair to the indexes of the rules it can match."""
+        table = {}
+        for category, priority in product([None, *Category], [None, *Priority]):
+            table[(category, priority)] = tuple(
+                index for index, rule in enumerate(rules) if rule.accepts_classification(category, priority)
+            )
+        needs_keywords = {cell: any(rules[index].keywords for index in indexes) for cell, indexes in table.items()}
+        return table, needs_keywords
+
+    @staticmethod
+    def _compile_keywords(rules: Sequence[RoutingRule]) -> KeywordScanner:
+        """Compile all keywords into one scanner reporting the indexes of the rules they satisfy."""
+        rule_indexes: Dict[str, Set[int]] = {}
+        for index, rule in enumerate(rules):
+            for keyword in rule.keywords:
+                rule_indexes.setdefault(keyword, set()).add(index)
+        return KeywordScanner(rule_indexes)
+
+    def _keyword_hits(self, ticket: Ticket, cell: tuple) -> Set[int]:
+        """Get the indexes of rules whose keywords occur in the ticket (only scanned when a candidate needs it)."""
+        if not self._table_needs_keywords[cell]:
+            return set()
+        return self._keywords.scan(f"{ticket.title}\n{ticket.description}")
+
+    def match(self, ticket: Ticket, customer_tier: Optional[str] = None) -> Optional[RoutingRule]:
+        """Get the first rule matching the ticket, None if no rule matches."""
+        cell = (ticket.category, ticket.priority)
+        hits = self._keyword_hits(ticket, cell)
+        for index in self._table[cell]:
+            rule = self.rules[index]
+            if rule.accepts_tier(customer_tier) and (not rule.keywords or index in hits):
+                return rule
+        return None
+
+
+def compile_routing_rules(configs: Iterable[Mapping[str, Any]]) -> CompiledRoutingRules:
+    """
+    Compile routing rules from their configuration.
+
+    Raises:
+        ValueError: If a rule is invalid
+    """
+    rules: List[RoutingRule] = []
+    for position, config in enumerate(configs):
+        try:
+            rules.append(RoutingRule.from_config(config))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Routing rule {position}: {e}") from e
+    return CompiledRoutingRules(rules)
+
+
+# Active routing rules; replaced atomically on (re)load
+_routing_rules = CompiledRoutingRules()
+
+
+def get_routing_rules() -> CompiledRoutingRules:
+    """Get the active routing rules."""
+    return _routing_rules
+
+
+def set_routing_rules(rules: CompiledRoutingRules) -> None:
+    """Activate routing rules; tickets routed afterwards use them."""
+    global _routing_rules
+    _routing_rules = rules
 
 
 class TicketRoutingService:
@@ -33,11 +240,80 @@ class TicketRoutingService:
     @staticmethod
     def get_team_for_category(category: Category) -> str:
         """Get team name for category."""
-        routing_map = {
-            Category.TECHNICAL: "technical-support",
-            Category.BILLING: "billing-team",
-            Category.FEATURE_REQUEST: "product-team",
-            Category.BUG_REPORT: "engineering-team",
-            Category.GENERAL: "customer-support",
-        }
-        return routing_map.get(category, "customer-support")
+        return get_rules().team_for(category)
+
+    @staticmethod
+    def route(ticket: Ticket, customer_tier: Optional[str] = None) -> str:
+        """
+        Get the team for a ticket.
+
+        The first matching routing rule decides; tickets matching no rule go
+        to the team of their category.
+        """
+        rule = get_routing_rules().match(ticket, customer_tier)
+        if rule is not None:
+            return rule.team
+        return get_rules().team_for(ticket.category)
+
+
+# Higher rank = more urgent
+PRIORITY_RANK: Mapping[Priority, int] = MappingProxyType({Priority.LOW: 0, Priority.MEDIUM: 1, Priority.HIGH: 2, Priority.URGENT: 3})
+
+DEFAULT_URGENCY_KEYWORDS: Mapping[Priority, Tuple[str, ...]] = MappingProxyType(
+    {
+        Priority.URGENT: (
+            "outage",
+            "is down",
+            "system down",
+            "site down",
+            "not working",
+            "data loss",
+            "security breach",
+            "hacked",
+            "urgent",
+            "asap",
+            "critical",
+            "production",
+            "cannot log in",
+            "can't log in",
+        ),
+        Priority.HIGH: ("error", "failed", "failing", "broken", "crash", "crashes", "charged twice", "refund", "locked out"),
+        Priority.LOW: ("feature request", "suggestion", "would be nice", "nice to have", "question", "how do i"),
+    }
+)
+
+
+class TicketUrgencyEstimator:
+    """Cheap local estimate of a ticket's priority from keywords, used before the AI classification"""
+
+    def __init__(self, keywords: Mapping[Priority, Iterable[str]] = DEFAULT_URGENCY_KEYWORDS, default: Priority = Priority.MEDIUM):
+        """
+        Initialize estimator.
+
+        Args:
+            keywords: Keywords indicating each priority; the most urgent match wins
+            default: Priority of tickets without any keyword
+        """
+        labels: Dict[str, Set[Priority]] = {}
+        for priority, priority_keywords in keywords.items():
+            for keyword in priority_keywords:
+                labels.setdefault(normalize_keyword(keyword), set()).add(priority)
+        self._scanner = KeywordScanner(labels)
+        self.default = default
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Iterable[str]]) -> "TicketUrgencyEstimator":
+        """
+        Build an estimator from keywords keyed by priority value, e.g. ``{"URGENT": ["outage"]}``.
+
+        Raises:
+            ValueError: If a priority is unknown
+        """
+        return cls({Priority(priority): tuple(keywords) for priority, keywords in config.items()})
+
+    def estimate(self, title: str, description: str) -> Priority:
+        """Estimate the priority of a ticket."""
+        found = self._scanner.scan(f"{title}\n{description}")
+        if not found:
+            return self.default
+        return max(found, key=PRIORITY_RANK.__getitem__)
@@ -0,0 +1,96 @@
+"""JWT authentication for the API endpoints"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.base_user import AbstractBaseUser
+from ninja.security import HttpBearer
+from ninja_jwt.authentication import JWTAuth, JWTStatelessUserAuthentication
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import Token
+
+from pyticket.infrastructure.auth.user_cache import UserCache
+
+AUTH_MODES = ("database", "cached", "stateless")
+
+
+class CachedJWTAuth(JWTAuth):
+    """
+    JWTAuth without the per-request work for a token seen recently.
+
+    JWTAuth decodes and verifies the token and loads the user from the
+    database on every request. Here verified tokens are kept in process
+    memory until they expire (at most ``token_cache_size`` of them) and
+    users in a UserCache, so a repeated token costs neither a signature
+    check nor a query. Inactive or deleted users are never cached.
+    """
+
+    def __init__(self, user_cache: Optional[UserCache] = None, token_cache_size: int = 1024):
+        """
+        Initialize cached JWT authentication.
+
+        Args:
+            user_cache: Cache of users by id
+            token_cache_size: Verified tokens kept in memory
+        """
+        super().__init__()
+        self.user_cache = user_cache or UserCache()
+        self.token_cache_size = max(token_cache_size, 0)
+        self._tokens: "OrderedDict[str, Tuple[Token, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_validated_token(self, raw_token) -> Token:
+        """Verify a token, or reuse the result of an earlier verification until it expires."""
+        now = time.time()
+        with self._lock:
+            cached = self._tokens.get(raw_token)
+            if cached is not None and cached[1] > now:
+                self._tokens.move_to_end(raw_token)
+                return cached[0]
+        validated_token = super().get_validated_token(raw_token)
+        self._remember(raw_token, validated_token, now)
+        return validated_token
+
+    def _remember(self, raw_token: str, validated_token: Token, now: float) -> None:
+        """Keep a verified token until it expires or the user cache entry would (whichever is first)."""
+        if not self.token_cache_size:
+            return
+        expires_at = min(validated_token.get("exp", now), now + self.user_cache.ttl_seconds)
+        with self._lock:
+            self._tokens[raw_token] = (validated_token, expires_at)
+            self._tokens.move_to_end(raw_token)
+            while len(self._tokens) > self.token_cache_size:
+                self._tokens.popitem(last=False)
+
+    def get_user(self, validated_token) -> AbstractBaseUser:
+        """Get the token's user from the cache, loading (and checking) it from the database on a miss."""
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        user = self.user_cache.get(user_id) if user_id is not None else None
+        if user is None:
+            user = super().get_user(validated_token)
+            self.user_cache.set(user_id, user)
+        return user
+
+
+def get_api_auth() -> HttpBearer:
+    """
+    Get the authentication of the API endpoints for the API_AUTH_MODE setting.
+
+    "database" runs JWTAuth (a user query per request), "cached" runs
+    CachedJWTAuth and "stateless" trusts the token claims without loading
+    the user at all (ninja_jwt's TokenUser).
+    """
+    mode = getattr(settings, "API_AUTH_MODE", "cached").lower()
+    if mode == "database":
+        return JWTAuth()
+    if mode == "stateless":
+        return JWTStatelessUserAuthentication()
+    if mode == "cached":
+        return CachedJWTAuth(
+            user_cache=UserCache(ttl_seconds=getattr(settings, "API_AUTH_USER_CACHE_SECONDS", 30)),
+            token_cache_size=getattr(settings, "API_AUTH_TOKEN_CACHE_SIZE", 1024),
+        )
+    raise ValueError(f"Unsupported API auth mode: {mode}. Supported modes: {', '.join(AUTH_MODES)}")
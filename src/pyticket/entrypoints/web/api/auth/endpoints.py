@@ -1,5 +1,8 @@
 """JWT authentication endpoints"""
 
+from typing import Optional, Union
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
@@ -8,13 +11,55 @@ from ninja import Router
 from ninja_jwt.tokens import RefreshToken
 
 from pyticket.entrypoints.web.api.auth.schemas import TokenResponseSchema, UserLoginSchema, UserRegistrationSchema
+from pyticket.entrypoints.web.api.dependencies import get_password_hashing
+from pyticket.infrastructure.auth.passwords import authenticate_user
+from pyticket.infrastructure.ratelimit.factory import RateLimiterFactory
+from pyticket.infrastructure.ratelimit.interfaces import RateLimit
 
 User = get_user_model()
 
 router = Router(tags=["auth"])
 
 
-@router.post("/register", response={200: TokenResponseSchema, 400: dict})
+def _login_retry_after(request, username: str) -> Optional[int]:
+    """Count a login attempt per username and per client IP; seconds to wait if either is over its limit."""
+    attempts = getattr(settings, "LOGIN_RATE_LIMIT_ATTEMPTS", 10)
+    if attempts <= 0:
+        return None
+    rate = RateLimit(attempts, getattr(settings, "LOGIN_RATE_LIMIT_WINDOW_SECONDS", 60))
+    limiter = RateLimiterFactory.get()
+    results = [
+        limiter.hit(f"login:user:{username.lower()}", rate),
+        limiter.hit(f"login:ip:{request.META.get('REMOTE_ADDR', '')}", rate),
+    ]
+    return max((result.reset_seconds for result in results if not result.allowed), default=None)
+
+
+def obtain_tokens(request, username: str, password: str) -> Union[JsonResponse, dict]:
+    """
+    Check credentials and issue a JWT pair; shared by /auth/login and /token/pair.
+
+    Attempts are rate limited per username and per client IP, and the
+    password check runs on the bounded hashing pool.
+    """
+    retry_after = _login_retry_after(request, username)
+    if retry_after is not None:
+        return JsonResponse({"error": "Too many login attempts"}, status=429, headers={"Retry-After": str(retry_after)})
+
+    user = authenticate_user(get_password_hashing(), username, password)
+
+    if user is None:
+        return JsonResponse({"error": "Invalid credentials"}, status=401)
+
+    refresh = RefreshToken.for_user(user)
+    return {
+        "username": user.get_username(),
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+    }
+
+
+@router.post("/register", response={200: TokenResponseSchema, 400: dict, 429: dict})
 def register(request, payload: UserRegistrationSchema):
     """
     Register a new user and return JWT tokens.
@@ -32,12 +77,13 @@ def register(request, payload: UserRegistrationSchema):
     except ValidationError as e:
         return JsonResponse({"error": "; ".join(e.messages)}, status=400)
 
-    # Create user
-    user = User.objects.create_user(
-        username=payload.username,
-        password=payload.password,
-        email=payload.email if payload.email else "",
+    # Create user; the password is hashed on the bounded hashing pool (429 when it is full)
+    user = User(
+        username=User.normalize_username(payload.username),
+        email=User.objects.normalize_email(payload.email or ""),
+        password=get_password_hashing().make_password(payload.password),
     )
+    user.save()
 
     # Generate tokens
     refresh = RefreshToken.for_user(user)
@@ -50,27 +96,14 @@ def register(request, payload: UserRegistrationSchema):
     }
 
 
-@router.post("/login", response={200: TokenResponseSchema, 401: dict})
+@router.post("/login", response={200: TokenResponseSchema, 401: dict, 429: dict})
 def login(request, payload: UserLoginSchema):
     """
     Login with username and password to get JWT tokens.
 
-    This endpoint is provided by NinjaJWTDefaultController, but we're
+    This endpoint is provided by TokenController (/token/pair), but we're
     creating a custom one for consistency with our registration endpoint.
+    Both go through obtain_tokens, so they share the login rate limit and
+    the bounded hashing pool.
     """
-    from django.contrib.auth import authenticate
-
-    user = authenticate(username=payload.username, password=payload.password)
-
-    if user is None:
-        return JsonResponse({"error": "Invalid credentials"}, status=401)
-
-    # Generate tokens
-    refresh = RefreshToken.for_user(user)
-    access_token = str(refresh.access_token)
-    refresh_token = str(refresh)
-
-    return {
-        "access": access_token,
-        "refresh": refresh_token,
-    }
+    return obtain_tokens(request, payload.username, payload.password)
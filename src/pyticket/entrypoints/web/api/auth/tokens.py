@@ -0,0 +1,55 @@
+"""JWT token endpoints (obtain pair, refresh, verify)"""
+
+from ninja_extra import api_controller, http_post
+from ninja_extra.permissions import AllowAny
+from ninja_jwt.schema_control import SchemaControl
+from ninja_jwt.settings import api_settings
+
+from pyticket.entrypoints.web.api.auth.endpoints import obtain_tokens
+from pyticket.entrypoints.web.api.auth.schemas import UserLoginSchema
+
+schema = SchemaControl(api_settings)
+
+
+@api_controller("/token", permissions=[AllowAny], tags=["token"], auth=None)
+class TokenController:
+    """
+    Same endpoints as ninja_jwt's NinjaJWTDefaultController.
+
+    Importing ninja_jwt.controller builds every controller variant it ships
+    (sliding, blacklist and their async versions) on each worker's cold
+    start; only this one is used. The pair endpoint does not use ninja_jwt's
+    input schema, which authenticates with django.contrib.auth.authenticate()
+    while parsing; it goes through the same login limit and hashing pool as
+    /auth/login.
+    """
+
+    @http_post(
+        "/pair",
+        response={200: schema.obtain_pair_schema.get_response_schema(), 401: dict, 429: dict},
+        url_name="token_obtain_pair",
+        operation_id="token_obtain_pair",
+    )
+    def obtain_token(self, credentials: UserLoginSchema):
+        """Obtain an access and refresh token pair."""
+        return obtain_tokens(self.context.request, credentials.username, credentials.password)
+
+    @http_post(
+        "/refresh",
+        response=schema.obtain_pair_refresh_schema.get_response_schema(),
+        url_name="token_refresh",
+        operation_id="token_refresh",
+    )
+    def refresh_token(self, refresh_token: schema.obtain_pair_refresh_schema):
+        """Get a new access token from a refresh token."""
+        return refresh_token.to_response_schema()
+
+    @http_post(
+        "/verify",
+        response={200: schema.verify_schema.get_response_schema()},
+        url_name="token_verify",
+        operation_id="token_verify",
+    )
+    def verify_token(self, token: schema.verify_schema):
+        """Check that a token is valid."""
+        return token.to_response_schema()
@@ -1,12 +1,141 @@
 """Dependency injection for API endpoints"""
 
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from pyticket.domain.tickets.services import TicketUrgencyEstimator
 from pyticket.infrastructure.ai.factory import AIClassificationServiceFactory
+from pyticket.infrastructure.auth.passwords import PasswordHashingPool
+from pyticket.infrastructure.events.factory import TicketEventBusFactory
+from pyticket.infrastructure.repositories.django_classification_usage_repository import DjangoClassificationUsageRepository
+from pyticket.infrastructure.repositories.django_idempotency_repository import DjangoIdempotencyRepository
+from pyticket.infrastructure.repositories.django_routing_outbox import DjangoRoutingOutbox
 from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+from pyticket.infrastructure.repositories.django_ticket_stats_repository import DjangoTicketStatsRepository
+from pyticket.infrastructure.repositories.interfaces import IIdempotencyRepository
+from pyticket.service.tickets.classification_pool import ProcessClassificationPool
+from pyticket.service.tickets.ingestion import TicketIngestionService
+from pyticket.service.tickets.scheduler import ClassificationScheduler
+from pyticket.service.tickets.stats_service import TicketStatsService
 from pyticket.service.tickets.ticket_service import TicketService
+from pyticket.service.tickets.usage_service import ClassificationUsageService
 
 
-def get_ticket_service() -> TicketService:
+def get_ticket_service(classification_pool: Optional[ProcessClassificationPool] = None) -> TicketService:
     """Get ticket service instance with dependencies injected."""
     repository = DjangoTicketRepository()
     ai_service = AIClassificationServiceFactory.create()
-    return TicketService(repository=repository, ai_classification_service=ai_service)
+    return TicketService(
+        repository=repository,
+        ai_classification_service=ai_service,
+        event_bus=TicketEventBusFactory.get(),
+        routing_outbox=DjangoRoutingOutbox(),
+        ticket_stats=DjangoTicketStatsRepository(),
+        classification_pool=classification_pool,
+        usage_repository=DjangoClassificationUsageRepository(),
+        duplicate_window=_duplicate_window(),
+        duplicate_threshold=getattr(settings, "TICKET_DUPLICATE_THRESHOLD", 1.0),
+    )
+
+
+def _duplicate_window() -> Optional[timedelta]:
+    """Get the ticket deduplication window, None when it is disabled."""
+    seconds = getattr(settings, "TICKET_DUPLICATE_WINDOW_SECONDS", 0)
+    return timedelta(seconds=seconds) if seconds > 0 else None
+
+
+def get_classification_usage_service() -> ClassificationUsageService:
+    """Get classification usage service instance with dependencies injected."""
+    return ClassificationUsageService(
+        usage_repository=DjangoClassificationUsageRepository(),
+        prices=getattr(settings, "AI_TOKEN_PRICES", {}),
+    )
+
+
+def get_classification_pool() -> Optional[ProcessClassificationPool]:
+    """Get a classification process pool when CLASSIFICATION_EXECUTION is "process", otherwise None."""
+    if getattr(settings, "CLASSIFICATION_EXECUTION", "thread").lower() != "process":
+        return None
+    return ProcessClassificationPool(
+        factory=AIClassificationServiceFactory.create,
+        workers=getattr(settings, "CLASSIFICATION_PROCESS_WORKERS", 0),
+    )
+
+
+def get_ticket_stats_service() -> TicketStatsService:
+    """Get ticket statistics service instance with dependencies injected."""
+    return TicketStatsService(ticket_stats=DjangoTicketStatsRepository())
+
+
+def get_idempotency_repository() -> IIdempotencyRepository:
+    """Get the store of idempotency keys of retried requests."""
+    return DjangoIdempotencyRepository()
+
+
+def _urgency_estimator() -> TicketUrgencyEstimator:
+    """Get the urgency estimator, with the configured keywords if any."""
+    keywords = getattr(settings, "TICKET_URGENCY_KEYWORDS", {})
+    return TicketUrgencyEstimator.from_config(keywords) if keywords else TicketUrgencyEstimator()
+
+
+_ingestion: Optional[TicketIngestionService] = None
+_ingestion_lock = threading.Lock()
+
+
+def create_ticket_ingestion(max_depth: Optional[int] = None) -> TicketIngestionService:
+    """Create a ticket ingestion service configured from settings."""
+    return TicketIngestionService(
+        ticket_service=get_ticket_service(),
+        max_depth=max_depth if max_depth is not None else getattr(settings, "TICKET_INGESTION_MAX_DEPTH", 1000),
+        defer_depth=getattr(settings, "TICKET_INGESTION_DEFER_DEPTH", 8),
+        workers=getattr(settings, "TICKET_INGESTION_WORKERS", 2),
+        after_task=close_old_connections,
+        scheduler=ClassificationScheduler(getattr(settings, "TICKET_CLASSIFICATION_AGING_SECONDS", 60.0)),
+        estimator=_urgency_estimator(),
+    )
+
+
+def get_ticket_ingestion() -> TicketIngestionService:
+    """
+    Get the process-wide ticket ingestion service; its queue and workers are shared by all requests.
+
+    On creation, tickets left unclassified for TICKET_INGESTION_RECOVER_AGE_SECONDS
+    (by a process that stopped with a backlog) are claimed and queued again; a negative
+    age disables this.
+    """
+    global _ingestion
+    if _ingestion is None:
+        with _ingestion_lock:
+            if _ingestion is None:
+                ingestion = create_ticket_ingestion()
+                _recover_deferred(ingestion)
+                _ingestion = ingestion
+    return _ingestion
+
+
+def _recover_deferred(ingestion: TicketIngestionService) -> None:
+    """Queue tickets left unclassified for TICKET_INGESTION_RECOVER_AGE_SECONDS, unless it is negative."""
+    recover_age = getattr(settings, "TICKET_INGESTION_RECOVER_AGE_SECONDS", 300.0)
+    if recover_age >= 0:
+        ingestion.recover(datetime.now(timezone.utc) - timedelta(seconds=recover_age))
+
+
+_password_hashing: Optional[PasswordHashingPool] = None
+_password_hashing_lock = threading.Lock()
+
+
+def get_password_hashing() -> PasswordHashingPool:
+    """Get the process-wide password hashing pool shared by the auth endpoints."""
+    global _password_hashing
+    if _password_hashing is None:
+        with _password_hashing_lock:
+            if _password_hashing is None:
+                _password_hashing = PasswordHashingPool(
+                    workers=getattr(settings, "PASSWORD_HASHING_WORKERS", 0),
+                    max_pending=getattr(settings, "PASSWORD_HASHING_MAX_PENDING", 16),
+                )
+    return _password_hashing
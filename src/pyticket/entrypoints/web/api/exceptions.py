@@ -4,6 +4,9 @@ from django.http import JsonResponse
 from ninja import NinjaAPI
 
 from pyticket.domain.tickets.exceptions import ClassificationError, InvalidTicketStatusError, RoutingError
+from pyticket.entrypoints.web.api.idempotency import IdempotencyKeyError
+from pyticket.entrypoints.web.api.ratelimit import rate_limit_headers, RateLimitExceeded
+from pyticket.infrastructure.auth.passwords import PasswordHashingOverloadedError
 
 
 def register_exception_handlers(api: NinjaAPI) -> None:
@@ -20,3 +23,19 @@ def register_exception_handlers(api: NinjaAPI) -> None:
     @api.exception_handler(RoutingError)
     def routing_error_handler(request, exc):
         return JsonResponse({"error": str(exc)}, status=500)
+
+    api.add_exception_handler(PasswordHashingOverloadedError, password_hashing_overloaded_handler)
+    api.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    api.add_exception_handler(IdempotencyKeyError, idempotency_key_error_handler)
+
+
+def password_hashing_overloaded_handler(request, exc: PasswordHashingOverloadedError):
+    return JsonResponse({"error": str(exc)}, status=429, headers={"Retry-After": str(exc.retry_after)})
+
+
+def rate_limit_exceeded_handler(request, exc: RateLimitExceeded):
+    return JsonResponse({"error": str(exc)}, status=429, headers=rate_limit_headers(exc.result))
+
+
+def idempotency_key_error_handler(request, exc: IdempotencyKeyError):
+    return JsonResponse({"error": str(exc)}, status=exc.status)
@@ -0,0 +1,125 @@
+"""Idempotency-Key support for retried POST requests"""
+
+import hashlib
+from datetime import timedelta
+from functools import wraps
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from django.utils import timezone
+
+from pyticket.entrypoints.web.api.dependencies import get_idempotency_repository
+from pyticket.entrypoints.web.api.ratelimit import client_key
+from pyticket.infrastructure.repositories.interfaces import IdempotencyRecord
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+REPLAYED_HEADER = "Idempotent-Replayed"
+MAX_KEY_LENGTH = 255
+
+
+class IdempotencyKeyError(Exception):
+    """Raised when a request cannot be run or replayed under its idempotency key."""
+
+    def __init__(self, message: str, status: int):
+        super().__init__(message, status)
+        self.message = message
+        self.status = status
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def request_fingerprint(request: HttpRequest) -> str:
+    """Hash of the method, path and body; a key may only be reused for the same request."""
+    digest = hashlib.sha256()
+    for part in (request.method.encode(), request.path.encode(), request.body):
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def replay(record: IdempotencyRecord, fingerprint: str) -> HttpResponse:
+    """
+    Answer a retry with the stored response.
+
+    Raises:
+        IdempotencyKeyError: If the key was used for another request (422) or its first request is still running (409)
+    """
+    if record.fingerprint != fingerprint:
+        raise IdempotencyKeyError(f"{IDEMPOTENCY_HEADER} was already used for a different request", status=422)
+    if not record.completed:
+        raise IdempotencyKeyError(f"A request with this {IDEMPOTENCY_HEADER} is still in progress, retry later", status=409)
+    response = HttpResponse(record.body, status=record.status_code, content_type=record.content_type)
+    response[REPLAYED_HEADER] = "true"
+    return response
+
+
+def scoped_key(request: HttpRequest, key: str) -> str:
+    """
+    Scope a client's key so clients cannot replay each other's responses.
+
+    Raises:
+        IdempotencyKeyError: If the key is blank or too long (400)
+    """
+    if not key.strip() or len(key) > MAX_KEY_LENGTH:
+        raise IdempotencyKeyError(f"{IDEMPOTENCY_HEADER} must be 1 to {MAX_KEY_LENGTH} characters", status=400)
+    return f"{client_key(request)}:{key}"
+
+
+def claim(key: str, fingerprint: str) -> Optional[IdempotencyRecord]:
+    """Claim a key for a request; returns the record holding it when it is already taken."""
+    now = timezone.now()
+    return get_idempotency_repository().claim(
+        key,
+        fingerprint,
+        expired_before=now - timedelta(seconds=getattr(settings, "IDEMPOTENCY_KEY_TTL_SECONDS", 86400)),
+        stale_before=now - timedelta(seconds=getattr(settings, "IDEMPOTENCY_LOCK_SECONDS", 300)),
+    )
+
+
+def _store_response(key: str, response: HttpResponse) -> None:
+    """Keep a successful response for retries, release the key otherwise."""
+    repository = get_idempotency_repository()
+    if isinstance(response, HttpResponse) and 200 <= response.status_code < 300:
+        repository.complete(key, response.status_code, response.content, response["Content-Type"])
+    else:
+        repository.release(key)
+
+
+def _run(view: Callable, key: str, request: HttpRequest, *args, **kwargs) -> HttpResponse:
+    """Run the view holding a claimed key, storing or releasing the key afterwards."""
+    try:
+        response = view(request, *args, **kwargs)
+    except BaseException:
+        get_idempotency_repository().release(key)
+        raise
+    _store_response(key, response)
+    return response
+
+
+def idempotent(view: Callable) -> Callable:
+    """
+    Make a POST endpoint safe to retry with an ``Idempotency-Key`` header.
+
+    The first request with a key runs the endpoint and its 2xx response is
+    stored; retries with the same key and body get that response back
+    (marked ``Idempotent-Replayed: true``) without running the endpoint
+    again. Keys are scoped per client and kept IDEMPOTENCY_KEY_TTL_SECONDS.
+    Error responses are not stored, so a retry after one runs again.
+    Requests without the header are not affected.
+    """
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if key is None:
+            return view(request, *args, **kwargs)
+        key = scoped_key(request, key)
+        fingerprint = request_fingerprint(request)
+        record = claim(key, fingerprint)
+        if record is not None:
+            return replay(record, fingerprint)
+        return _run(view, key, request, *args, **kwargs)
+
+    return wrapper
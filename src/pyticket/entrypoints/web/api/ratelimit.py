@@ -0,0 +1,100 @@
+"""Per-client rate limits of the API endpoints"""
+
+from functools import wraps
+from typing import Callable, Dict, Optional
+
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+
+from pyticket.infrastructure.ratelimit.factory import RateLimiterFactory
+from pyticket.infrastructure.ratelimit.interfaces import RateLimit, RateLimitResult
+
+# Endpoints that call the AI provider; everything else counts against DEFAULT_BUCKET
+CLASSIFY_BUCKET = "classify"
+DEFAULT_BUCKET = "default"
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a client is over the rate limit of an endpoint bucket."""
+
+    def __init__(self, bucket: str, result: RateLimitResult):
+        super().__init__(bucket, result)
+        self.bucket = bucket
+        self.result = result
+
+    def __str__(self) -> str:
+        return f"Rate limit exceeded for {self.bucket} requests, retry after {self.result.reset_seconds}s"
+
+
+def rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    """Headers telling the client its limit, what is left and when the window resets."""
+    headers = {
+        "X-RateLimit-Limit": str(result.limit),
+        "X-RateLimit-Remaining": str(result.remaining),
+        "X-RateLimit-Reset": str(result.reset_seconds),
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(result.reset_seconds)
+    return headers
+
+
+def get_rate(bucket: str) -> Optional[RateLimit]:
+    """Get the rate of a bucket from API_RATE_LIMITS, None if it is unlimited."""
+    return RateLimit.parse(getattr(settings, "API_RATE_LIMITS", {}).get(bucket, ""))
+
+
+def client_key(request: HttpRequest) -> str:
+    """Identify the client: the authenticated user, or the client IP for anonymous requests."""
+    user_id = getattr(getattr(request, "auth", None), "pk", None)
+    return f"user:{user_id}" if user_id is not None else f"ip:{request.META.get('REMOTE_ADDR', '')}"
+
+
+def check_rate_limit(request: HttpRequest, bucket: str) -> None:
+    """
+    Count a request of the client against the rate of a bucket.
+
+    Raises:
+        RateLimitExceeded: If the client is over the rate
+    """
+    rate = get_rate(bucket)
+    if rate is None:
+        return
+    result = RateLimiterFactory.get().hit(f"{bucket}:{client_key(request)}", rate)
+    request.rate_limit = result
+    if not result.allowed:
+        raise RateLimitExceeded(bucket, result)
+
+
+def rate_limit(bucket: str = DEFAULT_BUCKET) -> Callable:
+    """
+    Limit an endpoint per client with the rate of a bucket.
+
+    Place it below the router decorator so it runs after authentication.
+    Over the limit the endpoint raises RateLimitExceeded (a 429 response);
+    otherwise the result is kept on the request for RateLimitHeadersMiddleware.
+    """
+
+    def decorator(view: Callable) -> Callable:
+        @wraps(view)
+        def wrapper(request: HttpRequest, *args, **kwargs):
+            check_rate_limit(request, bucket)
+            return view(request, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class RateLimitHeadersMiddleware:
+    """Adds the X-RateLimit-* headers to responses of rate limited endpoints"""
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]):
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        response = self.get_response(request)
+        result = getattr(request, "rate_limit", None)
+        if result is not None:
+            for header, value in rate_limit_headers(result).items():
+                response.headers.setdefault(header, value)
+        return response
@@ -1,9 +1,9 @@
 """Main API router for django-ninja"""
 
 from ninja_extra import NinjaExtraAPI
-from ninja_jwt.controller import NinjaJWTDefaultController
 
 from pyticket.entrypoints.web.api.auth.endpoints import router as auth_router
+from pyticket.entrypoints.web.api.auth.tokens import TokenController
 from pyticket.entrypoints.web.api.exceptions import register_exception_handlers
 from pyticket.entrypoints.web.api.tickets.router import router as tickets_router
 
@@ -17,7 +17,7 @@ api = NinjaExtraAPI(
 register_exception_handlers(api)
 
 # Register JWT controller (provides token refresh, verify endpoints)
-api.register_controllers(NinjaJWTDefaultController)
+api.register_controllers(TokenController)
 
 # Register custom auth endpoints (register, login)
 api.add_router("/auth", auth_router)
@@ -0,0 +1,175 @@
+"""Lean JSON rendering for ticket responses"""
+
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.dispatch import receiver
+from django.http import HttpResponse
+from django.test.signals import setting_changed
+from django.utils.module_loading import import_string
+
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
+from pyticket.service.tickets.dtos import (
+    ClassificationResultDTO,
+    StatusUpdateResultDTO,
+    TicketResponseDTO,
+    TicketSearchResponseDTO,
+    TicketStatisticsDTO,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+JSONEncoder = Callable[[Any], bytes]
+
+CONTENT_TYPE = "application/json; charset=utf-8"
+
+# Pre-built enum -> wire value lookups
+_STATUS_VALUES: Dict[TicketStatus, str] = {status: status.value for status in TicketStatus}
+_CATEGORY_VALUES: Dict[Optional[Category], Optional[str]] = {None: None, **{category: category.value for category in Category}}
+_PRIORITY_VALUES: Dict[Optional[Priority], Optional[str]] = {None: None, **{priority: priority.value for priority in Priority}}
+
+
+def stdlib_json_encoder(data: Any) -> bytes:
+    """Encode data with the standard library json module."""
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def get_json_encoder() -> JSONEncoder:
+    """
+    Get the configured JSON encoder.
+
+    ``TICKETS_JSON_ENCODER`` may point to any callable taking a plain
+    Python structure and returning bytes. Without it, orjson is used when
+    installed and the standard library otherwise. The encoder is resolved
+    once and cached until the setting changes.
+    """
+    encoder_path = getattr(settings, "TICKETS_JSON_ENCODER", "")
+    if encoder_path:
+        return import_string(encoder_path)
+    if orjson is not None:
+        return orjson.dumps
+    return stdlib_json_encoder
+
+
+@receiver(setting_changed)
+def reset_json_encoder(setting: str, **kwargs: Any) -> None:
+    """Drop the cached encoder when ``TICKETS_JSON_ENCODER`` is overridden."""
+    if setting == "TICKETS_JSON_ENCODER":
+        get_json_encoder.cache_clear()
+
+
+def format_datetime(value: datetime) -> str:
+    """Format datetime the same way Django's JSON encoder does."""
+    text = value.isoformat()
+    if value.microsecond:
+        text = text[:23] + text[26:]
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return text
+
+
+def classification_to_dict(classification: Optional[ClassificationResultDTO]) -> Optional[Dict[str, Any]]:
+    """Convert classification DTO to a JSON-ready dict."""
+    if classification is None:
+        return None
+    return {
+        "category": _CATEGORY_VALUES[classification.category],
+        "priority": _PRIORITY_VALUES[classification.priority],
+        "confidence_score": classification.confidence_score,
+        "reasoning": classification.reasoning,
+    }
+
+
+def ticket_to_dict(ticket_dto: TicketResponseDTO) -> Dict[str, Any]:
+    """
+    Convert ticket DTO to a JSON-ready dict matching TicketResponseSchema.
+
+    DTOs are trusted server-side data, so the schema is only used as the
+    documented contract and is not re-validated per response.
+    """
+    return {
+        "id": str(ticket_dto.id),
+        "title": ticket_dto.title,
+        "description": ticket_dto.description,
+        "status": _STATUS_VALUES[ticket_dto.status],
+        "category": _CATEGORY_VALUES[ticket_dto.category],
+        "priority": _PRIORITY_VALUES[ticket_dto.priority],
+        "created_at": format_datetime(ticket_dto.created_at),
+        "updated_at": format_datetime(ticket_dto.updated_at),
+        "classification": classification_to_dict(ticket_dto.classification),
+    }
+
+
+def render_ticket(ticket_dto: TicketResponseDTO, status: int = 200) -> HttpResponse:
+    """Render a single ticket DTO as a JSON response."""
+    encoder = get_json_encoder()
+    return HttpResponse(encoder(ticket_to_dict(ticket_dto)), content_type=CONTENT_TYPE, status=status)
+
+
+def render_tickets(ticket_dtos: Iterable[TicketResponseDTO], status: int = 200) -> HttpResponse:
+    """Render a list of ticket DTOs as a JSON response."""
+    encoder = get_json_encoder()
+    return HttpResponse(encoder([ticket_to_dict(ticket_dto) for ticket_dto in ticket_dtos]), content_type=CONTENT_TYPE, status=status)
+
+
+def render_search_page(page: TicketSearchResponseDTO, status: int = 200) -> HttpResponse:
+    """Render a page of search results as a JSON response."""
+    encoder = get_json_encoder()
+    body = {"items": [ticket_to_dict(ticket_dto) for ticket_dto in page.items], "next_cursor": page.next_cursor}
+    return HttpResponse(encoder(body), content_type=CONTENT_TYPE, status=status)
+
+
+def statistics_to_dict(statistics: TicketStatisticsDTO) -> Dict[str, Any]:
+    """Convert statistics DTO to a JSON-ready dict matching TicketStatisticsSchema."""
+    return {
+        "total": statistics.total,
+        "by_status": statistics.by_status,
+        "by_category": statistics.by_category,
+        "by_priority": statistics.by_priority,
+        "backlog_by_team": statistics.backlog_by_team,
+        "buckets": [
+            {
+                "status": _STATUS_VALUES[bucket.status],
+                "category": _CATEGORY_VALUES[bucket.category],
+                "priority": _PRIORITY_VALUES[bucket.priority],
+                "count": bucket.count,
+            }
+            for bucket in statistics.buckets
+        ],
+    }
+
+
+def render_statistics(statistics: TicketStatisticsDTO, status: int = 200) -> HttpResponse:
+    """Render ticket statistics as a JSON response."""
+    encoder = get_json_encoder()
+    return HttpResponse(encoder(statistics_to_dict(statistics)), content_type=CONTENT_TYPE, status=status)
+
+
+def status_result_to_dict(result: StatusUpdateResultDTO) -> Dict[str, Any]:
+    """Convert status update result DTO to a JSON-ready dict matching TicketStatusResultSchema."""
+    return {
+        "ticket_id": str(result.ticket_id),
+        "updated": result.updated,
+        "status": _STATUS_VALUES[result.status] if result.status else None,
+        "error": result.error,
+    }
+
+
+def render_status_results(results: Iterable[StatusUpdateResultDTO], status: int = 200) -> HttpResponse:
+    """Render the per-ticket results of a batch status update as a JSON response."""
+    encoder = get_json_encoder()
+    body = {"results": [status_result_to_dict(result) for result in results]}
+    return HttpResponse(encoder(body), content_type=CONTENT_TYPE, status=status)
+
+
+def render_error(message: str, status: int, headers: Optional[Dict[str, str]] = None) -> HttpResponse:
+    """Render an error message as a JSON response."""
+    encoder = get_json_encoder()
+    return HttpResponse(encoder({"error": message}), content_type=CONTENT_TYPE, status=status, headers=headers)
@@ -1,100 +1,195 @@
 """Ticket API endpoints"""
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from ninja import Router
-from ninja_jwt.authentication import JWTAuth
 
 from pyticket.domain.tickets.entities import TicketStatus
-from pyticket.entrypoints.web.api.dependencies import get_ticket_service
+from pyticket.entrypoints.web.api.auth.authentication import get_api_auth
+from pyticket.entrypoints.web.api.dependencies import (
+    get_classification_usage_service,
+    get_ticket_ingestion,
+    get_ticket_service,
+    get_ticket_stats_service,
+)
+from pyticket.entrypoints.web.api.idempotency import idempotent
+from pyticket.entrypoints.web.api.ratelimit import CLASSIFY_BUCKET, rate_limit
+from pyticket.entrypoints.web.api.tickets.renderers import (
+    render_error,
+    render_search_page,
+    render_statistics,
+    render_status_results,
+    render_ticket,
+    render_tickets,
+)
 from pyticket.entrypoints.web.api.tickets.schemas import (
-    ClassificationResultSchema,
+    IngestionMetricsSchema,
+    TicketBulkStatusResponseSchema,
+    TicketBulkStatusSchema,
     TicketCreateSchema,
     TicketResponseSchema,
+    TicketSearchResponseSchema,
+    TicketStatisticsSchema,
     TicketUpdateStatusSchema,
+    UsageReportSchema,
 )
+from pyticket.entrypoints.web.api.tickets.streams import stream_events
+from pyticket.infrastructure.events.factory import TicketEventBusFactory
 from pyticket.service.tickets.dtos import CreateTicketDTO
+from pyticket.service.tickets.ingestion import IngestionOverloadedError
 
 router = Router(tags=["tickets"])
-auth = JWTAuth()
+auth = get_api_auth()
+
+MAX_SEARCH_LIMIT = 100
+MAX_BULK_STATUS_TICKETS = 5000
+MAX_USAGE_DAYS = 90
+MAX_USAGE_TOP_TICKETS = 100
 
 
-@router.post("/", response=TicketResponseSchema, auth=auth)
+@router.post(
+    "/",
+    response={200: TicketResponseSchema, 202: TicketResponseSchema, 400: dict, 409: dict, 422: dict, 429: dict},
+    auth=auth,
+)
+@idempotent  # Outermost, so replayed retries are answered without spending the classify budget
+@rate_limit(CLASSIFY_BUCKET)
 def create_ticket(request, payload: TicketCreateSchema):
-    """Create and classify a ticket."""
-    service = get_ticket_service()
+    """
+    Create and classify a ticket; under load classification is deferred (202) or the ticket is refused (429).
+
+    Retries sending the same ``Idempotency-Key`` header get the original response instead of a new ticket.
+    """
+    ingestion = get_ticket_ingestion()
     dto = CreateTicketDTO(title=payload.title, description=payload.description)
-    ticket_dto = service.create_ticket(dto)
+    try:
+        ticket_dto = ingestion.submit(dto)
+    except IngestionOverloadedError as e:
+        return render_error(str(e), status=429, headers={"Retry-After": str(e.retry_after)})
+
+    return render_ticket(ticket_dto, status=200 if ticket_dto.classification else 202)
+
 
-    return _to_response_schema(ticket_dto)
+@router.get("/ingestion", response=IngestionMetricsSchema, auth=auth)
+@rate_limit()
+def ingestion_metrics(request):
+    """Get ticket ingestion queue depth and admission counters."""
+    return get_ticket_ingestion().metrics()
 
 
-@router.get("/{ticket_id}", response=TicketResponseSchema, auth=auth)
-def get_ticket(request, ticket_id: UUID):
-    """Get a ticket by ID."""
+@router.get("/search", response={200: TicketSearchResponseSchema, 400: dict}, auth=auth)
+@rate_limit()
+def search_tickets(request, q: str, limit: int = 20, cursor: Optional[str] = None):
+    """Search tickets by title and description, best matches first."""
     service = get_ticket_service()
-    ticket_dto = service.get_ticket(ticket_id)
+    try:
+        page = service.search_tickets(q, limit=min(max(limit, 1), MAX_SEARCH_LIMIT), cursor=cursor)
+    except ValueError as e:
+        return 400, {"error": str(e)}
+    return render_search_page(page)
+
+
+@router.get("/stats", response=TicketStatisticsSchema, auth=auth)
+@rate_limit()
+def ticket_statistics(request):
+    """Get ticket counts by status, category, priority and team backlog."""
+    service = get_ticket_stats_service()
+    return render_statistics(service.get_statistics())
+
+
+@router.get("/usage", response=UsageReportSchema, auth=auth)
+@rate_limit()
+def classification_usage(request, days: int = 7, top: int = 10):
+    """Get classification token usage and estimated cost per day, provider and model, and the costliest tickets."""
+    service = get_classification_usage_service()
+    return service.get_report(days=min(max(days, 1), MAX_USAGE_DAYS), top=min(max(top, 0), MAX_USAGE_TOP_TICKETS))
+
+
+@router.get("/events", auth=auth)
+@rate_limit()
+def ticket_events(request):
+    """Stream events for all tickets (server-sent events)."""
+    return stream_events(TicketEventBusFactory.get().subscribe())
+
+
+@router.get("/{ticket_id}/events", auth=auth)
+@rate_limit()
+def ticket_events_for_ticket(request, ticket_id: UUID):
+    """Stream events for a single ticket (server-sent events)."""
+    return stream_events(TicketEventBusFactory.get().subscribe(ticket_id))
+
+
+@router.patch("/status", response={200: TicketBulkStatusResponseSchema, 400: dict}, auth=auth)
+@rate_limit()
+def update_tickets_status(request, payload: TicketBulkStatusSchema):
+    """Update the status of several tickets; results are reported per ticket."""
+    if len(payload.ticket_ids) > MAX_BULK_STATUS_TICKETS:
+        return 400, {"error": f"At most {MAX_BULK_STATUS_TICKETS} tickets can be updated at once"}
+    try:
+        new_status = TicketStatus(payload.status)
+    except ValueError as e:
+        return 400, {"error": f"Invalid status: {str(e)}"}
+    service = get_ticket_service()
+    return render_status_results(service.update_status_many(payload.ticket_ids, new_status))
+
+
+@router.get("/{ticket_id}", response={200: TicketResponseSchema, 404: dict}, auth=auth)
+@rate_limit()
+def get_ticket(request, ticket_id: UUID, include_archived: bool = False):
+    """Get a ticket by ID; archived tickets are only found with ``include_archived``."""
+    service = get_ticket_service()
+    ticket_dto = service.get_ticket(ticket_id, include_archived=include_archived)
 
     if not ticket_dto:
-        return {"error": "Ticket not found"}, 404
+        return 404, {"error": "Ticket not found"}
 
-    return _to_response_schema(ticket_dto)
+    return render_ticket(ticket_dto)
 
 
 @router.get("/", response=List[TicketResponseSchema], auth=auth)
-def list_tickets(request, limit: int = 100, offset: int = 0):
-    """List tickets."""
+@rate_limit()
+def list_tickets(request, limit: int = 100, offset: int = 0, archived: bool = False):
+    """List tickets, or archived tickets with ``archived``."""
     service = get_ticket_service()
+    if archived:
+        return render_tickets(service.list_archived_tickets(limit=limit, offset=offset))
     tickets = service.list_tickets(limit=limit, offset=offset)
-    return [_to_response_schema(ticket) for ticket in tickets]
+    return render_tickets(tickets)
+
+
+@router.delete("/{ticket_id}", response={204: None, 404: dict}, auth=auth)
+@rate_limit()
+def delete_ticket(request, ticket_id: UUID):
+    """Soft-delete a ticket."""
+    service = get_ticket_service()
+    if not service.delete_ticket(ticket_id):
+        return 404, {"error": "Ticket not found"}
+    return 204, None
 
 
 @router.post("/{ticket_id}/reclassify", response=TicketResponseSchema, auth=auth)
+@rate_limit(CLASSIFY_BUCKET)
 def reclassify_ticket(request, ticket_id: UUID):
     """Reclassify a ticket."""
     service = get_ticket_service()
     try:
         ticket_dto = service.reclassify_ticket(ticket_id)
-        return _to_response_schema(ticket_dto)
+        return render_ticket(ticket_dto)
     except ValueError as e:
         return {"error": str(e)}, 404
 
 
 @router.patch("/{ticket_id}/status", response=TicketResponseSchema, auth=auth)
+@rate_limit()
 def update_ticket_status(request, ticket_id: UUID, payload: TicketUpdateStatusSchema):
     """Update ticket status."""
     service = get_ticket_service()
     try:
         new_status = TicketStatus(payload.status)
         ticket_dto = service.update_ticket_status(ticket_id, new_status)
-        return _to_response_schema(ticket_dto)
+        return render_ticket(ticket_dto)
     except ValueError as e:
         return {"error": f"Invalid status: {str(e)}"}, 400
     except Exception as e:
         return {"error": str(e)}, 400
-
-
-def _to_response_schema(ticket_dto) -> dict:
-    """Convert DTO to response schema."""
-
-    classification = None
-    if ticket_dto.classification:
-        classification = ClassificationResultSchema(
-            category=ticket_dto.classification.category.value,
-            priority=ticket_dto.classification.priority.value,
-            confidence_score=ticket_dto.classification.confidence_score,
-            reasoning=ticket_dto.classification.reasoning,
-        )
-
-    return {
-        "id": ticket_dto.id,
-        "title": ticket_dto.title,
-        "description": ticket_dto.description,
-        "status": ticket_dto.status.value,
-        "category": ticket_dto.category.value if ticket_dto.category else None,
-        "priority": ticket_dto.priority.value if ticket_dto.priority else None,
-        "created_at": ticket_dto.created_at,
-        "updated_at": ticket_dto.updated_at,
-        "classification": classification.dict() if classification else None,
-    }
@@ -1,7 +1,7 @@
 """Request/Response schemas for tickets API"""
 
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from ninja import Schema
@@ -37,7 +37,106 @@ class TicketResponseSchema(Schema):
     classification: Optional[ClassificationResultSchema] = None
 
 
+class TicketSearchResponseSchema(Schema):
+    """Schema for a page of ticket search results"""
+
+    items: List[TicketResponseSchema]
+    next_cursor: Optional[str] = None
+
+
+class TicketCountSchema(Schema):
+    """Schema for the ticket count of one status x category x priority bucket"""
+
+    status: str
+    category: Optional[str] = None
+    priority: Optional[str] = None
+    count: int
+
+
+class TicketStatisticsSchema(Schema):
+    """Schema for ticket aggregates"""
+
+    total: int
+    by_status: Dict[str, int]
+    by_category: Dict[str, int]
+    by_priority: Dict[str, int]
+    backlog_by_team: Dict[str, int]
+    buckets: List[TicketCountSchema]
+
+
 class TicketUpdateStatusSchema(Schema):
     """Schema for updating ticket status"""
 
     status: str
+
+
+class TicketBulkStatusSchema(Schema):
+    """Schema for updating the status of several tickets"""
+
+    ticket_ids: List[UUID]
+    status: str
+
+
+class TicketStatusResultSchema(Schema):
+    """Schema for the outcome of one status change in a batch"""
+
+    ticket_id: UUID
+    updated: bool
+    status: Optional[str] = None
+    error: Optional[str] = None
+
+
+class TicketBulkStatusResponseSchema(Schema):
+    """Schema for the outcome of a batch status update"""
+
+    results: List[TicketStatusResultSchema]
+
+
+class IngestionMetricsSchema(Schema):
+    """Schema for ticket ingestion queue metrics"""
+
+    queued: int
+    inline: int
+    max_depth: int
+    defer_depth: int
+    workers: int
+    avg_classification_seconds: float
+    accepted: int
+    deferred: int
+    rejected: int
+    processed: int
+    failed: int
+
+
+class UsageSummarySchema(Schema):
+    """Schema for classification usage of one provider and model on one day"""
+
+    day: date
+    provider: str
+    model: str
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    avg_latency_ms: float
+    estimated_cost: Optional[float] = None
+
+
+class TicketUsageSchema(Schema):
+    """Schema for the classification usage of one ticket"""
+
+    ticket_id: UUID
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+class UsageReportSchema(Schema):
+    """Schema for classification usage and cost"""
+
+    since: datetime
+    total_tokens: int
+    estimated_cost: float
+    by_day: List[UsageSummarySchema]
+    top_tickets: List[TicketUsageSchema]
@@ -0,0 +1,62 @@
+"""Server-sent event streams for ticket updates"""
+
+from typing import Any, Dict, Iterator
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+
+from pyticket.domain.tickets.events import TicketEvent
+from pyticket.entrypoints.web.api.tickets.renderers import format_datetime, get_json_encoder
+from pyticket.infrastructure.events.interfaces import ITicketEventSubscription
+
+HEARTBEAT = b": keep-alive\n\n"
+
+
+def event_to_dict(event: TicketEvent) -> Dict[str, Any]:
+    """Convert ticket event to a JSON-ready dict."""
+    return {
+        "type": event.event_type.value,
+        "ticket_id": str(event.ticket_id),
+        "status": event.status.value,
+        "category": event.category.value if event.category else None,
+        "priority": event.priority.value if event.priority else None,
+        "occurred_at": format_datetime(event.occurred_at),
+    }
+
+
+class TicketEventStream:
+    """Iterator yielding server-sent event frames for a subscription"""
+
+    def __init__(self, subscription: ITicketEventSubscription, heartbeat_seconds: float):
+        """
+        Initialize event stream.
+
+        Args:
+            subscription: Event subscription to read from
+            heartbeat_seconds: Idle time after which a keep-alive comment is sent
+        """
+        self.subscription = subscription
+        self.heartbeat_seconds = heartbeat_seconds
+        self.encoder = get_json_encoder()
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            event = self.subscription.get(timeout=self.heartbeat_seconds)
+            yield HEARTBEAT if event is None else self.format_event(event)
+
+    def format_event(self, event: TicketEvent) -> bytes:
+        """Format an event as a server-sent event frame."""
+        return b"event: " + event.event_type.value.encode() + b"\ndata: " + self.encoder(event_to_dict(event)) + b"\n\n"
+
+    def close(self) -> None:
+        """Release the subscription when the client disconnects."""
+        self.subscription.close()
+
+
+def stream_events(subscription: ITicketEventSubscription) -> StreamingHttpResponse:
+    """Create a streaming response for a subscription."""
+    heartbeat_seconds = getattr(settings, "TICKET_EVENTS_HEARTBEAT_SECONDS", 15.0)
+    response = StreamingHttpResponse(TicketEventStream(subscription, heartbeat_seconds), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
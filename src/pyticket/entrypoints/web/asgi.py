@@ -4,6 +4,9 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from pyticket.utils.common import startup_gc
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyticket.configurator.settings")
 
-application = get_asgi_application()
+with startup_gc():
+    application = get_asgi_application()
@@ -0,0 +1,39 @@
+"""Running assistants with token accounting"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class AssistantReply:
+    """Assistant response text with the tokens it cost"""
+
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+def token_counts(messages: Iterable[Any]) -> Tuple[int, int]:
+    """Sum the (prompt, completion) tokens reported on the messages of an assistant run."""
+    prompt_tokens = completion_tokens = 0
+    for message in messages:
+        usage = getattr(message, "usage_metadata", None) or {}
+        prompt_tokens += usage.get("input_tokens", 0)
+        completion_tokens += usage.get("output_tokens", 0)
+    return prompt_tokens, completion_tokens
+
+
+def run_assistant(assistant: Any, prompt: str) -> AssistantReply:
+    """
+    Run an assistant on a prompt, keeping the token usage that ``AIAssistant.run`` discards.
+
+    Assistants providing ``run_with_usage`` (recording/replay wrappers) are
+    asked directly; django-ai-assistant assistants are invoked and the usage
+    is read from the messages of the run.
+    """
+    if hasattr(assistant, "run_with_usage"):
+        return assistant.run_with_usage(prompt)
+    state = assistant.invoke({"input": prompt}, thread_id=None)
+    output = state["output"]
+    prompt_tokens, completion_tokens = token_counts(state.get("messages", ()))
+    return AssistantReply(output if isinstance(output, str) else str(output), prompt_tokens, completion_tokens)
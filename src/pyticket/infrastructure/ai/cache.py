@@ -0,0 +1,180 @@
+"""Persistent classification cache shared by all worker processes"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+from typing import Optional
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult, IClassificationCache
+from pyticket.infrastructure.ai.prompts import prompt_key
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteClassificationCache(IClassificationCache):
+    """
+    Classification results in a SQLite file shared by all processes.
+
+    The file uses WAL journaling, so any number of gunicorn or pool workers
+    read concurrently while one writes. It is opened lazily, once per thread
+    and process. At most ``max_entries`` results are kept; the oldest
+    writes are evicted first. Recent results are also held in a small
+    in-process LRU, optionally warmed from the file when it is opened.
+    """
+
+    def __init__(self, path: Path, max_entries: int = 100_000, memory_entries: int = 1024, warm_start: bool = False):
+        """
+        Initialize cache; nothing is opened until first use.
+
+        Args:
+            path: SQLite file holding the cache
+            max_entries: Results kept in the file
+            memory_entries: Results kept in process memory
+            warm_start: Load the newest results into memory when the file is opened
+        """
+        self.path = Path(path)
+        self.max_entries = max(max_entries, 1)
+        self.memory_entries = max(memory_entries, 0)
+        self.warm_start = warm_start
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[str, ClassificationResult]" = OrderedDict()
+        self._warmed_pid: Optional[int] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get this thread's connection, (re)opening it after a fork."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = self._open()
+            self._local.connection, self._local.pid = connection, os.getpid()
+            self._warm(connection)
+        return connection
+
+    def _open(self) -> sqlite3.Connection:
+        """Open the cache file, creating it if needed."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path), timeout=5.0, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS classifications ("
+            "key TEXT PRIMARY KEY, category TEXT NOT NULL, priority TEXT NOT NULL, confidence REAL NOT NULL, reasoning TEXT NOT NULL)"
+        )
+        return connection
+
+    def _warm(self, connection: sqlite3.Connection) -> None:
+        """Load the newest results into memory, once per process."""
+        if not self.warm_start or not self.memory_entries or self._warmed_pid == os.getpid():
+            return
+        rows = connection.execute(
+            "SELECT key, category, priority, confidence, reasoning FROM classifications ORDER BY rowid DESC LIMIT ?",
+            (self.memory_entries,),
+        ).fetchall()
+        with self._lock:
+            self._warmed_pid = os.getpid()
+            for key, *values in reversed(rows):
+                self._remember(key, self._to_result(*values))
+        logger.info(f"Warmed classification cache with {len(rows)} results")
+
+    def _remember(self, key: str, result: ClassificationResult) -> None:
+        """Keep a result in the in-process LRU (caller holds the lock)."""
+        if not self.memory_entries:
+            return
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _to_result(category: str, priority: str, confidence: float, reasoning: str) -> ClassificationResult:
+        return ClassificationResult(Category(category), Priority(priority), confidence, reasoning)
+
+    def get(self, key: str) -> Optional[ClassificationResult]:
+        """Get a cached classification, None on a miss."""
+        connection = self._connection()
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        row = connection.execute("SELECT category, priority, confidence, reasoning FROM classifications WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        result = self._to_result(*row)
+        with self._lock:
+            self._remember(key, result)
+        return result
+
+    def set(self, key: str, result: ClassificationResult) -> None:
+        """Cache a classification, evicting the oldest results beyond max_entries."""
+        connection = self._connection()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO classifications (key, category, priority, confidence, reasoning) VALUES (?, ?, ?, ?, ?)",
+                (key, result.category.value, result.priority.value, result.confidence_score, result.reasoning),
+            )
+            connection.execute(
+                "DELETE FROM classifications WHERE rowid <= (SELECT MAX(rowid) FROM classifications) - ?",
+                (self.max_entries,),
+            )
+        with self._lock:
+            self._remember(key, replace(result, usage=None))  # Cache hits cost no tokens
+
+
+class CachedClassificationService(AIClassificationService):
+    """Serves repeated classifications of the same ticket text from a cache instead of the provider"""
+
+    def __init__(self, service: AIClassificationService, cache: IClassificationCache, model: str, prompt_version: str):
+        """
+        Initialize cached classification service.
+
+        Args:
+            service: Service called on cache misses
+            cache: Classification cache
+            model: Model name; results of other models are not reused
+            prompt_version: Extra version to invalidate results by hand; prompt changes do so already
+        """
+        self.service = service
+        self.cache = cache
+        self.model = model
+        self.prompt_version = prompt_version
+
+    def cache_key(self, ticket: Ticket) -> str:
+        """
+        Key of a ticket's classification: hash of model, prompt version and prompt.
+
+        The prompt part covers the rendered prompt and a hash of the template
+        and instructions, so editing the prompt never serves stale results.
+        """
+        return hashlib.sha256(f"{self.model}\0{self.prompt_version}\0{prompt_key(ticket)}".encode("utf-8")).hexdigest()
+
+    def classify_ticket(self, ticket: Ticket) -> ClassificationResult:
+        """Classify a ticket, using the cached result when there is one."""
+        key = self.cache_key(ticket)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        result = self.service.classify_ticket(ticket)
+        self._set(key, result)
+        return result
+
+    def _get(self, key: str) -> Optional[ClassificationResult]:
+        """Read the cache; a broken cache only costs a provider call."""
+        try:
+            return self.cache.get(key)
+        except sqlite3.Error as e:
+            logger.warning(f"Classification cache read failed: {e}")
+            return None
+
+    def _set(self, key: str, result: ClassificationResult) -> None:
+        """Write the cache; failures are logged and ignored."""
+        try:
+            self.cache.set(key, result)
+        except sqlite3.Error as e:
+            logger.warning(f"Classification cache write failed: {e}")
@@ -1,12 +1,16 @@
 """Factory for creating AI classification services"""
 
 import logging
+import threading
+from pathlib import Path
+from typing import Dict
 
 from django.conf import settings
 
+from pyticket.infrastructure.ai.cache import CachedClassificationService, SqliteClassificationCache
 from pyticket.infrastructure.ai.interfaces import AIClassificationService
-from pyticket.infrastructure.ai.providers.anthropic_provider import AnthropicClassificationService
-from pyticket.infrastructure.ai.providers.openai_provider import OpenAIClassificationService
+from pyticket.infrastructure.ai.recordings import SqliteRecordingStore
+from pyticket.infrastructure.ai.registry import provider_registry
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +18,10 @@ logger = logging.getLogger(__name__)
 class AIClassificationServiceFactory:
     """Factory for creating AI classification service instances"""
 
+    _caches: Dict[Path, SqliteClassificationCache] = {}
+    _recording_stores: Dict[Path, SqliteRecordingStore] = {}
+    _lock = threading.Lock()
+
     @staticmethod
     def create() -> AIClassificationService:
         """
@@ -26,12 +34,92 @@ class AIClassificationServiceFactory:
             ValueError: If provider is not configured or not supported
         """
         provider = getattr(settings, "AI_PROVIDER", "OPENAI").upper()
-
-        if provider == "OPENAI":
-            logger.info("Creating OpenAI classification service")
-            return OpenAIClassificationService()
-        elif provider == "ANTHROPIC":
-            logger.info("Creating Anthropic classification service")
-            return AnthropicClassificationService()
+        if provider == "REPLAY":
+            service = AIClassificationServiceFactory._create_replay()
         else:
-            raise ValueError(f"Unsupported AI provider: {provider}. " f"Supported providers: OPENAI, ANTHROPIC")
+            service = AIClassificationServiceFactory._create_provider(provider)
+        return AIClassificationServiceFactory._with_cache(service)
+
+    @staticmethod
+    def _create_provider(provider: str) -> AIClassificationService:
+        """Create a service calling a real provider (imported on first use)."""
+        logger.info(f"Creating {provider} classification service")
+        return provider_registry.create(provider)
+
+    @staticmethod
+    def _with_cache(service: AIClassificationService) -> AIClassificationService:
+        """Put the persistent classification cache in front of a service when AI_CACHE_FILE is set."""
+        path = getattr(settings, "AI_CACHE_FILE", "")
+        if not path:
+            return service
+        return CachedClassificationService(
+            service,
+            AIClassificationServiceFactory._cache(Path(path)),
+            model=getattr(settings, "AI_MODEL", ""),
+            prompt_version=getattr(settings, "AI_PROMPT_VERSION", "1"),
+        )
+
+    @classmethod
+    def _cache(cls, path: Path) -> SqliteClassificationCache:
+        """
+        Get the classification cache for a file.
+
+        One cache is created per file and process, so every service shares
+        its connections and in-memory LRU.
+        """
+        cache = cls._caches.get(path)
+        if cache is None:
+            with cls._lock:
+                cache = cls._caches.get(path)
+                if cache is None:
+                    cache = SqliteClassificationCache(
+                        path,
+                        max_entries=getattr(settings, "AI_CACHE_MAX_ENTRIES", 100_000),
+                        memory_entries=getattr(settings, "AI_CACHE_MEMORY_ENTRIES", 1024),
+                        warm_start=getattr(settings, "AI_CACHE_WARM_START", False),
+                    )
+                    cls._caches[path] = cache
+        return cache
+
+    @classmethod
+    def _recording_store(cls, path: Path) -> SqliteRecordingStore:
+        """Get the recording store for a file; like caches, one is opened per file and process."""
+        store = cls._recording_stores.get(path)
+        if store is None:
+            with cls._lock:
+                store = cls._recording_stores.get(path)
+                if store is None:
+                    store = SqliteRecordingStore(path)
+                    cls._recording_stores[path] = store
+        return store
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared caches and recording stores (used by tests and on reconfiguration)."""
+        with cls._lock:
+            cls._caches.clear()
+            cls._recording_stores.clear()
+
+    @staticmethod
+    def _create_replay() -> AIClassificationService:
+        """
+        Create a record/replay service.
+
+        With AI_REPLAY_MODE=RECORD the AI_REPLAY_SOURCE provider is called and
+        its responses are recorded; otherwise recorded responses are replayed.
+        """
+        from pyticket.infrastructure.ai.providers.replay_provider import RecordingAssistant, ReplayClassificationService
+
+        store = AIClassificationServiceFactory._recording_store(Path(getattr(settings, "AI_REPLAY_FILE", "ai_recordings.sqlite3")))
+        if getattr(settings, "AI_REPLAY_MODE", "REPLAY").upper() == "RECORD":
+            source = getattr(settings, "AI_REPLAY_SOURCE", "OPENAI").upper()
+            logger.info(f"Recording {source} classification responses")
+            service = AIClassificationServiceFactory._create_provider(source)
+            service.assistant = RecordingAssistant(service.assistant, store)
+            return service
+        logger.info("Creating replay classification service")
+        return ReplayClassificationService(
+            store,
+            latency_scale=getattr(settings, "AI_REPLAY_LATENCY_SCALE", 1.0),
+            model=getattr(settings, "AI_MODEL", ""),
+        )
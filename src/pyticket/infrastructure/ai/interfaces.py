@@ -2,11 +2,27 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import Optional
 
 from pyticket.domain.tickets.entities import Category, Priority, Ticket
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class ClassificationUsage:
+    """Provider usage of one classification call"""
+
+    provider: str
+    model: str
+    prompt_tokens: int
+    completion_tokens: int
+    latency_seconds: float
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+
+@dataclass(frozen=True, slots=True)
 class ClassificationResult:
     """Result of AI classification"""
 
@@ -14,6 +30,7 @@ class ClassificationResult:
     priority: Priority
     confidence_score: float
     reasoning: str
+    usage: Optional[ClassificationUsage] = None  # None when no provider call was made (e.g. cache hit)
 
 
 class AIClassificationService(ABC):
@@ -33,3 +50,37 @@ class AIClassificationService(ABC):
         Raises:
             ClassificationError: If classification fails
         """
+
+
+@dataclass(frozen=True, slots=True)
+class Recording:
+    """Recorded assistant response to a prompt"""
+
+    response: str
+    latency_seconds: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+
+class IRecordingStore(ABC):
+    """Abstract store of recorded assistant responses, keyed by prompt"""
+
+    @abstractmethod
+    def get(self, prompt: str) -> Optional[Recording]:
+        """Get the recorded response to a prompt, None if it was never recorded."""
+
+    @abstractmethod
+    def add(self, prompt: str, recording: Recording) -> None:
+        """Record the response to a prompt, replacing an earlier recording."""
+
+
+class IClassificationCache(ABC):
+    """Abstract store of classification results, keyed by prompt, model and prompt version"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[ClassificationResult]:
+        """Get a cached classification, None on a miss."""
+
+    @abstractmethod
+    def set(self, key: str, result: ClassificationResult) -> None:
+        """Cache a classification."""
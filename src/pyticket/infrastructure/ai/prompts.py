@@ -0,0 +1,99 @@
+"""Classification prompt shared by the assistant-based providers"""
+
+import hashlib
+import json
+import re
+from typing import Any, Dict
+
+from pyticket.domain.tickets.entities import Ticket
+
+CLASSIFICATION_INSTRUCTIONS = """
+    You are a customer support ticket classification system.
+    Analyze the ticket title and description, then classify it into one of these categories:
+    - TECHNICAL: Technical issues, bugs, system problems, login issues, API errors
+    - BILLING: Payment, subscription, invoice issues, refund requests, payment failures
+    - FEATURE_REQUEST: Requests for new features, enhancements, improvements
+    - BUG_REPORT: Reports of software bugs, errors, unexpected behavior
+    - GENERAL: General inquiries that don't fit other categories
+
+    Also assign a priority:
+    - LOW: Non-urgent, can wait, feature requests, general questions
+    - MEDIUM: Standard priority, normal issues
+    - HIGH: Important, needs attention soon, billing issues, login problems
+    - URGENT: Critical, needs immediate attention, system down, payment blocked
+
+    Respond with a JSON object containing:
+    - category: one of the categories above
+    - priority: one of the priorities above
+    - confidence_score: a float between 0 and 1
+    - reasoning: brief explanation of your classification
+
+    Examples:
+
+    Example 1:
+    Title: Cannot log into my account
+    Description: I've been trying to log in for the past hour but keep getting an error message saying "Invalid credentials" even though I'm using the correct password.
+    Response: {"category": "TECHNICAL", "priority": "HIGH", "confidence_score": 0.95, "reasoning": "Login/authentication issue is a technical problem that needs prompt resolution"}
+
+    Example 2:
+    Title: Payment failed for my subscription
+    Description: My credit card payment was declined when trying to renew my subscription. I need help resolving this immediately as my service will expire soon.
+    Response: {"category": "BILLING", "priority": "HIGH", "confidence_score": 0.98, "reasoning": "Payment and subscription issue falls under billing category and is high priority"}
+
+    Example 3:
+    Title: Feature suggestion: Dark mode
+    Description: It would be great if you could add a dark mode option to the application. Many users would appreciate this feature, especially for night-time usage.
+    Response: {"category": "FEATURE_REQUEST", "priority": "LOW", "confidence_score": 0.92, "reasoning": "Request for new feature, not urgent"}
+
+    Example 4:
+    Title: Application crashes when uploading large files
+    Description: Every time I try to upload a file larger than 100MB, the application crashes. This happens consistently on both Chrome and Firefox browsers.
+    Response: {"category": "BUG_REPORT", "priority": "HIGH", "confidence_score": 0.96, "reasoning": "Report of reproducible software bug affecting functionality"}
+
+    Example 5:
+    Title: How do I export my data?
+    Description: I would like to know how to export all my data from the platform. Is there a feature for this?
+    Response: {"category": "GENERAL", "priority": "LOW", "confidence_score": 0.88, "reasoning": "General inquiry about platform features"}
+
+    Example 6:
+    Title: System is down - cannot access dashboard
+    Description: The entire system appears to be down. I cannot access the dashboard, API is returning 500 errors, and none of my integrations are working. This is affecting our production environment.
+    Response: {"category": "TECHNICAL", "priority": "URGENT", "confidence_score": 0.99, "reasoning": "System-wide outage is a critical technical issue requiring immediate attention"}
+    """
+
+_JSON_OBJECT = re.compile(r"\{[^{}]*\}")
+
+PROMPT_TEMPLATE = "Title: {title}\n\nDescription: {description}"
+
+# Changes whenever the instructions or the template do; cached classifications are keyed by it
+PROMPT_TEMPLATE_HASH = hashlib.sha256(f"{CLASSIFICATION_INSTRUCTIONS}\0{PROMPT_TEMPLATE}".encode("utf-8")).hexdigest()
+
+
+def build_prompt(ticket: Ticket) -> str:
+    """Render the prompt sent for a ticket."""
+    return PROMPT_TEMPLATE.format(title=ticket.title, description=ticket.description)
+
+
+def prompt_key(ticket: Ticket) -> str:
+    """Identify the full provider input for a ticket: the template hash and the rendered prompt."""
+    return f"{PROMPT_TEMPLATE_HASH}\0{build_prompt(ticket)}"
+
+
+def parse_response(response: str) -> Dict[str, Any]:
+    """
+    Parse a classification reply into its JSON fields.
+
+    Markdown code fences are stripped; if the reply still is not JSON, the
+    first flat JSON object in it is used.
+
+    Raises:
+        ValueError: If the reply contains no JSON object
+    """
+    text = response.strip().removeprefix("```json").removeprefix("```").removesuffix("```").strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError as err:
+        match = _JSON_OBJECT.search(text)
+        if match is None:
+            raise ValueError(f"Could not parse response as JSON: {text}") from err
+        return json.loads(match.group())
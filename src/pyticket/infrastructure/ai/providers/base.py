@@ -0,0 +1,71 @@
+"""Base for classification services driven by an assistant"""
+
+import logging
+import time
+from typing import Any
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.domain.tickets.exceptions import ClassificationError
+from pyticket.infrastructure.ai.assistants import AssistantReply, run_assistant
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult, ClassificationUsage
+from pyticket.infrastructure.ai.prompts import build_prompt, parse_response
+
+logger = logging.getLogger(__name__)
+
+
+class AssistantClassificationService(AIClassificationService):
+    """
+    Classifies tickets by sending the shared prompt to an assistant.
+
+    Subclasses only choose the assistant; prompt building, response parsing
+    and usage accounting are the same for every provider. This module imports
+    no provider SDK.
+    """
+
+    provider_name = ""
+
+    def __init__(self, assistant: Any):
+        """
+        Initialize assistant classification service.
+
+        Args:
+            assistant: Assistant answering prompts (``run``/``run_with_usage`` or ``invoke``)
+        """
+        self.assistant = assistant
+
+    def classify_ticket(self, ticket: Ticket) -> ClassificationResult:
+        """Classify ticket using the assistant."""
+        try:
+            started = time.monotonic()
+            reply = run_assistant(self.assistant, build_prompt(ticket))
+            latency = time.monotonic() - started
+
+            # Parse JSON response and map to domain entities
+            result = parse_response(reply.text)
+            category = Category(result["category"])
+            priority = Priority(result["priority"])
+            confidence = float(result["confidence_score"])
+            reasoning = result["reasoning"]
+
+            logger.info(f"Classified ticket {ticket.id}: {category.value}, {priority.value}, " f"confidence: {confidence}")
+
+            return ClassificationResult(
+                category=category,
+                priority=priority,
+                confidence_score=confidence,
+                reasoning=reasoning,
+                usage=self._usage(reply, latency),
+            )
+        except Exception as e:
+            logger.error(f"{self.provider_name} classification failed for ticket {ticket.id}: {e}")
+            raise ClassificationError(f"Failed to classify ticket: {str(e)}") from e
+
+    def _usage(self, reply: AssistantReply, latency: float) -> ClassificationUsage:
+        """Build the usage record of a provider call."""
+        return ClassificationUsage(
+            provider=self.provider_name,
+            model=self.assistant.get_model(),
+            prompt_tokens=reply.prompt_tokens,
+            completion_tokens=reply.completion_tokens,
+            latency_seconds=latency,
+        )
@@ -0,0 +1,112 @@
+"""Record/replay provider implementation for offline load testing"""
+
+import logging
+import time
+from typing import Any, Callable
+
+from pyticket.infrastructure.ai.assistants import AssistantReply, run_assistant
+from pyticket.infrastructure.ai.interfaces import IRecordingStore, Recording
+from pyticket.infrastructure.ai.providers.base import AssistantClassificationService
+
+logger = logging.getLogger(__name__)
+
+
+class RecordingAssistant:
+    """Wraps a real assistant and records every prompt -> response pair with its latency"""
+
+    def __init__(self, assistant: Any, store: IRecordingStore):
+        """
+        Initialize recording assistant.
+
+        Args:
+            assistant: Assistant whose run() calls the provider
+            store: Store receiving the recordings
+        """
+        self.assistant = assistant
+        self.store = store
+
+    def get_model(self) -> str:
+        """Get the model of the wrapped assistant."""
+        return self.assistant.get_model()
+
+    def run(self, prompt: str) -> str:
+        """Run the wrapped assistant and record its response."""
+        return self.run_with_usage(prompt).text
+
+    def run_with_usage(self, prompt: str) -> AssistantReply:
+        """Run the wrapped assistant and record its response, latency and token usage."""
+        started = time.monotonic()
+        reply = run_assistant(self.assistant, prompt)
+        recording = Recording(
+            response=reply.text,
+            latency_seconds=time.monotonic() - started,
+            prompt_tokens=reply.prompt_tokens,
+            completion_tokens=reply.completion_tokens,
+        )
+        self.store.add(prompt, recording)
+        return reply
+
+
+class ReplayAssistant:
+    """Answers prompts from recordings, waiting the recorded (scaled) latency"""
+
+    def __init__(
+        self,
+        store: IRecordingStore,
+        latency_scale: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+        model: str = "",
+    ):
+        """
+        Initialize replay assistant.
+
+        Args:
+            store: Store holding the recordings
+            latency_scale: Factor applied to recorded latencies (0 replays instantly)
+            sleep: Sleep function (replaceable in tests)
+            model: Model reported for replayed responses
+        """
+        self.store = store
+        self.latency_scale = latency_scale
+        self.sleep = sleep
+        self.model = model
+
+    def get_model(self) -> str:
+        """Get the model reported for replayed responses."""
+        return self.model
+
+    def run(self, prompt: str) -> str:
+        """Replay the recorded response to a prompt."""
+        return self.run_with_usage(prompt).text
+
+    def run_with_usage(self, prompt: str) -> AssistantReply:
+        """Replay the recorded response to a prompt with its recorded token usage."""
+        recording = self.store.get(prompt)
+        if recording is None:
+            raise LookupError("No recorded response for prompt")
+        if self.latency_scale > 0:
+            self.sleep(recording.latency_seconds * self.latency_scale)
+        return AssistantReply(recording.response, recording.prompt_tokens, recording.completion_tokens)
+
+
+class ReplayClassificationService(AssistantClassificationService):
+    """
+    Classification service answering from recorded provider responses.
+
+    Prompts and response parsing are the same as for the real providers, so
+    the whole stack runs as in production without calling a paid API.
+    Tickets whose prompt was never recorded fail with ClassificationError.
+    """
+
+    provider_name = "REPLAY"
+
+    def __init__(self, store: IRecordingStore, latency_scale: float = 1.0, model: str = ""):
+        """
+        Initialize replay classification service.
+
+        Args:
+            store: Store holding the recordings
+            latency_scale: Factor applied to recorded latencies
+            model: Model reported in usage records
+        """
+        super().__init__(ReplayAssistant(store, latency_scale, model=model))
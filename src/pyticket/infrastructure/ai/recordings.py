@@ -0,0 +1,58 @@
+"""SQLite store of recorded assistant responses"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Optional
+
+from pyticket.infrastructure.ai.interfaces import IRecordingStore, Recording
+
+
+class SqliteRecordingStore(IRecordingStore):
+    """Keeps one row per prompt (keyed by its SHA-256) in a standalone SQLite file"""
+
+    def __init__(self, path: Path):
+        """
+        Initialize store, creating the file if needed.
+
+        Args:
+            path: SQLite file holding the recordings
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS recordings (prompt_hash TEXT PRIMARY KEY, response TEXT NOT NULL, latency REAL NOT NULL, "
+            "prompt_tokens INTEGER NOT NULL DEFAULT 0, completion_tokens INTEGER NOT NULL DEFAULT 0)"
+        )
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def get(self, prompt: str) -> Optional[Recording]:
+        """Get the recorded response to a prompt, None if it was never recorded."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, latency, prompt_tokens, completion_tokens FROM recordings WHERE prompt_hash = ?", (self._key(prompt),)
+            ).fetchone()
+        return Recording(*row) if row else None
+
+    def add(self, prompt: str, recording: Recording) -> None:
+        """Record the response to a prompt, replacing an earlier recording."""
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO recordings (prompt_hash, response, latency, prompt_tokens, completion_tokens) VALUES (?, ?, ?, ?, ?)",
+                (
+                    self._key(prompt),
+                    recording.response,
+                    recording.latency_seconds,
+                    recording.prompt_tokens,
+                    recording.completion_tokens,
+                ),
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute("SELECT COUNT(*) FROM recordings").fetchone()[0]
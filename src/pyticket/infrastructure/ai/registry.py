@@ -0,0 +1,105 @@
+"""Registry of AI classification providers, imported on first use"""
+
+import logging
+import threading
+from importlib.metadata import entry_points, EntryPoint
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Union
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from pyticket.infrastructure.ai.interfaces import AIClassificationService
+
+logger = logging.getLogger(__name__)
+
+ProviderFactory = Callable[[], AIClassificationService]
+
+# Built-in providers by name; the modules (and their LLM SDKs) are only imported when selected
+DEFAULT_PROVIDERS: Mapping[str, str] = MappingProxyType(
+    {
+        "OPENAI": "pyticket.infrastructure.ai.providers.openai_provider.OpenAIClassificationService",
+        "ANTHROPIC": "pyticket.infrastructure.ai.providers.anthropic_provider.AnthropicClassificationService",
+    }
+)
+
+# Installed packages can add providers under this entry point group, e.g. in pyproject.toml:
+# [project.entry-points."pyticket.ai_providers"]
+# MISTRAL = "pyticket_mistral:MistralClassificationService"
+ENTRY_POINT_GROUP = "pyticket.ai_providers"
+
+
+class AIProviderRegistry:
+    """
+    Maps provider names to classification service factories.
+
+    Providers are registered as dotted paths and imported on first use, so
+    only the selected provider's SDK is loaded. Names are looked up in the
+    registered providers, then AI_PROVIDERS in settings, then the
+    ``pyticket.ai_providers`` entry points.
+    """
+
+    def __init__(self, providers: Mapping[str, Union[str, ProviderFactory]] = DEFAULT_PROVIDERS):
+        self._providers: Dict[str, Union[str, ProviderFactory]] = {name.upper(): provider for name, provider in providers.items()}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, provider: Union[str, ProviderFactory]) -> None:
+        """
+        Register a provider.
+
+        Args:
+            name: Provider name as used in AI_PROVIDER
+            provider: Dotted path to the service class (or factory), or the factory itself
+        """
+        with self._lock:
+            self._providers[name.upper()] = provider
+
+    def names(self) -> List[str]:
+        """Get the names of the known providers (without importing them)."""
+        configured = getattr(settings, "AI_PROVIDERS", {})
+        return sorted({*self._providers, *map(str.upper, configured), *(entry.name.upper() for entry in self._entry_points())})
+
+    def get(self, name: str) -> ProviderFactory:
+        """
+        Get the factory of a provider, importing it on first use.
+
+        Raises:
+            ValueError: If no provider has this name
+        """
+        key = name.upper()
+        with self._lock:
+            provider = self._providers.get(key) or self._find(key)
+            if provider is None:
+                raise ValueError(f"Unsupported AI provider: {name}. Supported providers: {', '.join(self.names())}")
+            provider = self._providers[key] = self._load(key, provider)
+        return provider
+
+    def create(self, name: str) -> AIClassificationService:
+        """Create a service of the named provider."""
+        return self.get(name)()
+
+    @staticmethod
+    def _load(key: str, provider: Union[str, EntryPoint, ProviderFactory]) -> ProviderFactory:
+        """Import a provider registered by path or entry point."""
+        if isinstance(provider, str):
+            logger.info(f"Importing AI provider {key}: {provider}")
+            return import_string(provider)
+        if isinstance(provider, EntryPoint):
+            logger.info(f"Importing AI provider {key}: {provider.value}")
+            return provider.load()
+        return provider
+
+    @staticmethod
+    def _find(key: str) -> Optional[Union[str, EntryPoint]]:
+        """Look a provider up in settings and entry points."""
+        configured = {name.upper(): path for name, path in getattr(settings, "AI_PROVIDERS", {}).items()}
+        if key in configured:
+            return configured[key]
+        return next((entry for entry in AIProviderRegistry._entry_points() if entry.name.upper() == key), None)
+
+    @staticmethod
+    def _entry_points():
+        return entry_points(group=ENTRY_POINT_GROUP)
+
+
+provider_registry = AIProviderRegistry()
@@ -0,0 +1 @@
+"""Authentication support"""
@@ -0,0 +1,41 @@
+"""Password hashers with their cost taken from settings
+
+Each hasher keeps Django's algorithm name, so existing hashes still verify
+and are re-hashed with the configured cost on the user's next login. A
+cost setting of 0 keeps Django's default.
+"""
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+def _cost(name: str, default: int) -> int:
+    return getattr(settings, name, 0) or default
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PASSWORD_PBKDF2_ITERATIONS iterations"""
+
+    @property
+    def iterations(self) -> int:
+        return _cost("PASSWORD_PBKDF2_ITERATIONS", hashers.PBKDF2PasswordHasher.iterations)
+
+
+class ScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    """scrypt with a work factor (N) of PASSWORD_SCRYPT_WORK_FACTOR"""
+
+    @property
+    def work_factor(self) -> int:
+        return _cost("PASSWORD_SCRYPT_WORK_FACTOR", hashers.ScryptPasswordHasher.work_factor)
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Argon2id with PASSWORD_ARGON2_TIME_COST passes over PASSWORD_ARGON2_MEMORY_COST KiB (needs argon2-cffi)"""
+
+    @property
+    def time_cost(self) -> int:
+        return _cost("PASSWORD_ARGON2_TIME_COST", hashers.Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self) -> int:
+        return _cost("PASSWORD_ARGON2_MEMORY_COST", hashers.Argon2PasswordHasher.memory_cost)
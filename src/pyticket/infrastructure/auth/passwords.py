@@ -0,0 +1,107 @@
+"""Password hashing on a bounded thread pool"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from django.contrib.auth import get_user_model, hashers
+from django.contrib.auth.base_user import AbstractBaseUser
+
+
+class PasswordHashingOverloadedError(Exception):
+    """Raised when too many passwords are already being hashed."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Too many concurrent logins, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class PasswordHashingPool:
+    """
+    Runs password hashing on a bounded thread pool.
+
+    A hash costs hundreds of milliseconds of CPU by design, so on the request
+    threads a burst of logins occupies every worker. Here at most ``workers``
+    hashes run at once and at most ``max_pending`` more wait; further calls
+    fail fast with PasswordHashingOverloadedError. hashlib releases the GIL
+    while hashing, so the other request threads keep serving meanwhile. With
+    0 workers hashing runs on the calling thread, unbounded.
+    """
+
+    def __init__(self, workers: int = 0, max_pending: int = 0, retry_after: int = 1):
+        """
+        Initialize pool.
+
+        Args:
+            workers: Threads hashing at once (0 = hash on the calling thread)
+            max_pending: Hashes allowed to wait for a thread
+            retry_after: Seconds clients are told to wait when the pool is full
+        """
+        self.workers = max(workers, 0)
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="password-hashing") if self.workers else None
+        self._slots = threading.BoundedSemaphore(self.workers + max(max_pending, 0)) if self.workers else None
+
+    def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function on the pool and wait for its result.
+
+        Raises:
+            PasswordHashingOverloadedError: If all threads are busy and the queue is full
+        """
+        if self._executor is None:
+            return func(*args)
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHashingOverloadedError(self.retry_after)
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+    def make_password(self, password: str) -> str:
+        """Hash a password with the preferred hasher."""
+        return self.run(hashers.make_password, password)
+
+    def check_password(self, password: str, encoded: str) -> bool:
+        """Check a password against its hash."""
+        return self.run(hashers.check_password, password, encoded)
+
+    def shutdown(self) -> None:
+        """Stop the hashing threads."""
+        if self._executor is not None:
+            self._executor.shutdown()
+
+
+def authenticate_user(pool: PasswordHashingPool, username: str, password: str) -> Optional[AbstractBaseUser]:
+    """
+    Check a username and password like Django's ModelBackend, hashing on the pool.
+
+    Database access stays on the calling thread (and its connection). As in
+    ModelBackend, an unknown username costs a hash too, so response times
+    do not reveal which usernames exist, and a hash made with an outdated
+    hasher or cost is replaced after a successful check.
+
+    Returns:
+        The active user, or None if the credentials are wrong
+    """
+    user_model = get_user_model()
+    try:
+        user = user_model._default_manager.get_by_natural_key(username)
+    except user_model.DoesNotExist:
+        pool.make_password(password)
+        return None
+    if not pool.check_password(password, user.password) or not getattr(user, "is_active", True):
+        return None
+    if _must_rehash(user.password):
+        user.password = pool.make_password(password)
+        user.save(update_fields=["password"])
+    return user
+
+
+def _must_rehash(encoded: str) -> bool:
+    """Whether a hash was made with another hasher or cost than the preferred one."""
+    preferred = hashers.get_hasher()
+    return hashers.identify_hasher(encoded).algorithm != preferred.algorithm or preferred.must_update(encoded)
@@ -0,0 +1,76 @@
+"""Cache of authenticated users, invalidated when they change"""
+
+import logging
+from typing import Any, Optional
+
+from django.conf import settings
+from django.contrib.auth.base_user import AbstractBaseUser
+from django.core.cache import BaseCache, caches
+from django.db.models.signals import post_delete, post_save
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "pyticket:auth:user:"
+
+
+class UserCache:
+    """
+    Users by id in a Django cache, so authentication can skip the user query.
+
+    Entries expire after ``ttl_seconds`` and are deleted when the user is
+    saved or deleted (see connect_user_cache). With a per-process cache
+    (the default LocMemCache) other processes only see a change once their
+    entry expires; configure a shared cache to invalidate everywhere at once.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, cache: Optional[BaseCache] = None):
+        """
+        Initialize user cache.
+
+        Args:
+            ttl_seconds: How long a user is served from the cache
+            cache: Django cache (default: the API_AUTH_CACHE alias)
+        """
+        self.ttl_seconds = ttl_seconds
+        self._cache = cache
+
+    @property
+    def cache(self) -> BaseCache:
+        return self._cache or caches[getattr(settings, "API_AUTH_CACHE", "default")]
+
+    @staticmethod
+    def key(user_id: Any) -> str:
+        return f"{KEY_PREFIX}{user_id}"
+
+    def get(self, user_id: Any) -> Optional[AbstractBaseUser]:
+        """Get a cached user, None on a miss."""
+        return self.cache.get(self.key(user_id))
+
+    def set(self, user_id: Any, user: AbstractBaseUser) -> None:
+        """Cache a user for ttl_seconds."""
+        self.cache.set(self.key(user_id), user, self.ttl_seconds)
+
+    def invalidate(self, user_id: Any) -> None:
+        """Drop a user from the cache."""
+        self.cache.delete(self.key(user_id))
+
+
+def _invalidate_user(sender, instance, **kwargs) -> None:
+    """Drop a changed or deleted user from the cache."""
+    UserCache().invalidate(instance.pk)
+
+
+def _invalidate_blacklisted(sender, instance, **kwargs) -> None:
+    """Drop the user of a blacklisted token, so their next request is checked against the database."""
+    user_id = instance.token.user_id
+    if user_id is not None:
+        logger.info(f"Token of user {user_id} blacklisted, dropping cached user")
+        UserCache().invalidate(user_id)
+
+
+def connect_user_cache() -> None:
+    """Invalidate cached users when a user changes or one of their tokens is blacklisted."""
+    post_save.connect(_invalidate_user, sender=settings.AUTH_USER_MODEL, dispatch_uid="pyticket.user_cache.save")
+    post_delete.connect(_invalidate_user, sender=settings.AUTH_USER_MODEL, dispatch_uid="pyticket.user_cache.delete")
+    if "ninja_jwt.token_blacklist" in settings.INSTALLED_APPS:
+        post_save.connect(_invalidate_blacklisted, sender="token_blacklist.BlacklistedToken", dispatch_uid="pyticket.user_cache.blacklist")
@@ -0,0 +1 @@
+"""Ticket event bus implementations"""
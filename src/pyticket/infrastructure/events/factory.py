@@ -0,0 +1,46 @@
+"""Factory for the process-wide ticket event bus"""
+
+import logging
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from pyticket.infrastructure.events.interfaces import ITicketEventBus
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EVENT_BUS = "pyticket.infrastructure.events.in_memory_bus.InMemoryTicketEventBus"
+
+
+class TicketEventBusFactory:
+    """Factory for the shared ticket event bus instance"""
+
+    _instance: Optional[ITicketEventBus] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> ITicketEventBus:
+        """
+        Get the event bus configured by TICKET_EVENT_BUS.
+
+        The bus is created once per process so publishers and subscribers
+        share it.
+
+        Returns:
+            An instance of ITicketEventBus
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    bus_path = getattr(settings, "TICKET_EVENT_BUS", "") or DEFAULT_EVENT_BUS
+                    logger.info(f"Creating ticket event bus: {bus_path}")
+                    cls._instance = import_string(bus_path)()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared instance (used by tests and on reconfiguration)."""
+        with cls._lock:
+            cls._instance = None
@@ -0,0 +1,99 @@
+"""In-process implementation of the ticket event bus"""
+
+import logging
+import threading
+from collections import deque
+from typing import Deque, Optional, Set
+from uuid import UUID
+
+from pyticket.domain.tickets.events import TicketEvent
+from pyticket.infrastructure.events.interfaces import ITicketEventBus, ITicketEventSubscription
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryTicketEventSubscription(ITicketEventSubscription):
+    """Bounded queue of events delivered to a single subscriber"""
+
+    def __init__(self, bus: "InMemoryTicketEventBus", ticket_id: Optional[UUID], max_pending: int):
+        """
+        Initialize subscription.
+
+        Args:
+            bus: Bus the subscription belongs to
+            ticket_id: Ticket to filter on, or None for all tickets
+            max_pending: Maximum number of undelivered events kept
+        """
+        self.bus = bus
+        self.ticket_id = ticket_id
+        self._events: Deque[TicketEvent] = deque(maxlen=max_pending if max_pending > 0 else None)
+        self._condition = threading.Condition()
+
+    def matches(self, event: TicketEvent) -> bool:
+        """Check if the subscription wants the event."""
+        return self.ticket_id is None or self.ticket_id == event.ticket_id
+
+    def deliver(self, event: TicketEvent) -> None:
+        """Queue an event, dropping the oldest one if the subscriber is too slow."""
+        with self._condition:
+            if len(self._events) == self._events.maxlen:
+                logger.warning(f"Event subscriber for {self.ticket_id or 'all tickets'} is lagging, dropping oldest event")
+            self._events.append(event)  # Drops the oldest event when full, under the same lock
+            self._condition.notify()
+
+    def get(self, timeout: float) -> Optional[TicketEvent]:
+        """Wait for the next event, returning None on timeout."""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._events, timeout=timeout):
+                return None
+            return self._events.popleft()
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self.bus.unsubscribe(self)
+
+
+class InMemoryTicketEventBus(ITicketEventBus):
+    """
+    Event bus delivering events to subscribers within the current process.
+
+    Suitable for a single server process; multi-process deployments should
+    plug in a broker-backed implementation via TICKET_EVENT_BUS.
+    """
+
+    def __init__(self, max_pending: int = 100):
+        """
+        Initialize event bus.
+
+        Args:
+            max_pending: Maximum number of undelivered events per subscriber
+        """
+        self.max_pending = max_pending
+        self._subscriptions: Set[InMemoryTicketEventSubscription] = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event: TicketEvent) -> None:
+        """Publish an event to all matching subscribers."""
+        with self._lock:
+            subscriptions = list(self._subscriptions)
+        for subscription in subscriptions:
+            if subscription.matches(event):
+                subscription.deliver(event)
+
+    def subscribe(self, ticket_id: Optional[UUID] = None) -> InMemoryTicketEventSubscription:
+        """Subscribe to events for one ticket, or all tickets when ticket_id is None."""
+        subscription = InMemoryTicketEventSubscription(self, ticket_id, self.max_pending)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: InMemoryTicketEventSubscription) -> None:
+        """Remove a subscription."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    @property
+    def subscriber_count(self) -> int:
+        """Number of active subscriptions."""
+        with self._lock:
+            return len(self._subscriptions)
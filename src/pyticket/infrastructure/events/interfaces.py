@@ -0,0 +1,31 @@
+"""Event bus interfaces"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+from uuid import UUID
+
+from pyticket.domain.tickets.events import TicketEvent
+
+
+class ITicketEventSubscription(ABC):
+    """Interface for a subscription to ticket events"""
+
+    @abstractmethod
+    def get(self, timeout: float) -> Optional[TicketEvent]:
+        """Wait for the next event, returning None on timeout."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop receiving events."""
+
+
+class ITicketEventBus(ABC):
+    """Interface for publishing and subscribing to ticket events"""
+
+    @abstractmethod
+    def publish(self, event: TicketEvent) -> None:
+        """Publish an event to all matching subscribers."""
+
+    @abstractmethod
+    def subscribe(self, ticket_id: Optional[UUID] = None) -> ITicketEventSubscription:
+        """Subscribe to events for one ticket, or all tickets when ticket_id is None."""
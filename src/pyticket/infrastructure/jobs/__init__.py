@@ -0,0 +1 @@
+"""Background job support"""
@@ -0,0 +1,43 @@
+"""File based job checkpoints"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+
+from pyticket.infrastructure.jobs.interfaces import IJobCheckpointStore
+
+
+class FileJobCheckpointStore(IJobCheckpointStore):
+    """Stores one JSON file per job; writes are atomic so a crash never leaves a torn checkpoint"""
+
+    def __init__(self, directory: Optional[Path] = None):
+        self.directory = Path(directory or settings.JOB_CHECKPOINT_DIR)
+
+    def _path(self, job_name: str) -> Path:
+        return self.directory / f"{job_name}.json"
+
+    def load(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """Load the last saved state of a job, None if there is none."""
+        try:
+            with self._path(job_name).open(encoding="utf-8") as checkpoint_file:
+                return json.load(checkpoint_file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, job_name: str, state: Dict[str, Any]) -> None:
+        """Save the state of a job, replacing the previous one."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(job_name)
+        temp_path = path.with_suffix(".tmp")
+        with temp_path.open("w", encoding="utf-8") as checkpoint_file:
+            json.dump(state, checkpoint_file)
+            checkpoint_file.flush()
+            os.fsync(checkpoint_file.fileno())
+        os.replace(temp_path, path)
+
+    def clear(self, job_name: str) -> None:
+        """Remove the saved state of a finished job."""
+        self._path(job_name).unlink(missing_ok=True)
@@ -0,0 +1,20 @@
+"""Job checkpoint interfaces"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+
+
+class IJobCheckpointStore(ABC):
+    """Interface for persisting the progress of resumable jobs"""
+
+    @abstractmethod
+    def load(self, job_name: str) -> Optional[Dict[str, Any]]:
+        """Load the last saved state of a job, None if there is none."""
+
+    @abstractmethod
+    def save(self, job_name: str, state: Dict[str, Any]) -> None:
+        """Save the state of a job, replacing the previous one."""
+
+    @abstractmethod
+    def clear(self, job_name: str) -> None:
+        """Remove the saved state of a finished job."""
@@ -0,0 +1,34 @@
+"""App config for infrastructure models"""
+
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class InfrastructureModelsConfig(AppConfig):
+    """App config for infrastructure models"""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "pyticket.infrastructure.models"
+    verbose_name = "Infrastructure Models"
+
+    def ready(self):
+        from pyticket.infrastructure.auth.user_cache import connect_user_cache
+        from pyticket.infrastructure.models.connection import configure_sqlite_connection
+        from pyticket.infrastructure.rules.loader import configure_routing_rules, configure_ticket_rules
+
+        connection_created.connect(configure_sqlite_connection, dispatch_uid="pyticket.configure_sqlite_connection")
+        connect_user_cache()
+        configure_ticket_rules()
+        configure_routing_rules()
+        self._watch_routing_rules()
+
+    @staticmethod
+    def _watch_routing_rules():
+        from django.conf import settings
+
+        from pyticket.infrastructure.rules.watcher import RoutingRulesWatcher
+
+        rules_file = getattr(settings, "TICKET_ROUTING_RULES_FILE", "")
+        interval = getattr(settings, "TICKET_ROUTING_RULES_RELOAD_SECONDS", 0)
+        if rules_file and interval > 0:
+            RoutingRulesWatcher(rules_file, interval).start()
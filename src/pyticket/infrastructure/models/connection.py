@@ -0,0 +1,35 @@
+"""Database connection tuning hooks"""
+
+import logging
+import re
+from typing import Any, Mapping
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_PRAGMA_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+
+def apply_sqlite_pragmas(connection, pragmas: Mapping[str, Any]) -> None:
+    """Apply PRAGMA statements to an open SQLite connection."""
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            if not (_PRAGMA_PATTERN.match(name) and _PRAGMA_PATTERN.match(str(value))):
+                raise ValueError(f"Invalid SQLite PRAGMA: {name}={value}")
+            cursor.execute(f"PRAGMA {name}={value}")
+
+
+def configure_sqlite_connection(sender, connection, **kwargs) -> None:
+    """
+    Tune new SQLite connections with SQLITE_PRAGMAS.
+
+    Connected to Django's connection_created signal; other database
+    vendors are left untouched.
+    """
+    if connection.vendor != "sqlite":
+        return
+    pragmas = getattr(settings, "SQLITE_PRAGMAS", {})
+    if pragmas:
+        apply_sqlite_pragmas(connection, pragmas)
+        logger.debug(f"Applied SQLite PRAGMAs to {connection.alias}: {pragmas}")
@@ -0,0 +1,28 @@
+"""Move old tickets to the archive"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+from pyticket.service.tickets.archival import TicketArchivalJob
+
+
+class Command(BaseCommand):
+    """Run the ticket archival job"""
+
+    help = "Move CLOSED and soft-deleted tickets older than --days from the tickets table to tickets_archive (run periodically)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=getattr(settings, "TICKET_ARCHIVE_AFTER_DAYS", 90))
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "TICKET_ARCHIVE_BATCH_SIZE", 500))
+
+    def handle(self, *args, **options):
+        job = TicketArchivalJob(
+            repository=DjangoTicketRepository(),
+            older_than=timedelta(days=options["days"]),
+            batch_size=options["batch_size"],
+        )
+        archived = job.run(on_progress=lambda count: self.stdout.write(f"{count} tickets archived"))
+        self.stdout.write(f"Archived {archived} tickets")
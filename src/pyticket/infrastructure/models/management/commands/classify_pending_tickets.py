@@ -0,0 +1,25 @@
+"""Classify tickets left unclassified by deferred ingestion"""
+
+from datetime import datetime, timedelta, timezone
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from pyticket.entrypoints.web.api.dependencies import create_ticket_ingestion
+
+
+class Command(BaseCommand):
+    """Sweep unclassified tickets through the ingestion workers"""
+
+    help = "Classify tickets still unclassified after --older-than seconds, e.g. deferred by a process that stopped (run periodically)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--older-than", type=float, default=getattr(settings, "TICKET_INGESTION_RECOVER_AGE_SECONDS", 300.0))
+        parser.add_argument("--limit", type=int, default=getattr(settings, "TICKET_INGESTION_MAX_DEPTH", 1000))
+
+    def handle(self, *args, **options):
+        ingestion = create_ticket_ingestion(max_depth=options["limit"])
+        queued = ingestion.recover(datetime.now(timezone.utc) - timedelta(seconds=max(options["older_than"], 0)))
+        ingestion.shutdown()
+        metrics = ingestion.metrics()
+        self.stdout.write(f"Classified {metrics.processed} of {queued} pending tickets ({metrics.failed} failed)")
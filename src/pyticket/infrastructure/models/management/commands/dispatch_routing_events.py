@@ -0,0 +1,51 @@
+"""Dispatch routing events from the outbox to team sinks"""
+
+import signal
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from pyticket.infrastructure.repositories.django_routing_outbox import DjangoRoutingOutbox
+from pyticket.infrastructure.routing.factory import RoutingSinkFactory
+from pyticket.service.tickets.routing_dispatcher import RoutingDispatcher
+
+
+class Command(BaseCommand):
+    """Run the routing outbox dispatcher"""
+
+    help = "Dispatch pending routing events from the outbox to the configured routing sink."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Dispatch a single batch and exit.")
+        parser.add_argument("--interval", type=float, default=1.0, help="Seconds to wait when the outbox is empty.")
+        parser.add_argument(
+            "--max-backoff",
+            type=float,
+            default=getattr(settings, "ROUTING_DISPATCH_MAX_BACKOFF", 60.0),
+            help="Longest wait, in seconds, after repeated failed batches.",
+        )
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "ROUTING_DISPATCH_BATCH_SIZE", 100))
+
+    def handle(self, *args, **options):
+        dispatcher = RoutingDispatcher(
+            outbox=DjangoRoutingOutbox(),
+            sink=RoutingSinkFactory.create(),
+            batch_size=options["batch_size"],
+            max_attempts=getattr(settings, "ROUTING_DISPATCH_MAX_ATTEMPTS", 5),
+            before_batch=close_old_connections,
+        )
+        if options["once"]:
+            count = dispatcher.dispatch_batch()
+            self.stdout.write(f"Dispatched batch of {count} routing events")
+            return
+
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        self.stdout.write("Routing dispatcher started")
+        try:
+            dispatcher.run(stop, interval=options["interval"], max_backoff=options["max_backoff"])
+        except KeyboardInterrupt:
+            stop.set()
+        self.stdout.write("Routing dispatcher stopped")
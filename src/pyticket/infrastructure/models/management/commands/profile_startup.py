@@ -0,0 +1,39 @@
+"""Profile the cold start of the web entrypoints"""
+
+from django.core.management.base import BaseCommand
+
+from pyticket.utils.startup import ENTRYPOINTS, profile_startup, StartupProfile
+
+
+class Command(BaseCommand):
+    """Report where a fresh worker spends its time before answering its first request"""
+
+    help = (
+        "Boot the WSGI/ASGI application in fresh interpreters and report import time, app registry and "
+        "URL resolution time and first-request latency. Times include -X importtime overhead."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entrypoint", choices=ENTRYPOINTS, action="append", help="Entrypoint to profile (default: both).")
+        parser.add_argument("--path", default="/api/tickets/stats", help="Path of the first request (GET).")
+        parser.add_argument("--repeat", type=int, default=3, help="Cold starts per entrypoint; the fastest is reported.")
+        parser.add_argument("--top", type=int, default=15, help="Imports and packages to list.")
+
+    def handle(self, *args, **options):
+        for entrypoint in options["entrypoint"] or ENTRYPOINTS:
+            runs = [profile_startup(entrypoint, options["path"]) for _ in range(max(options["repeat"], 1))]
+            self._write_profile(min(runs, key=lambda run: run.total_seconds), len(runs), options["top"])
+
+    def _write_profile(self, profile: StartupProfile, runs: int, top: int) -> None:
+        self.stdout.write(f"{profile.entrypoint}: GET {profile.path} -> {profile.status} (fastest of {runs})")
+        for phase, seconds in profile.phases.items():
+            self.stdout.write(f"  {phase:<28}{seconds * 1000:>9.1f} ms")
+        self.stdout.write(f"  {'total':<28}{profile.total_seconds * 1000:>9.1f} ms")
+        self.stdout.write(f"  {'process (with interpreter)':<28}{profile.process_seconds * 1000:>9.1f} ms")
+        self.stdout.write("Slowest top-level imports (cumulative):")
+        for timing in profile.slowest_imports(top):
+            self.stdout.write(f"  {timing.module:<56}{timing.cumulative_us / 1000:>9.1f} ms")
+        self.stdout.write("Import time by package (self):")
+        for package, self_us in profile.package_totals(top):
+            self.stdout.write(f"  {package:<56}{self_us / 1000:>9.1f} ms")
+        self.stdout.write("")
@@ -0,0 +1,20 @@
+"""Delete expired idempotency keys"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from pyticket.infrastructure.repositories.django_idempotency_repository import DjangoIdempotencyRepository
+
+
+class Command(BaseCommand):
+    """Delete the idempotency keys older than IDEMPOTENCY_KEY_TTL_SECONDS"""
+
+    help = "Delete stored idempotency keys and responses older than IDEMPOTENCY_KEY_TTL_SECONDS (run periodically)."
+
+    def handle(self, *args, **options):
+        expired_before = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL_SECONDS)
+        count = DjangoIdempotencyRepository().purge(expired_before)
+        self.stdout.write(f"Deleted {count} idempotency keys")
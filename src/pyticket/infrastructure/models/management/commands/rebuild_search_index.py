@@ -0,0 +1,20 @@
+"""Rebuild the ticket full-text search index"""
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from pyticket.infrastructure.repositories.search import rebuild_sqlite_index
+
+
+class Command(BaseCommand):
+    """Rebuild the SQLite FTS5 ticket index"""
+
+    help = "Rebuild the SQLite ticket search index (after VACUUM or table rebuilds). PostgreSQL indexes are maintained automatically."
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite":
+            self.stdout.write(f"Nothing to rebuild for {connection.vendor}")
+            return
+        with transaction.atomic():
+            count = rebuild_sqlite_index()
+        self.stdout.write(f"Indexed {count} tickets")
@@ -0,0 +1,15 @@
+"""Rebuild the ticket counters"""
+
+from django.core.management.base import BaseCommand
+
+from pyticket.infrastructure.repositories.django_ticket_stats_repository import DjangoTicketStatsRepository
+
+
+class Command(BaseCommand):
+    """Recompute the ticket counters from the tickets table"""
+
+    help = "Recompute the ticket statistics counters from the tickets table (use to correct drift)."
+
+    def handle(self, *args, **options):
+        count = DjangoTicketStatsRepository().rebuild()
+        self.stdout.write(f"Counted {count} tickets")
@@ -0,0 +1,45 @@
+"""Reclassify all tickets with the configured AI provider"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from pyticket.entrypoints.web.api.dependencies import get_classification_pool, get_ticket_service
+from pyticket.infrastructure.jobs.checkpoints import FileJobCheckpointStore
+from pyticket.service.tickets.reclassification_job import ReclassificationJob, ReclassificationProgress
+
+
+class Command(BaseCommand):
+    """Run the bulk reclassification job"""
+
+    help = "Reclassify every ticket (e.g. after a model or prompt change). Resumes from the last checkpoint after a crash."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=getattr(settings, "RECLASSIFY_BATCH_SIZE", 100))
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=getattr(settings, "RECLASSIFY_WORKERS", 4),
+            help="Concurrent classification calls; keep within the provider's rate limit.",
+        )
+        parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the first ticket.")
+
+    def handle(self, *args, **options):
+        classification_pool = get_classification_pool()
+        ticket_service = get_ticket_service(classification_pool)
+        job = ReclassificationJob(
+            ticket_service=ticket_service,
+            repository=ticket_service.repository,
+            checkpoints=FileJobCheckpointStore(),
+            batch_size=options["batch_size"],
+            max_workers=options["workers"],
+        )
+        try:
+            progress = job.run(restart=options["restart"], on_progress=self._write_progress)
+        finally:
+            if classification_pool is not None:
+                classification_pool.shutdown()
+        self.stdout.write(f"Reclassified {progress.processed} tickets ({progress.failed} failed)")
+
+    def _write_progress(self, progress: ReclassificationProgress) -> None:
+        eta = f"{progress.eta_seconds:.0f}s" if progress.eta_seconds is not None else "unknown"
+        self.stdout.write(f"{progress.processed}/{progress.total} tickets, {progress.rate:.1f}/s, ETA {eta}")
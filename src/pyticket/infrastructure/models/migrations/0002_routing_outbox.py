@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:23
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="RoutingOutboxModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("ticket_id", models.UUIDField()),
+                ("team", models.CharField(max_length=50)),
+                ("category", models.CharField(max_length=20)),
+                ("priority", models.CharField(blank=True, max_length=20, null=True)),
+                ("created_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("dispatched_at", models.DateTimeField(blank=True, null=True)),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "db_table": "routing_outbox",
+                "ordering": ["id"],
+                "indexes": [models.Index(fields=["dispatched_at", "id"], name="routing_outbox_pending_idx")],
+            },
+        ),
+    ]
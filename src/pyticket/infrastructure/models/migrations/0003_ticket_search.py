@@ -0,0 +1,81 @@
+"""Full-text search index for tickets
+
+SQLite: FTS5 table ``tickets_fts`` (rowid = tickets.rowid) kept in sync by triggers.
+PostgreSQL: generated ``search_vector`` tsvector column with a GIN index.
+Other databases fall back to LIKE scans and need no schema changes.
+"""
+
+from django.db import migrations
+
+SQLITE_FORWARD = [
+    "CREATE VIRTUAL TABLE tickets_fts USING fts5(ticket_id UNINDEXED, title, description, tokenize='porter unicode61')",
+    """
+    CREATE TRIGGER tickets_fts_insert AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts(rowid, ticket_id, title, description) VALUES (new.rowid, new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_fts_delete AFTER DELETE ON tickets BEGIN
+        DELETE FROM tickets_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER tickets_fts_update AFTER UPDATE OF title, description ON tickets BEGIN
+        UPDATE tickets_fts SET title = new.title, description = new.description WHERE rowid = old.rowid;
+    END
+    """,
+    "INSERT INTO tickets_fts(rowid, ticket_id, title, description) SELECT rowid, id, title, description FROM tickets",
+]
+
+SQLITE_BACKWARD = [
+    "DROP TRIGGER IF EXISTS tickets_fts_update",
+    "DROP TRIGGER IF EXISTS tickets_fts_delete",
+    "DROP TRIGGER IF EXISTS tickets_fts_insert",
+    "DROP TABLE IF EXISTS tickets_fts",
+]
+
+POSTGRES_FORWARD = [
+    """
+    ALTER TABLE tickets ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX tickets_search_vector_idx ON tickets USING GIN (search_vector)",
+]
+
+POSTGRES_BACKWARD = [
+    "DROP INDEX IF EXISTS tickets_search_vector_idx",
+    "ALTER TABLE tickets DROP COLUMN IF EXISTS search_vector",
+]
+
+STATEMENTS = {
+    "sqlite": (SQLITE_FORWARD, SQLITE_BACKWARD),
+    "postgresql": (POSTGRES_FORWARD, POSTGRES_BACKWARD),
+}
+
+
+def _run(schema_editor, direction):
+    statements = STATEMENTS.get(schema_editor.connection.vendor)
+    if statements:
+        for statement in statements[direction]:
+            schema_editor.execute(statement)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, 0)
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, 1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0002_routing_outbox"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:31
+
+from django.db import migrations, models
+
+
+def count_existing_tickets(apps, schema_editor):
+    TicketModel = apps.get_model("models", "TicketModel")
+    TicketCounterModel = apps.get_model("models", "TicketCounterModel")
+    rows = TicketModel.objects.order_by().values("status", "category", "priority").annotate(total=models.Count("id"))
+    TicketCounterModel.objects.bulk_create(
+        TicketCounterModel(status=row["status"], category=row["category"] or "", priority=row["priority"] or "", count=row["total"])
+        for row in rows
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0003_ticket_search"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TicketCounterModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("status", models.CharField(max_length=20)),
+                ("category", models.CharField(blank=True, default="", max_length=20)),
+                ("priority", models.CharField(blank=True, default="", max_length=20)),
+                ("count", models.IntegerField(default=0)),
+            ],
+            options={
+                "db_table": "ticket_counters",
+                "constraints": [models.UniqueConstraint(fields=("status", "category", "priority"), name="ticket_counters_bucket_unique")],
+            },
+        ),
+        migrations.RunPython(count_existing_tickets, migrations.RunPython.noop),
+    ]
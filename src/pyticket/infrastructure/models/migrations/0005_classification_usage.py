@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-19 11:53
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0004_ticket_counters"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ClassificationUsageModel",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("ticket_id", models.UUIDField(db_index=True)),
+                ("provider", models.CharField(max_length=20)),
+                ("model", models.CharField(blank=True, default="", max_length=100)),
+                ("prompt_tokens", models.PositiveIntegerField(default=0)),
+                ("completion_tokens", models.PositiveIntegerField(default=0)),
+                ("latency_seconds", models.FloatField(default=0)),
+                ("created_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "classification_usage",
+                "ordering": ["id"],
+            },
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:20
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0005_classification_usage"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="IdempotencyKeyModel",
+            fields=[
+                ("key", models.CharField(max_length=320, primary_key=True, serialize=False)),
+                ("fingerprint", models.CharField(max_length=64)),
+                ("status_code", models.PositiveSmallIntegerField(blank=True, null=True)),
+                ("body", models.BinaryField(default=b"")),
+                ("content_type", models.CharField(blank=True, default="", max_length=100)),
+                ("created_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "idempotency_keys",
+            },
+        ),
+    ]
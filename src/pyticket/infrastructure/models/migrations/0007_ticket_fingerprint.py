@@ -0,0 +1,31 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0006_idempotency_keys"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketmodel",
+            name="content_digest",
+            field=models.CharField(blank=True, max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name="ticketmodel",
+            name="content_minhash",
+            field=models.CharField(blank=True, max_length=256, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(fields=["created_at"], name="tickets_created_at_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(fields=["content_digest", "created_at"], name="tickets_content_digest_idx"),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.2.8 on 2026-10-19 13:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0007_ticket_fingerprint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketmodel",
+            name="deleted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(fields=["status", "updated_at"], name="tickets_status_updated_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(condition=models.Q(("deleted_at__isnull", False)), fields=["deleted_at"], name="tickets_deleted_idx"),
+        ),
+        migrations.CreateModel(
+            name="TicketArchiveModel",
+            fields=[
+                ("id", models.UUIDField(editable=False, primary_key=True, serialize=False)),
+                ("title", models.CharField(max_length=200)),
+                ("description", models.TextField()),
+                ("status", models.CharField(max_length=20)),
+                ("category", models.CharField(blank=True, max_length=20, null=True)),
+                ("priority", models.CharField(blank=True, max_length=20, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("deleted_at", models.DateTimeField(blank=True, null=True)),
+                ("archived_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "db_table": "tickets_archive",
+                "ordering": ["-created_at"],
+                "indexes": [models.Index(fields=["created_at"], name="tickets_archive_created_idx")],
+            },
+        ),
+    ]
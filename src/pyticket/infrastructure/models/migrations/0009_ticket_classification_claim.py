@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("models", "0008_ticket_lifecycle"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ticketmodel",
+            name="classification_claimed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="ticketmodel",
+            index=models.Index(condition=models.Q(("category__isnull", True)), fields=["created_at"], name="tickets_unclassified_idx"),
+        ),
+    ]
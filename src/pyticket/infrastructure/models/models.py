@@ -1,6 +1,7 @@
 """Django models for tickets"""
 
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
 
 
@@ -15,10 +16,122 @@ class TicketModel(models.Model):
     priority = models.CharField(max_length=20, null=True, blank=True)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Content fingerprint (domain.tickets.fingerprint) for duplicate detection; nullable so
+    # adding the columns does not rebuild the table (and its SQLite FTS triggers)
+    content_digest = models.CharField(max_length=64, null=True, blank=True)
+    content_minhash = models.CharField(max_length=256, null=True, blank=True)
+    deleted_at = models.DateTimeField(null=True, blank=True)  # Soft delete; hidden from every read
+    # Last time a process claimed the unclassified ticket for deferred classification (a lease)
+    classification_claimed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = "tickets"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["created_at"], name="tickets_created_at_idx"),
+            models.Index(fields=["content_digest", "created_at"], name="tickets_content_digest_idx"),
+            # Archival candidates: CLOSED by last change, and soft-deleted tickets
+            models.Index(fields=["status", "updated_at"], name="tickets_status_updated_idx"),
+            models.Index(fields=["deleted_at"], name="tickets_deleted_idx", condition=Q(deleted_at__isnull=False)),
+            # Unclassified tickets, swept by deferred classification recovery
+            models.Index(fields=["created_at"], name="tickets_unclassified_idx", condition=Q(category__isnull=True)),
+        ]
 
     def __str__(self):
         return f"{self.title} ({self.status})"
+
+
+class TicketArchiveModel(models.Model):
+    """Tickets moved out of the tickets table by the archival job"""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    title = models.CharField(max_length=200)
+    description = models.TextField()
+    status = models.CharField(max_length=20)
+    category = models.CharField(max_length=20, null=True, blank=True)
+    priority = models.CharField(max_length=20, null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    deleted_at = models.DateTimeField(null=True, blank=True)
+    archived_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = "tickets_archive"
+        ordering = ["-created_at"]
+        indexes = [models.Index(fields=["created_at"], name="tickets_archive_created_idx")]
+
+    def __str__(self):
+        return f"{self.title} ({self.status}, archived)"
+
+
+class RoutingOutboxModel(models.Model):
+    """Transactional outbox of routing events awaiting dispatch"""
+
+    ticket_id = models.UUIDField()
+    team = models.CharField(max_length=50)
+    category = models.CharField(max_length=20)
+    priority = models.CharField(max_length=20, null=True, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    dispatched_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True, default="")
+
+    class Meta:
+        db_table = "routing_outbox"
+        ordering = ["id"]
+        indexes = [models.Index(fields=["dispatched_at", "id"], name="routing_outbox_pending_idx")]
+
+    def __str__(self):
+        return f"{self.ticket_id} -> {self.team}"
+
+
+class TicketCounterModel(models.Model):
+    """Materialized ticket counts per status x category x priority"""
+
+    status = models.CharField(max_length=20)
+    category = models.CharField(max_length=20, blank=True, default="")
+    priority = models.CharField(max_length=20, blank=True, default="")
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = "ticket_counters"
+        constraints = [models.UniqueConstraint(fields=["status", "category", "priority"], name="ticket_counters_bucket_unique")]
+
+    def __str__(self):
+        return f"{self.status}/{self.category or '-'}/{self.priority or '-'}: {self.count}"
+
+
+class ClassificationUsageModel(models.Model):
+    """Token usage and latency of one classification call"""
+
+    ticket_id = models.UUIDField(db_index=True)
+    provider = models.CharField(max_length=20)
+    model = models.CharField(max_length=100, blank=True, default="")
+    prompt_tokens = models.PositiveIntegerField(default=0)
+    completion_tokens = models.PositiveIntegerField(default=0)
+    latency_seconds = models.FloatField(default=0)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "classification_usage"
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.ticket_id}: {self.provider}/{self.model} {self.prompt_tokens}+{self.completion_tokens}"
+
+
+class IdempotencyKeyModel(models.Model):
+    """Idempotency key of a request and the response it got"""
+
+    key = models.CharField(primary_key=True, max_length=320)
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField(null=True, blank=True)
+    body = models.BinaryField(default=b"")
+    content_type = models.CharField(max_length=100, blank=True, default="")
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        db_table = "idempotency_keys"
+
+    def __str__(self):
+        return f"{self.key}: {self.status_code or 'in progress'}"
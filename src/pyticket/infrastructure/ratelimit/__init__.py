@@ -0,0 +1 @@
+"""Rate limiter implementations"""
@@ -0,0 +1,53 @@
+"""Fixed-window rate limiter with counters in a Django cache"""
+
+import hashlib
+import math
+import time
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+
+from pyticket.infrastructure.ratelimit.in_memory import window_result
+from pyticket.infrastructure.ratelimit.interfaces import IRateLimiter, RateLimit, RateLimitResult
+
+KEY_PREFIX = "pyticket:ratelimit:"
+
+
+class CacheRateLimiter(IRateLimiter):
+    """
+    Fixed-window counters in a Django cache.
+
+    With a shared cache (Redis, Memcached) the limits hold across all
+    workers; the default LocMemCache counts per process.
+    """
+
+    def __init__(self, cache: Optional[BaseCache] = None, clock: Callable[[], float] = time.time):
+        """
+        Initialize rate limiter.
+
+        Args:
+            cache: Django cache holding the counters (default: the API_RATE_LIMIT_CACHE alias)
+            clock: Time source (replaceable in tests)
+        """
+        self._cache = cache
+        self.clock = clock
+
+    @property
+    def cache(self) -> BaseCache:
+        return self._cache or caches[getattr(settings, "API_RATE_LIMIT_CACHE", "default")]
+
+    def hit(self, key: str, rate: RateLimit) -> RateLimitResult:
+        """Count a hit for a key in the current window."""
+        now = self.clock()
+        window = int(now // rate.window_seconds)
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        cache_key = f"{KEY_PREFIX}{digest}:{rate.window_seconds:g}:{window}"
+        timeout = math.ceil(rate.window_seconds)
+        self.cache.add(cache_key, 0, timeout=timeout)
+        try:
+            count = self.cache.incr(cache_key)
+        except ValueError:  # Expired between add and incr
+            self.cache.set(cache_key, 1, timeout=timeout)
+            count = 1
+        return window_result(count, rate, window, now)
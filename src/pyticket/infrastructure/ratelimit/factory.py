@@ -0,0 +1,46 @@
+"""Factory for the process-wide rate limiter"""
+
+import logging
+import threading
+from typing import Optional
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from pyticket.infrastructure.ratelimit.interfaces import IRateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMITER = "pyticket.infrastructure.ratelimit.in_memory.InMemoryRateLimiter"
+
+
+class RateLimiterFactory:
+    """Factory for the shared rate limiter instance"""
+
+    _instance: Optional[IRateLimiter] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> IRateLimiter:
+        """
+        Get the rate limiter configured by API_RATE_LIMIT_BACKEND.
+
+        The limiter is created once per process so all requests count
+        against the same counters.
+
+        Returns:
+            An instance of IRateLimiter
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    backend_path = getattr(settings, "API_RATE_LIMIT_BACKEND", "") or DEFAULT_RATE_LIMITER
+                    logger.info(f"Creating rate limiter: {backend_path}")
+                    cls._instance = import_string(backend_path)()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the shared instance (used by tests and on reconfiguration)."""
+        with cls._lock:
+            cls._instance = None
@@ -0,0 +1,60 @@
+"""In-process fixed-window rate limiter"""
+
+import math
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+from pyticket.infrastructure.ratelimit.interfaces import IRateLimiter, RateLimit, RateLimitResult
+
+
+def window_result(count: int, rate: RateLimit, window: int, now: float) -> RateLimitResult:
+    """Build the result of the count-th hit in a window."""
+    reset_seconds = max(math.ceil((window + 1) * rate.window_seconds - now), 1)
+    return RateLimitResult(count <= rate.limit, rate.limit, max(rate.limit - count, 0), reset_seconds)
+
+
+class InMemoryRateLimiter(IRateLimiter):
+    """
+    Fixed-window counters in process memory.
+
+    Counts per process, so with N workers a client gets up to N times the
+    limit; use a shared backend (e.g. CacheRateLimiter on Redis) when that
+    matters. At most ``max_keys`` counters are kept; expired ones are
+    dropped first.
+    """
+
+    def __init__(self, max_keys: int = 100_000, clock: Callable[[], float] = time.time):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_keys: Counters kept before expired ones are pruned
+            clock: Time source (replaceable in tests)
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        self._counters: Dict[Tuple[str, float], Tuple[int, int]] = {}  # (key, window length) -> (window, count)
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, rate: RateLimit) -> RateLimitResult:
+        """Count a hit for a key in the current window."""
+        now = self.clock()
+        window = int(now // rate.window_seconds)
+        counter = (key, rate.window_seconds)
+        with self._lock:
+            counted_window, count = self._counters.get(counter, (window, 0))
+            count = count + 1 if counted_window == window else 1
+            self._counters[counter] = (window, count)
+            if len(self._counters) > self.max_keys:
+                self._prune(now)
+        return window_result(count, rate, window, now)
+
+    def _prune(self, now: float) -> None:
+        """Drop counters of past windows, then the oldest ones if still full (caller holds the lock)."""
+        current = {length: int(now // length) for _, length in self._counters}
+        for counter, (window, _) in list(self._counters.items()):
+            if window < current[counter[1]]:
+                del self._counters[counter]
+        while len(self._counters) > self.max_keys:
+            del self._counters[next(iter(self._counters))]
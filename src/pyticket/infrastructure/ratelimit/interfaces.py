@@ -0,0 +1,61 @@
+"""Rate limiter interfaces"""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """At most ``limit`` hits per window of ``window_seconds``"""
+
+    limit: int
+    window_seconds: float
+
+    @classmethod
+    def parse(cls, rate: str) -> Optional["RateLimit"]:
+        """
+        Parse a rate such as "30/minute" or "5/10s".
+
+        Returns:
+            The rate limit, or None for an empty rate or a limit of 0 (unlimited)
+
+        Raises:
+            ValueError: If the rate is malformed
+        """
+        if not rate.strip():
+            return None
+        count, _, period = (part.strip() for part in rate.partition("/"))
+        window = _period_seconds(period.lower())
+        if window is None or not count.isdigit():
+            raise ValueError(f"Invalid rate: {rate!r}, expected e.g. 30/minute or 5/10s")
+        return cls(int(count), window) if int(count) > 0 else None
+
+
+def _period_seconds(period: str) -> Optional[int]:
+    """Length of a period name ("minute") or a number of seconds ("10s"), None if invalid."""
+    if period in PERIODS:
+        return PERIODS[period]
+    if period.endswith("s") and period[:-1].isdigit():
+        return int(period[:-1])
+    return None
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of a hit: whether it is allowed and the state of its window"""
+
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: int  # Until the window ends (the Retry-After of a refused hit)
+
+
+class IRateLimiter(ABC):
+    """Interface for counting hits per key against a rate limit"""
+
+    @abstractmethod
+    def hit(self, key: str, rate: RateLimit) -> RateLimitResult:
+        """Count a hit for a key and tell whether it is within the rate."""
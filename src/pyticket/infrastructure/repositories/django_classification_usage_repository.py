@@ -0,0 +1,75 @@
+"""Django ORM implementation of the classification usage log"""
+
+from datetime import datetime
+from typing import List, Sequence, Tuple
+from uuid import UUID
+
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+from pyticket.infrastructure.ai.interfaces import ClassificationUsage
+from pyticket.infrastructure.models.models import ClassificationUsageModel
+from pyticket.infrastructure.repositories.interfaces import IClassificationUsageRepository, TicketUsageTotals, UsageTotals
+
+
+class DjangoClassificationUsageRepository(IClassificationUsageRepository):
+    """Django ORM implementation of the classification usage log"""
+
+    def add_many(self, records: Sequence[Tuple[UUID, ClassificationUsage]]) -> None:
+        """Store the usage of classification calls, each with its ticket ID."""
+        ClassificationUsageModel.objects.bulk_create(
+            ClassificationUsageModel(
+                ticket_id=ticket_id,
+                provider=usage.provider,
+                model=usage.model,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                latency_seconds=usage.latency_seconds,
+            )
+            for ticket_id, usage in records
+        )
+
+    def totals_by_day(self, since: datetime) -> List[UsageTotals]:
+        """Sum usage since a point in time per day, provider and model (oldest day first)."""
+        rows = (
+            ClassificationUsageModel.objects.filter(created_at__gte=since)
+            .annotate(day=TruncDate("created_at"))
+            .values("day", "provider", "model")
+            .annotate(
+                classifications=Count("id"),
+                prompt=Sum("prompt_tokens"),
+                completion=Sum("completion_tokens"),
+                latency=Sum("latency_seconds"),
+            )
+            .order_by("day", "provider", "model")
+        )
+        return [
+            UsageTotals(
+                day=row["day"],
+                provider=row["provider"],
+                model=row["model"],
+                classifications=row["classifications"],
+                prompt_tokens=row["prompt"],
+                completion_tokens=row["completion"],
+                latency_seconds=row["latency"],
+            )
+            for row in rows
+        ]
+
+    def top_tickets(self, since: datetime, limit: int) -> List[TicketUsageTotals]:
+        """Get the tickets that used the most tokens since a point in time."""
+        rows = (
+            ClassificationUsageModel.objects.filter(created_at__gte=since)
+            .values("ticket_id")
+            .annotate(classifications=Count("id"), prompt=Sum("prompt_tokens"), completion=Sum("completion_tokens"))
+            .order_by((F("prompt") + F("completion")).desc(), "ticket_id")[:limit]
+        )
+        return [
+            TicketUsageTotals(
+                ticket_id=row["ticket_id"],
+                classifications=row["classifications"],
+                prompt_tokens=row["prompt"],
+                completion_tokens=row["completion"],
+            )
+            for row in rows
+        ]
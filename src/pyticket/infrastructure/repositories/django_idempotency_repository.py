@@ -0,0 +1,54 @@
+"""Django ORM implementation of the idempotency key store"""
+
+from datetime import datetime
+from typing import Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+
+from pyticket.infrastructure.models.models import IdempotencyKeyModel
+from pyticket.infrastructure.repositories.interfaces import IdempotencyRecord, IIdempotencyRepository
+
+
+class DjangoIdempotencyRepository(IIdempotencyRepository):
+    """Django ORM implementation of the idempotency key store"""
+
+    @staticmethod
+    def _to_record(model: IdempotencyKeyModel) -> IdempotencyRecord:
+        """Convert Django model to idempotency record."""
+        return IdempotencyRecord(
+            key=model.key,
+            fingerprint=model.fingerprint,
+            created_at=model.created_at,
+            status_code=model.status_code,
+            body=bytes(model.body),
+            content_type=model.content_type,
+        )
+
+    def claim(self, key: str, fingerprint: str, expired_before: datetime, stale_before: datetime) -> Optional[IdempotencyRecord]:
+        """Claim a key by inserting its row; the primary key makes concurrent claims fail."""
+        IdempotencyKeyModel.objects.filter(
+            Q(created_at__lt=expired_before) | Q(status_code__isnull=True, created_at__lt=stale_before), key=key
+        ).delete()
+        try:
+            with transaction.atomic():
+                IdempotencyKeyModel.objects.create(key=key, fingerprint=fingerprint)
+            return None
+        except IntegrityError:
+            model = IdempotencyKeyModel.objects.filter(key=key).first()
+        if model is None:  # Released in between: the next retry claims it
+            return IdempotencyRecord(key=key, fingerprint=fingerprint, created_at=stale_before)
+        return self._to_record(model)
+
+    def complete(self, key: str, status_code: int, body: bytes, content_type: str) -> None:
+        """Store the response of the request holding a key."""
+        IdempotencyKeyModel.objects.filter(key=key).update(status_code=status_code, body=body, content_type=content_type)
+
+    def release(self, key: str) -> None:
+        """Delete the row of a key that has no response."""
+        IdempotencyKeyModel.objects.filter(key=key, status_code__isnull=True).delete()
+
+    def purge(self, expired_before: datetime) -> int:
+        """Delete records created before a point in time."""
+        deleted, _ = IdempotencyKeyModel.objects.filter(created_at__lt=expired_before).delete()
+        return deleted
@@ -0,0 +1,57 @@
+"""Django ORM implementation of the routing outbox"""
+
+from typing import List, Sequence
+
+from django.db.models import F
+from django.utils import timezone
+
+from pyticket.domain.tickets.entities import Category, Priority
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.infrastructure.models.models import RoutingOutboxModel
+from pyticket.infrastructure.repositories.interfaces import IRoutingOutbox
+
+
+class DjangoRoutingOutbox(IRoutingOutbox):
+    """Django ORM implementation of the routing outbox"""
+
+    def _to_domain(self, model: RoutingOutboxModel) -> RoutingEvent:
+        """Convert Django model to routing event."""
+        return RoutingEvent(
+            id=model.id,
+            ticket_id=model.ticket_id,
+            team=model.team,
+            category=Category(model.category),
+            priority=Priority(model.priority) if model.priority else None,
+            created_at=model.created_at,
+        )
+
+    @staticmethod
+    def _to_model(event: RoutingEvent) -> RoutingOutboxModel:
+        """Convert routing event to an unsaved outbox row."""
+        return RoutingOutboxModel(
+            ticket_id=event.ticket_id,
+            team=event.team,
+            category=event.category.value,
+            priority=event.priority.value if event.priority else None,
+        )
+
+    def add(self, event: RoutingEvent) -> None:
+        """Add a routing event to the outbox."""
+        self._to_model(event).save()
+
+    def add_many(self, events: Sequence[RoutingEvent]) -> None:
+        """Add routing events to the outbox with a single bulk insert."""
+        RoutingOutboxModel.objects.bulk_create([self._to_model(event) for event in events])
+
+    def fetch_pending(self, limit: int, max_attempts: int) -> List[RoutingEvent]:
+        """Fetch undispatched events in insertion order."""
+        models = RoutingOutboxModel.objects.filter(dispatched_at__isnull=True, attempts__lt=max_attempts).order_by("id")[:limit]
+        return [self._to_domain(model) for model in models]
+
+    def mark_dispatched(self, event_ids: Sequence[int]) -> None:
+        """Mark events as dispatched."""
+        RoutingOutboxModel.objects.filter(id__in=event_ids).update(dispatched_at=timezone.now(), last_error="")
+
+    def mark_failed(self, event_ids: Sequence[int], error: str) -> None:
+        """Record a failed dispatch attempt."""
+        RoutingOutboxModel.objects.filter(id__in=event_ids).update(attempts=F("attempts") + 1, last_error=error)
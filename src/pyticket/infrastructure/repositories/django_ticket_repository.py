@@ -1,17 +1,40 @@
 """Django ORM implementation of ticket repository"""
 
-from typing import List, Optional
+from datetime import datetime
+from typing import ContextManager, Dict, List, Optional, Sequence, Union
 from uuid import UUID
 
+from django.db import transaction
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
 from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
-from pyticket.infrastructure.models.models import TicketModel
-from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+from pyticket.domain.tickets.fingerprint import TicketFingerprint
+from pyticket.infrastructure.models.models import TicketArchiveModel, TicketModel
+from pyticket.infrastructure.repositories.interfaces import ITicketRepository, TicketSearchPage
+from pyticket.infrastructure.repositories.search import decode_cursor, encode_cursor, get_search_backend
+
+# Columns written by the bulk updates; each writes only what it changes, so concurrent
+# status changes and reclassifications never overwrite each other's columns
+CLASSIFICATION_UPDATE_FIELDS = ["category", "priority", "updated_at"]
+STATUS_UPDATE_FIELDS = ["status", "updated_at"]
+BULK_UPDATE_BATCH_SIZE = 500
+# Recent tickets compared by MinHash when no exact duplicate is found
+DUPLICATE_SCAN_LIMIT = 200
+# Columns copied from tickets to tickets_archive
+ARCHIVE_FIELDS = ["id", "title", "description", "status", "category", "priority", "created_at", "updated_at", "deleted_at"]
+ARCHIVE_UPDATE_FIELDS = [*ARCHIVE_FIELDS[1:], "archived_at"]
+
+
+def live_tickets() -> QuerySet:
+    """Tickets that are not soft-deleted; every read of the hot table starts here."""
+    return TicketModel.objects.filter(deleted_at__isnull=True)
 
 
 class DjangoTicketRepository(ITicketRepository):
     """Django ORM implementation of ticket repository"""
 
-    def _to_domain(self, model: TicketModel) -> Ticket:
+    def _to_domain(self, model: Union[TicketModel, TicketArchiveModel]) -> Ticket:
         """Convert Django model to domain entity."""
         ticket = Ticket(
             id=model.id,
@@ -28,6 +51,10 @@ class DjangoTicketRepository(ITicketRepository):
     def _to_model(self, ticket: Ticket) -> TicketModel:
         """Convert domain entity to Django model."""
         model, _ = TicketModel.objects.get_or_create(id=ticket.id)
+        if model.content_digest is None or model.title != ticket.title or model.description != ticket.description:
+            fingerprint = TicketFingerprint.of(ticket.title, ticket.description)
+            model.content_digest = fingerprint.digest
+            model.content_minhash = fingerprint.signature_hex
         model.title = ticket.title
         model.description = ticket.description
         model.status = ticket.status.value
@@ -37,23 +64,37 @@ class DjangoTicketRepository(ITicketRepository):
         model.updated_at = ticket.updated_at
         return model
 
+    def atomic(self) -> ContextManager:
+        """Transaction spanning a ticket write and its outbox/counter writes."""
+        return transaction.atomic()
+
     def save(self, ticket: Ticket) -> Ticket:
         """Save a ticket."""
         model = self._to_model(ticket)
         model.save()
         return self._to_domain(model)
 
-    def get_by_id(self, ticket_id: UUID) -> Optional[Ticket]:
-        """Get a ticket by ID."""
-        try:
-            model = TicketModel.objects.get(id=ticket_id)
-            return self._to_domain(model)
-        except TicketModel.DoesNotExist:
-            return None
+    def get_by_id(self, ticket_id: UUID, include_archived: bool = False) -> Optional[Ticket]:
+        """Get a ticket by ID, falling back to the archive when asked to."""
+        model = live_tickets().filter(id=ticket_id).first()
+        if model is None and include_archived:
+            model = TicketArchiveModel.objects.filter(id=ticket_id, deleted_at__isnull=True).first()
+        return self._to_domain(model) if model is not None else None
+
+    def get_many(self, ticket_ids: Sequence[UUID], for_update: bool = False) -> Dict[UUID, Ticket]:
+        """Get tickets by ID with a single query, locking the rows (SELECT ... FOR UPDATE) if asked."""
+        queryset = live_tickets().select_for_update() if for_update else live_tickets()
+        models = queryset.in_bulk(list(ticket_ids))
+        return {ticket_id: self._to_domain(model) for ticket_id, model in models.items()}
 
     def list_all(self, limit: int = 100, offset: int = 0) -> List[Ticket]:
         """List all tickets."""
-        models = TicketModel.objects.all()[offset : offset + limit]
+        models = live_tickets()[offset : offset + limit]
+        return [self._to_domain(model) for model in models]
+
+    def list_archived(self, limit: int = 100, offset: int = 0) -> List[Ticket]:
+        """List archived tickets, newest first."""
+        models = TicketArchiveModel.objects.filter(deleted_at__isnull=True)[offset : offset + limit]
         return [self._to_domain(model) for model in models]
 
     def update(self, ticket: Ticket) -> Ticket:
@@ -61,9 +102,102 @@ class DjangoTicketRepository(ITicketRepository):
         return self.save(ticket)
 
     def delete(self, ticket_id: UUID) -> bool:
-        """Delete a ticket."""
-        try:
-            TicketModel.objects.get(id=ticket_id).delete()
-            return True
-        except TicketModel.DoesNotExist:
-            return False
+        """Soft-delete a ticket; the archival job removes it from the table later."""
+        return live_tickets().filter(id=ticket_id).update(deleted_at=timezone.now()) > 0
+
+    def archive(self, closed_before: datetime, limit: int) -> int:
+        """Move a chunk of old CLOSED and soft-deleted tickets to the archive table in one transaction."""
+        candidates = TicketModel.objects.filter(
+            Q(status=TicketStatus.CLOSED.value, updated_at__lt=closed_before) | Q(deleted_at__lt=closed_before)
+        )
+        with transaction.atomic():
+            rows = list(candidates.order_by().values(*ARCHIVE_FIELDS)[:limit])
+            if not rows:
+                return 0
+            # Upsert: a ticket archived before keeps a single, current archive row
+            TicketArchiveModel.objects.bulk_create(
+                [TicketArchiveModel(**row) for row in rows],
+                update_conflicts=True,
+                unique_fields=["id"],
+                update_fields=ARCHIVE_UPDATE_FIELDS,
+            )
+            TicketModel.objects.filter(id__in=[row["id"] for row in rows]).delete()
+        return len(rows)
+
+    def list_after(self, after: Optional[UUID], limit: int) -> List[Ticket]:
+        """List tickets ordered by ID, starting after the given ID."""
+        queryset = live_tickets().order_by("id")
+        if after is not None:
+            queryset = queryset.filter(id__gt=after)
+        return [self._to_domain(model) for model in queryset[:limit]]
+
+    def claim_unclassified(self, stale_before: datetime, limit: int) -> List[Ticket]:
+        """Claim unclassified tickets with a conditional UPDATE; rows claimed meanwhile by another process are skipped."""
+        claimable = live_tickets().filter(
+            Q(classification_claimed_at=None, created_at__lt=stale_before) | Q(classification_claimed_at__lt=stale_before),
+            category=None,
+        )
+        ids = list(claimable.order_by("created_at").values_list("id", flat=True)[:limit])
+        if not ids:
+            return []
+        claimed_at = timezone.now()
+        claimable.filter(id__in=ids).update(classification_claimed_at=claimed_at)
+        claimed = TicketModel.objects.filter(id__in=ids, classification_claimed_at=claimed_at).order_by("created_at")
+        return [self._to_domain(model) for model in claimed]
+
+    def count(self) -> int:
+        """Count all tickets."""
+        return live_tickets().count()
+
+    def update_classifications(self, tickets: Sequence[Ticket]) -> int:
+        """Write the category and priority of tickets with a single bulk UPDATE per batch."""
+        return self._bulk_update(tickets, CLASSIFICATION_UPDATE_FIELDS)
+
+    def update_statuses(self, tickets: Sequence[Ticket]) -> int:
+        """Write the status of tickets with a single bulk UPDATE per batch."""
+        return self._bulk_update(tickets, STATUS_UPDATE_FIELDS)
+
+    @staticmethod
+    def _bulk_update(tickets: Sequence[Ticket], fields: List[str]) -> int:
+        """Write the given columns of existing tickets; other columns are left as they are in the database."""
+        models = [
+            TicketModel(
+                id=ticket.id,
+                status=ticket.status.value,
+                category=ticket.category.value if ticket.category else None,
+                priority=ticket.priority.value if ticket.priority else None,
+                updated_at=ticket.updated_at,
+            )
+            for ticket in tickets
+        ]
+        return TicketModel.objects.bulk_update(models, fields, batch_size=BULK_UPDATE_BATCH_SIZE)
+
+    def find_duplicate(self, fingerprint: TicketFingerprint, since: datetime, threshold: float = 1.0) -> Optional[Ticket]:
+        """Find the newest ticket created since a point in time with the same or similar content."""
+        recent = live_tickets().filter(created_at__gte=since).order_by("-created_at")
+        model = recent.filter(content_digest=fingerprint.digest).first()
+        if model is None and threshold < 1.0:
+            model = self._most_similar(recent, fingerprint, threshold)
+        return self._to_domain(model) if model is not None else None
+
+    @staticmethod
+    def _most_similar(recent: QuerySet, fingerprint: TicketFingerprint, threshold: float) -> Optional[TicketModel]:
+        """Compare the MinHash of the newest tickets, returning the most similar one above the threshold."""
+        best_id, best_similarity = None, threshold
+        candidates = recent.exclude(content_minhash=None).values_list("id", "content_digest", "content_minhash")
+        for ticket_id, digest, signature_hex in candidates[:DUPLICATE_SCAN_LIMIT]:
+            similarity = fingerprint.similarity(TicketFingerprint.from_stored(digest, signature_hex))
+            if similarity >= best_similarity:
+                best_id, best_similarity = ticket_id, similarity
+        return TicketModel.objects.filter(id=best_id).first() if best_id is not None else None
+
+    def search(self, query: str, limit: int = 20, cursor: Optional[str] = None) -> TicketSearchPage:
+        """Search tickets by title and description, best matches first."""
+        after = decode_cursor(cursor) if cursor else None
+        scored_ids = get_search_backend().search(query, limit + 1, after)
+        page, has_more = scored_ids[:limit], len(scored_ids) > limit
+
+        models = live_tickets().in_bulk([ticket_id for _, ticket_id in page])
+        tickets = [self._to_domain(models[ticket_id]) for _, ticket_id in page if ticket_id in models]
+        next_cursor = encode_cursor(*page[-1]) if has_more else None
+        return TicketSearchPage(tickets=tickets, next_cursor=next_cursor)
@@ -0,0 +1,61 @@
+"""Django ORM implementation of the ticket counters"""
+
+from collections import Counter
+from typing import List, Mapping, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F
+
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
+from pyticket.infrastructure.models.models import TicketArchiveModel, TicketCounterModel, TicketModel
+from pyticket.infrastructure.repositories.interfaces import ITicketStatsRepository, TicketStatsKey
+
+
+class DjangoTicketStatsRepository(ITicketStatsRepository):
+    """Django ORM implementation of the ticket counters"""
+
+    @staticmethod
+    def _bucket(key: TicketStatsKey) -> dict:
+        """Convert key to counter column values."""
+        return {
+            "status": key.status.value,
+            "category": key.category.value if key.category else "",
+            "priority": key.priority.value if key.priority else "",
+        }
+
+    @staticmethod
+    def _to_key(status: str, category: str, priority: str) -> TicketStatsKey:
+        """Convert counter column values to key."""
+        return TicketStatsKey(
+            status=TicketStatus(status),
+            category=Category(category) if category else None,
+            priority=Priority(priority) if priority else None,
+        )
+
+    def apply(self, changes: Mapping[TicketStatsKey, int]) -> None:
+        """Add the given deltas to the counters."""
+        for key, delta in changes.items():
+            if delta:
+                counter, _ = TicketCounterModel.objects.get_or_create(**self._bucket(key))
+                TicketCounterModel.objects.filter(pk=counter.pk).update(count=F("count") + delta)
+
+    def snapshot(self) -> List[Tuple[TicketStatsKey, int]]:
+        """Return all non-empty counters."""
+        rows = TicketCounterModel.objects.filter(count__gt=0).values_list("status", "category", "priority", "count")
+        return [(self._to_key(status, category, priority), count) for status, category, priority, count in rows]
+
+    def rebuild(self) -> int:
+        """Recompute all counters from the tickets and archive tables, leaving out soft-deleted tickets."""
+        with transaction.atomic():
+            totals: Counter = Counter()
+            for model in (TicketModel, TicketArchiveModel):
+                rows = model.objects.filter(deleted_at__isnull=True).order_by().values("status", "category", "priority")
+                for row in rows.annotate(total=Count("id")):
+                    totals[(row["status"], row["category"] or "", row["priority"] or "")] += row["total"]
+            counters = [
+                TicketCounterModel(status=status, category=category, priority=priority, count=count)
+                for (status, category, priority), count in totals.items()
+            ]
+            TicketCounterModel.objects.all().delete()
+            TicketCounterModel.objects.bulk_create(counters)
+        return sum(counter.count for counter in counters)
@@ -1,31 +1,297 @@
 """Repository interfaces"""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import ContextManager, Dict, List, Mapping, Optional, Sequence, Tuple
 from uuid import UUID
 
-from pyticket.domain.tickets.entities import Ticket
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.domain.tickets.fingerprint import TicketFingerprint
+from pyticket.infrastructure.ai.interfaces import ClassificationUsage
+
+
+@dataclass(frozen=True, slots=True)
+class TicketSearchPage:
+    """Page of ranked search results"""
+
+    tickets: List[Ticket] = field(default_factory=list)
+    next_cursor: Optional[str] = None  # Opaque keyset cursor, None on the last page
 
 
 class ITicketRepository(ABC):
     """Interface for ticket repository"""
 
+    @abstractmethod
+    def atomic(self) -> ContextManager:
+        """Transaction spanning a ticket write and its outbox/counter writes."""
+
     @abstractmethod
     def save(self, ticket: Ticket) -> Ticket:
         """Save a ticket."""
 
     @abstractmethod
-    def get_by_id(self, ticket_id: UUID) -> Optional[Ticket]:
-        """Get a ticket by ID."""
+    def get_by_id(self, ticket_id: UUID, include_archived: bool = False) -> Optional[Ticket]:
+        """Get a ticket by ID; archived tickets are only found with include_archived."""
+
+    @abstractmethod
+    def get_many(self, ticket_ids: Sequence[UUID], for_update: bool = False) -> Dict[UUID, Ticket]:
+        """
+        Get tickets by ID; missing IDs are left out of the result.
+
+        Args:
+            ticket_ids: Tickets to load
+            for_update: Lock the rows until the surrounding transaction ends
+        """
 
     @abstractmethod
     def list_all(self, limit: int = 100, offset: int = 0) -> List[Ticket]:
         """List all tickets."""
 
+    @abstractmethod
+    def list_archived(self, limit: int = 100, offset: int = 0) -> List[Ticket]:
+        """List archived tickets."""
+
     @abstractmethod
     def update(self, ticket: Ticket) -> Ticket:
         """Update a ticket."""
 
     @abstractmethod
     def delete(self, ticket_id: UUID) -> bool:
-        """Delete a ticket."""
+        """
+        Soft-delete a ticket; it is left out of every read from then on.
+
+        Returns:
+            False if the ticket does not exist or was already deleted
+        """
+
+    @abstractmethod
+    def archive(self, closed_before: datetime, limit: int) -> int:
+        """
+        Move tickets CLOSED or soft-deleted before a point in time out of the working set.
+
+        Args:
+            closed_before: Tickets whose last change (or deletion) is older are moved
+            limit: Maximum number of tickets moved in this call
+
+        Returns:
+            Number of moved tickets; 0 when nothing is left to archive
+        """
+
+    @abstractmethod
+    def list_after(self, after: Optional[UUID], limit: int) -> List[Ticket]:
+        """
+        List tickets ordered by ID, starting after the given ID (keyset pagination).
+
+        Args:
+            after: Last ID of the previous page, None for the first page
+            limit: Maximum number of tickets to return
+        """
+
+    @abstractmethod
+    def claim_unclassified(self, stale_before: datetime, limit: int) -> List[Ticket]:
+        """
+        Claim unclassified tickets for classification, oldest first.
+
+        A ticket is claimable when it was created, or last claimed, before
+        ``stale_before``: the process that deferred it or claimed it last is
+        presumed gone. Claiming is atomic, so concurrent callers never get the
+        same ticket.
+
+        Args:
+            stale_before: Tickets created or claimed later are left alone
+            limit: Maximum number of tickets to claim
+        """
+
+    @abstractmethod
+    def count(self) -> int:
+        """Count all tickets."""
+
+    @abstractmethod
+    def update_classifications(self, tickets: Sequence[Ticket]) -> int:
+        """
+        Write the category and priority of existing tickets in bulk; other fields are not touched.
+
+        Returns:
+            Number of updated tickets
+        """
+
+    @abstractmethod
+    def update_statuses(self, tickets: Sequence[Ticket]) -> int:
+        """
+        Write the status of existing tickets in bulk; other fields are not touched.
+
+        Returns:
+            Number of updated tickets
+        """
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 20, cursor: Optional[str] = None) -> TicketSearchPage:
+        """
+        Search tickets by title and description, best matches first.
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+
+    @abstractmethod
+    def find_duplicate(self, fingerprint: TicketFingerprint, since: datetime, threshold: float = 1.0) -> Optional[Ticket]:
+        """
+        Find the newest ticket created since a point in time with the same or similar content.
+
+        Args:
+            fingerprint: Fingerprint of the new ticket's content
+            since: Oldest creation time to consider
+            threshold: Minimum estimated similarity; 1.0 only matches exact (normalized) duplicates
+
+        Returns:
+            The duplicate ticket, or None
+        """
+
+
+class IRoutingOutbox(ABC):
+    """Interface for the transactional outbox of routing events"""
+
+    @abstractmethod
+    def add(self, event: RoutingEvent) -> None:
+        """Add a routing event to the outbox."""
+
+    @abstractmethod
+    def add_many(self, events: Sequence[RoutingEvent]) -> None:
+        """Add several routing events to the outbox."""
+
+    @abstractmethod
+    def fetch_pending(self, limit: int, max_attempts: int) -> List[RoutingEvent]:
+        """Fetch undispatched events in insertion order."""
+
+    @abstractmethod
+    def mark_dispatched(self, event_ids: Sequence[int]) -> None:
+        """Mark events as dispatched."""
+
+    @abstractmethod
+    def mark_failed(self, event_ids: Sequence[int], error: str) -> None:
+        """Record a failed dispatch attempt."""
+
+
+@dataclass(frozen=True, slots=True)
+class TicketStatsKey:
+    """Counter bucket: status x category x priority"""
+
+    status: TicketStatus
+    category: Optional[Category] = None
+    priority: Optional[Priority] = None
+
+    @classmethod
+    def for_ticket(cls, ticket: Ticket) -> "TicketStatsKey":
+        """Get the bucket a ticket is counted in."""
+        return cls(status=ticket.status, category=ticket.category, priority=ticket.priority)
+
+
+class ITicketStatsRepository(ABC):
+    """Interface for incrementally maintained ticket counters"""
+
+    @abstractmethod
+    def apply(self, changes: Mapping[TicketStatsKey, int]) -> None:
+        """Add the given deltas to the counters."""
+
+    @abstractmethod
+    def snapshot(self) -> List[Tuple[TicketStatsKey, int]]:
+        """Return all non-empty counters."""
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """
+        Recompute all counters from the tickets and archived tickets, leaving out deleted ones.
+
+        Returns:
+            Number of counted tickets
+        """
+
+
+@dataclass(frozen=True, slots=True)
+class UsageTotals:
+    """Classification usage summed per day, provider and model"""
+
+    day: date
+    provider: str
+    model: str
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+    latency_seconds: float
+
+
+@dataclass(frozen=True, slots=True)
+class TicketUsageTotals:
+    """Classification usage summed per ticket"""
+
+    ticket_id: UUID
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+
+
+class IClassificationUsageRepository(ABC):
+    """Interface for the per-classification token usage log"""
+
+    @abstractmethod
+    def add_many(self, records: Sequence[Tuple[UUID, ClassificationUsage]]) -> None:
+        """Store the usage of classification calls, each with its ticket ID."""
+
+    @abstractmethod
+    def totals_by_day(self, since: datetime) -> List[UsageTotals]:
+        """Sum usage since a point in time per day, provider and model (oldest day first)."""
+
+    @abstractmethod
+    def top_tickets(self, since: datetime, limit: int) -> List[TicketUsageTotals]:
+        """Get the tickets that used the most tokens since a point in time."""
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """Request made with an idempotency key and, once it completed, its response"""
+
+    key: str
+    fingerprint: str  # Hash of the request the key was first used with
+    created_at: datetime
+    status_code: Optional[int] = None  # None while the first request is still running
+    body: bytes = b""
+    content_type: str = ""
+
+    @property
+    def completed(self) -> bool:
+        return self.status_code is not None
+
+
+class IIdempotencyRepository(ABC):
+    """Interface for the idempotency keys of retried requests"""
+
+    @abstractmethod
+    def claim(self, key: str, fingerprint: str, expired_before: datetime, stale_before: datetime) -> Optional[IdempotencyRecord]:
+        """
+        Claim a key for a request, atomically.
+
+        A completed record created before ``expired_before``, or one still
+        running since before ``stale_before`` (its request died), is replaced.
+
+        Returns:
+            None if the key is now claimed for this request, otherwise the record holding it
+        """
+
+    @abstractmethod
+    def complete(self, key: str, status_code: int, body: bytes, content_type: str) -> None:
+        """Store the response of the request holding a key."""
+
+    @abstractmethod
+    def release(self, key: str) -> None:
+        """Release a key whose request did not complete, so a retry runs again."""
+
+    @abstractmethod
+    def purge(self, expired_before: datetime) -> int:
+        """
+        Delete records created before a point in time.
+
+        Returns:
+            Number of deleted records
+        """
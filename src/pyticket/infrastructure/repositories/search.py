@@ -0,0 +1,152 @@
+"""Full-text search backends for tickets"""
+
+import base64
+import re
+from abc import ABC, abstractmethod
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from django.db import connection
+from django.db.models import Q
+
+from pyticket.infrastructure.models.models import TicketModel
+
+# (score, ticket id) pairs; lower scores rank first
+ScoredIds = List[Tuple[float, UUID]]
+Cursor = Tuple[float, UUID]
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def encode_cursor(score: float, ticket_id: UUID) -> str:
+    """Encode a keyset position as an opaque cursor."""
+    return base64.urlsafe_b64encode(f"{score!r}|{ticket_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Cursor:
+    """
+    Decode an opaque cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        score, ticket_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return float(score), UUID(ticket_id)
+    except ValueError as err:  # Includes binascii.Error and UnicodeDecodeError
+        raise ValueError("Invalid search cursor") from err
+
+
+class TicketSearchBackend(ABC):
+    """Database-specific ticket search returning ranked ids"""
+
+    @abstractmethod
+    def search(self, query: str, limit: int, after: Optional[Cursor]) -> ScoredIds:
+        """Return up to limit (score, id) pairs ordered by score then id, after the cursor."""
+
+
+class SQLiteTicketSearch(TicketSearchBackend):
+    """FTS5 search over the tickets_fts table (bm25, title weighted higher), skipping soft-deleted tickets"""
+
+    SQL = """
+        SELECT score, ticket_id FROM (
+            SELECT bm25(tickets_fts, 0.0, 10.0, 1.0) AS score, ticket_id
+            FROM tickets_fts WHERE tickets_fts MATCH %s
+            AND rowid NOT IN (SELECT rowid FROM tickets WHERE deleted_at IS NOT NULL)
+        )
+        WHERE score > %s OR (score = %s AND ticket_id > %s)
+        ORDER BY score, ticket_id
+        LIMIT %s
+    """
+
+    @staticmethod
+    def to_match_expression(query: str) -> str:
+        """Turn free text into an FTS5 expression matching all words."""
+        # Quoting every word disables FTS5 operators in user input
+        return " ".join('"' + token + '"' for token in _TOKEN_PATTERN.findall(query))
+
+    def search(self, query: str, limit: int, after: Optional[Cursor]) -> ScoredIds:
+        expression = self.to_match_expression(query)
+        if not expression:
+            return []
+        score, ticket_id = after or (float("-inf"), UUID(int=0))
+        with connection.cursor() as cursor:
+            cursor.execute(self.SQL, [expression, score, score, ticket_id.hex, limit])
+            return [(row_score, UUID(row_id)) for row_score, row_id in cursor.fetchall()]
+
+
+class PostgresTicketSearch(TicketSearchBackend):
+    """tsvector/GIN search over tickets.search_vector (negated ts_rank_cd), skipping soft-deleted tickets"""
+
+    SQL = """
+        SELECT score, id FROM (
+            SELECT (-ts_rank_cd(search_vector, query))::float8 AS score, id
+            FROM tickets, websearch_to_tsquery('english', %s) AS query
+            WHERE search_vector @@ query AND deleted_at IS NULL
+        ) ranked
+        WHERE score > %s OR (score = %s AND id > %s)
+        ORDER BY score, id
+        LIMIT %s
+    """
+
+    def search(self, query: str, limit: int, after: Optional[Cursor]) -> ScoredIds:
+        score, ticket_id = after or (float("-inf"), UUID(int=0))
+        with connection.cursor() as cursor:
+            cursor.execute(self.SQL, [query, score, score, ticket_id, limit])
+            return [(row_score, row_id) for row_score, row_id in cursor.fetchall()]
+
+
+class ScanTicketSearch(TicketSearchBackend):
+    """Unindexed substring search for databases without full-text support"""
+
+    def search(self, query: str, limit: int, after: Optional[Cursor]) -> ScoredIds:
+        matches = Q()
+        for token in _TOKEN_PATTERN.findall(query):
+            matches &= Q(title__icontains=token) | Q(description__icontains=token)
+        queryset = TicketModel.objects.filter(matches, deleted_at__isnull=True).order_by("id")
+        if after:
+            queryset = queryset.filter(id__gt=after[1])
+        return [(0.0, ticket_id) for ticket_id in queryset.values_list("id", flat=True)[:limit]]
+
+
+def get_search_backend() -> TicketSearchBackend:
+    """Get the search backend for the default database."""
+    backends = {"sqlite": SQLiteTicketSearch, "postgresql": PostgresTicketSearch}
+    return backends.get(connection.vendor, ScanTicketSearch)()
+
+
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_insert AFTER INSERT ON tickets BEGIN
+        INSERT INTO tickets_fts(rowid, ticket_id, title, description) VALUES (new.rowid, new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_delete AFTER DELETE ON tickets BEGIN
+        DELETE FROM tickets_fts WHERE rowid = old.rowid;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tickets_fts_update AFTER UPDATE OF title, description ON tickets BEGIN
+        UPDATE tickets_fts SET title = new.title, description = new.description WHERE rowid = old.rowid;
+    END
+    """,
+]
+
+
+def rebuild_sqlite_index() -> int:
+    """
+    Restore the sync triggers and refill tickets_fts from tickets.
+
+    Needed after operations that change SQLite rowids or drop triggers
+    (VACUUM, table rebuilds by schema migrations).
+
+    Returns:
+        Number of indexed tickets
+    """
+    with connection.cursor() as cursor:
+        for statement in SQLITE_TRIGGERS:
+            cursor.execute(statement)
+        cursor.execute("DELETE FROM tickets_fts")
+        cursor.execute("INSERT INTO tickets_fts(rowid, ticket_id, title, description) SELECT rowid, id, title, description FROM tickets")
+        return cursor.rowcount
@@ -0,0 +1 @@
+"""Routing event sinks"""
@@ -0,0 +1,28 @@
+"""Factory for creating routing sinks"""
+
+import logging
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+from pyticket.infrastructure.routing.interfaces import IRoutingSink
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROUTING_SINK = "pyticket.infrastructure.routing.sinks.LoggingRoutingSink"
+
+
+class RoutingSinkFactory:
+    """Factory for creating routing sink instances"""
+
+    @staticmethod
+    def create() -> IRoutingSink:
+        """
+        Create the routing sink configured by ROUTING_SINK.
+
+        Returns:
+            An instance of IRoutingSink
+        """
+        sink_path = getattr(settings, "ROUTING_SINK", "") or DEFAULT_ROUTING_SINK
+        logger.info(f"Creating routing sink: {sink_path}")
+        return import_string(sink_path)()
@@ -0,0 +1,23 @@
+"""Routing sink interfaces"""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from pyticket.domain.tickets.events import RoutingEvent
+
+
+class IRoutingSink(ABC):
+    """Interface for delivering routing events to a team"""
+
+    @abstractmethod
+    def send(self, team: str, events: Sequence[RoutingEvent]) -> None:
+        """
+        Deliver a batch of routing events to a team.
+
+        Args:
+            team: Team the events are routed to
+            events: Events for that team
+
+        Raises:
+            Exception: If delivery fails; the batch is retried later
+        """
@@ -0,0 +1,72 @@
+"""Routing sink implementations"""
+
+import json
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Optional, Sequence, Tuple
+
+from django.conf import settings
+
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.infrastructure.routing.interfaces import IRoutingSink
+
+logger = logging.getLogger(__name__)
+
+
+def _event_to_dict(event: RoutingEvent) -> dict:
+    return {
+        "id": event.id,
+        "ticket_id": str(event.ticket_id),
+        "team": event.team,
+        "category": event.category.value,
+        "priority": event.priority.value if event.priority else None,
+        "created_at": event.created_at.isoformat(),
+    }
+
+
+class LoggingRoutingSink(IRoutingSink):
+    """Sink that only logs routing events"""
+
+    def send(self, team: str, events: Sequence[RoutingEvent]) -> None:
+        """Log a batch of routing events."""
+        for event in events:
+            logger.info(f"Ticket {event.ticket_id} dispatched to team: {team}")
+
+
+class JsonlFileRoutingSink(IRoutingSink):
+    """Sink appending routing events to a JSON Lines file"""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Initialize file sink.
+
+        Args:
+            path: Output file, defaults to ROUTING_EVENTS_FILE
+        """
+        self.path = Path(path or getattr(settings, "ROUTING_EVENTS_FILE", "routing_events.jsonl"))
+        self._lock = threading.Lock()
+
+    def send(self, team: str, events: Sequence[RoutingEvent]) -> None:
+        """Append a batch of routing events to the file."""
+        lines = "".join(json.dumps(_event_to_dict(event)) + "\n" for event in events)
+        with self._lock, self.path.open("a", encoding="utf-8") as output:
+            output.write(lines)
+
+
+class QueueRoutingSink(IRoutingSink):
+    """Sink putting routing batches on an in-process queue"""
+
+    def __init__(self, target: Optional["queue.Queue[Tuple[str, Sequence[RoutingEvent]]]"] = None):
+        """
+        Initialize queue sink.
+
+        Args:
+            target: Queue receiving (team, events) tuples
+        """
+        self.queue = target if target is not None else queue.Queue()
+
+    def send(self, team: str, events: Sequence[RoutingEvent]) -> None:
+        """Put a batch of routing events on the queue."""
+        self.queue.put((team, list(events)))
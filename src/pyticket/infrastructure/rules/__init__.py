@@ -0,0 +1 @@
+"""Ticket rule configuration"""
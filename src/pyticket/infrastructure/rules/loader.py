@@ -0,0 +1,64 @@
+"""Load ticket rules from settings"""
+
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from pyticket.domain.tickets.rules import DEFAULT_RULES, set_rules, TicketRules
+from pyticket.domain.tickets.services import compile_routing_rules, CompiledRoutingRules, set_routing_rules
+
+
+def _read_json(path: str):
+    """Read a JSON rules file."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def load_ticket_rules() -> TicketRules:
+    """
+    Build ticket rules from the defaults and the configured overrides.
+
+    ``TICKET_RULES_FILE`` (a JSON file) is applied first, then the
+    ``TICKET_RULES`` setting; see ``TicketRules.with_config`` for the format.
+    """
+    rules = DEFAULT_RULES
+    rules_file = getattr(settings, "TICKET_RULES_FILE", "")
+    if rules_file:
+        rules = rules.with_config(_read_json(rules_file))
+    rules_config = getattr(settings, "TICKET_RULES", {})
+    if rules_config:
+        rules = rules.with_config(rules_config)
+    return rules
+
+
+def configure_ticket_rules() -> None:
+    """Activate the configured ticket rules."""
+    try:
+        set_rules(load_ticket_rules())
+    except (OSError, ValueError) as e:
+        raise ImproperlyConfigured(f"Invalid ticket rules: {e}") from e
+
+
+def load_routing_rules() -> CompiledRoutingRules:
+    """
+    Compile the configured routing rules.
+
+    Rules from ``TICKET_ROUTING_RULES_FILE`` (a JSON list) come first,
+    followed by the ``TICKET_ROUTING_RULES`` setting; the first matching
+    rule wins. See ``RoutingRule.from_config`` for the rule format.
+    """
+    configs = []
+    rules_file = getattr(settings, "TICKET_ROUTING_RULES_FILE", "")
+    if rules_file:
+        configs.extend(_read_json(rules_file))
+    configs.extend(getattr(settings, "TICKET_ROUTING_RULES", []))
+    return compile_routing_rules(configs)
+
+
+def configure_routing_rules() -> None:
+    """Activate the configured routing rules."""
+    try:
+        set_routing_rules(load_routing_rules())
+    except (OSError, TypeError, ValueError) as e:
+        raise ImproperlyConfigured(f"Invalid routing rules: {e}") from e
@@ -0,0 +1,72 @@
+"""Hot reload of the routing rules file"""
+
+import logging
+import os
+import threading
+from typing import Optional
+
+from pyticket.domain.tickets.services import set_routing_rules
+from pyticket.infrastructure.rules.loader import load_routing_rules
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingRulesWatcher:
+    """Reloads routing rules when the rules file changes; invalid files keep the previous rules"""
+
+    def __init__(self, path: str, interval: float = 5.0):
+        """
+        Initialize watcher.
+
+        Args:
+            path: Routing rules file to watch
+            interval: Seconds between modification checks
+        """
+        self.path = path
+        self.interval = interval
+        self._stamp = self._current_stamp()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _current_stamp(self) -> Optional[tuple]:
+        """Get the file's modification time and size, None if it is missing."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def check(self) -> bool:
+        """
+        Reload the rules if the file changed since the last check.
+
+        Returns:
+            True if new rules were activated
+        """
+        stamp = self._current_stamp()
+        if stamp is None or stamp == self._stamp:
+            return False
+        self._stamp = stamp
+        try:
+            rules = load_routing_rules()
+        except (OSError, TypeError, ValueError) as e:
+            logger.error(f"Keeping previous routing rules, {self.path} is invalid: {e}")
+            return False
+        set_routing_rules(rules)
+        logger.info(f"Reloaded {len(rules)} routing rules from {self.path}")
+        return True
+
+    def start(self) -> None:
+        """Start checking for changes in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="routing-rules-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.check()
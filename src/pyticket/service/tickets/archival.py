@@ -0,0 +1,51 @@
+"""Archival of old tickets"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+
+from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+
+logger = logging.getLogger(__name__)
+
+
+class TicketArchivalJob:
+    """Moves CLOSED and soft-deleted tickets older than a cutoff to the archive, one chunk per transaction"""
+
+    def __init__(self, repository: ITicketRepository, older_than: timedelta, batch_size: int = 500):
+        """
+        Initialize the archival job.
+
+        Args:
+            repository: Ticket repository
+            older_than: Age of the last change after which a CLOSED or deleted ticket is archived
+            batch_size: Tickets moved per transaction; keeps locks short on a busy table
+        """
+        self.repository = repository
+        self.older_than = older_than
+        self.batch_size = max(batch_size, 1)
+
+    def run(self, on_progress: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Archive every eligible ticket.
+
+        The cutoff is fixed when the run starts, so tickets closed during the
+        run wait for the next one.
+
+        Args:
+            on_progress: Called with the number of tickets archived so far after each chunk
+
+        Returns:
+            Number of archived tickets
+        """
+        closed_before = datetime.now(timezone.utc) - self.older_than
+        archived = 0
+        while True:
+            moved = self.repository.archive(closed_before, self.batch_size)
+            if not moved:
+                break
+            archived += moved
+            if on_progress is not None:
+                on_progress(archived)
+        logger.info(f"Archived {archived} tickets last changed before {closed_before.isoformat()}")
+        return archived
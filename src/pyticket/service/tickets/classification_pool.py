@@ -0,0 +1,108 @@
+"""Process pool for CPU-bound ticket classification"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult, ClassificationUsage
+
+logger = logging.getLogger(__name__)
+
+# What crosses the process boundary: (title, description) in, (category, priority, confidence, reasoning, usage) out
+TicketPayload = Tuple[str, str]
+ResultPayload = Tuple[str, str, float, str, Optional[tuple]]
+
+# Classifier of the current worker process, built once by the pool initializer
+_worker_service: Optional[AIClassificationService] = None
+
+
+def _init_worker(factory: Callable[[], AIClassificationService]) -> None:
+    """Set up Django (spawned workers) and build the worker's classifier."""
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+    global _worker_service
+    _worker_service = factory()
+
+
+def _classify_chunk(payloads: Sequence[TicketPayload]) -> List[Optional[ResultPayload]]:
+    """Classify a chunk of tickets in a worker; failed tickets give None."""
+    results: List[Optional[ResultPayload]] = []
+    for title, description in payloads:
+        try:
+            result = _worker_service.classify_ticket(Ticket(title=title, description=description))
+        except Exception as e:
+            logger.error(f"Classification failed in worker {os.getpid()}: {e}")
+            results.append(None)
+            continue
+        usage = astuple(result.usage) if result.usage is not None else None
+        results.append((result.category.value, result.priority.value, result.confidence_score, result.reasoning, usage))
+    return results
+
+
+class ProcessClassificationPool:
+    """
+    Runs ticket classification in worker processes.
+
+    Local classification (text normalization, scoring, response parsing) is
+    CPU-bound, so threads are limited to one core by the GIL. Each worker
+    builds its classifier once when it starts (loading models up front) and
+    receives tickets in chunks as plain (title, description) pairs rather
+    than pickled entities, which keeps IPC cost low. Workers are spawned
+    rather than forked: a fork of the threaded web process could inherit
+    locks held by other threads and open DB or SQLite connections.
+    """
+
+    def __init__(self, factory: Callable[[], AIClassificationService], workers: int = 0, chunk_size: int = 16):
+        """
+        Initialize pool; worker processes start on first use.
+
+        Args:
+            factory: Picklable callable building the classifier in each worker
+            workers: Worker processes (0 = one per CPU)
+            chunk_size: Tickets sent to a worker per task
+        """
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+        self.chunk_size = max(chunk_size, 1)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(factory,),
+        )
+
+    def classify_many(self, tickets: Sequence[Ticket]) -> List[Optional[ClassificationResult]]:
+        """
+        Classify tickets in the worker processes.
+
+        Returns:
+            A result per ticket, in order; None where classification failed
+        """
+        payloads = [(ticket.title, ticket.description) for ticket in tickets]
+        chunks = [payloads[start : start + self.chunk_size] for start in range(0, len(payloads), self.chunk_size)]
+        results: List[Optional[ClassificationResult]] = []
+        for chunk_results in self._executor.map(_classify_chunk, chunks):
+            results.extend(map(self._to_result, chunk_results))
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker processes."""
+        self._executor.shutdown()
+
+    @staticmethod
+    def _to_result(payload: Optional[ResultPayload]) -> Optional[ClassificationResult]:
+        """Rebuild a classification result from its payload."""
+        if payload is None:
+            return None
+        category, priority, confidence, reasoning, usage = payload
+        return ClassificationResult(
+            Category(category), Priority(priority), confidence, reasoning, ClassificationUsage(*usage) if usage else None
+        )
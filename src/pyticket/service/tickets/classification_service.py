@@ -1,11 +1,15 @@
 """Ticket classification service"""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import List, Optional, Sequence
 
 from pyticket.domain.tickets.entities import Ticket
 from pyticket.domain.tickets.exceptions import ClassificationError
 from pyticket.domain.tickets.services import TicketClassificationService as DomainClassificationService
 from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult
+from pyticket.service.tickets.classification_pool import ProcessClassificationPool
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +17,16 @@ logger = logging.getLogger(__name__)
 class TicketClassificationService:
     """Service for orchestrating ticket classification"""
 
-    def __init__(self, ai_service: AIClassificationService):
+    def __init__(self, ai_service: AIClassificationService, process_pool: Optional[ProcessClassificationPool] = None):
         """
         Initialize classification service.
 
         Args:
             ai_service: AI classification service implementation
+            process_pool: Optional worker processes used by classify_many instead of threads
         """
         self.ai_service = ai_service
+        self.process_pool = process_pool
         self.domain_service = DomainClassificationService()
 
     def classify_ticket(self, ticket: Ticket) -> ClassificationResult:
@@ -38,15 +44,7 @@ class TicketClassificationService:
         """
         try:
             # Use AI service to classify
-            result = self.ai_service.classify_ticket(ticket)
-
-            # Apply domain validation rules
-            if not self.domain_service.validate_classification(result.category, result.priority):
-                logger.warning(
-                    f"Invalid classification combination: {result.category.value}, " f"{result.priority.value}. Adjusting priority."
-                )
-                # Adjust priority if invalid combination
-                result.priority = self.domain_service.get_default_priority_for_category(result.category)
+            result = self._apply_rules(self.ai_service.classify_ticket(ticket))
 
             logger.info(
                 f"Successfully classified ticket {ticket.id}: "
@@ -58,3 +56,37 @@ class TicketClassificationService:
         except Exception as e:
             logger.error(f"Classification failed for ticket {ticket.id}: {e}")
             raise ClassificationError(f"Failed to classify ticket: {str(e)}") from e
+
+    def classify_many(self, tickets: Sequence[Ticket], max_workers: int = 1) -> List[Optional[ClassificationResult]]:
+        """
+        Classify a batch of tickets.
+
+        Uses the process pool when configured (CPU-bound local classification),
+        otherwise up to ``max_workers`` threads (I/O-bound provider calls).
+
+        Args:
+            tickets: Tickets to classify
+            max_workers: Concurrent classification calls in thread mode
+
+        Returns:
+            A result per ticket, in order; None where classification failed
+        """
+        if self.process_pool is None:
+            with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+                return list(executor.map(self._try_classify, tickets))
+        return [result and self._apply_rules(result) for result in self.process_pool.classify_many(tickets)]
+
+    def _try_classify(self, ticket: Ticket) -> Optional[ClassificationResult]:
+        """Classify a ticket, returning None instead of raising on failure."""
+        try:
+            return self.classify_ticket(ticket)
+        except ClassificationError:
+            return None
+
+    def _apply_rules(self, result: ClassificationResult) -> ClassificationResult:
+        """Apply domain validation rules to a classification."""
+        if self.domain_service.validate_classification(result.category, result.priority):
+            return result
+        logger.warning(f"Invalid classification combination: {result.category.value}, " f"{result.priority.value}. Adjusting priority.")
+        # Adjust priority if invalid combination
+        return replace(result, priority=self.domain_service.get_default_priority_for_category(result.category))
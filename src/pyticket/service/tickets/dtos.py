@@ -1,14 +1,14 @@
 """Data Transfer Objects for service layer"""
 
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CreateTicketDTO:
     """DTO for creating a ticket"""
 
@@ -16,7 +16,7 @@ class CreateTicketDTO:
     description: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ClassificationResultDTO:
     """DTO for classification result"""
 
@@ -26,7 +26,7 @@ class ClassificationResultDTO:
     reasoning: str
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketResponseDTO:
     """DTO for ticket response"""
 
@@ -39,3 +39,106 @@ class TicketResponseDTO:
     created_at: datetime
     updated_at: datetime
     classification: Optional[ClassificationResultDTO] = None
+    duplicate: bool = False  # An existing ticket returned for a duplicate submission
+
+
+@dataclass(frozen=True, slots=True)
+class TicketSearchResponseDTO:
+    """DTO for a page of ticket search results"""
+
+    items: List[TicketResponseDTO]
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class TicketCountDTO:
+    """DTO for the ticket count of one status x category x priority bucket"""
+
+    status: TicketStatus
+    category: Optional[Category]
+    priority: Optional[Priority]
+    count: int
+
+
+@dataclass(frozen=True, slots=True)
+class TicketStatisticsDTO:
+    """DTO for ticket aggregates"""
+
+    total: int
+    by_status: Dict[str, int]
+    by_category: Dict[str, int]
+    by_priority: Dict[str, int]
+    backlog_by_team: Dict[str, int]
+    buckets: List[TicketCountDTO]
+
+
+@dataclass(frozen=True, slots=True)
+class ReclassificationBatchDTO:
+    """DTO for the outcome of reclassifying a batch of tickets"""
+
+    updated: int
+    failed: List[UUID]
+
+
+@dataclass(frozen=True, slots=True)
+class StatusUpdateResultDTO:
+    """DTO for the outcome of one status change in a batch"""
+
+    ticket_id: UUID
+    updated: bool
+    status: Optional[TicketStatus] = None
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class IngestionMetricsDTO:
+    """DTO for ticket ingestion queue metrics"""
+
+    queued: int
+    inline: int
+    max_depth: int
+    defer_depth: int
+    workers: int
+    avg_classification_seconds: float
+    accepted: int
+    deferred: int
+    rejected: int
+    processed: int
+    failed: int
+
+
+@dataclass(frozen=True, slots=True)
+class UsageSummaryDTO:
+    """DTO for classification usage of one provider and model on one day"""
+
+    day: date
+    provider: str
+    model: str
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+    avg_latency_ms: float
+    estimated_cost: Optional[float]  # None when the model has no configured price
+
+
+@dataclass(frozen=True, slots=True)
+class TicketUsageDTO:
+    """DTO for the classification usage of one ticket"""
+
+    ticket_id: UUID
+    classifications: int
+    prompt_tokens: int
+    completion_tokens: int
+    total_tokens: int
+
+
+@dataclass(frozen=True, slots=True)
+class UsageReportDTO:
+    """DTO for classification usage and cost since a point in time"""
+
+    since: datetime
+    total_tokens: int
+    estimated_cost: float  # Sum over priced models
+    by_day: List[UsageSummaryDTO]
+    top_tickets: List[TicketUsageDTO]
@@ -0,0 +1,245 @@
+"""Ticket ingestion with admission control"""
+
+import logging
+import math
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Callable, List, Optional
+from uuid import UUID
+
+from pyticket.domain.tickets.services import TicketUrgencyEstimator
+from pyticket.service.tickets.dtos import CreateTicketDTO, IngestionMetricsDTO, TicketResponseDTO
+from pyticket.service.tickets.scheduler import ClassificationScheduler
+from pyticket.service.tickets.ticket_service import TicketService
+
+logger = logging.getLogger(__name__)
+
+
+class IngestionOverloadedError(Exception):
+    """Raised when the classification backlog is full and a ticket cannot be accepted."""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"Ticket ingestion is over capacity, retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class Admission(Enum):
+    """How a new ticket is admitted"""
+
+    CLASSIFY_NOW = "classify_now"
+    DEFER = "defer"
+    REJECT = "reject"
+
+
+class TicketIngestionService:
+    """
+    Service admitting new tickets under load.
+
+    While load (queued plus inline classifications) is below ``defer_depth``
+    tickets are created and classified in the request, as before. Above it
+    tickets are persisted unclassified right away and scheduled for
+    background classification workers, most urgent first by a cheap keyword
+    estimate of their priority (see ClassificationScheduler). When
+    ``max_depth`` tickets are queued new tickets are rejected with a retry
+    hint derived from the observed classification time.
+
+    The queue lives in memory; ``recover`` claims and re-queues tickets that
+    a stopped process left unclassified.
+    """
+
+    def __init__(
+        self,
+        ticket_service: TicketService,
+        max_depth: int = 1000,
+        defer_depth: int = 8,
+        workers: int = 2,
+        after_task: Optional[Callable[[], None]] = None,
+        scheduler: Optional[ClassificationScheduler] = None,
+        estimator: Optional[TicketUrgencyEstimator] = None,
+    ):
+        """
+        Initialize ingestion service.
+
+        Args:
+            ticket_service: Service creating and classifying tickets
+            max_depth: Queued tickets at which new tickets are rejected
+            defer_depth: Load at which classification is deferred to the queue
+            workers: Background classification threads
+            after_task: Called by workers after each ticket (e.g. to release DB connections)
+            scheduler: Orders deferred tickets for the workers
+            estimator: Estimates the priority of deferred tickets before classification
+        """
+        self.ticket_service = ticket_service
+        self.max_depth = max_depth
+        self.defer_depth = defer_depth
+        self.workers = max(workers, 1)
+        self.after_task = after_task
+        self.scheduler = scheduler or ClassificationScheduler()
+        self.estimator = estimator or TicketUrgencyEstimator()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._queued = 0
+        self._inline = 0
+        self._counters = dict.fromkeys(("accepted", "deferred", "rejected", "processed", "failed"), 0)
+        self._avg_seconds = 0.0
+
+    def submit(self, dto: CreateTicketDTO) -> TicketResponseDTO:
+        """
+        Create a ticket, classifying it now or in the background depending on load.
+
+        Args:
+            dto: Ticket creation data
+
+        Returns:
+            TicketResponseDTO; without classification when it was deferred
+
+        Raises:
+            IngestionOverloadedError: If the backlog is full
+        """
+        admission = self._admit()
+        if admission is Admission.REJECT:
+            raise IngestionOverloadedError(self.retry_after())
+        if admission is Admission.CLASSIFY_NOW:
+            return self._classify_now(dto)
+        return self._defer(dto)
+
+    def recover(self, stale_before: datetime) -> int:
+        """
+        Claim and queue persisted unclassified tickets, e.g. those deferred by a process that stopped.
+
+        Only tickets created, or last claimed, before ``stale_before`` are
+        taken, and each is claimed by exactly one process. At most the free
+        queue capacity is taken; run it again to pick up the rest.
+
+        Args:
+            stale_before: Tickets created or claimed later are left to their process
+
+        Returns:
+            Number of queued tickets
+        """
+        with self._lock:
+            free = self.max_depth - self._queued
+        tickets = self.ticket_service.claim_unclassified_tickets(stale_before, free) if free > 0 else []
+        if not tickets:
+            return 0
+        with self._lock:
+            self._queued += len(tickets)
+            self._counters["deferred"] += len(tickets)
+        self._ensure_workers()
+        for ticket in tickets:
+            self.scheduler.put(ticket.id, self.estimator.estimate(ticket.title, ticket.description))
+        logger.info(f"Queued {len(tickets)} unclassified tickets for classification")
+        return len(tickets)
+
+    def retry_after(self) -> int:
+        """Seconds until the backlog has likely drained below capacity (1 to 60)."""
+        with self._lock:
+            backlog_seconds = (self._queued - self.max_depth + 1) * self._avg_seconds / self.workers
+        return min(max(math.ceil(backlog_seconds), 1), 60)
+
+    def metrics(self) -> IngestionMetricsDTO:
+        """Get queue depth and admission counters."""
+        with self._lock:
+            return IngestionMetricsDTO(
+                queued=self._queued,
+                inline=self._inline,
+                max_depth=self.max_depth,
+                defer_depth=self.defer_depth,
+                workers=self.workers,
+                avg_classification_seconds=round(self._avg_seconds, 3),
+                **self._counters,
+            )
+
+    def shutdown(self) -> None:
+        """Stop the workers after the queued tickets are processed."""
+        self.scheduler.close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _admit(self) -> Admission:
+        """Decide how to admit a ticket and reserve its slot."""
+        with self._lock:
+            if self._queued >= self.max_depth:
+                self._counters["rejected"] += 1
+                return Admission.REJECT
+            self._counters["accepted"] += 1
+            if self._queued + self._inline < self.defer_depth:
+                self._inline += 1
+                return Admission.CLASSIFY_NOW
+            self._queued += 1
+            self._counters["deferred"] += 1
+            return Admission.DEFER
+
+    def _release(self, queued: bool) -> None:
+        """Release a slot reserved by _admit."""
+        with self._lock:
+            if queued:
+                self._queued -= 1
+            else:
+                self._inline -= 1
+
+    def _defer(self, dto: CreateTicketDTO) -> TicketResponseDTO:
+        """Create the ticket unclassified and queue it for the workers, unless it is a duplicate."""
+        try:
+            ticket_dto = self.ticket_service.create_unclassified_ticket(dto)
+        except Exception:
+            self._release(queued=True)
+            raise
+        if ticket_dto.duplicate:  # Already created, and classified or queued
+            self._release(queued=True)
+            return ticket_dto
+        self._ensure_workers()
+        self.scheduler.put(ticket_dto.id, self.estimator.estimate(dto.title, dto.description))
+        return ticket_dto
+
+    def _classify_now(self, dto: CreateTicketDTO) -> TicketResponseDTO:
+        """Create and classify a ticket in the calling thread."""
+        started = time.monotonic()
+        try:
+            return self.ticket_service.create_ticket(dto)
+        finally:
+            self._observe(time.monotonic() - started)
+            self._release(queued=False)
+
+    def _observe(self, seconds: float) -> None:
+        """Track the average classification time (exponentially weighted)."""
+        with self._lock:
+            self._avg_seconds = seconds if not self._avg_seconds else 0.8 * self._avg_seconds + 0.2 * seconds
+
+    def _ensure_workers(self) -> None:
+        """Start the background workers on first use."""
+        if self._threads:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            self._threads = [
+                threading.Thread(target=self._work, name=f"ticket-ingestion-{index}", daemon=True) for index in range(self.workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        """Classify scheduled tickets until shutdown."""
+        while (ticket_id := self.scheduler.get()) is not None:
+            self._process(ticket_id)
+
+    def _process(self, ticket_id: UUID) -> None:
+        """Classify one deferred ticket."""
+        started = time.monotonic()
+        outcome = "processed"
+        try:
+            self.ticket_service.classify_pending_ticket(ticket_id)  # Skips tickets classified meanwhile
+        except Exception as e:
+            outcome = "failed"
+            logger.error(f"Deferred classification failed for ticket {ticket_id}: {e}")
+        finally:
+            self._observe(time.monotonic() - started)
+            self._release(queued=True)
+            with self._lock:
+                self._counters[outcome] += 1
+            if self.after_task is not None:
+                self.after_task()
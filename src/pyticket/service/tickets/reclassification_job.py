@@ -0,0 +1,137 @@
+"""Resumable bulk reclassification job"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+from uuid import UUID
+
+from pyticket.infrastructure.jobs.interfaces import IJobCheckpointStore
+from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+from pyticket.service.tickets.ticket_service import TicketService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class ReclassificationProgress:
+    """Progress of a bulk reclassification run"""
+
+    last_id: Optional[UUID] = None
+    processed: int = 0
+    failed: int = 0
+    total: int = 0
+    run_processed: int = 0  # Tickets processed since this run (re)started
+    run_seconds: float = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Tickets per second in the current run."""
+        return self.run_processed / self.run_seconds if self.run_seconds > 0 else 0.0
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until the remaining tickets are processed."""
+        if not self.rate:
+            return None
+        return max(self.total - self.processed, 0) / self.rate
+
+    def to_checkpoint(self) -> Dict[str, Any]:
+        """Get the state needed to resume."""
+        return {
+            "last_id": str(self.last_id) if self.last_id else None,
+            "processed": self.processed,
+            "failed": self.failed,
+        }
+
+    @classmethod
+    def from_checkpoint(cls, state: Dict[str, Any]) -> "ReclassificationProgress":
+        """Restore progress saved with to_checkpoint."""
+        return cls(
+            last_id=UUID(state["last_id"]) if state.get("last_id") else None,
+            processed=state.get("processed", 0),
+            failed=state.get("failed", 0),
+        )
+
+
+class ReclassificationJob:
+    """Reclassifies every ticket in ID order, checkpointing after each batch"""
+
+    JOB_NAME = "reclassify_tickets"
+
+    def __init__(
+        self,
+        ticket_service: TicketService,
+        repository: ITicketRepository,
+        checkpoints: IJobCheckpointStore,
+        batch_size: int = 100,
+        max_workers: int = 4,
+    ):
+        """
+        Initialize reclassification job.
+
+        Args:
+            ticket_service: Service classifying and storing ticket batches
+            repository: Repository the ticket IDs are streamed from
+            checkpoints: Store keeping the last processed ID between runs
+            batch_size: Tickets loaded, classified and written per step
+            max_workers: Concurrent classification calls per batch
+        """
+        self.ticket_service = ticket_service
+        self.repository = repository
+        self.checkpoints = checkpoints
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        restart: bool = False,
+        on_progress: Optional[Callable[[ReclassificationProgress], None]] = None,
+    ) -> ReclassificationProgress:
+        """
+        Run the job until all tickets are processed.
+
+        Resumes after the last checkpointed ticket unless ``restart`` is set.
+        The checkpoint is removed once the job completes.
+
+        Args:
+            restart: Ignore an existing checkpoint and start from the first ticket
+            on_progress: Called after every batch
+
+        Returns:
+            Final progress
+        """
+        progress = self._initial_progress(restart)
+        started = time.monotonic()
+        while True:
+            tickets = self.repository.list_after(progress.last_id, self.batch_size)
+            if not tickets:
+                break
+            result = self.ticket_service.reclassify_many(tickets, self.max_workers)
+
+            progress.last_id = tickets[-1].id
+            progress.processed += len(tickets)
+            progress.failed += len(result.failed)
+            progress.run_processed += len(tickets)
+            progress.run_seconds = time.monotonic() - started
+            self.checkpoints.save(self.JOB_NAME, progress.to_checkpoint())
+            self._report(progress, on_progress)
+
+        self.checkpoints.clear(self.JOB_NAME)
+        return progress
+
+    def _initial_progress(self, restart: bool) -> ReclassificationProgress:
+        """Load the checkpointed progress, or start over."""
+        state = None if restart else self.checkpoints.load(self.JOB_NAME)
+        progress = ReclassificationProgress.from_checkpoint(state) if state else ReclassificationProgress()
+        progress.total = self.repository.count()
+        if progress.last_id is not None:
+            logger.info(f"Resuming reclassification after ticket {progress.last_id} ({progress.processed} done)")
+        return progress
+
+    @staticmethod
+    def _report(progress: ReclassificationProgress, on_progress: Optional[Callable[[ReclassificationProgress], None]]) -> None:
+        """Log progress and notify the caller."""
+        logger.info(f"Reclassified {progress.processed}/{progress.total} tickets ({progress.failed} failed, {progress.rate:.1f}/s)")
+        if on_progress is not None:
+            on_progress(progress)
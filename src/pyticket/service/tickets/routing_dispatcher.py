@@ -0,0 +1,107 @@
+"""Background dispatcher for routing events"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.infrastructure.repositories.interfaces import IRoutingOutbox
+from pyticket.infrastructure.routing.interfaces import IRoutingSink
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingDispatcher:
+    """Service delivering outbox routing events to team sinks in batches"""
+
+    def __init__(
+        self,
+        outbox: IRoutingOutbox,
+        sink: IRoutingSink,
+        batch_size: int = 100,
+        max_attempts: int = 5,
+        before_batch: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize routing dispatcher.
+
+        Args:
+            outbox: Routing outbox to read from
+            sink: Sink receiving per-team batches
+            batch_size: Maximum number of events fetched per batch
+            max_attempts: Attempts after which an event is no longer retried
+            before_batch: Called by run() before each batch (e.g. to drop stale DB connections)
+        """
+        self.outbox = outbox
+        self.sink = sink
+        self.batch_size = batch_size
+        self.max_attempts = max_attempts
+        self.before_batch = before_batch
+
+    def dispatch_batch(self) -> int:
+        """
+        Dispatch one batch of pending events.
+
+        Returns:
+            Number of events fetched from the outbox
+        """
+        return self._dispatch_pending()[0]
+
+    def run(self, stop: threading.Event, interval: float = 1.0, max_backoff: float = 60.0) -> None:
+        """
+        Dispatch continuously until stop is set.
+
+        Sleeps for interval seconds whenever the outbox is drained. After a
+        failed batch (a sink or outbox error) the wait doubles, up to
+        max_backoff seconds, so an unreachable sink is not retried in a
+        tight loop; the first successful batch resets it.
+        """
+        backoff = interval
+        while not stop.is_set():
+            fetched, failed = self._pass()
+            if failed:
+                stop.wait(backoff)
+                backoff = min(backoff * 2, max(max_backoff, interval))
+                continue
+            backoff = interval
+            if fetched < self.batch_size:
+                stop.wait(interval)
+
+    def _pass(self) -> Tuple[int, bool]:
+        """Run one loop pass; returns the events fetched and whether anything failed."""
+        if self.before_batch is not None:
+            self.before_batch()
+        try:
+            fetched, failed = self._dispatch_pending()
+        except Exception as e:
+            logger.error(f"Routing dispatch batch failed: {e}")
+            return 0, True
+        return fetched, failed > 0
+
+    def _dispatch_pending(self) -> Tuple[int, int]:
+        """Dispatch one batch; returns the events fetched and the team batches that failed."""
+        events = self.outbox.fetch_pending(self.batch_size, self.max_attempts)
+        failed = sum(not self._dispatch_team(team, team_events) for team, team_events in self._group_by_team(events).items())
+        return len(events), failed
+
+    def _dispatch_team(self, team: str, events: Sequence[RoutingEvent]) -> bool:
+        """Send a team's batch and record the outcome; False if the sink failed."""
+        event_ids = [event.id for event in events]
+        try:
+            self.sink.send(team, events)
+        except Exception as e:
+            logger.error(f"Routing dispatch to {team} failed for {len(events)} events: {e}")
+            self.outbox.mark_failed(event_ids, str(e))
+            return False
+        self.outbox.mark_dispatched(event_ids)
+        logger.info(f"Dispatched {len(events)} routing events to team: {team}")
+        return True
+
+    @staticmethod
+    def _group_by_team(events: Sequence[RoutingEvent]) -> Dict[str, List[RoutingEvent]]:
+        """Group events by team, keeping insertion order."""
+        grouped: Dict[str, List[RoutingEvent]] = defaultdict(list)
+        for event in events:
+            grouped[event.team].append(event)
+        return grouped
@@ -0,0 +1,65 @@
+"""Priority-aware scheduling of pending classifications"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import Callable, List, Optional, Tuple
+from uuid import UUID
+
+from pyticket.domain.tickets.entities import Priority
+from pyticket.domain.tickets.services import PRIORITY_RANK
+
+
+class ClassificationScheduler:
+    """
+    Queue of tickets waiting for classification, most urgent first.
+
+    Tickets are ordered by their estimated priority, with aging: every
+    ``aging_seconds`` a ticket waits counts as one priority level, so an
+    older LOW ticket is eventually served before newer URGENT ones and
+    nothing starves under a steady stream of urgent tickets. Ties are
+    served in arrival order.
+    """
+
+    def __init__(self, aging_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize scheduler.
+
+        Args:
+            aging_seconds: Waiting time worth one priority level
+            clock: Monotonic time source in seconds
+        """
+        self.aging_seconds = max(aging_seconds, 1e-3)
+        self.clock = clock
+        self._heap: List[Tuple[float, int, UUID]] = []
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._heap)
+
+    def put(self, ticket_id: UUID, priority: Priority) -> None:
+        """Schedule a ticket with its estimated priority."""
+        # Arrival time in priority levels minus the priority: lower is served first
+        key = self.clock() / self.aging_seconds - PRIORITY_RANK[priority]
+        with self._condition:
+            heapq.heappush(self._heap, (key, next(self._sequence), ticket_id))
+            self._condition.notify()
+
+    def get(self) -> Optional[UUID]:
+        """Wait for the next ticket to classify; None once closed and drained."""
+        with self._condition:
+            while not self._heap and not self._closed:
+                self._condition.wait()
+            if not self._heap:
+                return None
+            return heapq.heappop(self._heap)[2]
+
+    def close(self) -> None:
+        """Stop accepting waits; get() returns None once the queue is drained."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
@@ -0,0 +1,70 @@
+"""Ticket statistics service"""
+
+from collections import Counter
+from enum import Enum
+from typing import Dict, Optional
+
+from pyticket.domain.tickets.entities import TicketStatus
+from pyticket.domain.tickets.services import TicketRoutingService
+from pyticket.infrastructure.repositories.interfaces import ITicketStatsRepository
+from pyticket.service.tickets.dtos import TicketCountDTO, TicketStatisticsDTO
+
+UNCLASSIFIED = "UNCLASSIFIED"
+
+# Statuses counted as a team's open backlog
+BACKLOG_STATUSES = frozenset({TicketStatus.OPEN, TicketStatus.IN_PROGRESS})
+
+
+class TicketStatsService:
+    """Service serving ticket aggregates from the incremental counters"""
+
+    def __init__(self, ticket_stats: ITicketStatsRepository):
+        """
+        Initialize ticket statistics service.
+
+        Args:
+            ticket_stats: Incrementally maintained ticket counters
+        """
+        self.ticket_stats = ticket_stats
+        self.routing_service = TicketRoutingService()
+
+    def get_statistics(self) -> TicketStatisticsDTO:
+        """
+        Get ticket counts by status, category, priority and team backlog.
+
+        Reads only the counters table, so the cost does not grow with the
+        number of tickets.
+        """
+        buckets = [
+            TicketCountDTO(status=key.status, category=key.category, priority=key.priority, count=count)
+            for key, count in self.ticket_stats.snapshot()
+        ]
+        by_status: Counter = Counter()
+        by_category: Counter = Counter()
+        by_priority: Counter = Counter()
+        backlog_by_team: Counter = Counter()
+        for bucket in buckets:
+            by_status[bucket.status.value] += bucket.count
+            by_category[self._label(bucket.category)] += bucket.count
+            by_priority[self._label(bucket.priority)] += bucket.count
+            if bucket.status in BACKLOG_STATUSES:
+                backlog_by_team[self.routing_service.get_team_for_category(bucket.category)] += bucket.count
+
+        return TicketStatisticsDTO(
+            total=sum(by_status.values()),
+            by_status=self._sorted(by_status),
+            by_category=self._sorted(by_category),
+            by_priority=self._sorted(by_priority),
+            backlog_by_team=self._sorted(backlog_by_team),
+            buckets=buckets,
+        )
+
+    @staticmethod
+    def _label(value: Optional[Enum]) -> str:
+        """Get the wire label for an optional enum value."""
+        return value.value if value is not None else UNCLASSIFIED
+
+    @staticmethod
+    def _sorted(counts: Counter) -> Dict[str, int]:
+        """Get counts as a dict with stable key order."""
+        return dict(sorted(counts.items()))
@@ -1,16 +1,35 @@
 """Ticket management service"""
 
 import logging
-from typing import List, Optional
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 from uuid import UUID
 
 from pyticket.domain.tickets.entities import Ticket, TicketStatus
+from pyticket.domain.tickets.events import RoutingEvent, TicketEvent, TicketEventType
 from pyticket.domain.tickets.exceptions import InvalidTicketStatusError
+from pyticket.domain.tickets.fingerprint import TicketFingerprint
 from pyticket.domain.tickets.services import TicketRoutingService
-from pyticket.infrastructure.ai.interfaces import AIClassificationService
-from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult
+from pyticket.infrastructure.events.interfaces import ITicketEventBus
+from pyticket.infrastructure.repositories.interfaces import (
+    IClassificationUsageRepository,
+    IRoutingOutbox,
+    ITicketRepository,
+    ITicketStatsRepository,
+    TicketStatsKey,
+)
+from pyticket.service.tickets.classification_pool import ProcessClassificationPool
 from pyticket.service.tickets.classification_service import TicketClassificationService
-from pyticket.service.tickets.dtos import ClassificationResultDTO, CreateTicketDTO, TicketResponseDTO
+from pyticket.service.tickets.dtos import (
+    ClassificationResultDTO,
+    CreateTicketDTO,
+    ReclassificationBatchDTO,
+    StatusUpdateResultDTO,
+    TicketResponseDTO,
+    TicketSearchResponseDTO,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +41,13 @@ class TicketService:
         self,
         repository: ITicketRepository,
         ai_classification_service: AIClassificationService,
+        event_bus: Optional[ITicketEventBus] = None,
+        routing_outbox: Optional[IRoutingOutbox] = None,
+        ticket_stats: Optional[ITicketStatsRepository] = None,
+        classification_pool: Optional[ProcessClassificationPool] = None,
+        usage_repository: Optional[IClassificationUsageRepository] = None,
+        duplicate_window: Optional[timedelta] = None,
+        duplicate_threshold: float = 1.0,
     ):
         """
         Initialize ticket service.
@@ -29,21 +55,41 @@ class TicketService:
         Args:
             repository: Ticket repository
             ai_classification_service: AI classification service
+            event_bus: Optional event bus notified about ticket changes
+            routing_outbox: Optional outbox receiving routing events for team dispatch
+            ticket_stats: Optional counters kept in step with ticket changes
+            classification_pool: Optional worker processes for bulk classification
+            usage_repository: Optional log receiving the token usage of each classification
+            duplicate_window: How far back a new ticket is matched against existing ones; None disables deduplication
+            duplicate_threshold: Minimum content similarity of a duplicate (1.0 = same normalized text)
         """
         self.repository = repository
-        self.classification_service = TicketClassificationService(ai_classification_service)
+        self.event_bus = event_bus
+        self.routing_outbox = routing_outbox
+        self.ticket_stats = ticket_stats
+        self.usage_repository = usage_repository
+        self.duplicate_window = duplicate_window
+        self.duplicate_threshold = duplicate_threshold
+        self.classification_service = TicketClassificationService(ai_classification_service, classification_pool)
         self.routing_service = TicketRoutingService()
 
     def create_ticket(self, dto: CreateTicketDTO) -> TicketResponseDTO:
         """
         Create a new ticket and classify it.
 
+        A duplicate of a recent ticket is not created nor classified again;
+        the existing ticket is returned instead.
+
         Args:
             dto: Ticket creation data
 
         Returns:
             TicketResponseDTO with ticket and classification information
         """
+        duplicate = self._find_duplicate(dto)
+        if duplicate is not None:
+            return duplicate
+
         # Create domain entity
         ticket = Ticket(title=dto.title, description=dto.description)
 
@@ -54,26 +100,51 @@ class TicketService:
         ticket.classify(classification_result.category, classification_result.priority)
 
         # Get routing information
-        team = self.routing_service.get_team_for_category(classification_result.category)
+        team = self.routing_service.route(ticket)
         logger.info(f"Ticket {ticket.id} routed to team: {team}")
 
-        # Save ticket
-        saved_ticket = self.repository.save(ticket)
+        # Save ticket together with its routing event and counters
+        saved_ticket = self._persist(self.repository.save, ticket, team=team)
+        self._record_usage([(saved_ticket, classification_result)])
+        self._publish(TicketEventType.CREATED, saved_ticket)
 
         # Convert to DTO
         return self._to_response_dto(saved_ticket, classification_result)
 
-    def get_ticket(self, ticket_id: UUID) -> Optional[TicketResponseDTO]:
+    def create_unclassified_ticket(self, dto: CreateTicketDTO) -> TicketResponseDTO:
+        """
+        Create a ticket without classifying it.
+
+        Used when classification is deferred; ``reclassify_ticket`` classifies
+        and routes the ticket later. Duplicates are handled as in ``create_ticket``.
+
+        Args:
+            dto: Ticket creation data
+
+        Returns:
+            TicketResponseDTO without classification, or the existing duplicate
+        """
+        duplicate = self._find_duplicate(dto)
+        if duplicate is not None:
+            return duplicate
+
+        ticket = Ticket(title=dto.title, description=dto.description)
+        saved_ticket = self._persist(self.repository.save, ticket)
+        self._publish(TicketEventType.CREATED, saved_ticket)
+        return self._to_response_dto(saved_ticket, None)
+
+    def get_ticket(self, ticket_id: UUID, include_archived: bool = False) -> Optional[TicketResponseDTO]:
         """
         Get a ticket by ID.
 
         Args:
             ticket_id: Ticket ID
+            include_archived: Also look in the archive when the ticket is not in the working set
 
         Returns:
             TicketResponseDTO or None if not found
         """
-        ticket = self.repository.get_by_id(ticket_id)
+        ticket = self.repository.get_by_id(ticket_id, include_archived=include_archived)
         if not ticket:
             return None
 
@@ -102,6 +173,89 @@ class TicketService:
         tickets = self.repository.list_all(limit=limit, offset=offset)
         return [self._to_response_dto(ticket, None) for ticket in tickets]
 
+    def list_archived_tickets(self, limit: int = 100, offset: int = 0) -> List[TicketResponseDTO]:
+        """
+        List archived tickets.
+
+        Args:
+            limit: Maximum number of tickets to return
+            offset: Number of tickets to skip
+
+        Returns:
+            List of TicketResponseDTO
+        """
+        tickets = self.repository.list_archived(limit=limit, offset=offset)
+        return [self._to_response_dto(ticket, None) for ticket in tickets]
+
+    def claim_unclassified_tickets(self, stale_before: datetime, limit: int) -> List[TicketResponseDTO]:
+        """
+        Claim tickets left waiting for classification, oldest first.
+
+        Args:
+            stale_before: Only tickets created or last claimed earlier are claimed
+            limit: Maximum number of tickets to claim
+
+        Returns:
+            List of TicketResponseDTO
+        """
+        tickets = self.repository.claim_unclassified(stale_before, limit)
+        return [self._to_response_dto(ticket, None) for ticket in tickets]
+
+    def classify_pending_ticket(self, ticket_id: UUID) -> Optional[TicketResponseDTO]:
+        """
+        Classify a deferred ticket unless it has been classified meanwhile.
+
+        Args:
+            ticket_id: Ticket ID
+
+        Returns:
+            TicketResponseDTO with the classification, None if the ticket is gone or already classified
+        """
+        ticket = self.repository.get_by_id(ticket_id)
+        if ticket is None or ticket.is_classified():
+            return None
+        return self.reclassify_ticket(ticket_id)
+
+    def delete_ticket(self, ticket_id: UUID) -> bool:
+        """
+        Soft-delete a ticket and take it out of the counters.
+
+        Args:
+            ticket_id: Ticket ID
+
+        Returns:
+            False if the ticket was not found
+        """
+        ticket = self.repository.get_by_id(ticket_id)
+        if not ticket:
+            return False
+        with self.repository.atomic():
+            deleted = self.repository.delete(ticket_id)
+            if deleted and self.ticket_stats is not None:
+                self.ticket_stats.apply({TicketStatsKey.for_ticket(ticket): -1})
+        return deleted
+
+    def search_tickets(self, query: str, limit: int = 20, cursor: Optional[str] = None) -> TicketSearchResponseDTO:
+        """
+        Search tickets by title and description.
+
+        Args:
+            query: Free-text search query
+            limit: Maximum number of tickets to return
+            cursor: Cursor from a previous page
+
+        Returns:
+            TicketSearchResponseDTO with ranked tickets and the next cursor
+
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        page = self.repository.search(query, limit=limit, cursor=cursor)
+        return TicketSearchResponseDTO(
+            items=[self._to_response_dto(ticket, None) for ticket in page.tickets],
+            next_cursor=page.next_cursor,
+        )
+
     def reclassify_ticket(self, ticket_id: UUID) -> TicketResponseDTO:
         """
         Reclassify a ticket.
@@ -119,19 +273,60 @@ class TicketService:
         if not ticket:
             raise ValueError(f"Ticket {ticket_id} not found")
 
+        previous_team = self.routing_service.route(ticket) if ticket.is_classified() else None
+        previous_key = TicketStatsKey.for_ticket(ticket)
+
         # Classify ticket
         classification_result = self.classification_service.classify_ticket(ticket)
 
         # Apply classification to ticket
         ticket.classify(classification_result.category, classification_result.priority)
 
+        # Re-route only when the team changed
+        team = self.routing_service.route(ticket)
+        if team == previous_team:
+            team = None
+
         # Update ticket
-        updated_ticket = self.repository.update(ticket)
+        updated_ticket = self._persist(self.repository.update, ticket, previous_key, team)
+        self._record_usage([(updated_ticket, classification_result)])
+        self._publish(TicketEventType.CLASSIFIED, updated_ticket)
 
         logger.info(f"Reclassified ticket {ticket_id}")
 
         return self._to_response_dto(updated_ticket, classification_result)
 
+    def reclassify_many(self, tickets: Sequence[Ticket], max_workers: int = 1) -> ReclassificationBatchDTO:
+        """
+        Reclassify a batch of tickets.
+
+        Classification calls run in a thread pool, or in the classification
+        process pool when configured. Results are then applied to a fresh,
+        locked read of the rows, so status changes made during the calls are
+        kept and counter changes start from the stored values; only category
+        and priority are written, with a single bulk update, together with
+        routing events and counter changes. Tickets whose classification
+        fails keep their current values; tickets deleted meanwhile are skipped.
+
+        Args:
+            tickets: Tickets to reclassify
+            max_workers: Number of concurrent classification calls (thread mode)
+
+        Returns:
+            ReclassificationBatchDTO with the number of updated tickets and the failed IDs
+        """
+        results = self.classification_service.classify_many(tickets, max_workers)
+
+        outcomes = list(zip(tickets, results, strict=True))
+        failed = [ticket.id for ticket, result in outcomes if result is None]
+        classified = self._store_classifications({ticket.id: result for ticket, result in outcomes if result is not None})
+        self._record_usage((ticket, result) for ticket, result in outcomes if result is not None)
+        for ticket in classified:
+            self._publish(TicketEventType.CLASSIFIED, ticket)
+
+        logger.info(f"Reclassified {len(classified)} tickets, {len(failed)} failed")
+        return ReclassificationBatchDTO(updated=len(classified), failed=failed)
+
     def update_ticket_status(self, ticket_id: UUID, new_status: TicketStatus) -> TicketResponseDTO:
         """
         Update ticket status.
@@ -151,19 +346,193 @@ class TicketService:
         if not ticket:
             raise ValueError(f"Ticket {ticket_id} not found")
 
+        previous_key = TicketStatsKey.for_ticket(ticket)
         try:
             ticket.update_status(new_status)
         except ValueError as e:
             raise InvalidTicketStatusError(str(e)) from e
 
-        updated_ticket = self.repository.update(ticket)
+        updated_ticket = self._persist(self.repository.update, ticket, previous_key)
+        self._publish(TicketEventType.STATUS_CHANGED, updated_ticket)
 
         return self._to_response_dto(updated_ticket, None)
 
+    def update_status_many(self, ticket_ids: Sequence[UUID], new_status: TicketStatus) -> List[StatusUpdateResultDTO]:
+        """
+        Update the status of several tickets.
+
+        All tickets are loaded (and locked) with one query and each transition
+        is validated by the domain entity. Valid changes are written with a
+        single bulk update of the status only; invalid ones are reported
+        without failing the batch.
+
+        Args:
+            ticket_ids: Tickets to update; duplicates are processed once
+            new_status: New status
+
+        Returns:
+            One StatusUpdateResultDTO per distinct ticket ID, in request order
+        """
+        unique_ids = list(dict.fromkeys(ticket_ids))
+        updated: List[Ticket] = []
+        stats_changes: Counter = Counter()
+        with self.repository.atomic():
+            tickets = self.repository.get_many(unique_ids, for_update=True)
+            results = [self._transition(ticket_id, tickets.get(ticket_id), new_status, updated, stats_changes) for ticket_id in unique_ids]
+            self._store_many(self.repository.update_statuses, updated, stats_changes)
+        for ticket in updated:
+            self._publish(TicketEventType.STATUS_CHANGED, ticket)
+
+        logger.info(f"Moved {len(updated)} of {len(unique_ids)} tickets to {new_status.value}")
+        return results
+
+    def _transition(
+        self,
+        ticket_id: UUID,
+        ticket: Optional[Ticket],
+        new_status: TicketStatus,
+        updated: List[Ticket],
+        stats_changes: Counter,
+    ) -> StatusUpdateResultDTO:
+        """Apply one status transition of a batch, collecting the changed ticket."""
+        if ticket is None:
+            return StatusUpdateResultDTO(ticket_id=ticket_id, updated=False, error=f"Ticket {ticket_id} not found")
+        previous_key = TicketStatsKey.for_ticket(ticket)
+        try:
+            ticket.update_status(new_status)
+        except ValueError as e:
+            return StatusUpdateResultDTO(ticket_id=ticket_id, updated=False, status=ticket.status, error=str(e))
+        updated.append(ticket)
+        stats_changes.update(self._stats_changes(previous_key, ticket))
+        return StatusUpdateResultDTO(ticket_id=ticket_id, updated=True, status=ticket.status)
+
+    def _find_duplicate(self, dto: CreateTicketDTO) -> Optional[TicketResponseDTO]:
+        """Find a recent ticket with the same content when deduplication is enabled."""
+        if self.duplicate_window is None:
+            return None
+        since = datetime.now(timezone.utc) - self.duplicate_window
+        ticket = self.repository.find_duplicate(TicketFingerprint.of(dto.title, dto.description), since, self.duplicate_threshold)
+        if ticket is None:
+            return None
+        logger.info(f"New ticket duplicates ticket {ticket.id}, returning it without classifying again")
+        return self._to_response_dto(ticket, None, duplicate=True)
+
+    def _persist(
+        self,
+        persist: Callable[[Ticket], Ticket],
+        ticket: Ticket,
+        previous_key: Optional[TicketStatsKey] = None,
+        team: Optional[str] = None,
+    ) -> Ticket:
+        """
+        Persist a ticket with its routing event and counter changes in one transaction.
+
+        Args:
+            persist: Repository method writing the ticket
+            ticket: Ticket to persist
+            previous_key: Counter bucket the ticket was in before the change (None for new tickets)
+            team: Team to route the ticket to, if routing is needed
+        """
+        if self.ticket_stats is None and (self.routing_outbox is None or team is None):
+            return persist(ticket)
+        with self.repository.atomic():
+            saved_ticket = persist(ticket)
+            self._record_routing(saved_ticket, team)
+            self._record_stats(saved_ticket, previous_key)
+        return saved_ticket
+
+    def _apply_classification(
+        self,
+        ticket: Ticket,
+        result: ClassificationResult,
+        stats_changes: Counter,
+        routing_events: List[RoutingEvent],
+    ) -> None:
+        """Classify a ticket in place, collecting its counter changes and re-routing."""
+        previous_key = TicketStatsKey.for_ticket(ticket)
+        previous_team = self.routing_service.route(ticket) if ticket.is_classified() else None
+        ticket.classify(result.category, result.priority)
+        stats_changes.update(self._stats_changes(previous_key, ticket))
+        team = self.routing_service.route(ticket)
+        if team != previous_team:
+            routing_events.append(RoutingEvent.for_ticket(ticket, team))
+
+    def _store_classifications(self, results: Dict[UUID, ClassificationResult]) -> List[Ticket]:
+        """Apply classification results to a fresh, locked read of the tickets and store them; returns the stored tickets."""
+        if not results:
+            return []
+        stats_changes: Counter = Counter()
+        routing_events: List[RoutingEvent] = []
+        with self.repository.atomic():
+            tickets = self.repository.get_many(list(results), for_update=True)
+            classified = [tickets[ticket_id] for ticket_id in results if ticket_id in tickets]
+            for ticket in classified:
+                self._apply_classification(ticket, results[ticket.id], stats_changes, routing_events)
+            self._store_many(self.repository.update_classifications, classified, stats_changes, routing_events)
+        return classified
+
+    def _store_many(
+        self,
+        write: Callable[[Sequence[Ticket]], int],
+        tickets: List[Ticket],
+        stats_changes: Counter,
+        routing_events: Sequence[RoutingEvent] = (),
+    ) -> None:
+        """Write updated tickets with their routing events and counters in one transaction."""
+        if not tickets:
+            return
+        with self.repository.atomic():
+            write(tickets)
+            if self.routing_outbox is not None and routing_events:
+                self.routing_outbox.add_many(routing_events)
+            if self.ticket_stats is not None:
+                self.ticket_stats.apply(stats_changes)
+
+    def _record_routing(self, ticket: Ticket, team: Optional[str]) -> None:
+        """Queue the ticket's routing event when routing is configured."""
+        if self.routing_outbox is not None and team is not None:
+            self.routing_outbox.add(RoutingEvent.for_ticket(ticket, team))
+
+    def _record_stats(self, ticket: Ticket, previous_key: Optional[TicketStatsKey]) -> None:
+        """Apply the ticket's counter changes when statistics are configured."""
+        if self.ticket_stats is not None:
+            self.ticket_stats.apply(self._stats_changes(previous_key, ticket))
+
+    @staticmethod
+    def _stats_changes(previous_key: Optional[TicketStatsKey], ticket: Ticket) -> Dict[TicketStatsKey, int]:
+        """Move the ticket from its previous counter bucket to its current one."""
+        current_key = TicketStatsKey.for_ticket(ticket)
+        changes = {current_key: 1}
+        if previous_key is not None:
+            changes[previous_key] = changes.get(previous_key, 0) - 1
+        return changes
+
+    def _record_usage(self, classified: Iterable[Tuple[Ticket, ClassificationResult]]) -> None:
+        """Log the provider usage of classifications; accounting problems never fail the operation."""
+        if self.usage_repository is None:
+            return
+        records = [(ticket.id, result.usage) for ticket, result in classified if result.usage is not None]
+        if not records:
+            return
+        try:
+            self.usage_repository.add_many(records)
+        except Exception as e:
+            logger.error(f"Failed to record classification usage for {len(records)} tickets: {e}")
+
+    def _publish(self, event_type: TicketEventType, ticket: Ticket) -> None:
+        """Publish a ticket event; delivery problems never fail the operation."""
+        if self.event_bus is None:
+            return
+        try:
+            self.event_bus.publish(TicketEvent.for_ticket(event_type, ticket))
+        except Exception as e:
+            logger.error(f"Failed to publish {event_type.value} for ticket {ticket.id}: {e}")
+
     def _to_response_dto(
         self,
         ticket: Ticket,
         classification: Optional[ClassificationResultDTO],
+        duplicate: bool = False,
     ) -> TicketResponseDTO:
         """Convert domain entity to response DTO."""
         classification_dto = classification
@@ -185,4 +554,5 @@ class TicketService:
             created_at=ticket.created_at,
             updated_at=ticket.updated_at,
             classification=classification_dto,
+            duplicate=duplicate,
         )
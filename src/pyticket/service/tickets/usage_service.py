@@ -0,0 +1,76 @@
+"""Classification usage and cost service"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Mapping, Optional
+
+from pyticket.infrastructure.repositories.interfaces import IClassificationUsageRepository, TicketUsageTotals, UsageTotals
+from pyticket.service.tickets.dtos import TicketUsageDTO, UsageReportDTO, UsageSummaryDTO
+
+# Prices are per million tokens
+TOKENS_PER_PRICE_UNIT = 1_000_000
+
+
+class ClassificationUsageService:
+    """Service reporting token usage and estimated cost of classifications"""
+
+    def __init__(self, usage_repository: IClassificationUsageRepository, prices: Optional[Mapping[str, Mapping[str, float]]] = None):
+        """
+        Initialize usage service.
+
+        Args:
+            usage_repository: Per-classification usage log
+            prices: Model -> {"prompt": price, "completion": price} per million tokens
+        """
+        self.usage_repository = usage_repository
+        self.prices = prices or {}
+
+    def get_report(self, days: int = 7, top: int = 10) -> UsageReportDTO:
+        """
+        Get usage per day, provider and model, and the most expensive tickets.
+
+        Args:
+            days: Number of days to report, including today
+            top: Number of tickets in the top list
+        """
+        now = datetime.now(timezone.utc)
+        since = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=max(days, 1) - 1)
+        by_day = [self._summary(totals) for totals in self.usage_repository.totals_by_day(since)]
+        return UsageReportDTO(
+            since=since,
+            total_tokens=sum(summary.total_tokens for summary in by_day),
+            estimated_cost=round(sum(summary.estimated_cost or 0.0 for summary in by_day), 6),
+            by_day=by_day,
+            top_tickets=[self._ticket_usage(totals) for totals in self.usage_repository.top_tickets(since, top)] if top > 0 else [],
+        )
+
+    def estimate_cost(self, model: str, prompt_tokens: int, completion_tokens: int) -> Optional[float]:
+        """Estimate the cost of tokens of a model, None when the model has no price."""
+        price = self.prices.get(model)
+        if price is None:
+            return None
+        cost = prompt_tokens * price.get("prompt", 0.0) + completion_tokens * price.get("completion", 0.0)
+        return round(cost / TOKENS_PER_PRICE_UNIT, 6)
+
+    def _summary(self, totals: UsageTotals) -> UsageSummaryDTO:
+        """Convert day totals to a summary with latency and cost."""
+        return UsageSummaryDTO(
+            day=totals.day,
+            provider=totals.provider,
+            model=totals.model,
+            classifications=totals.classifications,
+            prompt_tokens=totals.prompt_tokens,
+            completion_tokens=totals.completion_tokens,
+            total_tokens=totals.prompt_tokens + totals.completion_tokens,
+            avg_latency_ms=round(totals.latency_seconds * 1000 / max(totals.classifications, 1), 1),
+            estimated_cost=self.estimate_cost(totals.model, totals.prompt_tokens, totals.completion_tokens),
+        )
+
+    @staticmethod
+    def _ticket_usage(totals: TicketUsageTotals) -> TicketUsageDTO:
+        return TicketUsageDTO(
+            ticket_id=totals.ticket_id,
+            classifications=totals.classifications,
+            prompt_tokens=totals.prompt_tokens,
+            completion_tokens=totals.completion_tokens,
+            total_tokens=totals.prompt_tokens + totals.completion_tokens,
+        )
@@ -1 +1,25 @@
 """Common shared file for supplementary utils"""
+
+import gc
+from contextlib import contextmanager
+from typing import Iterator
+
+
+@contextmanager
+def startup_gc() -> Iterator[None]:
+    """
+    Pause garbage collection while the application boots, then freeze what it loaded.
+
+    Importing the apps builds a large graph of long-lived objects (LangChain,
+    the OpenAI SDK, pydantic models) that would otherwise be rescanned by
+    every full collection during startup and later requests. Frozen objects
+    also stay untouched in forked workers, so their pages remain shared.
+    """
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.freeze()
+        if was_enabled:
+            gc.enable()
@@ -0,0 +1,198 @@
+"""Cold-start profiling of the web entrypoints
+
+Run as ``python -X importtime -m pyticket.utils.startup <wsgi|asgi> <path>``
+it is the probe: it boots the app phase by phase in a fresh interpreter,
+serves one request and prints the phase timings as JSON. profile_startup()
+runs the probe and parses its output.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+ENTRYPOINTS = ("wsgi", "asgi")
+PROBE_HOST = "localhost"
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One line of ``-X importtime`` output (times in microseconds)"""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass
+class StartupProfile:
+    """Cold start of one entrypoint"""
+
+    entrypoint: str
+    path: str
+    status: int
+    phases: Dict[str, float]  # Phase -> seconds, in boot order
+    process_seconds: float  # Wall time of the whole probe process, interpreter start included
+    imports: List[ImportTiming]
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(self.phases.values())
+
+    def slowest_imports(self, top: int) -> List[ImportTiming]:
+        """Top-level imports (those not triggered by another import) by cumulative time."""
+        roots = [timing for timing in self.imports if timing.depth == 0]
+        return sorted(roots, key=lambda timing: timing.cumulative_us, reverse=True)[:top]
+
+    def package_totals(self, top: int) -> List[Tuple[str, int]]:
+        """Self import time summed per top-level package, largest first."""
+        totals: Counter = Counter()
+        for timing in self.imports:
+            totals[timing.module.split(".")[0]] += timing.self_us
+        return totals.most_common(top)
+
+
+def parse_importtime(output: str) -> List[ImportTiming]:
+    """
+    Parse the ``-X importtime`` report written to stderr.
+
+    Lines look like ``import time:   self [us] | cumulative | imported package``
+    with the package name indented two spaces per nesting level; anything
+    else (the header, warnings) is skipped.
+    """
+    timings = (_parse_importtime_line(line) for line in output.splitlines())
+    return [timing for timing in timings if timing is not None]
+
+
+def _parse_importtime_line(line: str) -> Optional[ImportTiming]:
+    """Parse one line of the -X importtime report, None if it is not a timing."""
+    if not line.startswith("import time:"):
+        return None
+    fields = line[len("import time:") :].split("|")
+    if len(fields) != 3 or not fields[0].strip().isdigit():
+        return None
+    name = fields[2].rstrip()
+    module = name.lstrip()
+    return ImportTiming(module, int(fields[0]), int(fields[1]), (len(name) - len(module) - 1) // 2)
+
+
+def profile_startup(entrypoint: str = "wsgi", path: str = "/api/tickets/stats") -> StartupProfile:
+    """
+    Profile a cold start of an entrypoint in a fresh interpreter.
+
+    Args:
+        entrypoint: "wsgi" or "asgi"
+        path: Path of the first request (GET)
+
+    Returns:
+        Phase timings, first response status and the import-time report
+
+    Raises:
+        ValueError: If the entrypoint is unknown
+        RuntimeError: If the probe process fails
+    """
+    if entrypoint not in ENTRYPOINTS:
+        raise ValueError(f"Unknown entrypoint: {entrypoint}. Supported entrypoints: {', '.join(ENTRYPOINTS)}")
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", "pyticket.configurator.settings"),
+        "PYTHONPATH": os.pathsep.join(entry for entry in sys.path if entry),
+    }
+    command = [sys.executable, "-X", "importtime", "-m", __name__, entrypoint, path]
+    started = time.perf_counter()
+    completed = subprocess.run(command, env=env, capture_output=True, text=True)
+    process_seconds = time.perf_counter() - started
+    if completed.returncode != 0:
+        errors = [line for line in completed.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError(f"Startup probe failed: {' '.join(errors[-3:])}")
+    report = json.loads(completed.stdout.strip().splitlines()[-1])
+    return StartupProfile(entrypoint, path, report["status"], report["phases"], process_seconds, parse_importtime(completed.stderr))
+
+
+def _wsgi_request(application, path: str) -> int:
+    """Serve a GET request through a WSGI application; return the status code."""
+    from wsgiref.util import setup_testing_defaults
+
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": path, "HTTP_HOST": PROBE_HOST}
+    setup_testing_defaults(environ)
+    statuses = []
+    response = application(environ, lambda status, headers, exc_info=None: statuses.append(int(status.split()[0])))
+    try:
+        b"".join(response)
+    finally:
+        getattr(response, "close", lambda: None)()
+    return statuses[0]
+
+
+def _asgi_request(application, path: str) -> int:
+    """Serve a GET request through an ASGI application; return the status code."""
+    import asyncio
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", PROBE_HOST.encode())],
+        "server": (PROBE_HOST, 80),
+        "client": ("127.0.0.1", 0),
+    }
+    statuses = []
+    requests = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if requests:
+            return requests.pop()
+        await asyncio.Event().wait()  # Stay connected: Django drops the response on http.disconnect
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+
+    asyncio.run(application(scope, receive, send))
+    return statuses[0]
+
+
+def _probe(entrypoint: str, path: str) -> None:
+    """Boot the app one phase at a time and serve a first request (run in a fresh interpreter)."""
+    import importlib
+
+    phases: Dict[str, float] = {}
+    mark = time.perf_counter()
+
+    def lap(phase: str) -> None:
+        nonlocal mark
+        now = time.perf_counter()
+        phases[phase], mark = now - mark, now
+
+    from django.conf import settings
+
+    settings.INSTALLED_APPS  # Imports the settings module (and reads .env)
+    lap("settings")
+
+    application = importlib.import_module(f"pyticket.entrypoints.web.{entrypoint}").application
+    lap(f"app registry ({entrypoint}.py)")
+
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns  # Imports the URLconf and builds the API routers, as the first request would
+    lap("url resolution")
+
+    status = (_wsgi_request if entrypoint == "wsgi" else _asgi_request)(application, path)
+    lap("first request")
+
+    print(json.dumps({"status": status, "phases": phases}))
+
+
+if __name__ == "__main__":
+    _probe(*sys.argv[1:3])
@@ -9,16 +9,27 @@ from django.conf import settings
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "pyticket.configurator.settings")
 django.setup()
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 from uuid import uuid4
 
 import pytest
+from django.core.cache import caches
 
 from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+from pyticket.infrastructure.ai.factory import AIClassificationServiceFactory
 from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult
+from pyticket.infrastructure.ratelimit.factory import RateLimiterFactory
 from pyticket.infrastructure.repositories.interfaces import ITicketRepository
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with empty caches and fresh rate limit counters."""
+    caches["default"].clear()
+    RateLimiterFactory.reset()
+    AIClassificationServiceFactory.reset()
+
+
 @pytest.fixture
 def sample_ticket():
     """Create a sample ticket for testing."""
@@ -59,5 +70,5 @@ def mock_ai_service():
 @pytest.fixture
 def mock_repository():
     """Create a mock ticket repository."""
-    repository = Mock(spec=ITicketRepository)
+    repository = MagicMock(spec=ITicketRepository)
     return repository
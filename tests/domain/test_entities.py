@@ -56,6 +56,12 @@ class TestTicket:
         with pytest.raises(ValueError):
             sample_ticket.update_status(TicketStatus.CLOSED)
 
+    def test_ticket_is_slotted(self, sample_ticket):
+        """Test that tickets do not carry a per-instance __dict__."""
+        assert not hasattr(sample_ticket, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_ticket.unknown_attribute = "value"
+
 
 class TestCategory:
     """Tests for Category enum"""
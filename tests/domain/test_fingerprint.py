@@ -0,0 +1,37 @@
+"""Tests for ticket content fingerprints"""
+
+import pytest
+
+from pyticket.domain.tickets.fingerprint import TicketFingerprint
+
+DESCRIPTION = "My card was declined when paying the October invoice, the checkout page shows an error"
+
+
+class TestTicketFingerprint:
+    """Tests for TicketFingerprint"""
+
+    def test_exact_duplicate_ignores_case_punctuation_and_spacing(self):
+        """Test that normalized text gets the same digest."""
+        original = TicketFingerprint.of("Payment failed", DESCRIPTION)
+        resubmitted = TicketFingerprint.of("payment  FAILED!", DESCRIPTION.upper().replace(",", ""))
+
+        assert resubmitted.digest == original.digest
+        assert resubmitted.similarity(original) == 1.0
+
+    def test_near_duplicate_is_similar(self):
+        """Test that a small edit keeps a high similarity and other content a low one."""
+        original = TicketFingerprint.of("Payment failed", DESCRIPTION)
+        edited = TicketFingerprint.of("Payment failed", DESCRIPTION + " again")
+        unrelated = TicketFingerprint.of("Login broken", "Cannot sign into the dashboard since this morning")
+
+        assert edited.digest != original.digest
+        assert edited.similarity(original) > 0.7
+        assert unrelated.similarity(original) < 0.2
+
+    def test_stored_form_round_trip(self):
+        """Test that a fingerprint is rebuilt from its stored form."""
+        fingerprint = TicketFingerprint.of("Payment failed", DESCRIPTION)
+
+        assert TicketFingerprint.from_stored(fingerprint.digest, fingerprint.signature_hex) == fingerprint
+        with pytest.raises(ValueError):
+            TicketFingerprint.from_stored(fingerprint.digest, "abc")
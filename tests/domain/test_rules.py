@@ -0,0 +1,58 @@
+"""Tests for ticket rule tables"""
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+from pyticket.domain.tickets.rules import DEFAULT_RULES, get_rules, set_rules
+from pyticket.domain.tickets.services import TicketClassificationService, TicketRoutingService
+
+
+@pytest.fixture
+def restore_rules():
+    """Restore the active rules after the test."""
+    rules = get_rules()
+    yield
+    set_rules(rules)
+
+
+class TestTicketRules:
+    """Tests for TicketRules"""
+
+    def test_with_config_merges_overrides(self):
+        """Test that configured entries replace only their own keys."""
+        rules = DEFAULT_RULES.with_config(
+            {
+                "transitions": {"CLOSED": ["OPEN"]},
+                "default_priorities": {"BILLING": "URGENT"},
+                "teams": {"BILLING": "finance"},
+                "default_team": "helpdesk",
+            }
+        )
+
+        assert rules.transitions[TicketStatus.CLOSED] == frozenset({TicketStatus.OPEN})
+        assert rules.transitions[TicketStatus.OPEN] == DEFAULT_RULES.transitions[TicketStatus.OPEN]
+        assert rules.default_priority_for(Category.BILLING) == Priority.URGENT
+        assert rules.team_for(Category.BILLING) == "finance"
+        assert rules.team_for(Category.TECHNICAL) == "technical-support"
+        assert rules.team_for(None) == "helpdesk"
+        assert DEFAULT_RULES.team_for(Category.BILLING) == "billing-team"
+
+    def test_with_config_rejects_unknown_values(self):
+        """Test that typos in the configuration are reported."""
+        with pytest.raises(ValueError):
+            DEFAULT_RULES.with_config({"team": {"BILLING": "finance"}})
+        with pytest.raises(ValueError):
+            DEFAULT_RULES.with_config({"teams": {"BILLINGS": "finance"}})
+        with pytest.raises(ValueError):
+            DEFAULT_RULES.with_config({"transitions": {"OPEN": ["DONE"]}})
+
+    def test_set_rules_applies_everywhere(self, restore_rules):
+        """Test that activated rules drive the entity and the domain services."""
+        set_rules(DEFAULT_RULES.with_config({"transitions": {"CLOSED": ["OPEN"]}, "teams": {"BILLING": "finance"}}))
+        ticket = Ticket(title="Reopen", description="Closed too early", status=TicketStatus.CLOSED)
+
+        ticket.update_status(TicketStatus.OPEN)
+
+        assert ticket.status == TicketStatus.OPEN
+        assert TicketRoutingService.get_team_for_category(Category.BILLING) == "finance"
+        assert TicketClassificationService.get_default_priority_for_category(Category.BILLING) == Priority.HIGH
@@ -2,8 +2,15 @@
 
 import pytest
 
-from pyticket.domain.tickets.entities import Category, Priority
-from pyticket.domain.tickets.services import TicketClassificationService, TicketRoutingService
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.domain.tickets.services import (
+    compile_routing_rules,
+    get_routing_rules,
+    set_routing_rules,
+    TicketClassificationService,
+    TicketRoutingService,
+    TicketUrgencyEstimator,
+)
 
 
 class TestTicketClassificationService:
@@ -34,3 +41,119 @@ class TestTicketRoutingService:
         assert TicketRoutingService.get_team_for_category(Category.FEATURE_REQUEST) == "product-team"
         assert TicketRoutingService.get_team_for_category(Category.BUG_REPORT) == "engineering-team"
         assert TicketRoutingService.get_team_for_category(Category.GENERAL) == "customer-support"
+
+
+@pytest.fixture
+def restore_routing_rules():
+    """Restore the active routing rules after the test."""
+    rules = get_routing_rules()
+    yield
+    set_routing_rules(rules)
+
+
+def _ticket(title="Question", description="Something happened", category=None, priority=None):
+    ticket = Ticket(title=title, description=description)
+    if category is not None:
+        ticket.classify(category, priority)
+    return ticket
+
+
+class TestRoutingRules:
+    """Tests for routing rules"""
+
+    def test_first_matching_rule_wins(self):
+        """Test rule order and enum conditions."""
+        rules = compile_routing_rules(
+            [
+                {"team": "vip-billing", "categories": ["BILLING"], "priorities": ["URGENT"]},
+                {"team": "billing-ops", "categories": ["BILLING"]},
+            ]
+        )
+
+        assert rules.match(_ticket(category=Category.BILLING, priority=Priority.URGENT)).team == "vip-billing"
+        assert rules.match(_ticket(category=Category.BILLING, priority=Priority.LOW)).team == "billing-ops"
+        assert rules.match(_ticket(category=Category.TECHNICAL, priority=Priority.LOW)) is None
+        assert rules.match(_ticket()) is None
+
+    def test_keywords_match_whole_words(self):
+        """Test keyword matching, including keywords contained in longer ones."""
+        rules = compile_routing_rules(
+            [
+                {"team": "refund-desk", "keywords": ["refund request"]},
+                {"team": "payments", "keywords": ["refund", "chargeback"]},
+                {"team": "security", "keywords": ["2FA", "phishing"]},
+            ]
+        )
+
+        assert rules.match(_ticket(description="Please process my Refund Request")).team == "refund-desk"
+        assert rules.match(_ticket(description="Where is my refund?")).team == "payments"
+        assert rules.match(_ticket(title="2fa codes not arriving")).team == "security"
+        assert rules.match(_ticket(description="refunds and 2factor")) is None
+
+        only_short = compile_routing_rules([{"team": "payments", "keywords": ["refund"]}, {"team": "x", "keywords": ["refund request"]}])
+        assert only_short.match(_ticket(description="my refund request")).team == "payments"
+
+    def test_customer_tier(self):
+        """Test that tier rules only match tickets routed with that tier."""
+        rules = compile_routing_rules([{"team": "enterprise-desk", "customer_tiers": ["enterprise"]}])
+
+        assert rules.match(_ticket(), customer_tier="enterprise").team == "enterprise-desk"
+        assert rules.match(_ticket(), customer_tier="free") is None
+        assert rules.match(_ticket()) is None
+
+    def test_compiled_matches_reference_evaluation(self):
+        """Test that compiled evaluation agrees with evaluating each rule directly."""
+        configs = [
+            {"team": f"team-{index}", "categories": [category.value], "keywords": [f"word{index}", f"word{index} extra"]}
+            for index, category in enumerate(list(Category) * 4)
+        ] + [{"team": "urgent", "priorities": ["URGENT"]}]
+        rules = compile_routing_rules(configs)
+        tickets = [
+            _ticket(description=f"text word{index} extra word{index + 3}", category=category, priority=priority)
+            for index, (category, priority) in enumerate((c, p) for c in Category for p in Priority)
+        ]
+
+        for ticket in tickets:
+            expected = next((rule for rule in rules.rules if rule.matches(ticket)), None)
+            assert rules.match(ticket) == expected
+
+    def test_invalid_rule(self):
+        """Test that invalid rules are reported with their position."""
+        with pytest.raises(ValueError, match="Routing rule 1"):
+            compile_routing_rules([{"team": "a"}, {"team": "b", "categories": ["NOPE"]}])
+        with pytest.raises(ValueError):
+            compile_routing_rules([{"categories": ["BILLING"]}])
+
+    def test_route_falls_back_to_category_team(self, restore_routing_rules):
+        """Test routing with active rules and the category fallback."""
+        set_routing_rules(compile_routing_rules([{"team": "security", "keywords": ["phishing"]}]))
+
+        assert (
+            TicketRoutingService.route(_ticket(description="Phishing mail", category=Category.GENERAL, priority=Priority.LOW)) == "security"
+        )
+        assert TicketRoutingService.route(_ticket(category=Category.BILLING, priority=Priority.LOW)) == "billing-team"
+
+
+class TestTicketUrgencyEstimator:
+    """Tests for TicketUrgencyEstimator"""
+
+    def test_most_urgent_keyword_wins(self):
+        """Test that the most urgent matching keyword decides."""
+        estimator = TicketUrgencyEstimator()
+
+        assert estimator.estimate("Outage", "Checkout fails with an error") == Priority.URGENT
+        assert estimator.estimate("Payment", "I was charged twice") == Priority.HIGH
+        assert estimator.estimate("Feature request", "Dark mode would be nice") == Priority.LOW
+
+    def test_default_without_keywords(self):
+        """Test that tickets without keywords get the default priority."""
+        assert TicketUrgencyEstimator().estimate("Hello", "Some text") == Priority.MEDIUM
+
+    def test_from_config(self):
+        """Test building an estimator from configured keywords."""
+        estimator = TicketUrgencyEstimator.from_config({"URGENT": ["Pager"], "LOW": ["newsletter"]})
+
+        assert estimator.estimate("pager went off", "") == Priority.URGENT
+        assert estimator.estimate("Outage", "") == Priority.MEDIUM
+        with pytest.raises(ValueError):
+            TicketUrgencyEstimator.from_config({"NOPE": ["x"]})
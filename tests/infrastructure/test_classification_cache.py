@@ -0,0 +1,91 @@
+"""Tests for the persistent classification cache"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.infrastructure.ai import prompts
+from pyticket.infrastructure.ai.cache import CachedClassificationService, SqliteClassificationCache
+from pyticket.infrastructure.ai.factory import AIClassificationServiceFactory
+from pyticket.infrastructure.ai.interfaces import ClassificationResult
+
+RESULT = ClassificationResult(Category.BILLING, Priority.HIGH, 0.9, "Invoice issue")
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache.sqlite3"
+
+
+class TestSqliteClassificationCache:
+    """Tests for SqliteClassificationCache"""
+
+    def test_shared_between_instances(self, cache_path):
+        """Test that results written by one process-like instance are read by another."""
+        SqliteClassificationCache(cache_path).set("key", RESULT)
+
+        assert SqliteClassificationCache(cache_path, memory_entries=0).get("key") == RESULT
+        assert SqliteClassificationCache(cache_path).get("missing") is None
+
+    def test_evicts_oldest_beyond_max_entries(self, cache_path):
+        """Test size-bounded eviction."""
+        cache = SqliteClassificationCache(cache_path, max_entries=2, memory_entries=0)
+        for key in ("a", "b", "c"):
+            cache.set(key, RESULT)
+
+        assert [cache.get(key) is not None for key in ("a", "b", "c")] == [False, True, True]
+
+    def test_warm_start_loads_newest_results(self, cache_path):
+        """Test that warm start fills the in-process cache from the file."""
+        writer = SqliteClassificationCache(cache_path)
+        for key in ("a", "b", "c"):
+            writer.set(key, RESULT)
+
+        cache = SqliteClassificationCache(cache_path, memory_entries=2, warm_start=True)
+        cache.get("c")
+
+        assert list(cache._memory) == ["b", "c"]
+
+
+class TestCachedClassificationService:
+    """Tests for CachedClassificationService"""
+
+    def test_provider_called_once_per_prompt_and_model(self, cache_path):
+        """Test that repeated tickets are served from the cache, keyed by model and prompt version."""
+        provider = Mock()
+        provider.classify_ticket.return_value = RESULT
+        cache = SqliteClassificationCache(cache_path)
+        service = CachedClassificationService(provider, cache, model="model-a", prompt_version="1")
+
+        service.classify_ticket(Ticket(title="Invoice", description="Charged twice"))
+        result = service.classify_ticket(Ticket(title="Invoice", description="Charged twice"))
+        CachedClassificationService(provider, cache, model="model-b", prompt_version="1").classify_ticket(
+            Ticket(title="Invoice", description="Charged twice")
+        )
+
+        assert result == RESULT
+        assert provider.classify_ticket.call_count == 2
+
+    def test_prompt_change_invalidates_key(self, cache_path, monkeypatch):
+        """Test that editing the prompt template changes the cache key without a version bump."""
+        service = CachedClassificationService(Mock(), SqliteClassificationCache(cache_path), model="model-a", prompt_version="1")
+        ticket = Ticket(title="Invoice", description="Charged twice")
+        before = service.cache_key(ticket)
+
+        monkeypatch.setattr(prompts, "PROMPT_TEMPLATE_HASH", "changed")
+
+        assert service.cache_key(ticket) != before
+
+
+class TestFactoryCache:
+    """Tests for the factory's shared classification cache"""
+
+    def test_one_cache_per_file(self, cache_path, settings, mock_ai_service):
+        """Test that services created for the same file share one cache instance."""
+        settings.AI_CACHE_FILE = str(cache_path)
+
+        first = AIClassificationServiceFactory._with_cache(mock_ai_service)
+        second = AIClassificationServiceFactory._with_cache(mock_ai_service)
+
+        assert first.cache is second.cache
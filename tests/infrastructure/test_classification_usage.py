@@ -0,0 +1,45 @@
+"""Tests for the classification usage repository"""
+
+from datetime import timedelta
+from uuid import uuid4
+
+import pytest
+from django.utils import timezone
+
+from pyticket.infrastructure.ai.interfaces import ClassificationUsage
+from pyticket.infrastructure.models.models import ClassificationUsageModel
+from pyticket.infrastructure.repositories.django_classification_usage_repository import DjangoClassificationUsageRepository
+
+
+def _usage(model: str, prompt_tokens: int, completion_tokens: int) -> ClassificationUsage:
+    return ClassificationUsage("OPENAI", model, prompt_tokens, completion_tokens, latency_seconds=0.5)
+
+
+@pytest.mark.django_db
+class TestDjangoClassificationUsageRepository:
+    """Tests for DjangoClassificationUsageRepository"""
+
+    def test_totals_by_day_and_top_tickets(self):
+        """Test aggregation per day/provider/model and per ticket."""
+        repository = DjangoClassificationUsageRepository()
+        expensive, cheap = uuid4(), uuid4()
+        repository.add_many(
+            [
+                (expensive, _usage("gpt-4o", 900, 100)),
+                (expensive, _usage("gpt-4o-mini", 400, 100)),
+                (cheap, _usage("gpt-4o-mini", 100, 20)),
+            ]
+        )
+        old = uuid4()
+        repository.add_many([(old, _usage("gpt-4o", 10_000, 10_000))])
+        ClassificationUsageModel.objects.filter(ticket_id=old).update(created_at=timezone.now() - timedelta(days=30))
+
+        since = timezone.now() - timedelta(days=1)
+        totals = {total.model: total for total in repository.totals_by_day(since)}
+        top = repository.top_tickets(since, limit=1)
+
+        assert set(totals) == {"gpt-4o", "gpt-4o-mini"}
+        assert totals["gpt-4o-mini"].classifications == 2
+        assert (totals["gpt-4o-mini"].prompt_tokens, totals["gpt-4o-mini"].completion_tokens) == (500, 120)
+        assert totals["gpt-4o-mini"].latency_seconds == pytest.approx(1.0)
+        assert [(ticket.ticket_id, ticket.classifications, ticket.prompt_tokens) for ticket in top] == [(expensive, 2, 1300)]
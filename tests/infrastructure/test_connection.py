@@ -0,0 +1,35 @@
+"""Tests for database connection tuning"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from django.db import connection
+
+from pyticket.infrastructure.models.connection import apply_sqlite_pragmas, configure_sqlite_connection
+
+
+@pytest.mark.django_db
+class TestSQLiteConnectionTuning:
+    """Tests for SQLite PRAGMA tuning"""
+
+    def test_pragmas_applied_to_connection(self, settings):
+        """Test that configured PRAGMAs are active on the connection."""
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            synchronous = cursor.fetchone()[0]
+            cursor.execute("PRAGMA busy_timeout")
+            busy_timeout = cursor.fetchone()[0]
+
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == settings.SQLITE_PRAGMAS["busy_timeout"]
+
+    def test_invalid_pragma_rejected(self):
+        """Test that PRAGMA names and values are validated."""
+        with pytest.raises(ValueError, match="Invalid SQLite PRAGMA"):
+            apply_sqlite_pragmas(MagicMock(), {"journal_mode": "WAL; DROP TABLE tickets"})
+
+    def test_other_vendors_ignored(self):
+        """Test that non-SQLite connections are not touched."""
+        other = MagicMock(vendor="postgresql")
+        configure_sqlite_connection(sender=None, connection=other)
+        other.cursor.assert_not_called()
@@ -0,0 +1,88 @@
+"""Tests for event bus implementations"""
+
+import threading
+from uuid import uuid4
+
+from pyticket.domain.tickets.entities import TicketStatus
+from pyticket.domain.tickets.events import TicketEvent, TicketEventType
+from pyticket.infrastructure.events.in_memory_bus import InMemoryTicketEventBus
+
+
+def _event(ticket_id=None, event_type=TicketEventType.STATUS_CHANGED):
+    return TicketEvent(event_type=event_type, ticket_id=ticket_id or uuid4(), status=TicketStatus.OPEN)
+
+
+class TestInMemoryTicketEventBus:
+    """Tests for InMemoryTicketEventBus"""
+
+    def test_publish_to_all_subscribers(self):
+        """Test that subscribers without a filter receive every event."""
+        bus = InMemoryTicketEventBus()
+        subscription = bus.subscribe()
+        event = _event()
+
+        bus.publish(event)
+
+        assert subscription.get(timeout=0.1) == event
+
+    def test_subscription_filters_by_ticket(self):
+        """Test that ticket subscriptions only receive their ticket's events."""
+        bus = InMemoryTicketEventBus()
+        ticket_id = uuid4()
+        subscription = bus.subscribe(ticket_id)
+
+        bus.publish(_event())
+        bus.publish(_event(ticket_id))
+
+        assert subscription.get(timeout=0.1).ticket_id == ticket_id
+        assert subscription.get(timeout=0.01) is None
+
+    def test_slow_subscriber_drops_oldest(self):
+        """Test that a full subscriber queue drops the oldest event."""
+        bus = InMemoryTicketEventBus(max_pending=2)
+        subscription = bus.subscribe()
+        events = [_event() for _ in range(3)]
+
+        for event in events:
+            bus.publish(event)
+
+        assert subscription.get(timeout=0.1) == events[1]
+        assert subscription.get(timeout=0.1) == events[2]
+
+    def test_concurrent_publishers_never_overflow(self):
+        """Test that concurrent publishers to a full subscriber only drop events, never fail."""
+        bus = InMemoryTicketEventBus(max_pending=1)
+        subscription = bus.subscribe()
+        errors = []
+
+        def publish():
+            try:
+                for _ in range(500):
+                    bus.publish(_event())
+            except Exception as e:
+                errors.append(e)
+
+        publishers = [threading.Thread(target=publish) for _ in range(4)]
+        for thread in publishers:
+            thread.start()
+        while any(thread.is_alive() for thread in publishers):
+            subscription.get(timeout=0.001)
+        for thread in publishers:
+            thread.join()
+
+        last = _event()
+        bus.publish(last)
+
+        assert errors == []
+        assert subscription.get(timeout=0.1) == last
+
+    def test_close_unsubscribes(self):
+        """Test that closed subscriptions stop receiving events."""
+        bus = InMemoryTicketEventBus()
+        subscription = bus.subscribe()
+
+        subscription.close()
+        bus.publish(_event())
+
+        assert bus.subscriber_count == 0
+        assert subscription.get(timeout=0.01) is None
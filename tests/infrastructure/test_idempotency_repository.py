@@ -0,0 +1,67 @@
+"""Tests for the idempotency key repository"""
+
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from pyticket.infrastructure.models.models import IdempotencyKeyModel
+from pyticket.infrastructure.repositories.django_idempotency_repository import DjangoIdempotencyRepository
+
+
+def _claim(repository: DjangoIdempotencyRepository, key: str, fingerprint: str = "abc"):
+    now = timezone.now()
+    return repository.claim(key, fingerprint, expired_before=now - timedelta(days=1), stale_before=now - timedelta(minutes=5))
+
+
+@pytest.mark.django_db
+class TestDjangoIdempotencyRepository:
+    """Tests for DjangoIdempotencyRepository"""
+
+    def test_claim_complete_and_replay(self):
+        """Test that a claimed key is held until completed and then returns its response."""
+        repository = DjangoIdempotencyRepository()
+
+        assert _claim(repository, "user:1:key") is None
+        in_progress = _claim(repository, "user:1:key")
+        repository.complete("user:1:key", 202, b'{"id": 1}', "application/json")
+        completed = _claim(repository, "user:1:key")
+
+        assert not in_progress.completed
+        assert completed.completed
+        assert (completed.fingerprint, completed.status_code, completed.body) == ("abc", 202, b'{"id": 1}')
+
+    def test_release_lets_key_run_again(self):
+        """Test that a released key can be claimed again but a completed one is kept."""
+        repository = DjangoIdempotencyRepository()
+        _claim(repository, "released")
+        _claim(repository, "completed")
+        repository.complete("completed", 200, b"{}", "application/json")
+
+        repository.release("released")
+        repository.release("completed")
+
+        assert _claim(repository, "released") is None
+        assert _claim(repository, "completed").completed
+
+    def test_expired_and_stale_keys_are_replaced(self):
+        """Test that expired responses and abandoned claims do not hold their key."""
+        repository = DjangoIdempotencyRepository()
+        _claim(repository, "expired")
+        repository.complete("expired", 200, b"{}", "application/json")
+        _claim(repository, "stale")
+        IdempotencyKeyModel.objects.filter(key="expired").update(created_at=timezone.now() - timedelta(days=2))
+        IdempotencyKeyModel.objects.filter(key="stale").update(created_at=timezone.now() - timedelta(minutes=10))
+
+        assert _claim(repository, "expired", "new") is None
+        assert _claim(repository, "stale", "new") is None
+
+    def test_purge(self):
+        """Test that purging deletes only old records."""
+        repository = DjangoIdempotencyRepository()
+        _claim(repository, "old")
+        _claim(repository, "recent")
+        IdempotencyKeyModel.objects.filter(key="old").update(created_at=timezone.now() - timedelta(days=2))
+
+        assert repository.purge(timezone.now() - timedelta(days=1)) == 1
+        assert list(IdempotencyKeyModel.objects.values_list("key", flat=True)) == ["recent"]
@@ -0,0 +1,20 @@
+"""Tests for job checkpoint stores"""
+
+from pyticket.infrastructure.jobs.checkpoints import FileJobCheckpointStore
+
+
+class TestFileJobCheckpointStore:
+    """Tests for FileJobCheckpointStore"""
+
+    def test_save_load_clear(self, tmp_path):
+        """Test the checkpoint lifecycle of a job."""
+        store = FileJobCheckpointStore(tmp_path / "checkpoints")
+
+        assert store.load("job") is None
+        store.save("job", {"last_id": "a", "processed": 1})
+        store.save("job", {"last_id": "b", "processed": 2})
+        assert store.load("job") == {"last_id": "b", "processed": 2}
+
+        store.clear("job")
+        assert store.load("job") is None
+        store.clear("job")
@@ -0,0 +1,103 @@
+"""Tests for password hashing"""
+
+import threading
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import get_hasher, make_password
+
+from pyticket.infrastructure.auth.passwords import authenticate_user, PasswordHashingOverloadedError, PasswordHashingPool
+
+User = get_user_model()
+
+
+@pytest.fixture
+def fast_hashing(settings):
+    """Use a cheap PBKDF2 cost so tests do not spend seconds hashing."""
+    settings.PASSWORD_PBKDF2_ITERATIONS = 1000
+
+
+@pytest.fixture
+def pool():
+    """Create a hashing pool with one thread."""
+    pool = PasswordHashingPool(workers=1, max_pending=0)
+    yield pool
+    pool.shutdown()
+
+
+class TestPasswordHashers:
+    """Tests for the configurable hashers"""
+
+    def test_pbkdf2_cost_from_settings(self, fast_hashing):
+        """Test that new hashes use the configured iterations."""
+        assert make_password("secret").startswith("pbkdf2_sha256$1000$")
+
+    def test_scrypt_profile(self, settings):
+        """Test selecting scrypt with a tuned work factor."""
+        settings.PASSWORD_HASHERS = [
+            "pyticket.infrastructure.auth.hashers.ScryptPasswordHasher",
+            "pyticket.infrastructure.auth.hashers.PBKDF2PasswordHasher",
+        ]
+        settings.PASSWORD_SCRYPT_WORK_FACTOR = 2**10
+
+        assert get_hasher().decode(make_password("secret"))["work_factor"] == 2**10
+
+
+class TestPasswordHashingPool:
+    """Tests for PasswordHashingPool"""
+
+    def test_runs_on_pool_thread(self, pool):
+        """Test that work runs on a hashing thread."""
+        assert pool.run(lambda: threading.current_thread().name).startswith("password-hashing")
+
+    def test_inline_without_workers(self):
+        """Test that 0 workers hash on the calling thread."""
+        assert PasswordHashingPool().run(threading.current_thread) is threading.current_thread()
+
+    def test_overloaded(self, pool):
+        """Test that calls beyond workers + max_pending are refused."""
+        started, release = threading.Event(), threading.Event()
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        caller = threading.Thread(target=pool.run, args=(block,))
+        caller.start()
+        started.wait(5)
+        try:
+            with pytest.raises(PasswordHashingOverloadedError):
+                pool.run(lambda: None)
+        finally:
+            release.set()
+            caller.join()
+        assert pool.run(lambda: "free again") == "free again"
+
+
+@pytest.mark.django_db
+class TestAuthenticateUser:
+    """Tests for authenticate_user"""
+
+    def test_valid_and_invalid_credentials(self, pool, fast_hashing):
+        """Test checking credentials like ModelBackend."""
+        user = User.objects.create_user(username="alice", password="securepass123")
+
+        assert authenticate_user(pool, "alice", "securepass123") == user
+        assert authenticate_user(pool, "alice", "wrong") is None
+        assert authenticate_user(pool, "nobody", "securepass123") is None
+
+    def test_inactive_user(self, pool, fast_hashing):
+        """Test that inactive users cannot log in."""
+        User.objects.create_user(username="alice", password="securepass123", is_active=False)
+
+        assert authenticate_user(pool, "alice", "securepass123") is None
+
+    def test_rehash_with_new_cost(self, pool, settings, fast_hashing):
+        """Test that a hash with an outdated cost is replaced on login."""
+        User.objects.create_user(username="alice", password="securepass123")
+        settings.PASSWORD_PBKDF2_ITERATIONS = 2000
+
+        user = authenticate_user(pool, "alice", "securepass123")
+
+        user.refresh_from_db()
+        assert user.password.startswith("pbkdf2_sha256$2000$")
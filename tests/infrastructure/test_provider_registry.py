@@ -0,0 +1,39 @@
+"""Tests for the AI provider registry"""
+
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from pyticket.infrastructure.ai.registry import AIProviderRegistry
+
+
+class TestAIProviderRegistry:
+    """Tests for AIProviderRegistry"""
+
+    def test_providers_are_imported_on_first_use(self):
+        """Test that a provider registered by path is only imported when requested."""
+        module = "pyticket.infrastructure.ai.providers.anthropic_provider"
+        sys.modules.pop(module, None)
+        registry = AIProviderRegistry({"ANTHROPIC": f"{module}.AnthropicClassificationService"})
+
+        assert "ANTHROPIC" in registry.names()
+        assert module not in sys.modules
+        assert registry.get("anthropic").__name__ == "AnthropicClassificationService"
+        assert module in sys.modules
+
+    def test_register_factory_and_settings(self, settings):
+        """Test registering a factory directly and providers configured in settings."""
+        service = Mock()
+        registry = AIProviderRegistry({})
+        registry.register("local", lambda: service)
+        settings.AI_PROVIDERS = {"custom": "unittest.mock.Mock"}
+
+        assert registry.create("LOCAL") is service
+        assert registry.get("CUSTOM") is Mock
+        assert registry.names() == ["CUSTOM", "LOCAL"]
+
+    def test_unknown_provider(self):
+        """Test that unknown providers are reported with the known names."""
+        with pytest.raises(ValueError, match="Supported providers: OPENAI"):
+            AIProviderRegistry({"OPENAI": "x.Y"}).get("NOPE")
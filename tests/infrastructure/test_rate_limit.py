@@ -0,0 +1,72 @@
+"""Tests for the rate limiters"""
+
+import pytest
+from django.core.cache.backends.locmem import LocMemCache
+
+from pyticket.infrastructure.ratelimit.cache import CacheRateLimiter
+from pyticket.infrastructure.ratelimit.in_memory import InMemoryRateLimiter
+from pyticket.infrastructure.ratelimit.interfaces import RateLimit, RateLimitResult
+
+
+@pytest.mark.parametrize(
+    "rate, expected",
+    [("30/minute", RateLimit(30, 60)), ("5/10s", RateLimit(5, 10)), (" 2/Hour ", RateLimit(2, 3600)), ("", None), ("0/day", None)],
+)
+def test_parse_rate(rate, expected):
+    """Test parsing rates."""
+    assert RateLimit.parse(rate) == expected
+
+
+def test_parse_invalid_rate():
+    """Test that malformed rates are rejected."""
+    with pytest.raises(ValueError, match="Invalid rate"):
+        RateLimit.parse("30/fortnight")
+
+
+@pytest.fixture(params=["memory", "cache"])
+def limiter_and_clock(request):
+    """Create each rate limiter backend with a controllable clock."""
+    now = [100.0]
+    if request.param == "memory":
+        limiter = InMemoryRateLimiter(clock=lambda: now[0])
+    else:
+        limiter = CacheRateLimiter(LocMemCache(f"test-rate-limit-{id(now)}", {}), clock=lambda: now[0])
+    return limiter, now
+
+
+class TestRateLimiters:
+    """Tests shared by the rate limiter backends"""
+
+    def test_limit_per_window(self, limiter_and_clock):
+        """Test that hits beyond the limit are refused until the window ends."""
+        limiter, now = limiter_and_clock
+        rate = RateLimit(2, 60)
+
+        assert limiter.hit("alice", rate) == RateLimitResult(True, 2, 1, 20)
+        assert limiter.hit("alice", rate) == RateLimitResult(True, 2, 0, 20)
+        assert limiter.hit("alice", rate) == RateLimitResult(False, 2, 0, 20)
+        assert limiter.hit("bob", rate).allowed
+
+        now[0] = 121.0
+        assert limiter.hit("alice", rate).allowed
+
+    def test_rates_count_separately(self, limiter_and_clock):
+        """Test that the same key counts separately per window length."""
+        limiter, _ = limiter_and_clock
+
+        assert limiter.hit("alice", RateLimit(1, 60)).allowed
+        assert limiter.hit("alice", RateLimit(1, 3600)).allowed
+
+
+def test_in_memory_prunes_expired_counters():
+    """Test that the in-memory limiter keeps at most max_keys counters."""
+    now = [0.0]
+    limiter = InMemoryRateLimiter(max_keys=2, clock=lambda: now[0])
+    rate = RateLimit(1, 10)
+    limiter.hit("a", rate)
+    limiter.hit("b", rate)
+
+    now[0] = 15.0
+    limiter.hit("c", rate)
+
+    assert len(limiter._counters) == 1
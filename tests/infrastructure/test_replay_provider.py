@@ -0,0 +1,90 @@
+"""Tests for the record/replay AI provider"""
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.domain.tickets.exceptions import ClassificationError
+from pyticket.infrastructure.ai.factory import AIClassificationServiceFactory
+from pyticket.infrastructure.ai.interfaces import Recording
+from pyticket.infrastructure.ai.providers.replay_provider import RecordingAssistant, ReplayAssistant, ReplayClassificationService
+from pyticket.infrastructure.ai.recordings import SqliteRecordingStore
+
+RESPONSE = json.dumps({"category": "BILLING", "priority": "HIGH", "confidence_score": 0.9, "reasoning": "Invoice issue"})
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SqliteRecordingStore(tmp_path / "recordings.sqlite3")
+
+
+class TestRecordReplay:
+    """Tests for recording and replaying assistant responses"""
+
+    def test_records_responses_with_latency_and_tokens(self, store):
+        """Test that the recording assistant stores what the real assistant returned."""
+        message = Mock(usage_metadata={"input_tokens": 120, "output_tokens": 30})
+        real_assistant = Mock(spec=["invoke", "get_model"])
+        real_assistant.invoke.return_value = {"output": RESPONSE, "messages": [Mock(usage_metadata=None), message]}
+        assistant = RecordingAssistant(real_assistant, store)
+
+        assert assistant.run("Title: Invoice") == RESPONSE
+        recording = store.get("Title: Invoice")
+        assert recording.response == RESPONSE
+        assert recording.latency_seconds >= 0
+        assert (recording.prompt_tokens, recording.completion_tokens) == (120, 30)
+        assert store.get("Title: Other") is None
+
+    def test_replays_with_scaled_latency(self, store):
+        """Test that replay waits the scaled recorded latency."""
+        store.add("prompt", Recording(response=RESPONSE, latency_seconds=2.0))
+        sleep = Mock()
+
+        assert ReplayAssistant(store, latency_scale=0.5, sleep=sleep).run("prompt") == RESPONSE
+        sleep.assert_called_once_with(1.0)
+        with pytest.raises(LookupError):
+            ReplayAssistant(store, sleep=sleep).run("unknown")
+
+    def test_replay_service_classifies_from_recordings(self, store):
+        """Test classification through the replay service."""
+        ticket = Ticket(title="Invoice", description="Charged twice")
+        store.add(f"Title: {ticket.title}\n\nDescription: {ticket.description}", Recording(RESPONSE, 0.0))
+        service = ReplayClassificationService(store, latency_scale=0)
+
+        result = service.classify_ticket(ticket)
+
+        assert (result.category, result.priority) == (Category.BILLING, Priority.HIGH)
+        assert (result.usage.provider, result.usage.prompt_tokens) == ("REPLAY", 0)
+        with pytest.raises(ClassificationError):
+            service.classify_ticket(Ticket(title="New", description="Never recorded"))
+
+    def test_factory_selects_replay(self, settings, tmp_path):
+        """Test that AI_PROVIDER=REPLAY creates the replay service."""
+        settings.AI_PROVIDER = "REPLAY"
+        settings.AI_REPLAY_MODE = "REPLAY"
+        settings.AI_REPLAY_FILE = str(tmp_path / "recordings.sqlite3")
+
+        assert isinstance(AIClassificationServiceFactory.create(), ReplayClassificationService)
+
+    def test_factory_reuses_recording_store(self, settings, tmp_path):
+        """Test that replay services created for the same file share one store."""
+        settings.AI_PROVIDER = "REPLAY"
+        settings.AI_REPLAY_MODE = "REPLAY"
+        settings.AI_REPLAY_FILE = str(tmp_path / "recordings.sqlite3")
+
+        assert AIClassificationServiceFactory.create().assistant.store is AIClassificationServiceFactory.create().assistant.store
+
+    def test_replay_does_not_import_provider_sdks(self):
+        """Test that the replay provider loads without the OpenAI/LangChain stack."""
+        code = (
+            "import sys\n"
+            "import pyticket.infrastructure.ai.providers.replay_provider\n"
+            "assert 'django_ai_assistant' not in sys.modules\n"
+            "assert 'pyticket.infrastructure.ai.providers.openai_provider' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True, env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)})
@@ -1,10 +1,12 @@
 """Tests for repository implementations"""
 
+from datetime import datetime, timedelta, timezone
 from uuid import uuid4
 
 import pytest
 
 from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+from pyticket.domain.tickets.fingerprint import TicketFingerprint
 from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
 
 
@@ -86,3 +88,202 @@ class TestDjangoTicketRepository:
 
         retrieved = repository.get_by_id(saved.id)
         assert retrieved is None
+
+    def test_list_after_pages_by_id(self):
+        """Test keyset iteration over all tickets."""
+        repository = DjangoTicketRepository()
+        ids = sorted(repository.save(Ticket(title=f"Ticket {i}", description="Test")).id for i in range(5))
+
+        first_page = repository.list_after(None, 3)
+        second_page = repository.list_after(first_page[-1].id, 3)
+
+        assert [ticket.id for ticket in first_page + second_page] == ids
+        assert repository.list_after(ids[-1], 3) == []
+        assert repository.count() == 5
+
+    def test_claim_unclassified(self):
+        """Test that old unclassified tickets are claimed oldest first, and only once until the claim goes stale."""
+        repository = DjangoTicketRepository()
+        now = datetime.now(timezone.utc)
+        older = repository.save(Ticket(title="Older", description="Test", created_at=now - timedelta(hours=2)))
+        old = repository.save(Ticket(title="Old", description="Test", created_at=now - timedelta(hours=1)))
+        classified = Ticket(title="Classified", description="Test", created_at=now - timedelta(hours=1))
+        classified.classify(Category.BILLING, Priority.LOW)
+        repository.save(classified)
+        repository.save(Ticket(title="New", description="Test"))
+
+        assert [ticket.id for ticket in repository.claim_unclassified(now - timedelta(minutes=5), 1)] == [older.id]
+        assert [ticket.id for ticket in repository.claim_unclassified(now - timedelta(minutes=5), 10)] == [old.id]
+        assert repository.claim_unclassified(now - timedelta(minutes=5), 10) == []
+        stale = [ticket.id for ticket in repository.claim_unclassified(datetime.now(timezone.utc) + timedelta(seconds=1), 2)]
+        assert stale[:1] == [older.id]
+
+    def test_get_many(self):
+        """Test loading several tickets at once."""
+        repository = DjangoTicketRepository()
+        saved = [repository.save(Ticket(title=f"Ticket {i}", description="Test")) for i in range(2)]
+
+        tickets = repository.get_many([saved[0].id, saved[1].id, uuid4()])
+
+        assert set(tickets) == {saved[0].id, saved[1].id}
+        assert tickets[saved[1].id].title == "Ticket 1"
+
+    def test_update_classifications(self):
+        """Test that bulk classification updates leave a concurrently changed status alone."""
+        repository = DjangoTicketRepository()
+        tickets = [repository.save(Ticket(title=f"Ticket {i}", description="Test")) for i in range(3)]
+        closed = repository.get_by_id(tickets[0].id)
+        closed.update_status(TicketStatus.CLOSED)
+        repository.update(closed)
+        for ticket in tickets:
+            ticket.classify(Category.BILLING, Priority.LOW)
+
+        assert repository.update_classifications(tickets) == 3
+
+        retrieved = [repository.get_by_id(ticket.id) for ticket in tickets]
+        assert [(ticket.category, ticket.priority) for ticket in retrieved] == [(Category.BILLING, Priority.LOW)] * 3
+        assert retrieved[0].status == TicketStatus.CLOSED
+
+    def test_update_statuses(self):
+        """Test that bulk status updates leave a concurrent classification alone."""
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Ticket", description="Test"))
+        classified = repository.get_by_id(ticket.id)
+        classified.classify(Category.BILLING, Priority.LOW)
+        repository.update(classified)
+        ticket.update_status(TicketStatus.IN_PROGRESS)
+
+        assert repository.update_statuses([ticket]) == 1
+
+        retrieved = repository.get_by_id(ticket.id)
+        assert (retrieved.status, retrieved.category) == (TicketStatus.IN_PROGRESS, Category.BILLING)
+
+
+@pytest.mark.django_db
+class TestDjangoTicketRepositorySearch:
+    """Tests for DjangoTicketRepository.search"""
+
+    def test_search_matches_title_and_description(self):
+        """Test that search finds words in title and description."""
+        repository = DjangoTicketRepository()
+        login = repository.save(Ticket(title="Cannot login", description="Password rejected"))
+        billing = repository.save(Ticket(title="Invoice wrong", description="Charged twice after login"))
+        repository.save(Ticket(title="Dark mode", description="Please add a theme"))
+
+        page = repository.search("login")
+
+        assert [ticket.id for ticket in page.tickets] == [login.id, billing.id]
+        assert page.next_cursor is None
+
+    def test_search_paginates_with_cursor(self):
+        """Test keyset pagination returns every match exactly once."""
+        repository = DjangoTicketRepository()
+        saved = {repository.save(Ticket(title=f"Outage {index}", description="Dashboard is down")).id for index in range(5)}
+
+        first = repository.search("outage", limit=2)
+        second = repository.search("outage", limit=2, cursor=first.next_cursor)
+        third = repository.search("outage", limit=2, cursor=second.next_cursor)
+
+        found = [ticket.id for page in (first, second, third) for ticket in page.tickets]
+        assert len(found) == 5
+        assert set(found) == saved
+        assert third.next_cursor is None
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """Test that the index is kept in sync with the tickets table."""
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Refund request", description="Money back"))
+
+        ticket.title = "Chargeback request"
+        repository.update(ticket)
+        assert repository.search("refund").tickets == []
+        assert len(repository.search("chargeback").tickets) == 1
+
+        repository.delete(ticket.id)
+        assert repository.search("chargeback").tickets == []
+
+    def test_search_ignores_query_syntax(self):
+        """Test that FTS operators in user input do not break the query."""
+        repository = DjangoTicketRepository()
+        repository.save(Ticket(title="Error 500", description="API returns error"))
+
+        assert len(repository.search('error" (500*').tickets) == 1
+
+    def test_search_invalid_cursor(self):
+        """Test that malformed cursors are rejected."""
+        with pytest.raises(ValueError, match="Invalid search cursor"):
+            DjangoTicketRepository().search("error", cursor="not-a-cursor")
+
+    def test_find_duplicate(self):
+        """Test that exact and near duplicates are found within the window only."""
+        repository = DjangoTicketRepository()
+        description = "My card was declined when paying the October invoice, the checkout page shows an error"
+        old = Ticket(title="Payment failed", description=description, created_at=datetime.utcnow() - timedelta(hours=2))
+        repository.save(old)
+        recent = repository.save(Ticket(title="Payment failed", description=description))
+        repository.save(Ticket(title="Login broken", description="Cannot sign into the dashboard"))
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+
+        exact = repository.find_duplicate(TicketFingerprint.of("PAYMENT FAILED", description + "!"), since)
+        near = TicketFingerprint.of("Payment failed", description + " again")
+
+        assert exact.id == recent.id
+        assert repository.find_duplicate(near, since) is None
+        assert repository.find_duplicate(near, since, threshold=0.7).id == recent.id
+        assert repository.find_duplicate(TicketFingerprint.of("Other", "Unrelated text"), since, threshold=0.7) is None
+
+    def test_soft_delete_hides_ticket(self):
+        """Test that a deleted ticket stays in the table but is left out of reads."""
+        from pyticket.infrastructure.models.models import TicketModel
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Refund request", description="Money back"))
+
+        assert repository.delete(ticket.id) is True
+        assert repository.delete(ticket.id) is False
+        assert TicketModel.objects.filter(id=ticket.id, deleted_at__isnull=False).exists()
+        assert repository.get_many([ticket.id]) == {}
+        assert repository.list_all() == []
+        assert repository.count() == 0
+        assert repository.search("refund").tickets == []
+
+    def test_archive_moves_old_closed_and_deleted_tickets(self):
+        """Test that archival moves old CLOSED and deleted tickets in chunks and keeps them readable on request."""
+        from pyticket.infrastructure.models.models import TicketModel
+
+        repository = DjangoTicketRepository()
+        closed = [repository.save(Ticket(title=f"Closed {i}", description="Done", status=TicketStatus.CLOSED)) for i in range(3)]
+        deleted = repository.save(Ticket(title="Deleted", description="Spam"))
+        repository.delete(deleted.id)
+        recently_closed = repository.save(Ticket(title="Recent", description="Done", status=TicketStatus.CLOSED))
+        open_ticket = repository.save(Ticket(title="Open", description="Waiting"))
+        old = datetime.now(timezone.utc) - timedelta(days=100)
+        TicketModel.objects.exclude(id=recently_closed.id).update(updated_at=old, deleted_at=None)
+        TicketModel.objects.filter(id=deleted.id).update(deleted_at=old)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=90)
+
+        moved = [repository.archive(cutoff, limit=3), repository.archive(cutoff, limit=3), repository.archive(cutoff, limit=3)]
+
+        assert moved == [3, 1, 0]
+        assert set(TicketModel.objects.values_list("id", flat=True)) == {recently_closed.id, open_ticket.id}
+        assert repository.get_by_id(closed[0].id) is None
+        assert repository.get_by_id(closed[0].id, include_archived=True).title == "Closed 0"
+        assert repository.get_by_id(deleted.id, include_archived=True) is None
+        assert {ticket.id for ticket in repository.list_archived()} == {ticket.id for ticket in closed}
+        assert repository.search("closed").tickets == []
+
+    def test_archive_overwrites_existing_archive_row(self):
+        """Test that a ticket already in the archive is replaced by its newer hot row, not lost."""
+        from pyticket.infrastructure.models.models import TicketArchiveModel, TicketModel
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Current", description="Done", status=TicketStatus.CLOSED))
+        TicketArchiveModel.objects.create(
+            id=ticket.id, title="Stale", description="Old copy", status="OPEN", created_at=ticket.created_at, updated_at=ticket.updated_at
+        )
+
+        assert repository.archive(datetime.now(timezone.utc) + timedelta(seconds=1), limit=10) == 1
+
+        assert not TicketModel.objects.filter(id=ticket.id).exists()
+        archived = repository.get_by_id(ticket.id, include_archived=True)
+        assert (archived.title, archived.status) == ("Current", TicketStatus.CLOSED)
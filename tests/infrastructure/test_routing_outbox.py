@@ -0,0 +1,79 @@
+"""Tests for the routing outbox"""
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.infrastructure.models.models import RoutingOutboxModel, TicketModel
+from pyticket.infrastructure.repositories.django_routing_outbox import DjangoRoutingOutbox
+from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+from pyticket.infrastructure.routing.sinks import JsonlFileRoutingSink
+
+
+def _classified_ticket():
+    ticket = Ticket(title="Payment failed", description="Card declined")
+    ticket.classify(Category.BILLING, Priority.HIGH)
+    return ticket
+
+
+@pytest.mark.django_db
+class TestDjangoRoutingOutbox:
+    """Tests for DjangoRoutingOutbox"""
+
+    def test_add_and_fetch_pending(self):
+        """Test that added events are returned as pending."""
+        outbox = DjangoRoutingOutbox()
+        ticket = _classified_ticket()
+        outbox.add(RoutingEvent.for_ticket(ticket, "billing-team"))
+
+        pending = outbox.fetch_pending(limit=10, max_attempts=5)
+
+        assert len(pending) == 1
+        assert pending[0].id is not None
+        assert pending[0].ticket_id == ticket.id
+        assert pending[0].team == "billing-team"
+        assert pending[0].priority == Priority.HIGH
+
+    def test_mark_dispatched_and_failed(self):
+        """Test that dispatched and exhausted events are no longer pending."""
+        outbox = DjangoRoutingOutbox()
+        outbox.add(RoutingEvent.for_ticket(_classified_ticket(), "billing-team"))
+        outbox.add(RoutingEvent.for_ticket(_classified_ticket(), "billing-team"))
+        first, second = outbox.fetch_pending(limit=10, max_attempts=5)
+
+        outbox.mark_dispatched([first.id])
+        outbox.mark_failed([second.id], "sink down")
+
+        assert [event.id for event in outbox.fetch_pending(limit=10, max_attempts=5)] == [second.id]
+        assert outbox.fetch_pending(limit=10, max_attempts=1) == []
+        assert RoutingOutboxModel.objects.get(id=second.id).last_error == "sink down"
+
+    def test_atomic_rolls_back_ticket_and_event(self):
+        """Test that the ticket and its routing event are written atomically."""
+        outbox = DjangoRoutingOutbox()
+        repository = DjangoTicketRepository()
+        ticket = _classified_ticket()
+
+        with pytest.raises(RuntimeError):
+            with repository.atomic():
+                repository.save(ticket)
+                outbox.add(RoutingEvent.for_ticket(ticket, "billing-team"))
+                raise RuntimeError("crash before commit")
+
+        assert not TicketModel.objects.filter(id=ticket.id).exists()
+        assert not RoutingOutboxModel.objects.exists()
+
+
+class TestJsonlFileRoutingSink:
+    """Tests for JsonlFileRoutingSink"""
+
+    def test_send_appends_lines(self, tmp_path):
+        """Test that each event becomes one JSON line."""
+        path = tmp_path / "routing.jsonl"
+        sink = JsonlFileRoutingSink(path)
+        events = [RoutingEvent.for_ticket(_classified_ticket(), "billing-team") for _ in range(2)]
+
+        sink.send("billing-team", events)
+        sink.send("billing-team", events[:1])
+
+        assert len(path.read_text().splitlines()) == 3
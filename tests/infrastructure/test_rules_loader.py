@@ -0,0 +1,79 @@
+"""Tests for loading ticket rules from settings"""
+
+import json
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+
+from pyticket.domain.tickets.entities import Category
+from pyticket.domain.tickets.rules import get_rules
+from pyticket.domain.tickets.services import get_routing_rules, set_routing_rules
+from pyticket.infrastructure.rules.loader import configure_ticket_rules, load_routing_rules, load_ticket_rules
+from pyticket.infrastructure.rules.watcher import RoutingRulesWatcher
+
+
+class TestLoadTicketRules:
+    """Tests for load_ticket_rules"""
+
+    def test_file_then_setting_overrides(self, settings, tmp_path):
+        """Test that the TICKET_RULES setting is applied on top of the rules file."""
+        rules_file = tmp_path / "rules.json"
+        rules_file.write_text(json.dumps({"teams": {"BILLING": "finance", "GENERAL": "helpdesk"}}))
+        settings.TICKET_RULES_FILE = str(rules_file)
+        settings.TICKET_RULES = {"teams": {"GENERAL": "frontdesk"}}
+
+        rules = load_ticket_rules()
+
+        assert rules.team_for(Category.BILLING) == "finance"
+        assert rules.team_for(Category.GENERAL) == "frontdesk"
+
+    def test_invalid_rules_are_improperly_configured(self, settings):
+        """Test that invalid rules fail loudly and keep the active rules."""
+        active = get_rules()
+        settings.TICKET_RULES = {"teams": {"UNKNOWN": "nobody"}}
+
+        with pytest.raises(ImproperlyConfigured):
+            configure_ticket_rules()
+
+        assert get_rules() is active
+
+
+@pytest.fixture
+def restore_routing_rules():
+    """Restore the active routing rules after the test."""
+    rules = get_routing_rules()
+    yield
+    set_routing_rules(rules)
+
+
+class TestRoutingRulesLoading:
+    """Tests for loading and reloading routing rules"""
+
+    def test_file_rules_come_first(self, settings, tmp_path):
+        """Test that file rules are evaluated before the setting's rules."""
+        rules_file = tmp_path / "routing.json"
+        rules_file.write_text(json.dumps([{"team": "from-file", "categories": ["BILLING"]}]))
+        settings.TICKET_ROUTING_RULES_FILE = str(rules_file)
+        settings.TICKET_ROUTING_RULES = [{"team": "from-settings"}]
+
+        rules = load_routing_rules()
+
+        assert [rule.team for rule in rules.rules] == ["from-file", "from-settings"]
+
+    def test_watcher_reloads_changed_file(self, settings, tmp_path, restore_routing_rules):
+        """Test hot reload and that an invalid file keeps the previous rules."""
+        rules_file = tmp_path / "routing.json"
+        rules_file.write_text(json.dumps([{"team": "first"}]))
+        settings.TICKET_ROUTING_RULES_FILE = str(rules_file)
+        settings.TICKET_ROUTING_RULES = []
+        watcher = RoutingRulesWatcher(str(rules_file))
+
+        assert watcher.check() is False
+
+        rules_file.write_text(json.dumps([{"team": "second"}, {"team": "third"}]))
+        assert watcher.check() is True
+        assert [rule.team for rule in get_routing_rules().rules] == ["second", "third"]
+
+        rules_file.write_text("[{broken")
+        assert watcher.check() is False
+        assert [rule.team for rule in get_routing_rules().rules] == ["second", "third"]
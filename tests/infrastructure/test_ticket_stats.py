@@ -0,0 +1,67 @@
+"""Tests for the ticket counters"""
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket, TicketStatus
+from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+from pyticket.infrastructure.repositories.django_ticket_stats_repository import DjangoTicketStatsRepository
+from pyticket.infrastructure.repositories.interfaces import TicketStatsKey
+
+
+@pytest.mark.django_db
+class TestDjangoTicketStatsRepository:
+    """Tests for DjangoTicketStatsRepository"""
+
+    def test_apply_accumulates_deltas(self):
+        """Test that deltas are added to existing counters."""
+        stats = DjangoTicketStatsRepository()
+        open_key = TicketStatsKey(TicketStatus.OPEN)
+        closed_key = TicketStatsKey(TicketStatus.CLOSED, Category.BILLING, Priority.HIGH)
+
+        stats.apply({open_key: 2, closed_key: 1})
+        stats.apply({open_key: -1})
+
+        assert sorted(stats.snapshot(), key=lambda item: item[0].status.value) == [(closed_key, 1), (open_key, 1)]
+
+    def test_snapshot_skips_empty_counters(self):
+        """Test that counters dropping to zero are not reported."""
+        stats = DjangoTicketStatsRepository()
+        key = TicketStatsKey(TicketStatus.OPEN)
+
+        stats.apply({key: 1})
+        stats.apply({key: -1})
+
+        assert stats.snapshot() == []
+
+    def test_rebuild_recounts_tickets(self):
+        """Test that rebuild replaces drifted counters with real counts."""
+        repository = DjangoTicketRepository()
+        stats = DjangoTicketStatsRepository()
+        classified = Ticket(title="Invoice", description="Wrong amount")
+        classified.classify(Category.BILLING, Priority.HIGH)
+        repository.save(classified)
+        repository.save(Ticket(title="Hello", description="Question"))
+        repository.save(Ticket(title="Hi", description="Another question"))
+        stats.apply({TicketStatsKey(TicketStatus.CLOSED): 7})
+
+        count = stats.rebuild()
+
+        assert count == 3
+        assert dict(stats.snapshot()) == {
+            TicketStatsKey(TicketStatus.OPEN, Category.BILLING, Priority.HIGH): 1,
+            TicketStatsKey(TicketStatus.OPEN): 2,
+        }
+
+    def test_rebuild_counts_archived_and_skips_deleted(self):
+        """Test that archived tickets stay counted and deleted ones do not."""
+        from datetime import datetime, timedelta, timezone
+
+        repository = DjangoTicketRepository()
+        stats = DjangoTicketStatsRepository()
+        repository.save(Ticket(title="Closed", description="Done", status=TicketStatus.CLOSED))
+        deleted = repository.save(Ticket(title="Spam", description="Spam"))
+        repository.delete(deleted.id)
+        repository.archive(datetime.now(timezone.utc) + timedelta(seconds=1), limit=10)
+
+        assert stats.rebuild() == 1
+        assert dict(stats.snapshot()) == {TicketStatsKey(TicketStatus.CLOSED): 1}
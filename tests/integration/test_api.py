@@ -109,6 +109,70 @@ class TestAuthAPI:
         assert response.status_code == 401
         assert "error" in response.json()
 
+    def test_login_rate_limited(self, api_client, settings):
+        """Test that login attempts beyond the limit are refused with Retry-After."""
+        settings.LOGIN_RATE_LIMIT_ATTEMPTS = 2
+        credentials = {"username": "nonexistent", "password": "wrongpass"}
+
+        for _ in range(2):
+            assert api_client.post("/api/auth/login", data=credentials, content_type="application/json").status_code == 401
+        response = api_client.post("/api/auth/login", data=credentials, content_type="application/json")
+
+        assert response.status_code == 429
+        assert int(response["Retry-After"]) >= 1
+
+    def test_token_pair_shares_login_rate_limit(self, api_client, settings):
+        """Test that /token/pair counts against the same login limit as /auth/login."""
+        settings.LOGIN_RATE_LIMIT_ATTEMPTS = 2
+        settings.LOGIN_RATE_LIMIT_WINDOW_SECONDS = 86400  # No window boundary between the attempts
+        credentials = {"username": "nonexistent", "password": "wrongpass"}
+
+        assert api_client.post("/api/auth/login", data=credentials, content_type="application/json").status_code == 401
+        assert api_client.post("/api/token/pair", data=credentials, content_type="application/json").status_code == 401
+        response = api_client.post("/api/token/pair", data=credentials, content_type="application/json")
+
+        assert response.status_code == 429
+        assert int(response["Retry-After"]) >= 1
+
+    def test_register_hashing_overloaded(self, api_client):
+        """Test that registration answers 429 when the password hashing pool is full."""
+        from unittest.mock import Mock, patch
+
+        from pyticket.infrastructure.auth.passwords import PasswordHashingOverloadedError
+
+        hashing = Mock()
+        hashing.make_password.side_effect = PasswordHashingOverloadedError(3)
+        with patch("pyticket.entrypoints.web.api.auth.endpoints.get_password_hashing", return_value=hashing):
+            response = api_client.post(
+                "/api/auth/register",
+                data={"username": "busyuser", "password": "securepass123"},
+                content_type="application/json",
+            )
+
+        assert response.status_code == 429
+        assert response["Retry-After"] == "3"
+        assert not User.objects.filter(username="busyuser").exists()
+
+    def test_token_endpoints(self, api_client):
+        """Test obtaining, refreshing and verifying JWT tokens."""
+        User.objects.create_user(username="tokenuser", password="securepass123")
+
+        response = api_client.post(
+            "/api/token/pair",
+            data={"username": "tokenuser", "password": "securepass123"},
+            content_type="application/json",
+        )
+        assert response.status_code == 200
+        tokens = response.json()
+        assert tokens["username"] == "tokenuser"
+
+        response = api_client.post("/api/token/refresh", data={"refresh": tokens["refresh"]}, content_type="application/json")
+        assert response.status_code == 200
+        assert "access" in response.json()
+
+        response = api_client.post("/api/token/verify", data={"token": tokens["access"]}, content_type="application/json")
+        assert response.status_code == 200
+
 
 @pytest.mark.django_db
 class TestTicketAPI:
@@ -144,3 +208,378 @@ class TestTicketAPI:
         # Both indicate the endpoint is protected (404 means route not found without auth)
         # Let's check for either 401 (unauthorized) or 404 (not found)
         assert response.status_code in [401, 404], f"Expected 401 or 404, got {response.status_code}"
+
+
+@pytest.mark.django_db
+class TestTicketSearchAPI:
+    """Integration tests for ticket search"""
+
+    def test_search_tickets(self, authenticated_client):
+        """Test searching tickets through the API."""
+        from unittest.mock import patch
+
+        from pyticket.domain.tickets.entities import Ticket
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Payment failed", description="Card declined"))
+        service = TicketService(repository, None)
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_service", return_value=service):
+            response = authenticated_client.get("/api/tickets/search", {"q": "payment"})
+            bad_cursor = authenticated_client.get("/api/tickets/search", {"q": "payment", "cursor": "broken"})
+
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == [str(ticket.id)]
+        assert response.json()["next_cursor"] is None
+        assert bad_cursor.status_code == 400
+
+
+@pytest.mark.django_db
+class TestTicketStatsAPI:
+    """Integration tests for ticket statistics"""
+
+    def test_stats_follow_ticket_changes(self, authenticated_client):
+        """Test that statistics reflect created and updated tickets."""
+        from pyticket.domain.tickets.entities import Ticket
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.infrastructure.repositories.django_ticket_stats_repository import DjangoTicketStatsRepository
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Payment failed", description="Card declined"))
+        DjangoTicketStatsRepository().rebuild()
+        service = TicketService(repository, None, ticket_stats=DjangoTicketStatsRepository())
+        service.update_ticket_status(ticket.id, TicketStatus.CLOSED)
+
+        response = authenticated_client.get("/api/tickets/stats")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert data["by_status"] == {"CLOSED": 1}
+        assert data["backlog_by_team"] == {}
+        assert data["buckets"] == [{"status": "CLOSED", "category": None, "priority": None, "count": 1}]
+
+    def test_stats_requires_auth(self, api_client):
+        """Test that statistics require authentication."""
+        response = api_client.get("/api/tickets/stats")
+        assert response.status_code == 401
+
+
+@pytest.mark.django_db
+class TestClassificationUsageAPI:
+    """Integration tests for classification usage accounting"""
+
+    def test_usage_report(self, authenticated_client):
+        """Test that logged usage is reported per day and model with a cost estimate."""
+        from uuid import uuid4
+
+        from pyticket.infrastructure.ai.interfaces import ClassificationUsage
+        from pyticket.infrastructure.repositories.django_classification_usage_repository import DjangoClassificationUsageRepository
+
+        ticket_id = uuid4()
+        DjangoClassificationUsageRepository().add_many([(ticket_id, ClassificationUsage("OPENAI", "gpt-4o-mini", 1_000_000, 0, 1.5))])
+
+        response = authenticated_client.get("/api/tickets/usage?days=1&top=3")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_tokens"] == 1_000_000
+        assert data["by_day"][0]["model"] == "gpt-4o-mini"
+        assert data["by_day"][0]["avg_latency_ms"] == 1500.0
+        assert data["by_day"][0]["estimated_cost"] == pytest.approx(0.15)
+        assert data["top_tickets"] == [
+            {
+                "ticket_id": str(ticket_id),
+                "classifications": 1,
+                "prompt_tokens": 1_000_000,
+                "completion_tokens": 0,
+                "total_tokens": 1_000_000,
+            }
+        ]
+
+
+@pytest.mark.django_db
+class TestTicketBulkStatusAPI:
+    """Integration tests for batch status updates"""
+
+    def test_bulk_status_update(self, authenticated_client):
+        """Test closing several tickets in one request."""
+        from unittest.mock import patch
+        from uuid import uuid4
+
+        from pyticket.domain.tickets.entities import Ticket
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        repository = DjangoTicketRepository()
+        open_ticket = repository.save(Ticket(title="Open", description="Still open"))
+        closed_ticket = repository.save(Ticket(title="Closed", description="Done", status=TicketStatus.CLOSED))
+        missing_id = uuid4()
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_service", return_value=TicketService(repository, None)):
+            response = authenticated_client.patch(
+                "/api/tickets/status",
+                data={"ticket_ids": [str(open_ticket.id), str(closed_ticket.id), str(missing_id)], "status": "CLOSED"},
+                content_type="application/json",
+            )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [(result["ticket_id"], result["updated"]) for result in results] == [
+            (str(open_ticket.id), True),
+            (str(closed_ticket.id), False),
+            (str(missing_id), False),
+        ]
+        assert repository.get_by_id(open_ticket.id).status == TicketStatus.CLOSED
+
+    def test_bulk_status_invalid_status(self, authenticated_client):
+        """Test that an unknown status is rejected."""
+        response = authenticated_client.patch(
+            "/api/tickets/status",
+            data={"ticket_ids": [], "status": "DONE"},
+            content_type="application/json",
+        )
+
+        assert response.status_code == 400
+
+
+@pytest.mark.django_db
+class TestTicketIngestionAPI:
+    """Integration tests for ticket ingestion admission control"""
+
+    def test_create_ticket_deferred(self, authenticated_client):
+        """Test that deferred tickets are accepted with 202 and no classification."""
+        from unittest.mock import patch
+
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ingestion import TicketIngestionService
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        ticket_service = TicketService(DjangoTicketRepository(), None)
+        ingestion = TicketIngestionService(ticket_service, defer_depth=0)
+        ingestion._ensure_workers = lambda: None  # Keep the ticket queued
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_ingestion", return_value=ingestion):
+            response = authenticated_client.post(
+                "/api/tickets/", data={"title": "Outage", "description": "Site down"}, content_type="application/json"
+            )
+            metrics = authenticated_client.get("/api/tickets/ingestion")
+
+        assert response.status_code == 202
+        assert response.json()["classification"] is None
+        assert metrics.status_code == 200
+        assert metrics.json()["queued"] == 1
+        assert metrics.json()["deferred"] == 1
+
+    def test_create_ticket_over_capacity(self, authenticated_client):
+        """Test that a full queue answers 429 with Retry-After."""
+        from unittest.mock import Mock, patch
+
+        from pyticket.service.tickets.ingestion import IngestionOverloadedError
+
+        ingestion = Mock()
+        ingestion.submit.side_effect = IngestionOverloadedError(retry_after=7)
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_ingestion", return_value=ingestion):
+            response = authenticated_client.post(
+                "/api/tickets/", data={"title": "Outage", "description": "Site down"}, content_type="application/json"
+            )
+
+        assert response.status_code == 429
+        assert response["Retry-After"] == "7"
+        assert "over capacity" in response.json()["error"]
+
+
+@pytest.mark.django_db
+class TestRateLimitAPI:
+    """Tests for per-user API rate limits"""
+
+    def test_read_limit(self, authenticated_client, settings):
+        """Test that requests beyond the limit get 429 with rate limit headers."""
+        settings.API_RATE_LIMITS = {"default": "2/minute"}
+
+        first = authenticated_client.get("/api/tickets/stats")
+        authenticated_client.get("/api/tickets/stats")
+        refused = authenticated_client.get("/api/tickets/stats")
+
+        assert first.status_code == 200
+        assert first["X-RateLimit-Limit"] == "2"
+        assert first["X-RateLimit-Remaining"] == "1"
+        assert refused.status_code == 429
+        assert refused["X-RateLimit-Remaining"] == "0"
+        assert int(refused["Retry-After"]) >= 1
+
+    def test_classify_bucket_is_separate(self, authenticated_client, settings):
+        """Test that classification endpoints have their own bucket."""
+        from unittest.mock import patch
+
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ingestion import TicketIngestionService
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        settings.API_RATE_LIMITS = {"classify": "1/minute", "default": "10/minute"}
+        ingestion = TicketIngestionService(TicketService(DjangoTicketRepository(), None), defer_depth=0)
+        ingestion._ensure_workers = lambda: None  # Keep the tickets queued
+        ticket = {"title": "Outage", "description": "Site down"}
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_ingestion", return_value=ingestion):
+            accepted = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json")
+            refused = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json")
+            metrics = authenticated_client.get("/api/tickets/ingestion")
+
+        assert accepted.status_code == 202
+        assert refused.status_code == 429
+        assert "Rate limit exceeded" in refused.json()["error"]
+        assert metrics.status_code == 200
+        assert metrics.json()["queued"] == 1
+
+
+@pytest.mark.django_db
+class TestIdempotencyAPI:
+    """Tests for Idempotency-Key support of ticket creation"""
+
+    @pytest.fixture
+    def ingestion(self):
+        from unittest.mock import patch
+
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ingestion import TicketIngestionService
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        ingestion = TicketIngestionService(TicketService(DjangoTicketRepository(), None), defer_depth=0)
+        ingestion._ensure_workers = lambda: None  # Keep the tickets queued
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_ingestion", return_value=ingestion):
+            yield ingestion
+
+    def test_retry_replays_response(self, authenticated_client, ingestion):
+        """Test that a retry with the same key gets the original ticket without creating another."""
+        ticket = {"title": "Outage", "description": "Site down"}
+
+        first = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+        retry = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+        other = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="def")
+
+        assert first.status_code == retry.status_code == 202
+        assert retry.json()["id"] == first.json()["id"]
+        assert retry["Idempotent-Replayed"] == "true"
+        assert other.json()["id"] != first.json()["id"]
+        assert ingestion.metrics().queued == 2
+
+    def test_retry_not_rate_limited(self, authenticated_client, ingestion, settings):
+        """Test that a replayed retry neither counts against nor is refused by the classify limit."""
+        settings.API_RATE_LIMITS = {"classify": "1/day"}
+        ticket = {"title": "Outage", "description": "Site down"}
+
+        first = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+        retry = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+        other = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="def")
+
+        assert (first.status_code, retry.status_code, other.status_code) == (202, 202, 429)
+        assert retry["Idempotent-Replayed"] == "true"
+
+    def test_key_reused_for_different_request(self, authenticated_client, ingestion):
+        """Test that reusing a key with another body is refused."""
+        authenticated_client.post(
+            "/api/tickets/",
+            data={"title": "Outage", "description": "Site down"},
+            content_type="application/json",
+            HTTP_IDEMPOTENCY_KEY="abc",
+        )
+        response = authenticated_client.post(
+            "/api/tickets/", data={"title": "Other", "description": "Else"}, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc"
+        )
+
+        assert response.status_code == 422
+        assert "different request" in response.json()["error"]
+
+    def test_key_in_progress(self, authenticated_client, ingestion):
+        """Test that a retry while the first request still runs gets 409."""
+        ticket = {"title": "Outage", "description": "Site down"}
+        original = ingestion.submit
+
+        def submit_with_retry(dto):
+            # The client retries before the first request answered
+            retry.append(
+                authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+            )
+            return original(dto)
+
+        retry = []
+        ingestion.submit = submit_with_retry
+        first = authenticated_client.post("/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc")
+
+        assert first.status_code == 202
+        assert retry[0].status_code == 409
+        assert "in progress" in retry[0].json()["error"]
+
+    def test_failed_request_runs_again(self, authenticated_client):
+        """Test that an error response is not stored, so the retry runs the endpoint again."""
+        from unittest.mock import Mock, patch
+
+        from pyticket.service.tickets.ingestion import IngestionOverloadedError
+
+        ingestion = Mock()
+        ingestion.submit.side_effect = IngestionOverloadedError(retry_after=7)
+        ticket = {"title": "Outage", "description": "Site down"}
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_ingestion", return_value=ingestion):
+            for _ in range(2):
+                response = authenticated_client.post(
+                    "/api/tickets/", data=ticket, content_type="application/json", HTTP_IDEMPOTENCY_KEY="abc"
+                )
+
+        assert response.status_code == 429
+        assert ingestion.submit.call_count == 2
+
+
+@pytest.mark.django_db
+class TestTicketLifecycleAPI:
+    """Tests for ticket soft delete and archive reads"""
+
+    def test_delete_ticket(self, authenticated_client):
+        """Test that a deleted ticket is no longer returned."""
+        from unittest.mock import patch
+
+        from pyticket.domain.tickets.entities import Ticket
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Spam", description="Buy now"))
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_service", return_value=TicketService(repository, None)):
+            response = authenticated_client.delete(f"/api/tickets/{ticket.id}")
+            missing = authenticated_client.delete(f"/api/tickets/{ticket.id}")
+            read = authenticated_client.get(f"/api/tickets/{ticket.id}")
+
+        assert response.status_code == 204
+        assert missing.status_code == 404
+        assert read.status_code == 404
+
+    def test_archived_ticket_reads(self, authenticated_client):
+        """Test that archived tickets are only returned when asked for."""
+        from datetime import datetime, timedelta, timezone
+        from unittest.mock import patch
+
+        from pyticket.domain.tickets.entities import Ticket
+        from pyticket.infrastructure.repositories.django_ticket_repository import DjangoTicketRepository
+        from pyticket.service.tickets.ticket_service import TicketService
+
+        repository = DjangoTicketRepository()
+        ticket = repository.save(Ticket(title="Old", description="Done", status=TicketStatus.CLOSED))
+        repository.archive(datetime.now(timezone.utc) + timedelta(seconds=1), limit=10)
+
+        with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_service", return_value=TicketService(repository, None)):
+            hot = authenticated_client.get(f"/api/tickets/{ticket.id}")
+            archived = authenticated_client.get(f"/api/tickets/{ticket.id}?include_archived=true")
+            listing = authenticated_client.get("/api/tickets/?archived=true")
+            hot_listing = authenticated_client.get("/api/tickets/")
+
+        assert hot.status_code == 404
+        assert archived.status_code == 200
+        assert archived.json()["status"] == "CLOSED"
+        assert [item["id"] for item in listing.json()] == [str(ticket.id)]
+        assert hot_listing.json() == []
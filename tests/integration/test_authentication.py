@@ -0,0 +1,98 @@
+"""Tests for the JWT authentication of the API endpoints"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import RequestFactory
+from ninja_jwt.authentication import JWTAuth, JWTStatelessUserAuthentication
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken
+from ninja_jwt.tokens import AccessToken
+
+from pyticket.entrypoints.web.api.auth.authentication import CachedJWTAuth, get_api_auth
+from pyticket.infrastructure.auth.user_cache import UserCache
+
+User = get_user_model()
+
+
+@pytest.fixture
+def user():
+    """Create a user."""
+    return User.objects.create_user(username="authuser", password="securepass123")
+
+
+@pytest.fixture
+def token(user):
+    """Create an access token for the user."""
+    return str(AccessToken.for_user(user))
+
+
+@pytest.fixture
+def auth():
+    """Create cached JWT authentication."""
+    return CachedJWTAuth(user_cache=UserCache(ttl_seconds=30))
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuth:
+    """Tests for CachedJWTAuth"""
+
+    def test_repeated_token_skips_user_query(self, auth, token, user, django_assert_num_queries):
+        """Test that a repeated token is authenticated without a database query."""
+        request = RequestFactory().get("/")
+        with django_assert_num_queries(1):
+            assert auth.authenticate(request, token).pk == user.pk
+        with django_assert_num_queries(0):
+            assert auth.authenticate(request, token).pk == user.pk
+        assert request.user.pk == user.pk
+
+    def test_user_change_invalidates_cache(self, auth, token, user):
+        """Test that deactivating a user takes effect on their next request."""
+        auth.authenticate(RequestFactory().get("/"), token)
+
+        user.is_active = False
+        user.save()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.authenticate(RequestFactory().get("/"), token)
+
+    def test_deleted_user_is_rejected(self, auth, token, user):
+        """Test that a deleted user is not served from the cache."""
+        auth.authenticate(RequestFactory().get("/"), token)
+
+        user.delete()
+
+        with pytest.raises(AuthenticationFailed):
+            auth.authenticate(RequestFactory().get("/"), token)
+
+    def test_invalid_token_is_rejected(self, auth, token):
+        """Test that tampered tokens still fail verification."""
+        auth.authenticate(RequestFactory().get("/"), token)
+
+        with pytest.raises(InvalidToken):
+            auth.authenticate(RequestFactory().get("/"), token[:-2] + "xx")
+
+    def test_token_cache_is_bounded(self, user):
+        """Test that at most token_cache_size verified tokens are kept."""
+        auth = CachedJWTAuth(token_cache_size=2)
+        for _ in range(3):
+            auth.get_validated_token(str(AccessToken.for_user(user)))
+
+        assert len(auth._tokens) == 2
+
+
+@pytest.mark.parametrize(
+    "mode, expected",
+    [("database", JWTAuth), ("cached", CachedJWTAuth), ("stateless", JWTStatelessUserAuthentication)],
+)
+def test_get_api_auth(settings, mode, expected):
+    """Test choosing the authentication with API_AUTH_MODE."""
+    settings.API_AUTH_MODE = mode
+
+    assert type(get_api_auth()) is expected
+
+
+def test_get_api_auth_unknown_mode(settings):
+    """Test that unknown modes are rejected."""
+    settings.API_AUTH_MODE = "session"
+
+    with pytest.raises(ValueError, match="Unsupported API auth mode"):
+        get_api_auth()
@@ -0,0 +1,64 @@
+"""Tests for the cold-start profiler"""
+
+import gc
+
+import pytest
+
+from pyticket.utils.common import startup_gc
+from pyticket.utils.startup import ImportTiming, parse_importtime, profile_startup, StartupProfile
+
+IMPORTTIME_REPORT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     langchain_core.messages
+import time:      3000 |       3120 |   langchain_core
+some warning printed by an import
+import time:       500 |       3620 | django_ai_assistant
+import time:       250 |        250 | django.urls
+"""
+
+
+def test_parse_importtime():
+    """Test parsing the -X importtime report."""
+    timings = parse_importtime(IMPORTTIME_REPORT)
+
+    assert timings == [
+        ImportTiming("langchain_core.messages", 120, 120, 2),
+        ImportTiming("langchain_core", 3000, 3120, 1),
+        ImportTiming("django_ai_assistant", 500, 3620, 0),
+        ImportTiming("django.urls", 250, 250, 0),
+    ]
+
+
+def test_profile_summaries():
+    """Test the slowest top-level imports and per-package totals."""
+    profile = StartupProfile("wsgi", "/", 200, {"settings": 0.5, "first request": 0.25}, 1.0, parse_importtime(IMPORTTIME_REPORT))
+
+    assert profile.total_seconds == 0.75
+    assert [timing.module for timing in profile.slowest_imports(1)] == ["django_ai_assistant"]
+    assert profile.package_totals(2) == [("langchain_core", 3120), ("django_ai_assistant", 500)]
+
+
+def test_startup_gc_freezes_loaded_objects():
+    """Test that collection is paused during startup and re-enabled after it."""
+    try:
+        with startup_gc():
+            assert not gc.isenabled()
+        assert gc.isenabled()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.parametrize("entrypoint", ["wsgi", "asgi"])
+def test_profile_startup(entrypoint):
+    """Test profiling a real cold start of an entrypoint."""
+    profile = profile_startup(entrypoint, "/api/tickets/stats")
+
+    assert profile.status == 401
+    assert list(profile.phases) == ["settings", f"app registry ({entrypoint}.py)", "url resolution", "first request"]
+    assert any(timing.module == "pyticket.entrypoints.web.api.router" for timing in profile.imports)
+
+
+def test_profile_startup_unknown_entrypoint():
+    """Test that unknown entrypoints are rejected."""
+    with pytest.raises(ValueError, match="Unknown entrypoint"):
+        profile_startup("uwsgi")
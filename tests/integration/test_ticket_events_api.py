@@ -0,0 +1,56 @@
+"""Integration tests for the ticket event stream"""
+
+import json
+from uuid import uuid4
+
+import pytest
+from django.contrib.auth import get_user_model
+from ninja_jwt.tokens import RefreshToken
+
+from pyticket.domain.tickets.entities import TicketStatus
+from pyticket.domain.tickets.events import TicketEvent, TicketEventType
+from pyticket.infrastructure.events.factory import TicketEventBusFactory
+
+
+@pytest.fixture
+def event_bus():
+    """Provide a fresh shared event bus."""
+    TicketEventBusFactory.reset()
+    yield TicketEventBusFactory.get()
+    TicketEventBusFactory.reset()
+
+
+@pytest.fixture
+def auth_header():
+    """Create a user and return an authorization header."""
+    user = get_user_model().objects.create_user(username="streamer", password="testpass123")
+    return {"HTTP_AUTHORIZATION": f"Bearer {RefreshToken.for_user(user).access_token}"}
+
+
+@pytest.mark.django_db
+class TestTicketEventsAPI:
+    """Integration tests for ticket server-sent events"""
+
+    def test_events_require_auth(self, client):
+        """Test that the event stream requires authentication."""
+        response = client.get("/api/tickets/events")
+        assert response.status_code == 401
+
+    def test_ticket_stream_receives_events(self, client, event_bus, auth_header):
+        """Test that a ticket stream yields published events."""
+        ticket_id = uuid4()
+        response = client.get(f"/api/tickets/{ticket_id}/events", **auth_header)
+        assert response.status_code == 200
+        assert response["Content-Type"] == "text/event-stream"
+
+        event_bus.publish(TicketEvent(TicketEventType.STATUS_CHANGED, ticket_id, TicketStatus.IN_PROGRESS))
+        frame = next(iter(response.streaming_content)).decode()
+
+        event_line, data_line = frame.strip().split("\n")
+        assert event_line == "event: ticket.status_changed"
+        data = json.loads(data_line.removeprefix("data: "))
+        assert data["ticket_id"] == str(ticket_id)
+        assert data["status"] == "IN_PROGRESS"
+
+        response.close()
+        assert event_bus.subscriber_count == 0
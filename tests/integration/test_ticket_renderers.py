@@ -0,0 +1,92 @@
+"""Tests for lean ticket response rendering"""
+
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from django.test import override_settings
+from ninja.responses import NinjaJSONEncoder
+
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
+from pyticket.entrypoints.web.api.tickets import renderers
+from pyticket.entrypoints.web.api.tickets.renderers import get_json_encoder, render_tickets, stdlib_json_encoder, ticket_to_dict
+from pyticket.entrypoints.web.api.tickets.schemas import TicketResponseSchema
+from pyticket.service.tickets.dtos import ClassificationResultDTO, TicketResponseDTO
+
+
+def _make_dto(classified: bool = True) -> TicketResponseDTO:
+    now = datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    return TicketResponseDTO(
+        id=uuid4(),
+        title="Login issue",
+        description="Cannot log in",
+        status=TicketStatus.IN_PROGRESS,
+        category=Category.TECHNICAL if classified else None,
+        priority=Priority.HIGH if classified else None,
+        created_at=now,
+        updated_at=now,
+        classification=ClassificationResultDTO(Category.TECHNICAL, Priority.HIGH, 0.95, "Login") if classified else None,
+    )
+
+
+class TestTicketRenderers:
+    """Tests for ticket renderers"""
+
+    @pytest.mark.parametrize("classified", [True, False])
+    def test_matches_schema_output(self, classified):
+        """Test that lean output matches the schema-validated output."""
+        dto = _make_dto(classified)
+        fast = ticket_to_dict(dto)
+
+        schema = TicketResponseSchema.model_validate(fast)
+        expected = json.loads(json.dumps(schema.model_dump(), cls=NinjaJSONEncoder))
+
+        assert json.loads(stdlib_json_encoder(fast)) == expected
+
+    def test_render_tickets(self):
+        """Test rendering a list of tickets."""
+        dtos = [_make_dto(), _make_dto(classified=False)]
+        response = render_tickets(dtos)
+
+        assert response.status_code == 200
+        assert response["Content-Type"].startswith("application/json")
+        body = json.loads(response.content)
+        assert [item["id"] for item in body] == [str(dto.id) for dto in dtos]
+        assert body[1]["classification"] is None
+
+    @override_settings(TICKETS_JSON_ENCODER="pyticket.entrypoints.web.api.tickets.renderers.stdlib_json_encoder")
+    def test_configured_encoder(self):
+        """Test that the encoder can be configured via settings."""
+        assert get_json_encoder() is stdlib_json_encoder
+
+    def test_encoder_resolved_once(self):
+        """Test that the configured encoder is imported once, not per response."""
+        path = "pyticket.entrypoints.web.api.tickets.renderers.stdlib_json_encoder"
+        with patch("pyticket.entrypoints.web.api.tickets.renderers.import_string", return_value=stdlib_json_encoder) as import_string:
+            with override_settings(TICKETS_JSON_ENCODER=path):
+                get_json_encoder()
+                get_json_encoder()
+
+        import_string.assert_called_once_with(path)
+        assert get_json_encoder() is (renderers.orjson.dumps if renderers.orjson else stdlib_json_encoder)
+
+
+@pytest.mark.django_db
+def test_list_endpoint_uses_lean_renderer(client):
+    """Test the list endpoint returns rendered DTOs."""
+    from django.contrib.auth import get_user_model
+    from ninja_jwt.tokens import RefreshToken
+
+    user = get_user_model().objects.create_user(username="renderer", password="testpass123")
+    token = str(RefreshToken.for_user(user).access_token)
+    service = Mock()
+    service.list_tickets.return_value = [_make_dto()]
+
+    with patch("pyticket.entrypoints.web.api.tickets.router.get_ticket_service", return_value=service):
+        response = client.get("/api/tickets/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    assert response.status_code == 200
+    assert response.json()[0]["status"] == "IN_PROGRESS"
+    assert response.json()[0]["created_at"] == "2025-01-02T03:04:05.678Z"
@@ -0,0 +1,27 @@
+"""Tests for TicketArchivalJob"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+from pyticket.service.tickets.archival import TicketArchivalJob
+
+
+class TestTicketArchivalJob:
+    """Tests for TicketArchivalJob"""
+
+    def test_archives_in_chunks_until_done(self):
+        """Test that chunks are moved with one cutoff until none is left."""
+        repository = Mock(spec=ITicketRepository)
+        repository.archive.side_effect = [2, 2, 1, 0]
+        progress = []
+        job = TicketArchivalJob(repository, older_than=timedelta(days=90), batch_size=2)
+
+        archived = job.run(on_progress=progress.append)
+
+        assert archived == 5
+        assert progress == [2, 4, 5]
+        cutoffs = {call.args[0] for call in repository.archive.call_args_list}
+        assert len(cutoffs) == 1
+        assert abs(cutoffs.pop() - (datetime.now(timezone.utc) - timedelta(days=90))) < timedelta(minutes=1)
+        assert all(call.args[1] == 2 for call in repository.archive.call_args_list)
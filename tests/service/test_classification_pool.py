@@ -0,0 +1,58 @@
+"""Tests for ProcessClassificationPool"""
+
+import os
+
+import pytest
+
+from pyticket.domain.tickets.entities import Category, Priority, Ticket
+from pyticket.infrastructure.ai.interfaces import AIClassificationService, ClassificationResult
+from pyticket.service.tickets.classification_pool import ProcessClassificationPool
+from pyticket.service.tickets.classification_service import TicketClassificationService
+
+
+class KeywordClassifier(AIClassificationService):
+    """Deterministic local classifier run in the worker processes"""
+
+    def classify_ticket(self, ticket: Ticket) -> ClassificationResult:
+        if "fail" in ticket.title:
+            raise RuntimeError("cannot classify")
+        if "invoice" in ticket.description:
+            return ClassificationResult(Category.BILLING, Priority.HIGH, 0.9, f"pid {os.getpid()}")
+        return ClassificationResult(Category.GENERAL, Priority.URGENT, 0.5, f"pid {os.getpid()}")
+
+
+@pytest.fixture
+def pool():
+    pool = ProcessClassificationPool(KeywordClassifier, workers=2, chunk_size=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestProcessClassificationPool:
+    """Tests for ProcessClassificationPool"""
+
+    def test_classifies_in_worker_processes(self, pool):
+        """Test that results come back in order, with None for failures."""
+        tickets = [
+            Ticket(title="Billing", description="Wrong invoice"),
+            Ticket(title="fail", description="Provider error"),
+            Ticket(title="Hello", description="A question"),
+        ]
+
+        results = pool.classify_many(tickets)
+
+        assert [result and result.category for result in results] == [Category.BILLING, None, Category.GENERAL]
+        assert results[0].reasoning != f"pid {os.getpid()}"
+
+    def test_classification_service_applies_rules(self, pool):
+        """Test that domain rules are applied to results from the pool."""
+        service = TicketClassificationService(KeywordClassifier(), process_pool=pool)
+
+        results = service.classify_many([Ticket(title="Hello", description="A question")])
+
+        assert results[0].category == Category.GENERAL
+        assert results[0].priority == Priority.LOW
+
+    def test_workers_are_spawned(self, pool):
+        """Test that workers start from a fresh interpreter instead of a fork of the server."""
+        assert pool._executor._mp_context.get_start_method() == "spawn"
@@ -20,6 +20,24 @@ class TestTicketClassificationService:
         assert result.confidence_score == 0.95
         mock_ai_service.classify_ticket.assert_called_once_with(sample_ticket)
 
+    def test_classify_ticket_adjusts_invalid_priority(self, mock_ai_service, sample_ticket):
+        """Test that an invalid combination gets the category default priority."""
+        from pyticket.infrastructure.ai.interfaces import ClassificationResult
+
+        original = ClassificationResult(
+            category=Category.GENERAL,
+            priority=Priority.URGENT,
+            confidence_score=0.5,
+            reasoning="General question",
+        )
+        mock_ai_service.classify_ticket.return_value = original
+        service = TicketClassificationService(mock_ai_service)
+
+        result = service.classify_ticket(sample_ticket)
+
+        assert result.priority == Priority.LOW
+        assert original.priority == Priority.URGENT
+
     def test_classify_ticket_ai_error(self, sample_ticket):
         """Test classification when AI service fails."""
         from unittest.mock import Mock
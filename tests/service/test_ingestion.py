@@ -0,0 +1,107 @@
+"""Tests for TicketIngestionService"""
+
+import threading
+from datetime import datetime, timezone
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from pyticket.service.tickets.dtos import CreateTicketDTO
+from pyticket.service.tickets.ingestion import IngestionOverloadedError, TicketIngestionService
+
+DTO = CreateTicketDTO(title="Outage", description="Everything is down")
+
+
+def _ticket_service():
+    service = Mock()
+    service.create_ticket.return_value = Mock(id=uuid4(), classification=Mock())
+    service.create_unclassified_ticket.side_effect = lambda dto: Mock(id=uuid4(), classification=None, duplicate=False)
+    return service
+
+
+class TestTicketIngestionService:
+    """Tests for TicketIngestionService"""
+
+    def test_classifies_inline_below_defer_depth(self):
+        """Test that tickets are classified in the request while load is low."""
+        service = _ticket_service()
+        ingestion = TicketIngestionService(service, defer_depth=1)
+
+        ingestion.submit(DTO)
+
+        service.create_ticket.assert_called_once_with(DTO)
+        service.create_unclassified_ticket.assert_not_called()
+        assert ingestion.metrics().inline == 0
+
+    def test_defers_classification_to_workers(self):
+        """Test that deferred tickets are persisted first and classified in the background."""
+        service = _ticket_service()
+        after_task = Mock()
+        ingestion = TicketIngestionService(service, defer_depth=0, workers=2, after_task=after_task)
+
+        ticket_dtos = [ingestion.submit(DTO) for _ in range(3)]
+        ingestion.shutdown()
+
+        assert sorted(call.args[0] for call in service.classify_pending_ticket.call_args_list) == sorted(dto.id for dto in ticket_dtos)
+        metrics = ingestion.metrics()
+        assert (metrics.accepted, metrics.deferred, metrics.processed, metrics.queued) == (3, 3, 3, 0)
+        assert after_task.call_count == 3
+
+    def test_rejects_when_queue_is_full(self):
+        """Test admission control with a retry hint once the queue is full."""
+        service = _ticket_service()
+        release = threading.Event()
+        service.classify_pending_ticket.side_effect = lambda ticket_id: release.wait(5)
+        ingestion = TicketIngestionService(service, max_depth=1, defer_depth=0, workers=1)
+
+        ingestion.submit(DTO)
+        with pytest.raises(IngestionOverloadedError) as error:
+            ingestion.submit(DTO)
+        release.set()
+        ingestion.shutdown()
+
+        assert 1 <= error.value.retry_after <= 60
+        metrics = ingestion.metrics()
+        assert (metrics.accepted, metrics.rejected, metrics.processed) == (1, 1, 1)
+
+    def test_failed_classification_is_counted(self):
+        """Test that worker failures are counted and do not stop the worker."""
+        service = _ticket_service()
+        service.classify_pending_ticket.side_effect = [RuntimeError("provider down"), None]
+        ingestion = TicketIngestionService(service, defer_depth=0, workers=1)
+
+        ingestion.submit(DTO)
+        ingestion.submit(DTO)
+        ingestion.shutdown()
+
+        metrics = ingestion.metrics()
+        assert (metrics.failed, metrics.processed) == (1, 1)
+
+    def test_duplicate_is_not_queued(self):
+        """Test that a deferred duplicate releases its slot instead of being classified again."""
+        service = _ticket_service()
+        service.create_unclassified_ticket.side_effect = lambda dto: Mock(id=uuid4(), classification=None, duplicate=True)
+        ingestion = TicketIngestionService(service, defer_depth=0, workers=1)
+
+        ingestion.submit(DTO)
+        ingestion.shutdown()
+
+        service.classify_pending_ticket.assert_not_called()
+        assert ingestion.metrics().queued == 0
+
+    def test_recover_queues_unclassified_tickets(self):
+        """Test that tickets left unclassified by a stopped process are queued up to the free capacity."""
+        service = _ticket_service()
+        pending = [Mock(id=uuid4(), title="Outage", description="Everything is down") for _ in range(2)]
+        service.claim_unclassified_tickets.return_value = pending
+        ingestion = TicketIngestionService(service, max_depth=5, workers=1)
+        stale_before = datetime.now(timezone.utc)
+
+        queued = ingestion.recover(stale_before)
+        ingestion.shutdown()
+
+        service.claim_unclassified_tickets.assert_called_once_with(stale_before, 5)
+        assert queued == 2
+        assert sorted(call.args[0] for call in service.classify_pending_ticket.call_args_list) == sorted(ticket.id for ticket in pending)
+        assert (ingestion.metrics().processed, ingestion.metrics().queued) == (2, 0)
@@ -0,0 +1,83 @@
+"""Tests for ReclassificationJob"""
+
+from unittest.mock import Mock
+
+from pyticket.domain.tickets.entities import Ticket
+from pyticket.infrastructure.jobs.checkpoints import FileJobCheckpointStore
+from pyticket.infrastructure.repositories.interfaces import ITicketRepository
+from pyticket.service.tickets.dtos import ReclassificationBatchDTO
+from pyticket.service.tickets.reclassification_job import ReclassificationJob, ReclassificationProgress
+
+
+def _paged_repository(tickets, page_size):
+    """Repository mock serving tickets through list_after in ID order."""
+    ordered = sorted(tickets, key=lambda ticket: ticket.id)
+    repository = Mock(spec=ITicketRepository)
+    repository.count.return_value = len(ordered)
+
+    def list_after(after, limit):
+        remaining = [ticket for ticket in ordered if after is None or ticket.id > after]
+        return remaining[: min(limit, page_size)]
+
+    repository.list_after.side_effect = list_after
+    return repository, ordered
+
+
+def _ticket_service(failed_per_batch=0):
+    service = Mock()
+    service.reclassify_many.side_effect = lambda tickets, workers: ReclassificationBatchDTO(
+        updated=len(tickets) - failed_per_batch,
+        failed=[ticket.id for ticket in tickets[:failed_per_batch]],
+    )
+    return service
+
+
+class TestReclassificationJob:
+    """Tests for ReclassificationJob"""
+
+    def test_run_processes_all_tickets_in_batches(self, tmp_path):
+        """Test that every ticket is reclassified and the checkpoint is cleared."""
+        repository, ordered = _paged_repository([Ticket(title=f"T{i}", description="D") for i in range(5)], page_size=2)
+        service = _ticket_service(failed_per_batch=1)
+        checkpoints = FileJobCheckpointStore(tmp_path)
+        reports = []
+        job = ReclassificationJob(service, repository, checkpoints, batch_size=2, max_workers=3)
+
+        progress = job.run(on_progress=lambda p: reports.append((p.processed, p.total)))
+
+        assert progress.processed == 5
+        assert progress.failed == 3
+        assert reports == [(2, 5), (4, 5), (5, 5)]
+        assert [call.args[1] for call in service.reclassify_many.call_args_list] == [3, 3, 3]
+        assert checkpoints.load(ReclassificationJob.JOB_NAME) is None
+
+    def test_run_resumes_from_checkpoint(self, tmp_path):
+        """Test that a restarted job continues after the last checkpointed ticket."""
+        repository, ordered = _paged_repository([Ticket(title=f"T{i}", description="D") for i in range(4)], page_size=10)
+        checkpoints = FileJobCheckpointStore(tmp_path)
+        checkpoints.save(ReclassificationJob.JOB_NAME, ReclassificationProgress(last_id=ordered[1].id, processed=2).to_checkpoint())
+        service = _ticket_service()
+
+        progress = ReclassificationJob(service, repository, checkpoints, batch_size=10).run()
+
+        assert [ticket.id for ticket in service.reclassify_many.call_args.args[0]] == [ordered[2].id, ordered[3].id]
+        assert progress.processed == 4
+        assert progress.run_processed == 2
+
+    def test_run_restart_ignores_checkpoint(self, tmp_path):
+        """Test that restart starts from the first ticket."""
+        repository, ordered = _paged_repository([Ticket(title=f"T{i}", description="D") for i in range(3)], page_size=10)
+        checkpoints = FileJobCheckpointStore(tmp_path)
+        checkpoints.save(ReclassificationJob.JOB_NAME, {"last_id": str(ordered[1].id), "processed": 2, "failed": 0})
+
+        progress = ReclassificationJob(_ticket_service(), repository, checkpoints).run(restart=True)
+
+        assert progress.processed == 3
+
+    def test_progress_eta(self):
+        """Test the throughput and ETA estimate."""
+        progress = ReclassificationProgress(processed=40, total=100, run_processed=20, run_seconds=10.0)
+
+        assert progress.rate == 2.0
+        assert progress.eta_seconds == 30.0
+        assert ReclassificationProgress().eta_seconds is None
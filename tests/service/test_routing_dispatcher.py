@@ -0,0 +1,77 @@
+"""Tests for RoutingDispatcher"""
+
+from unittest.mock import Mock
+from uuid import uuid4
+
+from pyticket.domain.tickets.entities import Category
+from pyticket.domain.tickets.events import RoutingEvent
+from pyticket.infrastructure.repositories.interfaces import IRoutingOutbox
+from pyticket.infrastructure.routing.sinks import QueueRoutingSink
+from pyticket.service.tickets.routing_dispatcher import RoutingDispatcher
+
+
+def _event(event_id, team):
+    return RoutingEvent(id=event_id, ticket_id=uuid4(), team=team, category=Category.TECHNICAL)
+
+
+class TestRoutingDispatcher:
+    """Tests for RoutingDispatcher"""
+
+    def test_dispatch_batch_groups_by_team(self):
+        """Test that events are sent in one batch per team."""
+        outbox = Mock(spec=IRoutingOutbox)
+        outbox.fetch_pending.return_value = [_event(1, "billing-team"), _event(2, "product-team"), _event(3, "billing-team")]
+        sink = QueueRoutingSink()
+        dispatcher = RoutingDispatcher(outbox, sink, batch_size=10)
+
+        count = dispatcher.dispatch_batch()
+
+        assert count == 3
+        batches = {}
+        while not sink.queue.empty():
+            team, events = sink.queue.get_nowait()
+            batches[team] = [event.id for event in events]
+        assert batches == {"billing-team": [1, 3], "product-team": [2]}
+        dispatched = sorted(event_id for call in outbox.mark_dispatched.call_args_list for event_id in call.args[0])
+        assert dispatched == [1, 2, 3]
+
+    def test_failed_sink_marks_events_failed(self):
+        """Test that sink failures are recorded for retry."""
+        outbox = Mock(spec=IRoutingOutbox)
+        outbox.fetch_pending.return_value = [_event(1, "billing-team")]
+        sink = Mock()
+        sink.send.side_effect = ConnectionError("unreachable")
+        dispatcher = RoutingDispatcher(outbox, sink)
+
+        dispatcher.dispatch_batch()
+
+        outbox.mark_failed.assert_called_once_with([1], "unreachable")
+        outbox.mark_dispatched.assert_not_called()
+
+    def test_run_backs_off_after_failed_batches(self):
+        """Test that failing batches are retried with a growing wait instead of a tight loop."""
+        outbox = Mock(spec=IRoutingOutbox)
+        outbox.fetch_pending.return_value = [_event(1, "billing-team")]
+        sink = Mock()
+        sink.send.side_effect = ConnectionError("unreachable")
+        before_batch = Mock()
+        stop = Mock()
+        stop.is_set.side_effect = [False, False, False, False, True]
+        dispatcher = RoutingDispatcher(outbox, sink, before_batch=before_batch)
+
+        dispatcher.run(stop, interval=1.0, max_backoff=3.0)
+
+        assert [call.args[0] for call in stop.wait.call_args_list] == [1.0, 2.0, 3.0, 3.0]
+        assert before_batch.call_count == 4
+
+    def test_run_backs_off_after_outbox_errors(self):
+        """Test that outbox errors do not stop the dispatcher."""
+        outbox = Mock(spec=IRoutingOutbox)
+        outbox.fetch_pending.side_effect = [RuntimeError("database is locked"), []]
+        stop = Mock()
+        stop.is_set.side_effect = [False, False, True]
+        dispatcher = RoutingDispatcher(outbox, QueueRoutingSink())
+
+        dispatcher.run(stop, interval=0.5)
+
+        assert [call.args[0] for call in stop.wait.call_args_list] == [0.5, 0.5]
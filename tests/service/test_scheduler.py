@@ -0,0 +1,62 @@
+"""Tests for ClassificationScheduler"""
+
+import threading
+from uuid import uuid4
+
+from pyticket.domain.tickets.entities import Priority
+from pyticket.service.tickets.scheduler import ClassificationScheduler
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestClassificationScheduler:
+    """Tests for ClassificationScheduler"""
+
+    def test_most_urgent_first(self):
+        """Test that tickets are served by priority, then in arrival order."""
+        scheduler = ClassificationScheduler(clock=FakeClock())
+        low, high, urgent, high_later = uuid4(), uuid4(), uuid4(), uuid4()
+        scheduler.put(low, Priority.LOW)
+        scheduler.put(high, Priority.HIGH)
+        scheduler.put(urgent, Priority.URGENT)
+        scheduler.put(high_later, Priority.HIGH)
+
+        assert len(scheduler) == 4
+        assert [scheduler.get() for _ in range(4)] == [urgent, high, high_later, low]
+
+    def test_aging_prevents_starvation(self):
+        """Test that a waiting ticket overtakes newer, more urgent ones."""
+        clock = FakeClock()
+        scheduler = ClassificationScheduler(aging_seconds=10, clock=clock)
+        low = uuid4()
+        scheduler.put(low, Priority.LOW)
+        clock.now = 20
+        high = uuid4()
+        scheduler.put(high, Priority.HIGH)
+        clock.now = 31
+        urgent = uuid4()
+        scheduler.put(urgent, Priority.URGENT)
+
+        assert [scheduler.get() for _ in range(3)] == [low, high, urgent]
+
+    def test_close_releases_waiting_consumers(self):
+        """Test that get() drains the queue and then returns None after close()."""
+        scheduler = ClassificationScheduler()
+        ticket_id = uuid4()
+        scheduler.put(ticket_id, Priority.MEDIUM)
+        results = []
+        consumer = threading.Thread(target=lambda: results.extend([scheduler.get(), scheduler.get()]))
+        consumer.start()
+
+        scheduler.close()
+        consumer.join(timeout=5)
+
+        assert results == [ticket_id, None]
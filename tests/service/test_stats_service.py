@@ -0,0 +1,41 @@
+"""Tests for TicketStatsService"""
+
+from unittest.mock import Mock
+
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
+from pyticket.infrastructure.repositories.interfaces import ITicketStatsRepository, TicketStatsKey
+from pyticket.service.tickets.stats_service import TicketStatsService
+
+
+class TestTicketStatsService:
+    """Tests for TicketStatsService"""
+
+    def test_get_statistics(self):
+        """Test that counters are rolled up per dimension and per team backlog."""
+        ticket_stats = Mock(spec=ITicketStatsRepository)
+        ticket_stats.snapshot.return_value = [
+            (TicketStatsKey(TicketStatus.OPEN, Category.BILLING, Priority.HIGH), 3),
+            (TicketStatsKey(TicketStatus.IN_PROGRESS, Category.BILLING, Priority.LOW), 1),
+            (TicketStatsKey(TicketStatus.CLOSED, Category.TECHNICAL, Priority.HIGH), 5),
+            (TicketStatsKey(TicketStatus.OPEN), 2),
+        ]
+        service = TicketStatsService(ticket_stats)
+
+        statistics = service.get_statistics()
+
+        assert statistics.total == 11
+        assert statistics.by_status == {"CLOSED": 5, "IN_PROGRESS": 1, "OPEN": 5}
+        assert statistics.by_category == {"BILLING": 4, "TECHNICAL": 5, "UNCLASSIFIED": 2}
+        assert statistics.by_priority == {"HIGH": 8, "LOW": 1, "UNCLASSIFIED": 2}
+        assert statistics.backlog_by_team == {"billing-team": 4, "customer-support": 2}
+        assert len(statistics.buckets) == 4
+
+    def test_get_statistics_empty(self):
+        """Test statistics without any tickets."""
+        ticket_stats = Mock(spec=ITicketStatsRepository)
+        ticket_stats.snapshot.return_value = []
+
+        statistics = TicketStatsService(ticket_stats).get_statistics()
+
+        assert statistics.total == 0
+        assert statistics.backlog_by_team == {}
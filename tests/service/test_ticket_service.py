@@ -1,11 +1,15 @@
 """Tests for TicketService"""
 
+from datetime import timedelta
+from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
 
-from pyticket.domain.tickets.entities import Category, TicketStatus
+from pyticket.domain.tickets.entities import Category, Priority, TicketStatus
+from pyticket.domain.tickets.events import TicketEventType
 from pyticket.domain.tickets.exceptions import ClassificationError
+from pyticket.infrastructure.repositories.interfaces import TicketStatsKey
 from pyticket.service.tickets.dtos import CreateTicketDTO
 from pyticket.service.tickets.ticket_service import TicketService
 
@@ -83,6 +87,14 @@ class TestTicketService:
         with pytest.raises(ValueError, match="not found"):
             service.reclassify_ticket(uuid4())
 
+    def test_classify_pending_ticket_skips_classified(self, mock_ai_service, mock_repository, classified_ticket):
+        """Test that a deferred ticket classified meanwhile is not classified again."""
+        mock_repository.get_by_id.return_value = classified_ticket
+        service = TicketService(mock_repository, mock_ai_service)
+
+        assert service.classify_pending_ticket(classified_ticket.id) is None
+        mock_ai_service.classify_ticket.assert_not_called()
+
     def test_update_ticket_status(self, mock_repository, sample_ticket):
         """Test updating ticket status."""
         mock_repository.get_by_id.return_value = sample_ticket
@@ -93,3 +105,249 @@ class TestTicketService:
 
         assert result.status == TicketStatus.IN_PROGRESS
         mock_repository.update.assert_called_once()
+
+    def test_create_ticket_records_usage(self, mock_ai_service, mock_repository):
+        """Test that the provider usage of a classification is logged with its ticket."""
+        from dataclasses import replace
+
+        from pyticket.infrastructure.ai.interfaces import ClassificationUsage
+
+        usage = ClassificationUsage("OPENAI", "gpt-4o-mini", 120, 30, 0.4)
+        mock_ai_service.classify_ticket.return_value = replace(mock_ai_service.classify_ticket.return_value, usage=usage)
+        mock_repository.save.side_effect = lambda ticket: ticket
+        usage_repository = Mock()
+        service = TicketService(mock_repository, mock_ai_service, usage_repository=usage_repository)
+
+        result = service.create_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        usage_repository.add_many.assert_called_once_with([(result.id, usage)])
+
+    def test_create_ticket_publishes_event(self, mock_ai_service, mock_repository):
+        """Test that creating a ticket publishes a created event."""
+        mock_repository.save.side_effect = lambda ticket: ticket
+        event_bus = Mock()
+        service = TicketService(mock_repository, mock_ai_service, event_bus=event_bus)
+
+        result = service.create_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        event = event_bus.publish.call_args.args[0]
+        assert event.event_type == TicketEventType.CREATED
+        assert event.ticket_id == result.id
+        assert event.category == Category.TECHNICAL
+
+    def test_update_ticket_status_publishes_event(self, mock_repository, sample_ticket):
+        """Test that status changes publish a status event."""
+        mock_repository.get_by_id.return_value = sample_ticket
+        mock_repository.update.return_value = sample_ticket
+        event_bus = Mock()
+        service = TicketService(mock_repository, None, event_bus=event_bus)
+
+        service.update_ticket_status(sample_ticket.id, TicketStatus.IN_PROGRESS)
+
+        event = event_bus.publish.call_args.args[0]
+        assert event.event_type == TicketEventType.STATUS_CHANGED
+        assert event.status == TicketStatus.IN_PROGRESS
+
+    def test_event_bus_failure_does_not_fail_operation(self, mock_ai_service, mock_repository, sample_ticket):
+        """Test that publishing errors are not propagated."""
+        mock_repository.get_by_id.return_value = sample_ticket
+        mock_repository.update.return_value = sample_ticket
+        event_bus = Mock()
+        event_bus.publish.side_effect = RuntimeError("bus down")
+        service = TicketService(mock_repository, mock_ai_service, event_bus=event_bus)
+
+        result = service.reclassify_ticket(sample_ticket.id)
+
+        assert result.category == Category.TECHNICAL
+
+    def test_create_ticket_writes_routing_outbox(self, mock_ai_service, mock_repository):
+        """Test that creating a ticket queues a routing event atomically."""
+        from unittest.mock import MagicMock
+
+        mock_repository.save.side_effect = lambda ticket: ticket
+        outbox = MagicMock()
+        service = TicketService(mock_repository, mock_ai_service, routing_outbox=outbox)
+
+        result = service.create_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        mock_repository.atomic.return_value.__enter__.assert_called_once()
+        event = outbox.add.call_args.args[0]
+        assert event.ticket_id == result.id
+        assert event.team == "technical-support"
+
+    def test_reclassify_same_category_skips_routing(self, mock_ai_service, mock_repository, classified_ticket):
+        """Test that reclassification without a category change is not re-routed."""
+        from unittest.mock import MagicMock
+
+        mock_repository.get_by_id.return_value = classified_ticket
+        mock_repository.update.return_value = classified_ticket
+        outbox = MagicMock()
+        service = TicketService(mock_repository, mock_ai_service, routing_outbox=outbox)
+
+        service.reclassify_ticket(classified_ticket.id)
+
+        outbox.add.assert_not_called()
+
+    def test_create_ticket_increments_counters(self, mock_ai_service, mock_repository):
+        """Test that a new ticket is counted in its bucket within the save transaction."""
+        mock_repository.save.side_effect = lambda ticket: ticket
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, mock_ai_service, ticket_stats=ticket_stats)
+
+        service.create_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        mock_repository.atomic.return_value.__enter__.assert_called_once()
+        ticket_stats.apply.assert_called_once_with(
+            {TicketStatsKey(TicketStatus.OPEN, Category.TECHNICAL, Priority.HIGH): 1},
+        )
+
+    def test_update_status_moves_counter_bucket(self, mock_repository, classified_ticket):
+        """Test that a status change moves the ticket between counter buckets."""
+        mock_repository.get_by_id.return_value = classified_ticket
+        mock_repository.update.side_effect = lambda ticket: ticket
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, None, ticket_stats=ticket_stats)
+
+        service.update_ticket_status(classified_ticket.id, TicketStatus.IN_PROGRESS)
+
+        ticket_stats.apply.assert_called_once_with(
+            {
+                TicketStatsKey(TicketStatus.IN_PROGRESS, Category.TECHNICAL, Priority.HIGH): 1,
+                TicketStatsKey(TicketStatus.OPEN, Category.TECHNICAL, Priority.HIGH): -1,
+            },
+        )
+
+    def test_reclassify_many(self, mock_ai_service, mock_repository):
+        """Test bulk reclassification with one failing ticket, applied to a fresh read of the rows."""
+        from pyticket.domain.tickets.entities import Ticket
+
+        ok_ticket = Ticket(title="Login", description="Cannot log in")
+        # Moved to IN_PROGRESS by someone else while the batch was being classified
+        fresh_ticket = Ticket(id=ok_ticket.id, title="Login", description="Cannot log in", status=TicketStatus.IN_PROGRESS)
+        mock_repository.get_many.return_value = {ok_ticket.id: fresh_ticket}
+        broken_ticket = Ticket(title="Broken", description="Provider fails")
+        classification = mock_ai_service.classify_ticket.return_value
+
+        def classify(ticket):
+            if ticket is broken_ticket:
+                raise RuntimeError("provider timeout")
+            return classification
+
+        mock_ai_service.classify_ticket.side_effect = classify
+        outbox = Mock()
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, mock_ai_service, routing_outbox=outbox, ticket_stats=ticket_stats)
+
+        result = service.reclassify_many([ok_ticket, broken_ticket], max_workers=2)
+
+        assert result.updated == 1
+        assert result.failed == [broken_ticket.id]
+        mock_repository.get_many.assert_called_once_with([ok_ticket.id], for_update=True)
+        mock_repository.update_classifications.assert_called_once_with([fresh_ticket])
+        assert (fresh_ticket.category, fresh_ticket.status) == (Category.TECHNICAL, TicketStatus.IN_PROGRESS)
+        assert [event.ticket_id for event in outbox.add_many.call_args.args[0]] == [ok_ticket.id]
+        ticket_stats.apply.assert_called_once_with(
+            {
+                TicketStatsKey(TicketStatus.IN_PROGRESS, Category.TECHNICAL, Priority.HIGH): 1,
+                TicketStatsKey(TicketStatus.IN_PROGRESS): -1,
+            },
+        )
+
+    def test_update_status_many(self, mock_repository, sample_ticket, classified_ticket):
+        """Test batch status updates with valid, invalid and missing tickets."""
+        from pyticket.domain.tickets.entities import Ticket
+
+        closed_ticket = Ticket(title="Done", description="Already closed", status=TicketStatus.CLOSED)
+        missing_id = uuid4()
+        mock_repository.get_many.return_value = {
+            sample_ticket.id: sample_ticket,
+            classified_ticket.id: classified_ticket,
+            closed_ticket.id: closed_ticket,
+        }
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, None, ticket_stats=ticket_stats)
+
+        results = service.update_status_many(
+            [sample_ticket.id, closed_ticket.id, missing_id, classified_ticket.id, sample_ticket.id],
+            TicketStatus.IN_PROGRESS,
+        )
+
+        assert [(result.ticket_id, result.updated) for result in results] == [
+            (sample_ticket.id, True),
+            (closed_ticket.id, False),
+            (missing_id, False),
+            (classified_ticket.id, True),
+        ]
+        assert results[1].status == TicketStatus.CLOSED
+        assert "Cannot transition" in results[1].error
+        assert "not found" in results[2].error
+        mock_repository.get_many.assert_called_once()
+        mock_repository.update_statuses.assert_called_once_with([sample_ticket, classified_ticket])
+        ticket_stats.apply.assert_called_once_with(
+            {
+                TicketStatsKey(TicketStatus.IN_PROGRESS): 1,
+                TicketStatsKey(TicketStatus.OPEN): -1,
+                TicketStatsKey(TicketStatus.IN_PROGRESS, Category.TECHNICAL, Priority.HIGH): 1,
+                TicketStatsKey(TicketStatus.OPEN, Category.TECHNICAL, Priority.HIGH): -1,
+            },
+        )
+
+    def test_create_unclassified_ticket(self, mock_ai_service, mock_repository):
+        """Test that deferred creation skips classification and routing."""
+        mock_repository.save.side_effect = lambda ticket: ticket
+        outbox = Mock()
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, mock_ai_service, routing_outbox=outbox, ticket_stats=ticket_stats)
+
+        result = service.create_unclassified_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        assert result.category is None
+        assert result.classification is None
+        mock_ai_service.classify_ticket.assert_not_called()
+        outbox.add.assert_not_called()
+        ticket_stats.apply.assert_called_once_with({TicketStatsKey(TicketStatus.OPEN): 1})
+
+    def test_create_ticket_returns_duplicate(self, mock_ai_service, mock_repository, classified_ticket):
+        """Test that a duplicate of a recent ticket is returned without creating or classifying."""
+        mock_repository.find_duplicate.return_value = classified_ticket
+        service = TicketService(mock_repository, mock_ai_service, duplicate_window=timedelta(minutes=10), duplicate_threshold=0.9)
+
+        result = service.create_ticket(CreateTicketDTO(title=classified_ticket.title, description=classified_ticket.description))
+        deferred = service.create_unclassified_ticket(
+            CreateTicketDTO(title=classified_ticket.title, description=classified_ticket.description)
+        )
+
+        assert result.id == deferred.id == classified_ticket.id
+        assert result.duplicate and deferred.duplicate
+        assert mock_repository.find_duplicate.call_args.args[2] == 0.9
+        mock_ai_service.classify_ticket.assert_not_called()
+        mock_repository.save.assert_not_called()
+
+    def test_create_ticket_without_duplicate(self, mock_ai_service, mock_repository):
+        """Test that a ticket without a duplicate is created as usual."""
+        mock_repository.find_duplicate.return_value = None
+        mock_repository.save.side_effect = lambda ticket: ticket
+        service = TicketService(mock_repository, mock_ai_service, duplicate_window=timedelta(minutes=10))
+
+        result = service.create_ticket(CreateTicketDTO(title="Test", description="Test description"))
+
+        assert not result.duplicate
+        mock_ai_service.classify_ticket.assert_called_once()
+
+    def test_delete_ticket(self, mock_ai_service, mock_repository, classified_ticket):
+        """Test that deleting a ticket takes it out of the counters."""
+        mock_repository.get_by_id.return_value = classified_ticket
+        mock_repository.delete.return_value = True
+        ticket_stats = Mock()
+        service = TicketService(mock_repository, mock_ai_service, ticket_stats=ticket_stats)
+
+        assert service.delete_ticket(classified_ticket.id) is True
+        ticket_stats.apply.assert_called_once_with({TicketStatsKey(TicketStatus.OPEN, Category.TECHNICAL, Priority.HIGH): -1})
+
+    def test_delete_missing_ticket(self, mock_ai_service, mock_repository):
+        """Test that deleting an unknown ticket reports it."""
+        mock_repository.get_by_id.return_value = None
+        service = TicketService(mock_repository, mock_ai_service)
+
+        assert service.delete_ticket(uuid4()) is False
+        mock_repository.delete.assert_not_called()
@@ -0,0 +1,35 @@
+"""Tests for ClassificationUsageService"""
+
+from datetime import date
+from unittest.mock import Mock
+from uuid import uuid4
+
+from pyticket.infrastructure.repositories.interfaces import IClassificationUsageRepository, TicketUsageTotals, UsageTotals
+from pyticket.service.tickets.usage_service import ClassificationUsageService
+
+PRICES = {"gpt-4o-mini": {"prompt": 0.15, "completion": 0.60}}
+
+
+class TestClassificationUsageService:
+    """Tests for ClassificationUsageService"""
+
+    def test_report_with_costs(self):
+        """Test latency averages and cost estimates, with unpriced models reporting no cost."""
+        repository = Mock(spec=IClassificationUsageRepository)
+        repository.totals_by_day.return_value = [
+            UsageTotals(date(2026, 10, 19), "OPENAI", "gpt-4o-mini", 4, 2_000_000, 1_000_000, 2.0),
+            UsageTotals(date(2026, 10, 19), "REPLAY", "unknown", 1, 100, 10, 0.0),
+        ]
+        ticket_id = uuid4()
+        repository.top_tickets.return_value = [TicketUsageTotals(ticket_id, 2, 900, 100)]
+
+        report = ClassificationUsageService(repository, PRICES).get_report(days=7, top=5)
+
+        mini, replay = report.by_day
+        assert mini.estimated_cost == 0.9
+        assert mini.avg_latency_ms == 500.0
+        assert replay.estimated_cost is None
+        assert report.total_tokens == 3_000_110
+        assert report.estimated_cost == 0.9
+        assert report.top_tickets[0].total_tokens == 1000
+        repository.top_tickets.assert_called_once_with(report.since, 5)